@@ -4,8 +4,9 @@ Shared dependencies for the Bunking API.
 This module provides:
 - PocketBase client management (global instance, background task isolation)
 - Authentication helpers
-- Caching infrastructure (graph cache, ID translation cache)
+- Caching infrastructure (graph cache, session snapshot cache, validation sessions, ID translation cache)
 - Shared state for solver runs
+- Solver process pool
 """
 
 from __future__ import annotations
@@ -15,9 +16,13 @@ import logging
 from typing import Any
 
 from bunking.graph.graph_cache_manager import GraphCacheManager
+from bunking.sync.bunk_request_processor.data.async_pocketbase import AsyncPocketBase
 from pocketbase import PocketBase
 
 from .services.id_cache import IDLookupCache
+from .services.session_snapshot import SessionSnapshotCache
+from .services.solver_executor import SolverExecutor
+from .services.validation_sessions import ValidationSessionStore
 from .settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -29,6 +34,9 @@ logger = logging.getLogger(__name__)
 # PocketBase client architecture:
 # - pb: Global instance used by most endpoints (authenticated as admin on startup)
 # - task_pb: Fresh instance created in background tasks for isolation
+# - async_pb: Native async twin of pb (shared auth store). Twins of pb and of
+#   task clients (see IDLookupCache) share one connection pool per server,
+#   which is closed through async_pb on shutdown
 #
 # Thread safety notes (from PocketBase maintainer):
 # - The PocketBase API itself is stateless and thread-safe
@@ -38,6 +46,7 @@ logger = logging.getLogger(__name__)
 _settings = get_settings()
 pb_url = _settings.pocketbase_url
 pb = PocketBase(pb_url)
+async_pb = AsyncPocketBase.from_client(pb)
 
 
 class AuthState:
@@ -90,6 +99,12 @@ async def authenticate_task_pb(task_pb: PocketBase) -> None:
 
 graph_cache = GraphCacheManager(ttl_seconds=900, max_cache_size=50)
 
+# Prepared solver input and endpoint inputs per (session, year, scenario), reused across calls
+session_snapshots = SessionSnapshotCache(ttl_seconds=900, max_size=60)
+
+# Open incremental validation sessions for the bunking board
+validation_sessions = ValidationSessionStore(ttl_seconds=900, max_size=20)
+
 
 # ========================================
 # Solver Runs Storage
@@ -98,6 +113,12 @@ graph_cache = GraphCacheManager(ttl_seconds=900, max_cache_size=50)
 # In-memory storage for solver runs (in production, use Redis or a database)
 solver_runs: dict[str, dict[str, Any]] = {}
 
+# Solves run in worker processes so CP-SAT never blocks the event loop
+solver_executor = SolverExecutor(
+    max_workers=_settings.solver_max_processes,
+    max_pending=_settings.solver_max_pending,
+)
+
 
 # ========================================
 # ID Translation Cache
@@ -109,12 +130,16 @@ solver_runs: dict[str, dict[str, Any]] = {}
 __all__ = [
     "pb",
     "pb_url",
+    "async_pb",
     "auth_state",
     "authenticate_pb",
     "get_pb_client",
     "create_task_pb_client",
     "authenticate_task_pb",
     "graph_cache",
+    "session_snapshots",
+    "validation_sessions",
     "solver_runs",
+    "solver_executor",
     "IDLookupCache",
 ]
@@ -29,9 +29,11 @@ from bunking.auth_middleware import (
 from bunking.logging_config import configure_logging, get_logger
 
 from .dependencies import (
+    async_pb,
     auth_state,
     authenticate_pb,
     pb,
+    solver_executor,
 )
 from .settings import get_settings
 
@@ -56,7 +58,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     yield
 
-    # Shutdown (no cleanup needed - Go scheduler handles sync scheduling)
+    # Shutdown (sync scheduling is handled by the Go scheduler)
+    solver_executor.shutdown()
+    await async_pb.aclose()
 
 
 def create_app() -> FastAPI:
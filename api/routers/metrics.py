@@ -675,3 +675,24 @@ async def get_drilldown_attendees(
     except Exception as e:
         logger.error(f"Error getting drilldown attendees: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error getting drilldown attendees: {str(e)}")
+
+
+# ============================================================================
+# Cache Endpoint
+# ============================================================================
+
+
+@router.post("/cache/invalidate")
+async def invalidate_metrics_cache(
+    year: int | None = Query(None, description="Year to drop (default: all years)"),
+) -> dict[str, Any]:
+    """Drop cached metrics reads so the next request reloads from PocketBase.
+
+    The Go sync does not notify the API, so call this after a sync to show
+    its data before the cached entries expire on their own.
+    """
+    from api.services.metrics_repository import MetricsRepository
+
+    cache = MetricsRepository(pb).cache
+    invalidated = cache.invalidate(year)
+    return {"invalidated": invalidated, "stats": cache.get_stats()}
@@ -22,15 +22,20 @@ from pocketbase.client import ClientResponseError  # type: ignore[attr-defined]
 from bunking.models import (
     ClearScenarioRequest,
     CreateScenarioRequest,
+    IncrementalSolveRequest,
     SavedScenario,
     ScenarioAssignmentUpdate,
     UpdateScenarioRequest,
 )
+from bunking.solver.batch_score_evaluator import BatchScoreEvaluator
+from bunking.solver.neighborhood import build_neighborhood_input, select_neighborhood
 from bunking.solver.objective_evaluator import evaluate_objective
+from bunking.solver.score_evaluator import ScoreBreakdown
 
-from ..dependencies import pb, solver_runs
-from ..services.session_context import build_session_context
-from ..services.solver_runner import run_solver_task_v2
+from ..dependencies import pb, session_snapshots, solver_executor, solver_runs, validation_sessions
+from ..services.session_context import SessionContext, build_session_context
+from ..services.solver_executor import SolveJob
+from ..services.solver_runner import load_solver_input, run_solver_task_v2
 
 logger = logging.getLogger(__name__)
 
@@ -237,6 +242,132 @@ async def list_scenarios(
         raise HTTPException(status_code=500, detail=f"Failed to list scenarios: {str(e)}")
 
 
+async def _load_score_inputs(ctx: SessionContext, session_id: int, year: int) -> dict[str, list[dict[str, Any]]]:
+    """Fetch the requests, persons and bunks scenarios are scored against (by either evaluator)."""
+    # Fetch bunk requests for the session
+    requests_raw = await asyncio.to_thread(
+        pb.collection("bunk_requests").get_full_list,
+        query_params={
+            "filter": f"({ctx.session_id_filter}) && year = {year}",
+        },
+    )
+
+    # Convert requests to evaluator format
+    requests = []
+    for r in requests_raw:
+        req_dict = {
+            "requester_id": getattr(r, "requester_id", None),
+            "requestee_id": getattr(r, "requestee_id", None),
+            "request_type": getattr(r, "request_type", ""),
+            "priority": getattr(r, "priority", 5),
+            "source_field": getattr(r, "source_field", None),
+            "age_preference_target": getattr(r, "age_preference_target", None),
+        }
+        ai_reasoning = getattr(r, "ai_reasoning", None)
+        if isinstance(ai_reasoning, dict):
+            req_dict["csv_source_fields"] = ai_reasoning.get("csv_source_fields", [])
+        requests.append(req_dict)
+
+    # Fetch persons with session info (needed for age/grade flow)
+    persons_raw = await asyncio.to_thread(
+        pb.collection("persons").get_full_list,
+        query_params={"filter": f"year = {year}"},
+    )
+    persons = [
+        {
+            "cm_id": getattr(p, "cm_id", None),
+            "grade": getattr(p, "grade", None),
+            "gender": getattr(p, "gender", None),
+            "age": getattr(p, "age", None),
+            "session_cm_id": session_id,  # For age/grade flow calculation
+        }
+        for p in persons_raw
+    ]
+
+    # Fetch bunks with session info
+    bunks_raw = await asyncio.to_thread(
+        pb.collection("bunks").get_full_list,
+        query_params={"filter": f"year = {year}"},
+    )
+    bunks = [
+        {
+            "cm_id": getattr(b, "cm_id", None),
+            "name": getattr(b, "name", None),
+            "gender": getattr(b, "gender", None),
+            "capacity": getattr(b, "max_size", None),
+            "max_size": getattr(b, "max_size", None),
+            "session_cm_id": session_id,  # For age/grade flow calculation
+        }
+        for b in bunks_raw
+    ]
+
+    return {"requests": requests, "persons": persons, "bunks": bunks}
+
+
+async def _get_score_inputs(
+    ctx: SessionContext, session_id: int, year: int
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Return (requests, persons, bunks) for scoring.
+
+    They do not depend on the scenario; reuse them while unchanged.
+    """
+    inputs = await session_snapshots.get_prepared(
+        pb, session_id, year, None, "score_inputs", lambda: _load_score_inputs(ctx, session_id, year)
+    )
+    return inputs["requests"], inputs["persons"], inputs["bunks"]
+
+
+async def _load_assignment_map(ctx: SessionContext, year: int, scenario_id: str | None) -> dict[int, int]:
+    """Fetch person_cm_id -> bunk_cm_id from a scenario's drafts, or production if scenario_id is None."""
+    session_filter = ctx.session_relation_filter
+    if scenario_id:
+        assignments_raw = await asyncio.to_thread(
+            pb.collection("bunk_assignments_draft").get_full_list,
+            query_params={
+                "filter": f'scenario = "{scenario_id}" && ({session_filter}) && year = {year}',
+                "expand": "person,bunk",
+            },
+        )
+    else:
+        assignments_raw = await asyncio.to_thread(
+            pb.collection("bunk_assignments").get_full_list,
+            query_params={
+                "filter": f"({session_filter}) && year = {year}",
+                "expand": "person,bunk",
+            },
+        )
+
+    assignment_map: dict[int, int] = {}
+    for a in assignments_raw:
+        expand = getattr(a, "expand", {}) or {}
+        person_data = expand.get("person") if isinstance(expand, dict) else getattr(expand, "person", None)
+        bunk_data = expand.get("bunk") if isinstance(expand, dict) else getattr(expand, "bunk", None)
+
+        if person_data and bunk_data:
+            person_cm_id = getattr(person_data, "cm_id", None)
+            bunk_cm_id = getattr(bunk_data, "cm_id", None)
+            if person_cm_id and bunk_cm_id:
+                assignment_map[int(person_cm_id)] = int(bunk_cm_id)
+    return assignment_map
+
+
+def _score_response(scenario_id: str | None, session_id: int, year: int, breakdown: ScoreBreakdown) -> dict[str, Any]:
+    """Shape a ScoreBreakdown as the frontend's SolverScoreResult."""
+    return {
+        "scenario_id": scenario_id,
+        "session_id": session_id,
+        "year": year,
+        "total_score": breakdown.total_score,
+        "request_satisfaction_score": breakdown.request_satisfaction_score,
+        "soft_penalty_score": breakdown.soft_penalty_score,
+        "total_requests": breakdown.total_requests,
+        "satisfied_requests": breakdown.satisfied_requests,
+        "satisfaction_rate": breakdown.satisfaction_rate,
+        "field_scores": breakdown.field_scores,
+        "penalties": breakdown.penalties,
+    }
+
+
 @router.get("/score")
 async def evaluate_score(
     session_id: Annotated[int, Query(description="Session CampMinder ID")],
@@ -256,94 +387,11 @@ async def evaluate_score(
     try:
         # Build session context
         ctx = await build_session_context(session_id, year, pb)
-        session_filter = ctx.session_relation_filter
-        session_id_filter = ctx.session_id_filter
-
-        # Fetch bunk requests for the session
-        requests_raw = await asyncio.to_thread(
-            pb.collection("bunk_requests").get_full_list,
-            query_params={
-                "filter": f"({session_id_filter}) && year = {year}",
-            },
-        )
 
-        # Convert requests to evaluator format
-        requests = []
-        for r in requests_raw:
-            req_dict = {
-                "requester_id": getattr(r, "requester_id", None),
-                "requestee_id": getattr(r, "requestee_id", None),
-                "request_type": getattr(r, "request_type", ""),
-                "priority": getattr(r, "priority", 5),
-                "source_field": getattr(r, "source_field", None),
-            }
-            ai_reasoning = getattr(r, "ai_reasoning", None)
-            if isinstance(ai_reasoning, dict):
-                req_dict["csv_source_fields"] = ai_reasoning.get("csv_source_fields", [])
-            requests.append(req_dict)
-
-        # Fetch assignments - from draft if scenario specified, else production
-        if scenario_id:
-            assignments_raw = await asyncio.to_thread(
-                pb.collection("bunk_assignments_draft").get_full_list,
-                query_params={
-                    "filter": f'scenario = "{scenario_id}" && ({session_filter}) && year = {year}',
-                    "expand": "person,bunk",
-                },
-            )
-        else:
-            assignments_raw = await asyncio.to_thread(
-                pb.collection("bunk_assignments").get_full_list,
-                query_params={
-                    "filter": f"({session_filter}) && year = {year}",
-                    "expand": "person,bunk",
-                },
-            )
+        # Requests, persons and bunks do not depend on the scenario; reuse them while unchanged
+        requests, persons, bunks = await _get_score_inputs(ctx, session_id, year)
 
-        # Build assignment map (person_cm_id -> bunk_cm_id)
-        assignment_map: dict[int, int] = {}
-        for a in assignments_raw:
-            expand = getattr(a, "expand", {}) or {}
-            person_data = expand.get("person") if isinstance(expand, dict) else getattr(expand, "person", None)
-            bunk_data = expand.get("bunk") if isinstance(expand, dict) else getattr(expand, "bunk", None)
-
-            if person_data and bunk_data:
-                person_cm_id = getattr(person_data, "cm_id", None)
-                bunk_cm_id = getattr(bunk_data, "cm_id", None)
-                if person_cm_id and bunk_cm_id:
-                    assignment_map[int(person_cm_id)] = int(bunk_cm_id)
-
-        # Fetch persons with session info (needed for age/grade flow)
-        persons_raw = await asyncio.to_thread(
-            pb.collection("persons").get_full_list,
-            query_params={"filter": f"year = {year}"},
-        )
-        persons = [
-            {
-                "cm_id": getattr(p, "cm_id", None),
-                "grade": getattr(p, "grade", None),
-                "gender": getattr(p, "gender", None),
-                "age": getattr(p, "age", None),
-                "session_cm_id": session_id,  # For age/grade flow calculation
-            }
-            for p in persons_raw
-        ]
-
-        # Fetch bunks with session info
-        bunks_raw = await asyncio.to_thread(
-            pb.collection("bunks").get_full_list,
-            query_params={"filter": f"year = {year}"},
-        )
-        bunks = [
-            {
-                "cm_id": getattr(b, "cm_id", None),
-                "name": getattr(b, "name", None),
-                "gender": getattr(b, "gender", None),
-                "capacity": getattr(b, "max_size", None),
-                "session_cm_id": session_id,  # For age/grade flow calculation
-            }
-            for b in bunks_raw
-        ]
+        assignment_map = await _load_assignment_map(ctx, year, scenario_id)
 
         # Evaluate using the exact solver objective function
         breakdown = evaluate_objective(assignment_map, requests, persons, bunks)
@@ -373,6 +421,46 @@ async def evaluate_score(
         raise HTTPException(status_code=500, detail=f"Failed to evaluate score: {str(e)}")
 
 
+@router.get("/score/compare")
+async def compare_scores(
+    session_id: Annotated[int, Query(description="Session CampMinder ID")],
+    year: Annotated[int, Query(description="Year")],
+    scenario_ids: Annotated[str, Query(description="Comma-separated scenario IDs to compare")] = "",
+    include_production: Annotated[bool, Query(description="Also score production assignments")] = True,
+) -> dict[str, Any]:
+    """Score several scenarios (and production) of a session in one batch pass.
+
+    Uses the batch score evaluator, which reports evaluate_scenario_score's
+    request/penalty score rather than the solver objective /score returns,
+    so compare scores with each other, not with /score. Returns one score
+    per scenario in request order, production first.
+    """
+    ids: list[str | None] = [sid for sid in scenario_ids.split(",") if sid]
+    if include_production:
+        ids.insert(0, None)
+    if not ids:
+        raise HTTPException(status_code=400, detail="No scenarios to compare")
+
+    try:
+        ctx = await build_session_context(session_id, year, pb)
+        requests, persons, bunks = await _get_score_inputs(ctx, session_id, year)
+        evaluator = await asyncio.to_thread(BatchScoreEvaluator, requests, persons, bunks)
+        assignment_maps = await asyncio.gather(*(_load_assignment_map(ctx, year, sid) for sid in ids))
+        breakdowns = await asyncio.to_thread(evaluator.score_many, assignment_maps)
+        return {
+            "session_id": session_id,
+            "year": year,
+            "scores": [
+                _score_response(sid, session_id, year, breakdown)
+                for sid, breakdown in zip(ids, breakdowns, strict=True)
+            ],
+        }
+
+    except Exception as e:
+        logger.error(f"Error comparing scenario scores: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to compare scores: {str(e)}")
+
+
 @router.get("/{scenario_id}")
 async def get_scenario(
     scenario_id: Annotated[str, Path(description="Scenario ID")],
@@ -473,6 +561,8 @@ async def delete_scenario(scenario_id: str) -> dict[str, str]:
 
         # Delete the scenario
         await asyncio.to_thread(pb.collection("saved_scenarios").delete, scenario_id)
+        session_snapshots.invalidate(scenario=scenario_id)
+        validation_sessions.invalidate(scenario=scenario_id)
 
         return {"message": f"Scenario '{getattr(scenario, 'name', scenario_id)}' deleted successfully"}
 
@@ -635,6 +725,9 @@ async def update_scenario_assignment(scenario_id: str, update: ScenarioAssignmen
         if "existing" in locals():
             logger.error(f"Existing assignments: {existing}")
         raise HTTPException(status_code=500, detail=f"Failed to update assignment: {str(e)}")
+    finally:
+        # Drop cached session data once the draft write has happened (or failed part-way)
+        session_snapshots.invalidate(scenario=scenario_id)
 
 
 # ========================================
@@ -655,13 +748,17 @@ async def solve_scenario(scenario_id: str, background_tasks: BackgroundTasks) ->
     Reads existing assignments from bunk_assignments_draft (not production)
     and produces optimized assignments for the scenario.
     """
+    # Hold a queue slot now; the background task fetches data before it submits
+    run_id = str(uuid4())
+    if not solver_executor.reserve(run_id):
+        raise HTTPException(status_code=503, detail="Solver queue is full, try again shortly")
+
     try:
         scenario = await asyncio.to_thread(pb.collection("saved_scenarios").get_one, scenario_id)
 
         session_cm_id: int = getattr(scenario, "session_cm_id", 0)
         scenario_year: int = getattr(scenario, "year", 0)
 
-        run_id = str(uuid4())
         solver_runs[run_id] = {
             "id": run_id,
             "status": "pending",
@@ -687,14 +784,77 @@ async def solve_scenario(scenario_id: str, background_tasks: BackgroundTasks) ->
         return {"run_id": run_id, "status": "started", "message": "Solver run started for scenario"}
 
     except ClientResponseError as e:
+        solver_executor.release(run_id)
         if e.status == 404:
             raise HTTPException(status_code=404, detail="Scenario not found")
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
+        solver_executor.release(run_id)
         logger.error(f"Error starting solver for scenario: {e}")
         raise HTTPException(status_code=500, detail="Failed to start solver")
 
 
+@router.post("/{scenario_id}/solve/incremental")
+async def solve_scenario_incremental(scenario_id: str, request: IncrementalSolveRequest) -> dict[str, Any]:
+    """Re-optimize the campers around an edit without re-solving the whole scenario.
+
+    Every camper outside the neighborhood of the edited campers (the occupants
+    of the affected bunks plus their request partners) is locked, so the solve
+    returns within the requested sub-second budget. Proposed moves are
+    returned, not written - apply them through PUT /{scenario_id}/assignments.
+    """
+    # Hold the slot while the scenario loads, so the solve is not refused after it
+    run_id = f"incremental-{uuid4()}"
+    if not solver_executor.reserve(run_id):
+        raise HTTPException(status_code=503, detail="Solver queue is full, try again shortly")
+
+    try:
+        # Verify scenario exists (raises 404 if not found)
+        await asyncio.to_thread(pb.collection("saved_scenarios").get_one, scenario_id)
+
+        solver_input = await load_solver_input(pb, request.session_cm_id, request.year, True, scenario=scenario_id)
+        current = {a.person_cm_id: a.bunk_cm_id for a in solver_input.existing_assignments}
+        pinned = {p: current[p] for p in request.person_ids if p in current} if request.pin_edited else {}
+
+        free = select_neighborhood(solver_input, request.person_ids, request.bunk_ids)
+        neighborhood_input = build_neighborhood_input(solver_input, free, pinned=pinned)
+        logger.info(
+            f"Incremental solve for scenario {scenario_id}: {len(free)} of {len(solver_input.persons)} campers free"
+        )
+
+        job = SolveJob(
+            solver_input=neighborhood_input,
+            time_limit=request.time_limit_ms / 1000,
+            analyze_infeasibility=False,
+            num_workers=1,
+        )
+        outcome = await solver_executor.run(run_id, job)
+    except ClientResponseError as e:
+        if e.status == 404:
+            raise HTTPException(status_code=404, detail="Scenario not found")
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        solver_executor.release(run_id)
+
+    if outcome.output is None:
+        raise HTTPException(
+            status_code=409, detail="No valid arrangement found within the neighborhood of the edited campers"
+        )
+
+    moves = [
+        {"person_id": a.person_cm_id, "from_bunk_id": current.get(a.person_cm_id), "to_bunk_id": a.bunk_cm_id}
+        for a in outcome.output.assignments
+        if current.get(a.person_cm_id) != a.bunk_cm_id
+    ]
+    return {
+        "scenario_id": scenario_id,
+        "status": outcome.output.stats.get("status"),
+        "neighborhood_size": len(free),
+        "moves": moves,
+        "solve_time": outcome.output.stats.get("solve_time"),
+    }
+
+
 @router.post("/{scenario_id}/clear")
 async def clear_scenario(scenario_id: str, request: ClearScenarioRequest) -> dict[str, str | int]:
     """Clear all assignments in a scenario."""
@@ -713,6 +873,8 @@ async def clear_scenario(scenario_id: str, request: ClearScenarioRequest) -> dic
         for assignment in assignments:
             await asyncio.to_thread(pb.collection("bunk_assignments_draft").delete, assignment.id)
             deleted_count += 1
+        session_snapshots.invalidate(year=request.year, scenario=scenario_id)
+        validation_sessions.invalidate(year=request.year, scenario=scenario_id)
 
         return {
             "message": f"Cleared {deleted_count} assignments from scenario for year {request.year}",
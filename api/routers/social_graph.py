@@ -13,9 +13,10 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException, Path, Query
+import networkx as nx
+from fastapi import APIRouter, HTTPException, Path, Query, Response
 
 from bunking.graph.optimized_graph_builder import OptimizedSocialGraphBuilder
 from bunking.graph.social_graph_builder import SocialGraphBuilder
@@ -31,6 +32,7 @@ from ..schemas import (
     SocialGraphNode,
     SocialGraphResponse,
 )
+from ..services.bulk_loader import PersonRecord, fetch_by_ids
 from ..settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -47,6 +49,178 @@ router = APIRouter(tags=["social-graph"])
 # ========================================
 
 
+def _render_session_graph(
+    graph: nx.DiGraph,
+    persons: dict[int, Any],
+    edge_types: str | None,
+    layout: str,
+    include_metrics: bool,
+) -> tuple[SocialGraphResponse, bytes]:
+    """Convert a session graph into its response and serialized JSON.
+
+    Metrics, community grouping and layout are CPU-bound NetworkX work, so
+    callers run this in a worker thread.
+    """
+    # Convert to response format
+    nodes = []
+    for node_id in graph.nodes():
+        node_data = graph.nodes[node_id]
+
+        person = persons.get(node_id)
+        if person is not None:
+            name = f"{person.first_name} {person.last_name}"
+            grade = person.grade
+        else:
+            name = f"Person {node_id}"
+            grade = None
+
+        nodes.append(
+            SocialGraphNode(
+                id=node_id,
+                name=name,
+                grade=grade,
+                bunk_cm_id=node_data.get("bunk_cm_id"),
+                centrality=node_data.get("centrality", 0.0),
+                clustering=node_data.get("clustering", 0.0),
+                community=node_data.get("community"),
+                satisfaction_status=node_data.get("satisfaction_status"),
+            )
+        )
+
+    # Parse edge type filter
+    allowed_edge_types = None
+    if edge_types:
+        allowed_edge_types = set(edge_types.split(","))
+        logger.info(f"Filtering edges to types: {allowed_edge_types}")
+
+    # Convert edges
+    edges = []
+    edge_type_counts: dict[str, int] = {}
+    for source, target, data in graph.edges(data=True):
+        edge_type = data.get("edge_type", "request")
+
+        # Count edge types for metadata
+        edge_type_counts[edge_type] = edge_type_counts.get(edge_type, 0) + 1
+
+        # Filter by edge type if specified
+        if allowed_edge_types and edge_type not in allowed_edge_types:
+            continue
+
+        # Handle bundled edges
+        if edge_type == "bundled":
+            # For bundled edges, include all relationship types
+            edges.append(
+                SocialGraphEdge(
+                    source=source,
+                    target=target,
+                    weight=data.get("weight", 1.0),
+                    type=edge_type,
+                    reciprocal=graph.has_edge(target, source),
+                    confidence=data.get("metadata", {}).get("request", {}).get("confidence"),
+                    priority=data.get("metadata", {}).get("request", {}).get("priority"),
+                    metadata={
+                        "types": data.get("types", []),
+                        "bundle_count": data.get("bundle_count", 1),
+                        "details": data.get("metadata", {}),
+                    },
+                )
+            )
+        else:
+            edges.append(
+                SocialGraphEdge(
+                    source=source,
+                    target=target,
+                    weight=data.get("weight", 1.0),
+                    type=edge_type,
+                    reciprocal=graph.has_edge(target, source),
+                    confidence=data.get("confidence"),
+                    priority=data.get("priority"),
+                    metadata=data.get("metadata", {}),
+                )
+            )
+
+    # Calculate metrics if requested
+    metrics = {}
+    if include_metrics:
+        if len(graph) > 0:
+            metrics = {
+                "density": nx.density(graph),
+                "average_clustering": nx.average_clustering(graph.to_undirected()),
+                "number_of_components": nx.number_weakly_connected_components(graph),
+                "average_degree": sum(dict(graph.degree()).values()) / len(graph),
+            }
+        else:
+            metrics = {"density": 0.0, "average_clustering": 0.0, "number_of_components": 0, "average_degree": 0.0}
+
+    # Get communities
+    communities: dict[int, list[int]] = {}
+    for node_id, node_data in graph.nodes(data=True):
+        comm = node_data.get("community")
+        if comm is not None:
+            if comm not in communities:
+                communities[comm] = []
+            communities[comm].append(node_id)
+
+    # Generate warnings
+    warnings = []
+
+    # Check for isolated campers
+    isolated_nodes = [node for node in graph.nodes() if graph.degree(node) == 0]
+    if isolated_nodes:
+        warnings.append(f"{len(isolated_nodes)} camper(s) have no social connections")
+
+    # Check for weakly connected campers (only 1 connection)
+    weakly_connected = [node for node in graph.nodes() if graph.degree(node) == 1]
+    if weakly_connected:
+        warnings.append(f"{len(weakly_connected)} camper(s) have only one social connection")
+
+    # Check for split friend groups across bunks
+    if communities:
+        for comm_id, members in communities.items():
+            if len(members) > 2:
+                # Get bunk assignments for community members
+                bunks = set()
+                for member in members:
+                    bunk_id = graph.nodes[member].get("bunk_cm_id")
+                    if bunk_id:
+                        bunks.add(bunk_id)
+                if len(bunks) > 1:
+                    warnings.append(f"Friend group {comm_id} is split across {len(bunks)} bunks")
+
+    # Calculate layout positions if requested
+    layout_positions = None
+    if layout != "none" and len(graph) > 0:
+        if layout == "force":
+            pos = nx.spring_layout(graph, k=1.5, iterations=50)
+        elif layout == "circle":
+            pos = nx.circular_layout(graph)
+        elif layout == "hierarchical":
+            # Create a tree from the graph for hierarchical layout
+            # Use to_undirected() since is_connected only works on undirected graphs
+            undirected = graph.to_undirected()
+            if nx.is_connected(undirected):
+                tree = nx.minimum_spanning_tree(undirected)
+                pos = nx.spring_layout(tree)
+            else:
+                pos = nx.spring_layout(graph)
+        else:
+            pos = nx.spring_layout(graph)  # Default to force layout
+
+        # Convert positions to serializable format
+        layout_positions = {node: (float(x), float(y)) for node, (x, y) in pos.items()}
+
+    response = SocialGraphResponse(
+        nodes=nodes,
+        edges=edges,
+        metrics=metrics,
+        communities=communities,
+        warnings=warnings,
+        layout_positions=layout_positions,
+        edge_type_counts=edge_type_counts,
+    )
+    return response, response.model_dump_json().encode()
+
+
 @router.get("/api/sessions/{session_cm_id}/social-graph")
 async def get_session_social_graph(
     session_cm_id: Annotated[int, Path(description="Session CampMinder ID")],
@@ -72,14 +246,17 @@ async def get_session_social_graph(
         if year is None:
             year = datetime.now().year
 
+        # Serve repeat loads of the same view straight from the serialized response
+        response_variant = f"{edge_types or ''}|{layout}|{include_metrics}"
+        cached_response = graph_cache.get_session_response(session_cm_id, year, response_variant)
+        if cached_response is not None:
+            logger.info(f"Using cached social graph response for session {session_cm_id}")
+            return Response(content=cached_response, media_type="application/json")  # type: ignore[return-value]
+
         logger.info(f"Building social graph for session {session_cm_id}, year {year}")
 
-        # Check cache first
-        cached_graph = graph_cache.get_session_graph(session_cm_id, year)
-        if cached_graph:
-            logger.info(f"Using cached graph for session {session_cm_id}")
-            graph = cached_graph
-        else:
+        # A cached (or still-servable stale) graph means there is something to show
+        if not graph_cache.has_session_graph(session_cm_id, year):
             # Check if session has any bunk requests first (bunk_requests uses session_id field)
             try:
                 requests_check = await asyncio.to_thread(
@@ -112,179 +289,38 @@ async def get_session_social_graph(
                     layout_positions={},
                 )
 
-            # Use optimized builder with centralized random seed setting
-            builder = OptimizedSocialGraphBuilder(pb, random_seed=GRAPH_RANDOM_SEED)
-
-            # Build the graph
-            graph = builder.build_social_network(year, session_cm_id)
-
-            # Cache it
-            graph_cache.cache_session_graph(session_cm_id, year, graph)
-
-        # Convert to response format
-        nodes = []
-        for node_id in graph.nodes():
-            node_data = graph.nodes[node_id]
+        # Built in a worker thread; concurrent requests for this session share one build
+        # The version ties cached persons/response to this graph, not to a rebuild that
+        # lands meanwhile; None means the graph was not cached, so nothing derived is either
+        graph, graph_version = await graph_cache.get_or_build_versioned_session_graph(
+            session_cm_id,
+            year,
+            lambda: OptimizedSocialGraphBuilder(pb, random_seed=GRAPH_RANDOM_SEED).build_social_network(
+                year, session_cm_id
+            ),
+        )
 
-            # Get person details - must filter by year to get correct grade
+        # Person details for every node in one bulk fetch - must filter by year to get correct grade
+        persons = graph_cache.get_session_persons(session_cm_id, year)
+        if persons is None:
             try:
-                person = await asyncio.to_thread(
-                    pb.collection("persons").get_first_list_item, f"cm_id = {node_id} && year = {year}"
+                records = await fetch_by_ids(
+                    pb, "persons", "cm_id", graph.nodes(), f"year = {year}", convert=PersonRecord.from_record
                 )
-                name = f"{person.first_name} {person.last_name}"
-                grade = getattr(person, "grade", None)
-            except Exception:
-                name = f"Person {node_id}"
-                grade = None
-
-            nodes.append(
-                SocialGraphNode(
-                    id=node_id,
-                    name=name,
-                    grade=grade,
-                    bunk_cm_id=node_data.get("bunk_cm_id"),
-                    centrality=node_data.get("centrality", 0.0),
-                    clustering=node_data.get("clustering", 0.0),
-                    community=node_data.get("community"),
-                    satisfaction_status=node_data.get("satisfaction_status"),
-                )
-            )
-
-        # Parse edge type filter
-        allowed_edge_types = None
-        if edge_types:
-            allowed_edge_types = set(edge_types.split(","))
-            logger.info(f"Filtering edges to types: {allowed_edge_types}")
-
-        # Convert edges
-        edges = []
-        edge_type_counts: dict[str, int] = {}
-        for source, target, data in graph.edges(data=True):
-            edge_type = data.get("edge_type", "request")
-
-            # Count edge types for metadata
-            edge_type_counts[edge_type] = edge_type_counts.get(edge_type, 0) + 1
-
-            # Filter by edge type if specified
-            if allowed_edge_types and edge_type not in allowed_edge_types:
-                continue
-
-            # Handle bundled edges
-            if edge_type == "bundled":
-                # For bundled edges, include all relationship types
-                edges.append(
-                    SocialGraphEdge(
-                        source=source,
-                        target=target,
-                        weight=data.get("weight", 1.0),
-                        type=edge_type,
-                        reciprocal=graph.has_edge(target, source),
-                        confidence=data.get("metadata", {}).get("request", {}).get("confidence"),
-                        priority=data.get("metadata", {}).get("request", {}).get("priority"),
-                        metadata={
-                            "types": data.get("types", []),
-                            "bundle_count": data.get("bundle_count", 1),
-                            "details": data.get("metadata", {}),
-                        },
-                    )
-                )
-            else:
-                edges.append(
-                    SocialGraphEdge(
-                        source=source,
-                        target=target,
-                        weight=data.get("weight", 1.0),
-                        type=edge_type,
-                        reciprocal=graph.has_edge(target, source),
-                        confidence=data.get("confidence"),
-                        priority=data.get("priority"),
-                        metadata=data.get("metadata", {}),
-                    )
-                )
-
-        # Calculate metrics if requested
-        metrics = {}
-        if include_metrics:
-            import networkx as nx
-
-            if len(graph) > 0:
-                metrics = {
-                    "density": nx.density(graph),
-                    "average_clustering": nx.average_clustering(graph.to_undirected()),
-                    "number_of_components": nx.number_weakly_connected_components(graph),
-                    "average_degree": sum(dict(graph.degree()).values()) / len(graph),
-                }
-            else:
-                metrics = {"density": 0.0, "average_clustering": 0.0, "number_of_components": 0, "average_degree": 0.0}
-
-        # Get communities
-        communities: dict[int, list[int]] = {}
-        for node_id, node_data in graph.nodes(data=True):
-            comm = node_data.get("community")
-            if comm is not None:
-                if comm not in communities:
-                    communities[comm] = []
-                communities[comm].append(node_id)
-
-        # Generate warnings
-        warnings = []
-
-        # Check for isolated campers
-        isolated_nodes = [node for node in graph.nodes() if graph.degree(node) == 0]
-        if isolated_nodes:
-            warnings.append(f"{len(isolated_nodes)} camper(s) have no social connections")
-
-        # Check for weakly connected campers (only 1 connection)
-        weakly_connected = [node for node in graph.nodes() if graph.degree(node) == 1]
-        if weakly_connected:
-            warnings.append(f"{len(weakly_connected)} camper(s) have only one social connection")
-
-        # Check for split friend groups across bunks
-        if communities:
-            for comm_id, members in communities.items():
-                if len(members) > 2:
-                    # Get bunk assignments for community members
-                    bunks = set()
-                    for member in members:
-                        bunk_id = graph.nodes[member].get("bunk_cm_id")
-                        if bunk_id:
-                            bunks.add(bunk_id)
-                    if len(bunks) > 1:
-                        warnings.append(f"Friend group {comm_id} is split across {len(bunks)} bunks")
-
-        # Calculate layout positions if requested
-        import networkx as nx
-
-        layout_positions = None
-        if layout != "none" and len(graph) > 0:
-            if layout == "force":
-                pos = nx.spring_layout(graph, k=1.5, iterations=50)
-            elif layout == "circle":
-                pos = nx.circular_layout(graph)
-            elif layout == "hierarchical":
-                # Create a tree from the graph for hierarchical layout
-                # Use to_undirected() since is_connected only works on undirected graphs
-                undirected = graph.to_undirected()
-                if nx.is_connected(undirected):
-                    tree = nx.minimum_spanning_tree(undirected)
-                    pos = nx.spring_layout(tree)
-                else:
-                    pos = nx.spring_layout(graph)
-            else:
-                pos = nx.spring_layout(graph)  # Default to force layout
-
-            # Convert positions to serializable format
-            layout_positions = {node: (float(x), float(y)) for node, (x, y) in pos.items()}
+                persons = {int(p.cm_id): p for p in records}
+                if graph_version is not None:
+                    graph_cache.cache_session_persons(session_cm_id, year, persons, graph_version)
+            except Exception as e:
+                logger.warning(f"Failed to fetch person details for session {session_cm_id}: {e}")
+                persons = {}
 
-        return SocialGraphResponse(
-            nodes=nodes,
-            edges=edges,
-            metrics=metrics,
-            communities=communities,
-            warnings=warnings,
-            layout_positions=layout_positions,
-            edge_type_counts=edge_type_counts,
+        # Node/edge conversion, metrics and layout run in a worker thread
+        response, serialized = await asyncio.to_thread(
+            _render_session_graph, graph, persons, edge_types, layout, include_metrics
         )
+        if graph_version is not None:
+            graph_cache.cache_session_response(session_cm_id, year, response_variant, serialized, graph_version)
+        return response
 
     except Exception as e:
         logger.error(f"Error building social graph: {e}")
@@ -321,21 +357,15 @@ async def get_bunk_social_graph(bunk_cm_id: int, session_cm_id: int, year: int |
         except Exception:
             bunk_name = f"Bunk {bunk_cm_id}"
 
-        # Check cache first
-        cached_graph = graph_cache.get_bunk_graph(bunk_cm_id, session_cm_id, year)
-        if cached_graph:
-            logger.info(f"Using cached graph for bunk {bunk_cm_id}")
-            bunk_graph = cached_graph
-        else:
-            # Use optimized builder with centralized random seed setting
-            builder = OptimizedSocialGraphBuilder(pb, random_seed=GRAPH_RANDOM_SEED)
-
-            # Build bunk-specific graph with only request and sibling edges
-            bunk_graph = builder.build_bunk_graph(year, bunk_cm_id, session_cm_id)
-
-            # Cache it if not empty
-            if bunk_graph.number_of_nodes() > 0:
-                graph_cache.cache_bunk_graph(bunk_cm_id, session_cm_id, year, bunk_graph)
+        # Bunk-specific graph with only request and sibling edges (cached only if not empty)
+        bunk_graph = await graph_cache.get_or_build_bunk_graph(
+            bunk_cm_id,
+            session_cm_id,
+            year,
+            lambda: OptimizedSocialGraphBuilder(pb, random_seed=GRAPH_RANDOM_SEED).build_bunk_graph(
+                year, bunk_cm_id, session_cm_id
+            ),
+        )
 
         if bunk_graph.number_of_nodes() == 0:
             logger.info(f"No members found in bunk {bunk_cm_id}, returning empty graph")
@@ -507,8 +537,6 @@ async def get_bunk_social_graph(bunk_cm_id: int, session_cm_id: int, year: int |
         logger.info(f"Final edges being sent to frontend: {edge_type_summary}, total={len(edges)}")
 
         # Calculate bunk-specific metrics
-        import networkx as nx
-
         isolated_count = len([n for n in bunk_graph.nodes() if bunk_graph.degree(n) == 0])
         # Calculate density manually for directed graphs
         n = len(bunk_graph)
@@ -569,6 +597,27 @@ async def get_bunk_social_graph(bunk_cm_id: int, session_cm_id: int, year: int |
 # ========================================
 
 
+def _ego_network_metrics(full_graph: nx.DiGraph, person_cm_id: int, radius: int) -> tuple[nx.DiGraph, dict[str, Any]]:
+    """Extract a person's ego network and calculate their social metrics."""
+    ego_graph = nx.ego_graph(full_graph, person_cm_id, radius=radius)
+
+    # Calculate person-specific metrics
+    metrics = {
+        "degree": full_graph.degree(person_cm_id),
+        "degree_centrality": nx.degree_centrality(full_graph)[person_cm_id],
+        "clustering_coefficient": nx.clustering(full_graph)[person_cm_id],
+        "friends_count": ego_graph.degree(person_cm_id),
+        "network_size": len(ego_graph) - 1,  # Exclude self
+    }
+
+    # Add betweenness centrality if graph is small enough
+    if len(full_graph) < 200:
+        betweenness = nx.betweenness_centrality(full_graph)
+        metrics["betweenness_centrality"] = betweenness[person_cm_id]
+
+    return ego_graph, metrics
+
+
 @router.get("/api/persons/{person_cm_id}/ego-network")
 async def get_person_ego_network(
     person_cm_id: int, session_cm_id: int | None = None, radius: int = 2, include_historical: bool = False
@@ -592,9 +641,9 @@ async def get_person_ego_network(
         # Create builder instance with centralized random seed setting
         builder = SocialGraphBuilder(pb, random_seed=GRAPH_RANDOM_SEED)
 
-        # Build the appropriate graph
+        # Build the appropriate graph (blocking PocketBase reads and NetworkX analysis)
         if session_cm_id:
-            full_graph = builder.build_session_graph(year, session_cm_id)
+            full_graph = await asyncio.to_thread(builder.build_session_graph, year, session_cm_id)
         else:
             # Build a cross-session graph for this year
             # This would need to be implemented in SocialGraphBuilder
@@ -604,10 +653,8 @@ async def get_person_ego_network(
         if person_cm_id not in full_graph:
             raise HTTPException(status_code=404, detail=f"Person {person_cm_id} not found in session")
 
-        # Get ego network
-        import networkx as nx
-
-        ego_graph = nx.ego_graph(full_graph, person_cm_id, radius=radius)
+        # Ego network and the person's metrics are computed in a worker thread
+        ego_graph, metrics = await asyncio.to_thread(_ego_network_metrics, full_graph, person_cm_id, radius)
 
         # Get center person details - must filter by year to get correct grade
         try:
@@ -674,20 +721,6 @@ async def get_person_ego_network(
                 )
             )
 
-        # Calculate person-specific metrics
-        metrics = {
-            "degree": full_graph.degree(person_cm_id),
-            "degree_centrality": nx.degree_centrality(full_graph)[person_cm_id],
-            "clustering_coefficient": nx.clustering(full_graph)[person_cm_id],
-            "friends_count": ego_graph.degree(person_cm_id),
-            "network_size": len(ego_graph) - 1,  # Exclude self
-        }
-
-        # Add betweenness centrality if graph is small enough
-        if len(full_graph) < 200:
-            betweenness = nx.betweenness_centrality(full_graph)
-            metrics["betweenness_centrality"] = betweenness[person_cm_id]
-
         return EgoNetworkResponse(
             center_node=center_node,
             nodes=nodes,
@@ -735,17 +768,18 @@ async def update_camper_position(
         builder = OptimizedSocialGraphBuilder(pb, random_seed=GRAPH_RANDOM_SEED)
 
         # First ensure we have the graph built (will use cache if available)
-        cached_graph = graph_cache.get_session_graph(session_cm_id, year)
-        if not cached_graph:
-            # Build it if not cached
-            graph = builder.build_social_network(year, session_cm_id)
-            graph_cache.cache_session_graph(session_cm_id, year, graph)
-        else:
-            # Use the builder's graph
-            builder.graph = cached_graph
+        builder.graph = await graph_cache.get_or_build_session_graph(
+            session_cm_id,
+            year,
+            lambda: OptimizedSocialGraphBuilder(pb, random_seed=GRAPH_RANDOM_SEED).build_social_network(
+                year, session_cm_id
+            ),
+        )
 
         # Perform incremental update
-        update_result = builder.update_node_position(person_cm_id, update.new_bunk_cm_id, session_cm_id, year)
+        update_result = await asyncio.to_thread(
+            builder.update_node_position, person_cm_id, update.new_bunk_cm_id, session_cm_id, year
+        )
 
         # Invalidate caches for affected graphs
         invalidated_count = graph_cache.invalidate_for_person(person_cm_id)
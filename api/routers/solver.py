@@ -3,7 +3,8 @@ Solver Router - Endpoints for running the bunking solver.
 
 This router handles:
 - Running the OR-Tools constraint solver
-- Getting solver run status
+- Getting solver run status and progress
+- Cancelling solver runs
 - Pre-validation of solver inputs
 - Applying solver results
 - Multi-session solving
@@ -27,14 +28,16 @@ from pocketbase.client import ClientResponseError  # type: ignore[attr-defined]
 
 from bunking.config import ConfigLoader
 
-from ..dependencies import pb, solver_runs
+from ..dependencies import pb, session_snapshots, solver_executor, solver_runs, validation_sessions
 from ..schemas import (
     ClearAssignmentsRequest,
     MultiSessionSolverRequest,
     SolverRequest,
     SolverResponse,
 )
-from ..services.session_context import build_session_context
+from ..services.bulk_apply import BulkApplyError, build_apply_plan, execute_apply_plan
+from ..services.multi_session_scheduler import SessionSolve, run_multi_session_solve
+from ..services.session_context import SessionContext, build_session_context
 from ..services.solver_runner import run_solver_task_v2
 
 logger = logging.getLogger(__name__)
@@ -59,6 +62,10 @@ async def run_solver(request: SolverRequest, background_tasks: BackgroundTasks)
         time_limit = config.get_int("solver.time_limit_seconds", default=60)
         logger.info(f"Using config solver time limit: {time_limit}s")
 
+    # Hold a queue slot now; the background task fetches data before it submits
+    if not solver_executor.reserve(run_id):
+        raise HTTPException(status_code=503, detail="Solver queue is full, try again shortly")
+
     # Initialize run record
     solver_runs[run_id] = {
         "id": run_id,
@@ -80,6 +87,8 @@ async def run_solver(request: SolverRequest, background_tasks: BackgroundTasks)
         request.scenario,
         request.debug_constraints,
         request.config,
+        warm_start=request.warm_start,
+        change_penalty=request.change_penalty,
     )
 
     return SolverResponse(run_id=run_id, status="started", message="Solver run started in background")
@@ -107,6 +116,116 @@ async def get_solver_run(run_id: str) -> dict[str, Any]:
         "status": run["status"],
         "results": run.get("results"),
         "error_message": run.get("error_message"),
+        "progress": run.get("progress"),
+    }
+
+
+@router.post("/solver/run/{run_id}/cancel")
+async def cancel_solver_run(run_id: str) -> dict[str, Any]:
+    """Cancel a queued or running solver run."""
+    if run_id not in solver_runs:
+        raise HTTPException(status_code=404, detail="Solver run not found")
+
+    run = solver_runs[run_id]
+    if run["status"] not in ("pending", "running"):
+        raise HTTPException(status_code=409, detail=f"Solver run is already {run['status']}")
+
+    if "child_run_ids" in run:
+        # Multi-session parent: stop scheduling new sessions and cancel running ones
+        run["cancel_requested"] = True
+        for child_run_id in run["child_run_ids"]:
+            solver_executor.cancel(child_run_id)
+        return {"id": run_id, "status": "cancelling"}
+
+    if not solver_executor.cancel(run_id):
+        # A multi-session child still waiting for its turn, or a run just finishing
+        raise HTTPException(status_code=409, detail="Solver run is not cancellable yet, try again shortly")
+
+    return {"id": run_id, "status": "cancelling"}
+
+
+@router.post("/solver/snapshots/invalidate")
+async def invalidate_session_snapshots(session_cm_id: int | None = None, year: int | None = None) -> dict[str, Any]:
+    """Drop cached session data so the next call reloads from PocketBase.
+
+    Freshness probes pick up synced data on their own; this forces a reload
+    without waiting for them. With no arguments every snapshot is dropped;
+    session_cm_id and/or year narrow it down.
+    """
+    invalidated = session_snapshots.invalidate(session_cm_id, year)
+    return {"invalidated": invalidated, "stats": session_snapshots.get_stats()}
+
+
+async def _load_pre_validate_data(ctx: SessionContext) -> dict[str, Any]:
+    """Fetch the attendees, persons, requests, bunk plans and session names pre-validate checks."""
+    # Use pre-built filters from SessionContext
+    session_relation_filter = ctx.session_relation_filter
+    session_id_filter = ctx.session_id_filter
+
+    # Get all active, enrolled attendees for all related sessions
+    # Filter: is_active = 1 AND status_id = 2 (enrolled status)
+    # See CLAUDE.md "Attendee Active Status Filtering"
+    attendees = await asyncio.to_thread(
+        pb.collection("attendees").get_full_list,
+        query_params={
+            "filter": f"({session_relation_filter}) && year = {ctx.year} && is_active = 1 && status_id = 2",
+            "expand": "session",
+        },
+    )
+
+    # Create person lookup (using person_id field)
+    person_cm_ids = {getattr(a, "person_id", None) for a in attendees if getattr(a, "person_id", None)}
+
+    # Fetch persons to get names (with year filter for data integrity)
+    persons_dict: dict[int, Any] = {}
+    if person_cm_ids:
+        batch_size = 50
+        for i in range(0, len(person_cm_ids), batch_size):
+            batch_ids = list(person_cm_ids)[i : i + batch_size]
+            filter_str = " || ".join([f"cm_id = {cm_id}" for cm_id in batch_ids])
+            batch_persons = await asyncio.to_thread(
+                pb.collection("persons").get_full_list,
+                query_params={"filter": f"({filter_str}) && year = {ctx.year}"},
+            )
+            for person in batch_persons:
+                persons_dict[getattr(person, "cm_id", 0)] = person
+
+    # Get all bunk requests for related sessions
+    requests = await asyncio.to_thread(
+        pb.collection("bunk_requests").get_full_list,
+        query_params={
+            "filter": f'({session_id_filter}) && year = {ctx.year} && status = "resolved"',
+            "sort": "-priority",
+        },
+    )
+
+    # Get bunk plans for all related sessions (expand bunk to get gender)
+    logger.info(f"Pre-validate: Fetching bunk plans with filter: ({session_relation_filter}) && year = {ctx.year}")
+    bunk_plans = await asyncio.to_thread(
+        pb.collection("bunk_plans").get_full_list,
+        query_params={
+            "filter": f"({session_relation_filter}) && year = {ctx.year}",
+            "expand": "bunk",
+        },
+    )
+    logger.info(f"Pre-validate: Found {len(bunk_plans)} bunk plans")
+
+    # Get session names for better reporting (filter by year to avoid cross-year contamination)
+    all_sessions = await asyncio.to_thread(
+        pb.collection("camp_sessions").get_full_list,
+        query_params={
+            "filter": f"({' || '.join([f'cm_id = {sid}' for sid in ctx.related_session_ids])}) && year = {ctx.year}"
+        },
+    )
+    session_names = {getattr(s, "cm_id", 0): getattr(s, "name", "") for s in all_sessions}
+
+    return {
+        "attendees": attendees,
+        "person_cm_ids": person_cm_ids,
+        "persons": persons_dict,
+        "requests": requests,
+        "bunk_plans": bunk_plans,
+        "session_names": session_names,
     }
 
 
@@ -123,26 +242,17 @@ async def pre_validate_solver(request: SolverRequest) -> dict[str, Any]:
         # Build session context from request (validates session exists for year)
         ctx = await build_session_context(request.session_cm_id, request.year, pb)
 
-        # Load all data needed for validation
+        # Load all data needed for validation, reused while the session's data is unchanged
         logger.info(f"Pre-validating solver request for session {ctx.session_cm_id} year {ctx.year}")
-
-        # Use pre-built filters from SessionContext
-        session_relation_filter = ctx.session_relation_filter
-        session_id_filter = ctx.session_id_filter
-
-        # Get all active, enrolled attendees for all related sessions
-        # Filter: is_active = 1 AND status_id = 2 (enrolled status)
-        # See CLAUDE.md "Attendee Active Status Filtering"
-        attendees = await asyncio.to_thread(
-            pb.collection("attendees").get_full_list,
-            query_params={
-                "filter": f"({session_relation_filter}) && year = {ctx.year} && is_active = 1 && status_id = 2",
-                "expand": "session",
-            },
+        data = await session_snapshots.get_prepared(
+            pb, ctx.session_cm_id, ctx.year, None, "pre_validate", lambda: _load_pre_validate_data(ctx)
         )
-
-        # Create person lookup (using person_id field)
-        person_cm_ids = {getattr(a, "person_id", None) for a in attendees if getattr(a, "person_id", None)}
+        attendees = data["attendees"]
+        person_cm_ids = data["person_cm_ids"]
+        persons_dict: dict[int, Any] = data["persons"]
+        requests = data["requests"]
+        bunk_plans = data["bunk_plans"]
+        session_names: dict[int, str] = data["session_names"]
 
         # Build mapping of person_cm_id → session_type for gender counting
         # This allows us to exclude AG session enrollees from boys/girls counts
@@ -163,29 +273,6 @@ async def pre_validate_solver(request: SolverRequest) -> dict[str, Any]:
                 if session and hasattr(session, "cm_id"):
                     attendees_by_session[session.cm_id] += 1
 
-        # Fetch persons to get names (with year filter for data integrity)
-        persons_dict: dict[int, Any] = {}
-        if person_cm_ids:
-            batch_size = 50
-            for i in range(0, len(person_cm_ids), batch_size):
-                batch_ids = list(person_cm_ids)[i : i + batch_size]
-                filter_str = " || ".join([f"cm_id = {cm_id}" for cm_id in batch_ids])
-                batch_persons = await asyncio.to_thread(
-                    pb.collection("persons").get_full_list,
-                    query_params={"filter": f"({filter_str}) && year = {ctx.year}"},
-                )
-                for person in batch_persons:
-                    persons_dict[getattr(person, "cm_id", 0)] = person
-
-        # Get all bunk requests for related sessions
-        requests = await asyncio.to_thread(
-            pb.collection("bunk_requests").get_full_list,
-            query_params={
-                "filter": f'({session_id_filter}) && year = {ctx.year} && status = "resolved"',
-                "sort": "-priority",
-            },
-        )
-
         # Validation results
         errors = []
         warnings = []
@@ -285,17 +372,6 @@ async def pre_validate_solver(request: SolverRequest) -> dict[str, Any]:
         campers_with_requests = len(requests_by_person)
         campers_without_requests = total_campers - campers_with_requests
 
-        # Get bunk plans for all related sessions (expand bunk to get gender)
-        logger.info(f"Pre-validate: Fetching bunk plans with filter: ({session_relation_filter}) && year = {ctx.year}")
-        bunk_plans = await asyncio.to_thread(
-            pb.collection("bunk_plans").get_full_list,
-            query_params={
-                "filter": f"({session_relation_filter}) && year = {ctx.year}",
-                "expand": "bunk",
-            },
-        )
-        logger.info(f"Pre-validate: Found {len(bunk_plans)} bunk plans")
-
         # Calculate capacity: bunk_plans count × default capacity (from config)
         # This matches the frontend's capacity calculation approach
         config_loader = ConfigLoader.get_instance()
@@ -384,17 +460,6 @@ async def pre_validate_solver(request: SolverRequest) -> dict[str, Any]:
             # Fallback to total capacity error if gender breakdown doesn't explain it
             errors.append(f"Insufficient capacity: {total_campers} campers but only {total_capacity} beds available")
 
-        # Get session names for better reporting (filter by year to avoid cross-year contamination)
-        session_names: dict[int, str] = {}
-        all_sessions = await asyncio.to_thread(
-            pb.collection("camp_sessions").get_full_list,
-            query_params={
-                "filter": f"({' || '.join([f'cm_id = {sid}' for sid in ctx.related_session_ids])}) && year = {ctx.year}"
-            },
-        )
-        for s in all_sessions:
-            session_names[getattr(s, "cm_id", 0)] = getattr(s, "name", "")
-
         # Build session breakdown
         session_breakdown = []
         for sid, count in attendees_by_session.items():
@@ -441,7 +506,7 @@ async def analyze_solver_run(run_id: str) -> None:
 
 
 @router.post("/solver/apply/{run_id}")
-async def apply_solver_results(run_id: str) -> dict[str, str]:
+async def apply_solver_results(run_id: str) -> dict[str, Any]:
     """Apply the results of a solver run to the database."""
     session_cm_id = None
     scenario = None
@@ -482,168 +547,32 @@ async def apply_solver_results(run_id: str) -> dict[str, str]:
         run_year = datetime.now().year
         logger.warning(f"apply_solver_results: No year in run config/results, using current year {run_year}")
 
-    # Create ID cache for the run year
-    from ..services.id_cache import IDLookupCache
-
-    cache = IDLookupCache(pb, run_year)
-
-    # Build session context to get proper session filter (includes AG sessions)
-    # This ensures we get the correct attendee record for multi-enrolled campers
+    # Build session context to get the related (AG) sessions, so multi-enrolled
+    # campers are written against the attendee record for this session group
     if session_cm_id is None:
         raise HTTPException(status_code=400, detail="Session ID not found in solver run")
     ctx = await build_session_context(int(session_cm_id), run_year, pb)
-    session_filter = ctx.session_relation_filter
-
-    for person_cm_id_str, bunk_name in assignments.items():
-        try:
-            person_cm_id = int(person_cm_id_str)
-
-            bunks = await asyncio.to_thread(
-                pb.collection("bunks").get_full_list,
-                query_params={"filter": f'name = "{bunk_name}" && year = {run_year}'},
-            )
-
-            if not bunks:
-                logger.warning(f"Bunk {bunk_name} not found")
-                continue
-
-            bunk = bunks[0]
-            bunk_cm_id = getattr(bunk, "cm_id", None)
-            if bunk_cm_id is None:
-                logger.warning(f"Bunk {bunk_name} has no cm_id")
-                continue
-
-            if scenario:
-                collection_name = "bunk_assignments_draft"
-                person_pb_id = await cache.get_person_pb_id(person_cm_id)
-                if not person_pb_id:
-                    logger.warning(f"Person with cm_id {person_cm_id} not found")
-                    continue
-
-                existing = await asyncio.to_thread(
-                    pb.collection(collection_name).get_full_list,
-                    query_params={
-                        "filter": (f'person = "{person_pb_id}" && scenario = "{scenario}" && year = {run_year}')
-                    },
-                )
-
-                # Use session_filter to get correct attendee for multi-enrolled campers
-                attendees = await asyncio.to_thread(
-                    pb.collection("attendees").get_full_list,
-                    query_params={
-                        "filter": f'person_id = {person_cm_id} && year = {run_year} && status = "enrolled" && ({session_filter})',
-                        "expand": "session",
-                    },
-                )
-
-                if not attendees:
-                    logger.warning(
-                        f"No attendee record found for person CM ID {person_cm_id} in session(s) {ctx.related_session_ids}"
-                    )
-                    continue
-
-                attendee_expand = getattr(attendees[0], "expand", {}) or {}
-                session_data = (
-                    attendee_expand.get("session")
-                    if isinstance(attendee_expand, dict)
-                    else getattr(attendee_expand, "session", None)
-                )
-                actual_session_cm_id_val = (
-                    session_data.cm_id if session_data and hasattr(session_data, "cm_id") else None
-                )
-                if not actual_session_cm_id_val:
-                    logger.warning(f"No session cm_id found for attendee of person CM ID {person_cm_id}")
-                    continue
-                actual_session_cm_id = int(actual_session_cm_id_val)
-
-                # Use cache to resolve all PB IDs (cache handles the lookups properly)
-                bunk_pb_id = await cache.get_bunk_pb_id(int(bunk_cm_id))
-                session_pb_id = await cache.get_session_pb_id(actual_session_cm_id)
-                bunk_plan_pb_id = await cache.get_bunk_plan_id(int(bunk_cm_id), actual_session_cm_id, run_year)
-
-                if not all([bunk_pb_id, session_pb_id, bunk_plan_pb_id]):
-                    logger.warning(
-                        f"Failed to resolve PB IDs for person {person_cm_id}: "
-                        f"bunk={bunk_pb_id}, session={session_pb_id}, bunk_plan={bunk_plan_pb_id}"
-                    )
-                    continue
-
-                assignment_data = {
-                    "scenario": scenario,
-                    "person": person_pb_id,
-                    "session": session_pb_id,
-                    "bunk": bunk_pb_id,
-                    "bunk_plan": bunk_plan_pb_id,
-                    "year": run_year,
-                    "assignment_locked": False,
-                }
-            else:
-                collection_name = "bunk_assignments"
-
-                # Use session_filter to get correct attendee for multi-enrolled campers
-                attendees = await asyncio.to_thread(
-                    pb.collection("attendees").get_full_list,
-                    query_params={
-                        "filter": f'person_id = {person_cm_id} && year = {run_year} && status = "enrolled" && ({session_filter})',
-                        "expand": "session",
-                    },
-                )
-
-                if not attendees:
-                    logger.warning(
-                        f"No attendee record found for person CM ID {person_cm_id} in session(s) {ctx.related_session_ids}"
-                    )
-                    continue
 
-                attendee_expand = getattr(attendees[0], "expand", {}) or {}
-                session_data = (
-                    attendee_expand.get("session")
-                    if isinstance(attendee_expand, dict)
-                    else getattr(attendee_expand, "session", None)
-                )
-                actual_session_cm_id_raw = (
-                    session_data.cm_id if session_data and hasattr(session_data, "cm_id") else None
-                )
-                if not actual_session_cm_id_raw:
-                    logger.warning(f"No session cm_id found for attendee of person CM ID {person_cm_id}")
-                    continue
-                actual_session_cm_id = int(actual_session_cm_id_raw)
-
-                existing = await asyncio.to_thread(
-                    pb.collection(collection_name).get_full_list,
-                    query_params={
-                        "filter": (
-                            f"person.cm_id = {person_cm_id} && "
-                            f"session.cm_id = {actual_session_cm_id} && "
-                            f"year = {run_year}"
-                        ),
-                        "expand": "person,session,bunk",
-                    },
-                )
-
-                assignment_data = {
-                    "person_cm_id": person_cm_id,
-                    "session_cm_id": actual_session_cm_id,
-                    "bunk_cm_id": bunk_cm_id,
-                    "year": run_year,
-                    "assigned_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-                    "assigned_by": "solver",
-                }
-
-            if existing:
-                existing_record = existing[0]
-                existing_id_val = existing_record.get("id") if isinstance(existing_record, dict) else existing_record.id
-                existing_id = str(existing_id_val) if existing_id_val else ""
-                await asyncio.to_thread(pb.collection(collection_name).update, existing_id, assignment_data)
-            else:
-                await asyncio.to_thread(pb.collection(collection_name).create, assignment_data)
-
-        except Exception as e:
-            logger.error(f"Failed to update person {person_cm_id_str}: {e}")
-
-    table_name = "bunk_assignments_draft" if scenario else "bunk_assignments"
     assignments_dict: dict[str, Any] = assignments if isinstance(assignments, dict) else {}
-    return {"message": f"Applied {len(assignments_dict)} assignments to {table_name}"}
+    plan = await build_apply_plan(pb, assignments_dict, run_year, ctx.related_session_ids, scenario)
+    try:
+        result = await execute_apply_plan(pb, plan)
+    except BulkApplyError as e:
+        state = "rolled back" if e.rolled_back else "rollback incomplete"
+        raise HTTPException(status_code=500, detail=f"{e} ({state})")
+    finally:
+        # Cached session data for this session (or scenario) is now stale, even
+        # after a failed apply whose rollback may not have completed
+        session_snapshots.invalidate(int(session_cm_id), scenario=scenario)
+        validation_sessions.invalidate(int(session_cm_id), scenario=scenario)
+
+    return {
+        "message": f"Applied {len(assignments_dict)} assignments to {plan.collection}",
+        "created": result.created,
+        "updated": result.updated,
+        "unchanged": result.unchanged,
+        "skipped": result.skipped,
+    }
 
 
 # ========================================
@@ -680,6 +609,9 @@ async def run_multi_session_solver(
                 status_code=404, detail=f"No sessions found for parent ID {request.parent_session_cm_id}"
             )
 
+        if solver_executor.is_full:
+            raise HTTPException(status_code=503, detail="Solver queue is full, try again shortly")
+
         session_groups: dict[str, list[Any]] = {}
         if request.solve_by_sex:
             for session in child_sessions:
@@ -690,6 +622,11 @@ async def run_multi_session_solver(
         else:
             session_groups["all"] = child_sessions
 
+        # One parent run aggregates every child session; the scheduler solves
+        # them concurrently within a shared CP-SAT worker budget
+        parent_run_id = str(uuid4())
+        session_solves: list[SessionSolve] = []
+
         run_ids: dict[str, list[dict[str, Any]]] = {}
         for sex_group, sessions in session_groups.items():
             for session in sessions:
@@ -711,18 +648,9 @@ async def run_multi_session_solver(
                         "sex_group": sex_group,
                     },
                     "scenario": request.scenario,
+                    "parent_run_id": parent_run_id,
                 }
-
-                background_tasks.add_task(
-                    run_solver_task_v2,
-                    run_id,
-                    session_cm_id,
-                    request.year,
-                    request.respect_locks,
-                    time_limit,
-                    request.include_analysis,
-                    request.scenario,
-                )
+                session_solves.append(SessionSolve(run_id=run_id, session_cm_id=session_cm_id))
 
                 if sex_group not in run_ids:
                     run_ids[sex_group] = []
@@ -730,7 +658,29 @@ async def run_multi_session_solver(
                     {"run_id": run_id, "session_cm_id": session_cm_id, "session_name": session_name}
                 )
 
+        solver_runs[parent_run_id] = {
+            "id": parent_run_id,
+            "session_cm_id": request.parent_session_cm_id,
+            "status": "pending",
+            "created_at": datetime.now(UTC),
+            "config": {"respect_locks": request.respect_locks, "time_limit": time_limit},
+            "scenario": request.scenario,
+            "child_run_ids": [s.run_id for s in session_solves],
+        }
+
+        background_tasks.add_task(
+            run_multi_session_solve,
+            parent_run_id,
+            session_solves,
+            request.year,
+            request.respect_locks,
+            time_limit,
+            request.include_analysis,
+            request.scenario,
+        )
+
         return {
+            "parent_run_id": parent_run_id,
             "parent_session_cm_id": request.parent_session_cm_id,
             "total_sessions": len(child_sessions),
             "solver_runs": run_ids,
@@ -782,6 +732,9 @@ async def clear_session_assignments(session_cm_id: int, request: ClearAssignment
                 deletions_by_session[sid] += 1
                 total_deleted += 1
 
+        session_snapshots.invalidate(session_cm_id, ctx.year, scenario=request.scenario)
+        validation_sessions.invalidate(session_cm_id, ctx.year, scenario=request.scenario)
+
         session_names = {}
         all_sessions = await asyncio.to_thread(
             pb.collection("camp_sessions").get_full_list,
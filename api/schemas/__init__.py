@@ -52,7 +52,7 @@ from .solver import (
     SolverRequest,
     SolverResponse,
 )
-from .validation import ValidateBunkingRequest
+from .validation import ApplyAssignmentMovesRequest, AssignmentMoveRequest, ValidateBunkingRequest
 
 __all__ = [
     # Admin
@@ -84,6 +84,8 @@ __all__ = [
     "SolverRequest",
     "SolverResponse",
     # Validation
+    "ApplyAssignmentMovesRequest",
+    "AssignmentMoveRequest",
     "ValidateBunkingRequest",
     # Metrics
     "ComparisonDelta",
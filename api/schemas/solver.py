@@ -4,7 +4,7 @@ Pydantic schemas for solver endpoints.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -22,6 +22,11 @@ class SolverRequest(BaseModel):
     debug_constraints: dict[str, Any] | None = None
     debug_mode: bool = False
     config: dict[str, Any] | None = None
+    # Seed the solve with existing assignments ("current") or the last completed run ("last_run")
+    warm_start: Literal["current", "last_run"] | None = None
+    change_penalty: int = Field(
+        default=0, ge=0, description="Objective penalty per warm-started camper moved to another bunk (0 disables)"
+    )
 
 
 class MultiSessionSolverRequest(BaseModel):
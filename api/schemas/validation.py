@@ -13,3 +13,17 @@ class ValidateBunkingRequest(BaseModel):
     session_cm_id: int
     year: int
     scenario: str | None = None  # PocketBase ID of saved_scenario (relation)
+
+
+class AssignmentMoveRequest(BaseModel):
+    """One camper move; bunk_cm_id=None unassigns the camper."""
+
+    person_cm_id: int
+    bunk_cm_id: int | None = None
+
+
+class ApplyAssignmentMovesRequest(BaseModel):
+    """Moves to apply to an open validation session."""
+
+    moves: list[AssignmentMoveRequest]
+    expected_version: int | None = None  # Rejected with 409 if the session has moved on
@@ -26,6 +26,7 @@ from .extractors import (
     extract_years_at_camp,
 )
 from .id_cache import IDLookupCache
+from .metrics_cache import MetricsDataCache
 from .metrics_repository import MetricsRepository
 from .retention_service import RetentionService
 
@@ -33,6 +34,7 @@ __all__ = [
     # Existing
     "IDLookupCache",
     # Repository
+    "MetricsDataCache",
     "MetricsRepository",
     # Services
     "RetentionService",
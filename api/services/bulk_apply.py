@@ -0,0 +1,336 @@
+"""
+Bulk Apply Service - Writes solver results to PocketBase in batches.
+
+Applying a solver run used to cost several queries per camper (bunk by name,
+person/session/bunk_plan ID lookups, attendee and existing-assignment
+queries) followed by one write each. This service splits the work in two:
+
+1. build_apply_plan preloads every ID map the write needs in a handful of
+   chunked queries and diffs the solver output against the current
+   assignments, so campers already in their target bunk cost nothing.
+2. execute_apply_plan sends the remaining creates/updates through the
+   PocketBase batch API (`POST /api/batch`). Each batch is a transaction;
+   when a later batch fails the earlier ones are compensated (updates
+   restored, creates deleted), so the apply is all-or-nothing. If the batch
+   API is disabled on the server the same plan runs through a bounded
+   concurrent writer with the same compensation on failure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from pocketbase import PocketBase
+
+from .bulk_loader import fetch_by_ids
+
+logger = logging.getLogger(__name__)
+
+# Requests per /api/batch call (must not exceed the server's batch.maxRequests)
+BATCH_SIZE = 100
+
+# Writes in flight at once when falling back to individual requests
+MAX_CONCURRENT_WRITES = 8
+
+# Fields compared and restored when an existing assignment is updated
+_TRACKED_FIELDS = ("session", "bunk", "bunk_plan")
+
+
+class BulkApplyError(Exception):
+    """Raised when an apply fails; `rolled_back` reports whether compensation succeeded."""
+
+    def __init__(self, message: str, rolled_back: bool = True):
+        super().__init__(message)
+        self.rolled_back = rolled_back
+
+
+@dataclass(slots=True)
+class AssignmentWrite:
+    """One create (record_id is None) or update of an assignment record."""
+
+    person_cm_id: int
+    data: dict[str, Any]
+    record_id: str | None = None
+    # Field values before the update, written back on rollback
+    previous: dict[str, Any] | None = None
+
+
+@dataclass
+class ApplyPlan:
+    """Changed records for one apply, plus what was left alone."""
+
+    collection: str
+    writes: list[AssignmentWrite] = field(default_factory=list)
+    unchanged: int = 0
+    # (person_cm_id, reason) for campers that could not be resolved
+    skipped: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def creates(self) -> int:
+        return sum(1 for w in self.writes if w.record_id is None)
+
+    @property
+    def updates(self) -> int:
+        return sum(1 for w in self.writes if w.record_id is not None)
+
+
+@dataclass
+class ApplyResult:
+    """Outcome of executing an ApplyPlan."""
+
+    created: int
+    updated: int
+    unchanged: int
+    skipped: int
+    mode: str  # "batch", "concurrent" or "noop"
+
+
+def _quoted(values: list[str]) -> list[str]:
+    return [f'"{v}"' for v in values]
+
+
+async def build_apply_plan(
+    client: PocketBase,
+    assignments: dict[str, str],
+    year: int,
+    session_cm_ids: list[int],
+    scenario: str | None = None,
+) -> ApplyPlan:
+    """Resolve solver output into the minimal set of record writes.
+
+    Args:
+        client: PocketBase client
+        assignments: person CM ID (as string) -> bunk name, as stored in solver results
+        year: Year the run was solved for
+        session_cm_ids: The session and its related (AG) sessions
+        scenario: Draft scenario ID; None writes production bunk_assignments
+
+    Returns:
+        ApplyPlan with only the records whose bunk, session or bunk_plan changes;
+        a bunk with no bunk_plan for the session is written with bunk_plan cleared
+    """
+    collection = "bunk_assignments_draft" if scenario else "bunk_assignments"
+    plan = ApplyPlan(collection=collection)
+    targets = {int(person_cm_id): bunk_name for person_cm_id, bunk_name in assignments.items()}
+    if not targets:
+        return plan
+
+    semaphore = asyncio.Semaphore(4)
+    session_relation_filter = " || ".join(f"session.cm_id = {sid}" for sid in session_cm_ids)
+    bunks, persons, sessions, attendees = await asyncio.gather(
+        asyncio.to_thread(client.collection("bunks").get_full_list, query_params={"filter": f"year = {year}"}),
+        fetch_by_ids(client, "persons", "cm_id", targets, f"year = {year}", semaphore=semaphore),
+        fetch_by_ids(client, "camp_sessions", "cm_id", session_cm_ids, f"year = {year}", semaphore=semaphore),
+        fetch_by_ids(
+            client,
+            "attendees",
+            "person_id",
+            targets,
+            f'year = {year} && status = "enrolled" && ({session_relation_filter})',
+            semaphore=semaphore,
+        ),
+    )
+
+    bunk_by_name = {getattr(b, "name", None): b for b in bunks if getattr(b, "cm_id", None) is not None}
+    person_pb_ids = {int(p.cm_id): p.id for p in persons}
+    session_pb_ids = [s.id for s in sessions]
+    # First enrolled attendee wins, as with the per-camper lookup it replaces
+    attendee_session: dict[int, str] = {}
+    for attendee in attendees:
+        attendee_session.setdefault(int(attendee.person_id), attendee.session)
+
+    existing_filter = f'scenario = "{scenario}" && year = {year}' if scenario else f"year = {year}"
+    plans, existing = await asyncio.gather(
+        fetch_by_ids(client, "bunk_plans", "session", _quoted(session_pb_ids), f"year = {year}", semaphore=semaphore),
+        fetch_by_ids(
+            client, collection, "person", _quoted(list(person_pb_ids.values())), existing_filter, semaphore=semaphore
+        ),
+    )
+    plan_ids = {(p.bunk, p.session): p.id for p in plans}
+    # Drafts hold one record per person per scenario; production one per person per session
+    existing_by_key: dict[Any, Any] = {}
+    for record in existing:
+        key = record.person if scenario else (record.person, record.session)
+        existing_by_key.setdefault(key, record)
+
+    for person_cm_id, bunk_name in targets.items():
+        bunk = bunk_by_name.get(bunk_name)
+        person_pb_id = person_pb_ids.get(person_cm_id)
+        session_pb_id = attendee_session.get(person_cm_id)
+        if bunk is None:
+            plan.skipped.append((person_cm_id, f"bunk {bunk_name} not found"))
+            continue
+        if person_pb_id is None:
+            plan.skipped.append((person_cm_id, "person not found"))
+            continue
+        if session_pb_id is None:
+            plan.skipped.append((person_cm_id, "no enrolled attendee record"))
+            continue
+        # A bunk without a plan for this session still takes the camper, with bunk_plan cleared
+        bunk_plan_id = plan_ids.get((bunk.id, session_pb_id), "")
+        if not bunk_plan_id:
+            logger.warning(f"No bunk_plan for bunk {bunk_name}; writing person {person_cm_id} without one")
+
+        data: dict[str, Any] = {"session": session_pb_id, "bunk": bunk.id, "bunk_plan": bunk_plan_id}
+        record = existing_by_key.get(person_pb_id if scenario else (person_pb_id, session_pb_id))
+        if record is not None:
+            previous = {name: getattr(record, name, "") for name in _TRACKED_FIELDS}
+            if previous == data:
+                plan.unchanged += 1
+                continue
+            if scenario:
+                data["assignment_locked"] = False
+                previous["assignment_locked"] = getattr(record, "assignment_locked", False)
+            plan.writes.append(
+                AssignmentWrite(person_cm_id=person_cm_id, data=data, record_id=record.id, previous=previous)
+            )
+        else:
+            data.update({"person": person_pb_id, "year": year})
+            if scenario:
+                data.update({"scenario": scenario, "assignment_locked": False})
+            plan.writes.append(AssignmentWrite(person_cm_id=person_cm_id, data=data))
+
+    for person_cm_id, reason in plan.skipped:
+        logger.warning(f"Skipping person {person_cm_id} in apply: {reason}")
+    logger.info(
+        f"Apply plan for {collection}: {plan.creates} creates, {plan.updates} updates, "
+        f"{plan.unchanged} unchanged, {len(plan.skipped)} skipped"
+    )
+    return plan
+
+
+def _batch_request(collection: str, write: AssignmentWrite) -> dict[str, Any]:
+    url = f"/api/collections/{collection}/records"
+    if write.record_id is None:
+        return {"method": "POST", "url": url, "body": write.data}
+    return {"method": "PATCH", "url": f"{url}/{write.record_id}", "body": write.data}
+
+
+def _undo_request(collection: str, write: AssignmentWrite, created_id: str | None) -> dict[str, Any]:
+    url = f"/api/collections/{collection}/records"
+    if write.record_id is None:
+        return {"method": "DELETE", "url": f"{url}/{created_id}"}
+    return {"method": "PATCH", "url": f"{url}/{write.record_id}", "body": write.previous or {}}
+
+
+def _is_batch_disabled(error: Exception) -> bool:
+    return getattr(error, "status", None) in (403, 404)
+
+
+async def _send_batch(client: PocketBase, requests: list[dict[str, Any]]) -> list[Any]:
+    response = await asyncio.to_thread(client.send, "/api/batch", {"method": "POST", "body": {"requests": requests}})
+    return response if isinstance(response, list) else []
+
+
+async def _execute_batched(client: PocketBase, plan: ApplyPlan, batch_size: int) -> None:
+    """Send writes in transactional batches, compensating earlier batches on failure."""
+    # (write, created record ID) for every write already committed
+    applied: list[tuple[AssignmentWrite, str | None]] = []
+    for start in range(0, len(plan.writes), batch_size):
+        chunk = plan.writes[start : start + batch_size]
+        try:
+            responses = await _send_batch(client, [_batch_request(plan.collection, w) for w in chunk])
+        except Exception as e:
+            if not applied:
+                raise
+            logger.error(f"Batch apply failed after {len(applied)} writes, rolling back: {e}")
+            rolled_back = await _rollback_batched(client, plan.collection, applied, batch_size)
+            raise BulkApplyError(f"Failed to apply assignments: {e}", rolled_back=rolled_back) from e
+        for write, response in zip(chunk, responses, strict=False):
+            body = response.get("body", {}) if isinstance(response, dict) else {}
+            applied.append((write, body.get("id") if write.record_id is None else None))
+
+
+async def _rollback_batched(
+    client: PocketBase, collection: str, applied: list[tuple[AssignmentWrite, str | None]], batch_size: int
+) -> bool:
+    undo = [_undo_request(collection, write, created_id) for write, created_id in reversed(applied)]
+    try:
+        for start in range(0, len(undo), batch_size):
+            await _send_batch(client, undo[start : start + batch_size])
+    except Exception as e:
+        logger.error(f"Rollback of {collection} apply failed: {e}")
+        return False
+    return True
+
+
+async def _execute_concurrent(client: PocketBase, plan: ApplyPlan, max_concurrency: int) -> None:
+    """Send writes individually with bounded concurrency, compensating on any failure."""
+    records = client.collection(plan.collection)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def write_one(write: AssignmentWrite) -> str | None:
+        async with semaphore:
+            if write.record_id is None:
+                created = await asyncio.to_thread(records.create, write.data)
+                return str(created.id)
+            await asyncio.to_thread(records.update, write.record_id, write.data)
+            return None
+
+    async def undo_one(write: AssignmentWrite, created_id: str | None) -> None:
+        async with semaphore:
+            if write.record_id is None:
+                if created_id is not None:
+                    await asyncio.to_thread(records.delete, created_id)
+            else:
+                await asyncio.to_thread(records.update, write.record_id, write.previous or {})
+
+    results = await asyncio.gather(*(write_one(w) for w in plan.writes), return_exceptions=True)
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if not failures:
+        return
+
+    logger.error(f"{len(failures)} of {len(plan.writes)} writes failed, rolling back: {failures[0]}")
+    succeeded = [(w, r) for w, r in zip(plan.writes, results, strict=True) if not isinstance(r, BaseException)]
+    undo_results = await asyncio.gather(*(undo_one(w, r) for w, r in succeeded), return_exceptions=True)
+    rolled_back = not any(isinstance(r, BaseException) for r in undo_results)
+    raise BulkApplyError(f"Failed to apply assignments: {failures[0]}", rolled_back=rolled_back)
+
+
+async def execute_apply_plan(
+    client: PocketBase,
+    plan: ApplyPlan,
+    batch_size: int = BATCH_SIZE,
+    max_concurrency: int = MAX_CONCURRENT_WRITES,
+    use_batch: bool = True,
+) -> ApplyResult:
+    """Write an ApplyPlan all-or-nothing.
+
+    Args:
+        client: PocketBase client
+        plan: Plan from build_apply_plan
+        batch_size: Requests per /api/batch call
+        max_concurrency: Writes in flight for the non-batch fallback
+        use_batch: Try the batch API first (falls back if the server rejects it)
+
+    Raises:
+        BulkApplyError: If any write failed; earlier writes have been undone
+            unless `rolled_back` is False
+    """
+    mode = "noop"
+    if plan.writes:
+        mode = "concurrent"
+        if use_batch:
+            try:
+                await _execute_batched(client, plan, batch_size)
+                mode = "batch"
+            except BulkApplyError:
+                raise
+            except Exception as e:
+                # Nothing was committed - the first batch failed as a whole
+                if not _is_batch_disabled(e):
+                    raise BulkApplyError(f"Failed to apply assignments: {e}") from e
+                logger.info("PocketBase batch API unavailable, using concurrent writes")
+        if mode == "concurrent":
+            await _execute_concurrent(client, plan, max_concurrency)
+
+    return ApplyResult(
+        created=plan.creates,
+        updated=plan.updates,
+        unchanged=plan.unchanged,
+        skipped=len(plan.skipped),
+        mode=mode,
+    )
@@ -0,0 +1,177 @@
+"""
+Bulk Loader Service - Concurrent, chunked PocketBase fetches by ID list.
+
+Solver data preparation looks up hundreds of records by CampMinder ID. Each
+lookup is an OR-chained filter (`cm_id = 1 || cm_id = 2 || ...`) sent as a
+GET query string, so it has to be split into chunks. This service:
+- Packs as many clauses into each chunk as fit under the URL length limit
+- Issues the chunk queries concurrently, bounded by a semaphore
+- Converts persons and bunk requests into compact typed records, so the
+  solver input is built from plain slotted objects instead of SDK Records
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from pocketbase import PocketBase
+
+logger = logging.getLogger(__name__)
+
+# Characters available for the filter expression of a single query. Proxies and
+# servers commonly cap request lines at 8KB; the rest is headroom for the path,
+# the other query params and percent-encoding.
+MAX_FILTER_LENGTH = 4000
+
+# PocketBase queries in flight at once per bulk fetch
+MAX_CONCURRENT_QUERIES = 4
+
+
+@dataclass(slots=True)
+class PersonRecord:
+    """Compact persons row - the fields the solver reads."""
+
+    id: str
+    cm_id: int
+    first_name: str = ""
+    last_name: str = ""
+    grade: int = 0
+    birthdate: str = ""
+    gender: str | None = None
+
+    @classmethod
+    def from_record(cls, record: Any) -> PersonRecord:
+        return cls(
+            id=record.id,
+            cm_id=getattr(record, "cm_id", 0),
+            first_name=getattr(record, "first_name", ""),
+            last_name=getattr(record, "last_name", ""),
+            grade=getattr(record, "grade", 0),
+            birthdate=getattr(record, "birthdate", ""),
+            gender=getattr(record, "gender", None),
+        )
+
+
+@dataclass(slots=True)
+class BunkRequestRecord:
+    """Compact bunk_requests row - the fields the solver reads."""
+
+    id: str
+    requester_id: int
+    request_type: str
+    session_id: int
+    year: int
+    requestee_id: int | None = None
+    priority: int = 5
+    confidence_score: float = 0.0
+    status: str = "pending"
+    original_text: str | None = None
+    age_preference_target: str | None = None
+    friend_group_id: str | None = None
+    source_field: str | None = None
+
+    @classmethod
+    def from_record(cls, record: Any) -> BunkRequestRecord:
+        return cls(
+            id=record.id,
+            requester_id=record.requester_id,
+            request_type=record.request_type,
+            session_id=record.session_id,
+            year=record.year,
+            requestee_id=getattr(record, "requestee_id", None),
+            priority=getattr(record, "priority", 5),
+            confidence_score=getattr(record, "confidence_score", 0.0),
+            status=getattr(record, "status", "pending"),
+            original_text=getattr(record, "original_text", None),
+            age_preference_target=getattr(record, "age_preference_target", None),
+            friend_group_id=getattr(record, "friend_group_id", None),
+            source_field=getattr(record, "source_field", None),
+        )
+
+
+def chunk_filter_clauses(
+    field: str,
+    values: Iterable[Any],
+    max_length: int = MAX_FILTER_LENGTH,
+) -> list[str]:
+    """Split `field = v1 || field = v2 || ...` into chunks under max_length.
+
+    Duplicate values are dropped. Every chunk is wrapped in parentheses so it
+    can be AND-ed with a base filter.
+
+    Args:
+        field: Filter field (e.g. "cm_id" or "person.cm_id")
+        values: Values to match (numbers are inserted unquoted)
+        max_length: Maximum length of each OR-chain
+
+    Returns:
+        List of filter expressions, empty if there are no values
+    """
+    chunks: list[str] = []
+    current: list[str] = []
+    length = 0
+    for value in dict.fromkeys(values):
+        clause = f"{field} = {value}"
+        added = len(clause) + (4 if current else 0)  # " || "
+        if current and length + added > max_length:
+            chunks.append(f"({' || '.join(current)})")
+            current, length = [], 0
+            added = len(clause)
+        current.append(clause)
+        length += added
+    if current:
+        chunks.append(f"({' || '.join(current)})")
+    return chunks
+
+
+async def fetch_by_ids(
+    client: PocketBase,
+    collection: str,
+    field: str,
+    values: Iterable[Any],
+    base_filter: str | None = None,
+    expand: str | None = None,
+    convert: Callable[[Any], Any] | None = None,
+    max_concurrency: int = MAX_CONCURRENT_QUERIES,
+    max_filter_length: int = MAX_FILTER_LENGTH,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[Any]:
+    """Fetch every record of a collection whose `field` is in `values`.
+
+    Args:
+        client: PocketBase client
+        collection: Collection name
+        field: Field to match against values
+        values: IDs to look up
+        base_filter: Extra condition AND-ed to every chunk (e.g. "year = 2025")
+        expand: Relations to expand
+        convert: Optional per-record converter (e.g. PersonRecord.from_record)
+        max_concurrency: Maximum chunk queries in flight
+        max_filter_length: Maximum length of each chunk's OR-chain
+        semaphore: Shared limit when several bulk fetches run together
+            (overrides max_concurrency)
+
+    Returns:
+        Records (or converted records) in chunk order
+    """
+    chunks = chunk_filter_clauses(field, values, max_filter_length)
+    if not chunks:
+        return []
+
+    semaphore = semaphore or asyncio.Semaphore(max_concurrency)
+
+    async def fetch_chunk(chunk: str) -> list[Any]:
+        query_params = {"filter": f"{chunk} && ({base_filter})" if base_filter else chunk}
+        if expand:
+            query_params["expand"] = expand
+        async with semaphore:
+            records = await asyncio.to_thread(client.collection(collection).get_full_list, query_params=query_params)
+        return [convert(r) for r in records] if convert else list(records)
+
+    results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+    logger.debug(f"Bulk fetched {collection} by {field}: {len(chunks)} queries")
+    return [record for chunk_records in results for record in chunk_records]
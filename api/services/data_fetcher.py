@@ -9,6 +9,7 @@ This service handles:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 from collections import defaultdict
 from typing import Any
@@ -26,7 +27,8 @@ from bunking.direct_solver import (
 )
 from pocketbase import PocketBase
 
-from ..dependencies import pb
+from ..dependencies import pb, solver_runs
+from .bulk_loader import MAX_CONCURRENT_QUERIES, BunkRequestRecord, PersonRecord, fetch_by_ids
 from .session_context import build_session_context
 
 logger = logging.getLogger(__name__)
@@ -97,30 +99,49 @@ async def fetch_session_data_v2(
         bunk_cm_ids = list(set(bunk_cm_ids))
 
         # Fetch bunks by CampMinder IDs (with year filter to avoid cross-year duplicates)
-        bunks_list = []
-        if bunk_cm_ids:
-            filter_str = " || ".join([f"cm_id = {cm_id}" for cm_id in bunk_cm_ids])
-            bunks_list = await asyncio.to_thread(
-                client.collection("bunks").get_full_list,
-                query_params={"filter": f"({filter_str}) && year = {ctx.year}"},
-            )
+        bunks_list = await fetch_by_ids(client, "bunks", "cm_id", bunk_cm_ids, f"year = {ctx.year}")
 
         # Get person CampMinder IDs from attendees
         person_cm_ids = [getattr(a, "person_id", None) for a in attendees if getattr(a, "person_id", None)]
 
-        # Fetch persons using CampMinder IDs (with year filter)
-        persons_dict = {}
-        batch_size = 50
-        if person_cm_ids:
-            for i in range(0, len(person_cm_ids), batch_size):
-                batch_ids = person_cm_ids[i : i + batch_size]
-                filter_str = " || ".join([f"cm_id = {cm_id}" for cm_id in batch_ids])
-                batch_persons = await asyncio.to_thread(
-                    client.collection("persons").get_full_list,
-                    query_params={"filter": f"({filter_str}) && year = {ctx.year}"},
-                )
-                for person in batch_persons:
-                    persons_dict[getattr(person, "cm_id", 0)] = person
+        # Persons, bunk requests and assignments are looked up by person ID in
+        # chunked queries; all three run concurrently under one query limit
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        assignments_collection = "bunk_assignments_draft" if scenario else "bunk_assignments"
+        assignments_filter = f"({session_relation_filter}) && year = {ctx.year}"
+        if scenario:
+            # Add scenario filter for draft assignments
+            assignments_filter += f' && scenario = "{scenario}"'
+        persons, requests, assignments = await asyncio.gather(
+            fetch_by_ids(
+                client,
+                "persons",
+                "cm_id",
+                person_cm_ids,
+                f"year = {ctx.year}",
+                convert=PersonRecord.from_record,
+                semaphore=semaphore,
+            ),
+            fetch_by_ids(
+                client,
+                "bunk_requests",
+                "requester_id",
+                person_cm_ids,
+                f'({session_id_filter}) && year = {ctx.year} && status = "resolved"',
+                convert=BunkRequestRecord.from_record,
+                semaphore=semaphore,
+            ),
+            fetch_by_ids(
+                client,
+                assignments_collection,
+                "person.cm_id",
+                person_cm_ids,
+                assignments_filter,
+                expand="person,session,bunk",
+                semaphore=semaphore,
+            ),
+        )
+        persons_dict = {person.cm_id: person for person in persons}
 
         # Attach persons to attendees for compatibility
         for attendee in attendees:
@@ -130,39 +151,6 @@ async def fetch_session_data_v2(
                     attendee.expand = {}
                 attendee.expand["person"] = persons_dict[person_id]
 
-        # Fetch bunk requests
-        requests = []
-        if person_cm_ids:
-            for i in range(0, len(person_cm_ids), batch_size):
-                batch_ids = person_cm_ids[i : i + batch_size]
-                filter_str = " || ".join([f"requester_id = {cm_id}" for cm_id in batch_ids])
-                batch_requests = await asyncio.to_thread(
-                    client.collection("bunk_requests").get_full_list,
-                    query_params={
-                        "filter": f'({filter_str}) && ({session_id_filter}) && year = {ctx.year} && status = "resolved"',
-                    },
-                )
-                requests.extend(batch_requests)
-
-        # Fetch bunk assignments - from draft table if scenario provided, else production
-        assignments = []
-        assignments_collection = "bunk_assignments_draft" if scenario else "bunk_assignments"
-        if person_cm_ids:
-            for i in range(0, len(person_cm_ids), batch_size):
-                batch_ids = person_cm_ids[i : i + batch_size]
-                filter_str = " || ".join([f"person.cm_id = {cm_id}" for cm_id in batch_ids])
-                # Add scenario filter for draft assignments
-                base_filter = f"({filter_str}) && ({session_relation_filter}) && year = {ctx.year}"
-                if scenario:
-                    base_filter += f' && scenario = "{scenario}"'
-                batch_assignments = await asyncio.to_thread(
-                    client.collection(assignments_collection).get_full_list,
-                    query_params={
-                        "filter": base_filter,
-                        "expand": "person,session,bunk",
-                    },
-                )
-                assignments.extend(batch_assignments)
         logger.info(f"Fetched {len(assignments)} assignments from {assignments_collection}")
 
         return attendees, bunks_list, requests, assignments, bunk_plans
@@ -237,6 +225,58 @@ async def fetch_historical_bunking(
         return []
 
 
+async def fetch_last_solver_run_assignments(
+    session_cm_id: int,
+    pb_client: PocketBase | None = None,
+    scenario: str | None = None,
+) -> dict[int, str]:
+    """Fetch the assignments of the most recent completed solver run for a session.
+
+    Used to warm-start a re-solve. Runs still held in memory are preferred;
+    otherwise the latest completed run recorded in PocketBase is used.
+
+    Args:
+        session_cm_id: CampMinder session ID
+        pb_client: Optional PocketBase client (defaults to global)
+        scenario: Only consider runs for this scenario (None = production runs)
+
+    Returns:
+        Mapping of person_cm_id to bunk name (empty if no completed run exists)
+    """
+    in_memory = [
+        run
+        for run in solver_runs.values()
+        if run.get("status") == "completed"
+        and session_cm_id in (run.get("session_cm_id"), run.get("session_id"))
+        and run.get("scenario") == scenario
+        and run.get("results")
+    ]
+    if in_memory:
+        latest = max(in_memory, key=lambda run: run["completed_at"])
+        results = latest["results"]
+    else:
+        client = pb_client or pb
+        filter_str = f'session_cm_id = {session_cm_id} && status = "completed"'
+        filter_str += f' && scenario = "{scenario}"' if scenario else ' && scenario = ""'
+        try:
+            records = await asyncio.to_thread(
+                client.collection("solver_runs").get_list,
+                1,
+                1,
+                query_params={"filter": filter_str, "sort": "-created"},
+            )
+        except ClientResponseError as e:
+            logger.warning(f"Failed to fetch previous solver run for session {session_cm_id}: {e}")
+            return {}
+        if not records.items:
+            return {}
+        raw_results = getattr(records.items[0], "results", None) or {}
+        results = json.loads(raw_results) if isinstance(raw_results, str) else raw_results
+
+    assignments = results.get("assignments", {}) if isinstance(results, dict) else {}
+    return {int(person_cm_id): bunk_name for person_cm_id, bunk_name in assignments.items()}
+
+
 def prepare_direct_solver_input(
     attendees: list[Any],
     bunks: list[Any],
@@ -6,9 +6,9 @@ Provides efficient CM ID <-> PB ID translations with caching.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
+from bunking.sync.bunk_request_processor.data.async_pocketbase import AsyncPocketBase
 from pocketbase import PocketBase
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,9 @@ class IDLookupCache:
     The bunk_assignments_draft table uses PocketBase relation IDs, but the solver
     works internally with CampMinder IDs. This class provides efficient translation
     between the two ID systems with caching to minimize database queries.
+
+    Lookups go through the client's async twin, so they run on the event loop
+    over pooled connections instead of a thread per query.
     """
 
     def __init__(self, pb_client: PocketBase, year: int):
@@ -34,13 +37,16 @@ class IDLookupCache:
         self._session_pb_to_cm: dict[str, int] = {}
         self._bunk_plan_cache: dict[tuple[int, int, int], str] = {}  # (bunk_cm_id, session_cm_id, year) -> pb_id
 
+    @property
+    def _async_pb(self) -> AsyncPocketBase:
+        return AsyncPocketBase.from_client(self.pb)
+
     async def get_person_pb_id(self, cm_id: int) -> str | None:
         """Get PocketBase ID for a person from CampMinder ID."""
         if cm_id in self._person_cm_to_pb:
             return self._person_cm_to_pb[cm_id]
 
-        persons = await asyncio.to_thread(
-            self.pb.collection("persons").get_full_list,
+        persons = await self._async_pb.collection("persons").get_full_list(
             query_params={"filter": f"cm_id = {cm_id} && year = {self.year}"},
         )
         if persons:
@@ -55,8 +61,7 @@ class IDLookupCache:
         if cm_id in self._bunk_cm_to_pb:
             return self._bunk_cm_to_pb[cm_id]
 
-        bunks = await asyncio.to_thread(
-            self.pb.collection("bunks").get_full_list,
+        bunks = await self._async_pb.collection("bunks").get_full_list(
             query_params={"filter": f"cm_id = {cm_id} && year = {self.year}"},
         )
         if bunks:
@@ -71,8 +76,7 @@ class IDLookupCache:
         if cm_id in self._session_cm_to_pb:
             return self._session_cm_to_pb[cm_id]
 
-        sessions = await asyncio.to_thread(
-            self.pb.collection("camp_sessions").get_full_list,
+        sessions = await self._async_pb.collection("camp_sessions").get_full_list(
             query_params={"filter": f"cm_id = {cm_id} && year = {self.year}"},
         )
         if sessions:
@@ -88,7 +92,7 @@ class IDLookupCache:
             return self._person_pb_to_cm[pb_id]
 
         try:
-            person = await asyncio.to_thread(self.pb.collection("persons").get_one, pb_id)
+            person = await self._async_pb.collection("persons").get_one(pb_id)
             cm_id_val = getattr(person, "cm_id", None)
             if cm_id_val is None:
                 return None
@@ -105,7 +109,7 @@ class IDLookupCache:
             return self._bunk_pb_to_cm[pb_id]
 
         try:
-            bunk = await asyncio.to_thread(self.pb.collection("bunks").get_one, pb_id)
+            bunk = await self._async_pb.collection("bunks").get_one(pb_id)
             cm_id_val = getattr(bunk, "cm_id", None)
             if cm_id_val is None:
                 return None
@@ -122,7 +126,7 @@ class IDLookupCache:
             return self._session_pb_to_cm[pb_id]
 
         try:
-            session = await asyncio.to_thread(self.pb.collection("camp_sessions").get_one, pb_id)
+            session = await self._async_pb.collection("camp_sessions").get_one(pb_id)
             cm_id_val = getattr(session, "cm_id", None)
             if cm_id_val is None:
                 return None
@@ -136,8 +140,7 @@ class IDLookupCache:
     async def batch_load_persons(self, session_cm_id: int, year: int) -> None:
         """Pre-load person mappings for all attendees in a session."""
         try:
-            attendees = await asyncio.to_thread(
-                self.pb.collection("attendees").get_full_list,
+            attendees = await self._async_pb.collection("attendees").get_full_list(
                 query_params={"filter": f"session_cm_id = {session_cm_id} && year = {year}", "expand": "person"},
             )
             for attendee in attendees:
@@ -152,8 +155,7 @@ class IDLookupCache:
     async def batch_load_bunks(self, session_cm_id: int, year: int) -> None:
         """Pre-load bunk mappings for all bunks in a session's bunk plans."""
         try:
-            bunk_plans = await asyncio.to_thread(
-                self.pb.collection("bunk_plans").get_full_list,
+            bunk_plans = await self._async_pb.collection("bunk_plans").get_full_list(
                 query_params={"filter": f"session_cm_id = {session_cm_id} && year = {year}", "expand": "bunk"},
             )
             for plan in bunk_plans:
@@ -189,8 +191,7 @@ class IDLookupCache:
 
         # Look up the bunk_plan using PB IDs
         try:
-            plans = await asyncio.to_thread(
-                self.pb.collection("bunk_plans").get_full_list,
+            plans = await self._async_pb.collection("bunk_plans").get_full_list(
                 query_params={"filter": f'bunk = "{bunk_pb_id}" && session = "{session_pb_id}" && year = {year}'},
             )
             if plans:
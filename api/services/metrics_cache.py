@@ -0,0 +1,272 @@
+"""Metrics data cache - memoizes PocketBase reads for the metrics endpoints.
+
+Metrics dashboards that span several years re-read the same attendees,
+persons, sessions and camper_history for every load, and the retention,
+retention-trends and historical endpoints overlap in the years they read.
+Results are cached per (collection, year, variant), where the variant names
+the query's options (status, session types) rather than its filter string.
+Enrollment history is cached per person under one entry per (collection,
+year), so requests for overlapping person sets only fetch the persons not
+seen yet instead of caching one entry per 100-ID filter batch.
+
+Past years change rarely and expire after a long TTL; the current (and any
+future) year expires after a short one so new registrations show up. The Go
+sync does not notify this API, so data it writes shows up when entries
+expire, or immediately after POST /api/metrics/cache/invalidate.
+
+At most `max_size` entries are kept; the least recently used are evicted.
+Concurrent requests for the same uncached entry share one fetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_PAST_YEAR_TTL_SECONDS = 3600
+DEFAULT_MAX_SIZE = 64
+
+CacheKey = tuple[str, int, tuple[Any, ...]]
+
+# Cache per PocketBase client, see MetricsDataCache.for_client
+_client_caches: weakref.WeakKeyDictionary[Any, MetricsDataCache] = weakref.WeakKeyDictionary()
+
+
+class MetricsDataCache:
+    """Bounded TTL cache of metrics query results keyed by (collection, year, variant)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        past_year_ttl_seconds: float = DEFAULT_PAST_YEAR_TTL_SECONDS,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of current/future-year entries.
+            past_year_ttl_seconds: Lifetime of past-year entries.
+            max_size: Maximum entries kept (least recently used are evicted).
+        """
+        self.ttl = ttl_seconds
+        self.past_year_ttl = past_year_ttl_seconds
+        self.max_size = max_size
+        # key -> (expires_at, value), least recently used first
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Task[Any]] = {}
+        # Per in-flight key, bumped on invalidation so its fetch is not cached
+        self._generations: dict[CacheKey, int] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def for_client(
+        cls,
+        client: Any,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        past_year_ttl_seconds: float = DEFAULT_PAST_YEAR_TTL_SECONDS,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> MetricsDataCache:
+        """Get the cache shared by every repository built on this client.
+
+        MetricsRepository is created per request, so the cache has to outlive
+        it; keying by client keeps data from different servers (or test
+        doubles) apart.
+        """
+        cache = _client_caches.get(client)
+        if cache is None:
+            cache = cls(ttl_seconds, past_year_ttl_seconds, max_size)
+            _client_caches[client] = cache
+        return cache
+
+    @staticmethod
+    def make_key(collection: str, year: int, variant: tuple[Any, ...] = ()) -> CacheKey:
+        """Build the cache key for a query."""
+        return (collection, year, variant)
+
+    async def get_or_fetch(
+        self,
+        collection: str,
+        year: int,
+        variant: tuple[Any, ...],
+        fetch: Callable[[], Awaitable[list[Any]]],
+    ) -> list[Any]:
+        """Return cached records for a query, fetching them on a miss.
+
+        Args:
+            collection: Collection name.
+            year: Year the query reads; decides which TTL applies.
+            variant: Hashable query options (e.g. statuses, session types).
+            fetch: Coroutine factory that reads the records.
+
+        Returns:
+            A new list of the (shared) records.
+        """
+        key = self.make_key(collection, year, variant)
+        entry = self._get_entry(key)
+        if entry is not None:
+            self._hits += 1
+            return list(entry[1])
+
+        self._misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_fetch(key, year, fetch)
+
+        # Shield the shared fetch from cancellation of any one waiter
+        return list(await asyncio.shield(task))
+
+    async def get_or_fetch_by_person(
+        self,
+        collection: str,
+        year: int,
+        variant: tuple[Any, ...],
+        person_ids: set[int],
+        fetch_missing: Callable[[list[int]], Awaitable[dict[int, list[Any]]]],
+    ) -> dict[int, list[Any]]:
+        """Return cached records per person, fetching only persons not cached yet.
+
+        All persons share one entry per (collection, year, variant), which
+        keeps the expiry of the records it already holds when new persons
+        are added.
+
+        Args:
+            collection: Collection name.
+            year: Year the query reads; decides which TTL applies.
+            variant: Hashable query options.
+            person_ids: Persons to return.
+            fetch_missing: Reads the records of the given persons, grouped by person.
+
+        Returns:
+            Records per requested person (empty list for persons without any).
+        """
+        key = self.make_key(collection, year, variant)
+        # Let a running fetch for this entry land first, so its persons are not refetched
+        while (running := self._inflight.get(key)) is not None:
+            try:
+                await asyncio.shield(running)
+            except Exception:
+                break
+
+        entry = self._get_entry(key)
+        expires_at, known = entry if entry is not None else (None, {})
+        missing = sorted(person_ids - known.keys())
+        if not missing:
+            self._hits += 1
+            return {pid: list(known[pid]) for pid in person_ids}
+
+        self._misses += 1
+
+        async def fetch() -> dict[int, list[Any]]:
+            fetched = await fetch_missing(missing)
+            merged = dict(known)
+            for pid in missing:
+                merged[pid] = fetched.get(pid, [])
+            return merged
+
+        by_person = await asyncio.shield(self._start_fetch(key, year, fetch, expires_at))
+        return {pid: list(by_person.get(pid, [])) for pid in person_ids}
+
+    def _get_entry(self, key: CacheKey) -> tuple[float, Any] | None:
+        """Return an unexpired entry and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _start_fetch(
+        self,
+        key: CacheKey,
+        year: int,
+        fetch: Callable[[], Awaitable[Any]],
+        expires_at: float | None = None,
+    ) -> asyncio.Task[Any]:
+        """Start the shared fetch for a key."""
+        generation = self._generations.setdefault(key, 0)
+        task = asyncio.ensure_future(self._fetch(key, year, fetch, generation, expires_at))
+        task.add_done_callback(lambda done: self._fetch_finished(key, done))
+        self._inflight[key] = task
+        return task
+
+    async def _fetch(
+        self,
+        key: CacheKey,
+        year: int,
+        fetch: Callable[[], Awaitable[Any]],
+        generation: int,
+        expires_at: float | None,
+    ) -> Any:
+        """Run a fetch and cache its result unless its key was invalidated meanwhile."""
+        value = await fetch()
+        if generation == self._generations.get(key, 0):
+            if expires_at is None:
+                ttl = self.past_year_ttl if year < datetime.now().year else self.ttl
+                expires_at = time.monotonic() + ttl
+            self._store(key, expires_at, value)
+        return value
+
+    def _store(self, key: CacheKey, expires_at: float, value: Any) -> None:
+        """Cache a value, evicting the least recently used entries at capacity."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            logger.debug(f"Evicted cached metrics query {evicted}")
+
+    def _fetch_finished(self, key: CacheKey, task: asyncio.Task[Any]) -> None:
+        """Forget a finished fetch."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._generations.pop(key, None)
+
+    def invalidate(self, year: int | None = None, collection: str | None = None) -> int:
+        """Drop cached entries. Omitted arguments match everything.
+
+        Fetches in flight for matching keys finish for their waiters but are
+        not cached.
+
+        Args:
+            year: Year to drop.
+            collection: Collection to drop.
+
+        Returns:
+            Number of entries removed.
+        """
+
+        def matches(key: CacheKey) -> bool:
+            return (collection is None or key[0] == collection) and (year is None or key[1] == year)
+
+        keys = [key for key in self._entries if matches(key)]
+        for key in keys:
+            del self._entries[key]
+        for key in self._inflight:
+            if matches(key):
+                self._generations[key] = self._generations.get(key, 0) + 1
+        if keys:
+            logger.info(f"Invalidated {len(keys)} cached metrics queries")
+        return len(keys)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total > 0 else 0.0,
+            "fetches_in_flight": len(self._inflight),
+        }
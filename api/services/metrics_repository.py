@@ -8,10 +8,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
-if TYPE_CHECKING:
-    from pocketbase import PocketBase
+from bunking.sync.bunk_request_processor.data.pocketbase_wrapper import PocketBaseWrapper
+from pocketbase import PocketBase
+
+from ..settings import get_settings
+from .metrics_cache import MetricsDataCache
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +29,46 @@ class MetricsRepository:
     # Batch size for person ID queries to avoid overly long filter strings
     BATCH_SIZE = 100
 
-    def __init__(self, pb: PocketBase) -> None:
+    def __init__(self, pb: PocketBase | PocketBaseWrapper, cache: MetricsDataCache | None = None) -> None:
         """Initialize with PocketBase client.
 
+        A plain SDK client is wrapped in PocketBaseWrapper, whose get_full_list
+        fetches pages concurrently; page size and fan-out come from settings.
+
         Args:
             pb: PocketBase client instance.
+            cache: Query cache; defaults to the one shared by all repositories on pb.
+        """
+        self.pb = PocketBaseWrapper(pb) if isinstance(pb, PocketBase) else pb
+        settings = get_settings()
+        self.page_size = settings.pocketbase_page_size
+        self.page_concurrency = settings.pocketbase_page_concurrency
+        self.cache = cache or MetricsDataCache.for_client(
+            pb,
+            settings.metrics_cache_ttl_seconds,
+            settings.metrics_cache_past_year_ttl_seconds,
+            settings.metrics_cache_max_entries,
+        )
+
+    async def _read_full_list(self, collection: str, query_params: dict[str, Any]) -> list[Any]:
+        """Fetch all matching records of a collection off the event loop."""
+        return await asyncio.to_thread(
+            self.pb.collection(collection).get_full_list,
+            batch=self.page_size,
+            query_params=query_params,
+            concurrency=self.page_concurrency,
+        )
+
+    async def _get_full_list(
+        self, collection: str, year: int, variant: tuple[Any, ...], query_params: dict[str, Any]
+    ) -> list[Any]:
+        """Fetch all matching records of a collection, memoized per (collection, year, variant).
+
+        variant must identify query_params for that collection and year, see MetricsDataCache.
         """
-        self.pb = pb
+        return await self.cache.get_or_fetch(
+            collection, year, variant, lambda: self._read_full_list(collection, query_params)
+        )
 
     async def fetch_attendees(
         self,
@@ -51,24 +87,26 @@ class MetricsRepository:
         Returns:
             List of attendee records with session expansion.
         """
+        variant: tuple[Any, ...]
         if status_filter is None:
             # Default: active enrolled
             filter_str = f"year = {year} && is_active = 1 && status_id = 2"
+            variant = ("active_enrolled",)
         elif isinstance(status_filter, list):
             # Multiple statuses - build OR filter
             status_conditions = " || ".join(f'status = "{s}"' for s in status_filter)
             filter_str = f"year = {year} && ({status_conditions})"
+            variant = ("statuses", *sorted(status_filter))
         elif status_filter == "enrolled":
             # Enrolled uses the strict is_active + status_id filter
             filter_str = f"year = {year} && is_active = 1 && status_id = 2"
+            variant = ("active_enrolled",)
         else:
             # Single non-enrolled status
             filter_str = f'year = {year} && status = "{status_filter}"'
+            variant = ("status", status_filter)
 
-        return await asyncio.to_thread(
-            self.pb.collection("attendees").get_full_list,
-            query_params={"filter": filter_str, "expand": "session"},
-        )
+        return await self._get_full_list("attendees", year, variant, {"filter": filter_str, "expand": "session"})
 
     async def fetch_persons(self, year: int) -> dict[int, Any]:
         """Fetch all persons for a given year and return as dict by cm_id.
@@ -82,10 +120,7 @@ class MetricsRepository:
         Returns:
             Dictionary mapping cm_id (int) to person record.
         """
-        persons = await asyncio.to_thread(
-            self.pb.collection("persons").get_full_list,
-            query_params={"filter": f"year = {year}"},
-        )
+        persons = await self._get_full_list("persons", year, (), {"filter": f"year = {year}"})
         # Ensure int keys for consistent lookup (PocketBase may return float)
         return {int(getattr(p, "cm_id", 0)): p for p in persons}
 
@@ -108,9 +143,8 @@ class MetricsRepository:
             type_filter = " || ".join(f'session_type = "{t}"' for t in session_types)
             filter_str = f"({filter_str}) && ({type_filter})"
 
-        sessions = await asyncio.to_thread(
-            self.pb.collection("camp_sessions").get_full_list,
-            query_params={"filter": filter_str},
+        sessions = await self._get_full_list(
+            "camp_sessions", year, ("session_types", tuple(sorted(session_types or []))), {"filter": filter_str}
         )
         # Ensure int keys for consistent lookup
         return {int(getattr(s, "cm_id", 0)): s for s in sessions}
@@ -140,9 +174,8 @@ class MetricsRepository:
                 type_filter = " || ".join(f'session_type = "{t}"' for t in session_types)
                 filter_str = f"({filter_str}) && ({type_filter})"
 
-            records = await asyncio.to_thread(
-                self.pb.collection("camper_history").get_full_list,
-                query_params={"filter": filter_str},
+            records = await self._get_full_list(
+                "camper_history", year, ("session_types", tuple(sorted(session_types or []))), {"filter": filter_str}
             )
 
             return records
@@ -170,20 +203,26 @@ class MetricsRepository:
         if not person_ids:
             return []
 
-        sorted_ids = sorted(person_ids)
-        all_results: list[Any] = []
-
-        for i in range(0, len(sorted_ids), self.BATCH_SIZE):
-            batch_ids = sorted_ids[i : i + self.BATCH_SIZE]
-            person_filter = " || ".join(f"person_id = {pid}" for pid in batch_ids)
-            filter_str = f"({person_filter}) && status_id = 2 && year <= {max_year}"
-
-            batch_results = await asyncio.to_thread(
-                self.pb.collection("attendees").get_full_list,
-                query_params={"filter": filter_str, "expand": "session"},
-            )
-            all_results.extend(batch_results)
+        async def fetch_missing(missing: list[int]) -> dict[int, list[Any]]:
+            by_person: dict[int, list[Any]] = {}
+            for i in range(0, len(missing), self.BATCH_SIZE):
+                batch_ids = missing[i : i + self.BATCH_SIZE]
+                person_filter = " || ".join(f"person_id = {pid}" for pid in batch_ids)
+                filter_str = f"({person_filter}) && status_id = 2 && year <= {max_year}"
+
+                batch_results = await self._read_full_list("attendees", {"filter": filter_str, "expand": "session"})
+                for record in batch_results:
+                    by_person.setdefault(int(getattr(record, "person_id", 0)), []).append(record)
+            return by_person
+
+        # Cached per person, so overlapping person sets across requests only fetch the new persons
+        history = await self.cache.get_or_fetch_by_person(
+            "attendees", max_year, ("summer_history",), person_ids, fetch_missing
+        )
 
+        all_results: list[Any] = []
+        for pid in sorted(history):
+            all_results.extend(history[pid])
         return all_results
 
     def build_history_by_person(self, records: list[Any]) -> dict[int, Any]:
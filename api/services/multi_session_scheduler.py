@@ -0,0 +1,214 @@
+"""
+Multi-Session Scheduler - Solves the child sessions of a parent session in parallel.
+
+Child sessions are independent subproblems (campers never cross session
+boundaries), so they can be solved concurrently. The scheduler:
+- Loads every session's solver input up front to size the subproblems
+- Starts the largest sessions first so the longest solve never runs last
+- Splits a shared CP-SAT worker budget across the solves running at once,
+  so N concurrent solves never oversubscribe the CPU
+- Rolls child status and progress up into one parent run in solver_runs
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from bunking.models_v2 import DirectSolverInput
+
+from ..dependencies import authenticate_task_pb, create_task_pb_client, solver_runs
+from ..settings import get_settings
+from .solver_runner import load_solver_input, run_solver_task_v2
+
+logger = logging.getLogger(__name__)
+
+# How often parent progress is refreshed while children solve
+PARENT_PROGRESS_INTERVAL_SECONDS = 1.0
+
+
+@dataclass
+class SessionSolve:
+    """One child-session subproblem of a multi-session run."""
+
+    run_id: str
+    session_cm_id: int
+    solver_input: DirectSolverInput | None = None
+
+    @property
+    def size(self) -> int:
+        """Number of campers to place (used for largest-first ordering)."""
+        return len(self.solver_input.persons) if self.solver_input else 0
+
+
+def allocate_workers(available: int, open_slots: int) -> int:
+    """Worker share for the next solve to start.
+
+    The next solve gets an even share of the idle budget across the slots
+    about to be filled, rounded up so the largest (earliest) solve gets
+    any remainder. Never more than is available, and always at least one
+    worker (callers only start a solve while workers are available).
+    """
+    if open_slots <= 0:
+        return max(1, available)
+    return max(1, min(available, math.ceil(available / open_slots)))
+
+
+def summarize_children(child_run_ids: list[str]) -> dict[str, Any]:
+    """Aggregate status counts and per-child progress for a parent run."""
+    counts = {"pending": 0, "running": 0, "completed": 0, "failed": 0}
+    sessions: dict[str, Any] = {}
+    for run_id in child_run_ids:
+        child = solver_runs.get(run_id, {})
+        status = child.get("status", "pending")
+        counts[status] = counts.get(status, 0) + 1
+        sessions[run_id] = {
+            "session_cm_id": child.get("session_cm_id"),
+            "status": status,
+            "num_workers": child.get("num_workers"),
+            "progress": child.get("progress"),
+        }
+    return {"total": len(child_run_ids), **counts, "sessions": sessions}
+
+
+async def run_multi_session_solve(
+    parent_run_id: str,
+    sessions: list[SessionSolve],
+    year: int,
+    respect_locks: bool,
+    time_limit: int,
+    include_analysis: bool = False,
+    scenario: str | None = None,
+    max_concurrent: int | None = None,
+    worker_budget: int | None = None,
+) -> None:
+    """Background task that solves every child session under one parent run.
+
+    Args:
+        parent_run_id: solver_runs entry that aggregates the children
+        sessions: Child sessions, each with its own pre-created solver_runs entry
+        max_concurrent: Solves running at once (defaults to SOLVER_MAX_PROCESSES)
+        worker_budget: CP-SAT workers shared by running solves (defaults to SOLVER_WORKER_BUDGET)
+    """
+    settings = get_settings()
+    max_concurrent = max_concurrent or settings.solver_max_processes
+    worker_budget = worker_budget or settings.solver_worker_budget
+    parent = solver_runs[parent_run_id]
+    child_run_ids = [s.run_id for s in sessions]
+
+    parent["status"] = "running"
+    parent["started_at"] = datetime.now(UTC)
+
+    try:
+        # Load all inputs first so subproblems can be ordered by size
+        task_pb = create_task_pb_client()
+        await authenticate_task_pb(task_pb)
+        loaded = await asyncio.gather(
+            *(load_solver_input(task_pb, s.session_cm_id, year, respect_locks, scenario) for s in sessions),
+            return_exceptions=True,
+        )
+        for session, result in zip(sessions, loaded, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to load data for session {session.session_cm_id}: {result}")
+                _fail_child(session.run_id, f"Failed to load session data: {result}")
+            else:
+                session.solver_input = result
+
+        pending = sorted((s for s in sessions if s.solver_input is not None), key=lambda s: s.size, reverse=True)
+        logger.info(
+            f"Multi-session run {parent_run_id}: {len(pending)} sessions, "
+            f"{max_concurrent} concurrent, {worker_budget} workers shared"
+        )
+
+        running: dict[asyncio.Task[None], tuple[str, int]] = {}  # task -> (child run_id, workers held)
+        finishing: set[asyncio.Task[None]] = set()  # solve over, results still being recorded
+        available = worker_budget
+
+        while pending or running:
+            if parent.get("cancel_requested"):
+                for session in pending:
+                    _fail_child(session.run_id, "Solver run cancelled", cancelled=True)
+                pending = []
+
+            # Fill free slots, largest session first
+            while pending and len(running) < max_concurrent and available > 0:
+                open_slots = min(max_concurrent - len(running), len(pending))
+                workers = allocate_workers(available, open_slots)
+                session = pending.pop(0)
+                available -= workers
+                solver_runs[session.run_id]["num_workers"] = workers
+                logger.info(f"Starting session {session.session_cm_id} ({session.size} campers) with {workers} workers")
+                task = asyncio.create_task(
+                    run_solver_task_v2(
+                        session.run_id,
+                        session.session_cm_id,
+                        year,
+                        respect_locks,
+                        time_limit,
+                        include_analysis,
+                        scenario,
+                        solver_input=session.solver_input,
+                        num_workers=workers,
+                    )
+                )
+                running[task] = (session.run_id, workers)
+
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(
+                running.keys(), timeout=PARENT_PROGRESS_INTERVAL_SECONDS, return_when=asyncio.FIRST_COMPLETED
+            )
+            # Workers go back to the pool as soon as a solve ends, before its results are recorded
+            for task, (run_id, workers) in list(running.items()):
+                if task in done or solver_runs[run_id].get("status") in ("completed", "failed"):
+                    del running[task]
+                    available += workers
+                    if task not in done:
+                        finishing.add(task)
+            parent["progress"] = summarize_children(child_run_ids)
+
+        if finishing:
+            await asyncio.gather(*finishing)
+
+        summary = summarize_children(child_run_ids)
+        parent["progress"] = summary
+        parent["completed_at"] = datetime.now(UTC)
+        if parent.get("cancel_requested"):
+            parent["status"] = "failed"
+            parent["cancelled"] = True
+            parent["error_message"] = "Solver run cancelled"
+        elif summary["completed"] > 0:
+            parent["status"] = "completed"
+            if summary["failed"]:
+                parent["error_message"] = f"{summary['failed']} of {summary['total']} sessions failed"
+        else:
+            parent["status"] = "failed"
+            parent["error_message"] = "No session produced a solution"
+        logger.info(
+            f"Multi-session run {parent_run_id} finished: {summary['completed']} completed, {summary['failed']} failed"
+        )
+
+    except Exception as e:
+        logger.error(f"Multi-session run {parent_run_id} failed: {e}", exc_info=True)
+        for run_id in child_run_ids:
+            if solver_runs.get(run_id, {}).get("status") == "pending":
+                _fail_child(run_id, str(e))
+        parent["status"] = "failed"
+        parent["error_message"] = str(e)
+        parent["completed_at"] = datetime.now(UTC)
+        parent["progress"] = summarize_children(child_run_ids)
+
+
+def _fail_child(run_id: str, message: str, cancelled: bool = False) -> None:
+    """Mark a child run that never reached the solver as failed."""
+    child = solver_runs[run_id]
+    child["status"] = "failed"
+    child["error_message"] = message
+    child["completed_at"] = datetime.now(UTC)
+    if cancelled:
+        child["cancelled"] = True
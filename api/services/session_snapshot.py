@@ -0,0 +1,268 @@
+"""
+Session Snapshot Cache - Reuses prepared session data across calls.
+
+Building a DirectSolverInput takes a dozen PocketBase queries (attendees,
+persons, bunks, bunk_plans, bunk_requests, assignments, history), and the
+pre-validate, validate-bunking and score endpoints each load much of the same
+data in their own shape. Staff typically validate, solve, re-solve and score
+the same session back to back, so each prepared value is cached per
+(session, year, scenario) and kind, and reused until the underlying data
+changes.
+
+Freshness is checked by probing each source collection for its row count and
+latest `updated` timestamp (one tiny query per collection), so writes made by
+a CampMinder sync or directly through PocketBase are picked up on the next
+probe. Probes are skipped entirely for calls within `revalidate_seconds` of
+the last check; assignment writes made through the API invalidate entries
+immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from bunking.models_v2 import DirectBunk, DirectPerson, DirectSolverInput
+from pocketbase import PocketBase
+
+logger = logging.getLogger(__name__)
+
+# Year-scoped collections the solver input is built from
+SNAPSHOT_COLLECTIONS = ("attendees", "persons", "bunks", "bunk_plans", "bunk_requests", "bunk_assignments")
+
+SnapshotKey = tuple[int, int, str | None]  # (session_cm_id, year, scenario)
+
+# Kind of the prepared DirectSolverInput; endpoints cache their own inputs under other kinds
+SOLVER_INPUT = "solver_input"
+
+
+def key_matches(
+    key: SnapshotKey, session_cm_id: int | None = None, year: int | None = None, scenario: str | None = None
+) -> bool:
+    """Whether a (session_cm_id, year, scenario) key matches. Omitted arguments match everything.
+
+    Shared by the session-scoped caches so their invalidate() calls agree.
+    """
+    return (
+        (session_cm_id is None or key[0] == session_cm_id)
+        and (year is None or key[1] == year)
+        and (scenario is None or key[2] == scenario)
+    )
+
+
+@dataclass
+class SessionSnapshot:
+    """A value prepared from one session's data, plus lookup maps for solver input."""
+
+    key: SnapshotKey
+    value: Any
+    # collection -> (row count, latest updated) when the snapshot was taken
+    versions: dict[str, tuple[int, str]]
+    kind: str = SOLVER_INPUT
+    created_at: float = field(default_factory=time.time)
+    checked_at: float = field(default_factory=time.time)
+    persons_by_cm_id: dict[int, DirectPerson] = field(default_factory=dict)
+    bunks_by_cm_id: dict[int, DirectBunk] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if isinstance(self.value, DirectSolverInput):
+            if not self.persons_by_cm_id:
+                self.persons_by_cm_id = self.value.person_by_cm_id
+            if not self.bunks_by_cm_id:
+                self.bunks_by_cm_id = {b.campminder_id: b for b in self.value.bunks}
+
+    @property
+    def solver_input(self) -> DirectSolverInput:
+        """The prepared solver input (for SOLVER_INPUT snapshots)."""
+        return cast(DirectSolverInput, self.value)
+
+
+async def probe_versions(client: PocketBase, year: int, scenario: str | None = None) -> dict[str, tuple[int, str]]:
+    """Fetch (row count, latest updated) for every snapshot source collection.
+
+    Row counts catch deletions, which do not move the latest `updated` value.
+    """
+
+    async def probe(collection: str, filter_str: str) -> tuple[str, tuple[int, str]]:
+        result = await asyncio.to_thread(
+            client.collection(collection).get_list,
+            1,
+            1,
+            query_params={"filter": filter_str, "sort": "-updated", "fields": "updated"},
+        )
+        latest = str(getattr(result.items[0], "updated", "")) if result.items else ""
+        return collection, (result.total_items, latest)
+
+    probes = [probe(collection, f"year = {year}") for collection in SNAPSHOT_COLLECTIONS]
+    if scenario:
+        probes.append(probe("bunk_assignments_draft", f'year = {year} && scenario = "{scenario}"'))
+    return dict(await asyncio.gather(*probes))
+
+
+class SessionSnapshotCache:
+    """In-process cache of SessionSnapshots with change-based invalidation.
+
+    Entries are keyed by (session, year, scenario) and kind, so each session's
+    solver input and per-endpoint prepared values are cached side by side.
+    """
+
+    def __init__(self, ttl_seconds: int = 900, max_size: int = 20, revalidate_seconds: float = 5.0):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Hard expiry regardless of probes
+            max_size: Maximum snapshots kept (least recently used are evicted)
+            revalidate_seconds: Calls within this window of the last probe skip it
+        """
+        self._snapshots: dict[tuple[SnapshotKey, str], SessionSnapshot] = {}
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._revalidate = revalidate_seconds
+        self._lock = threading.RLock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    async def get_solver_input(
+        self,
+        client: PocketBase,
+        session_cm_id: int,
+        year: int,
+        scenario: str | None,
+        loader: Callable[[], Awaitable[DirectSolverInput]],
+    ) -> DirectSolverInput:
+        """Return the solver input for a session, loading it on a miss.
+
+        The returned input is a private copy, so callers may filter locks or
+        add hints without affecting the cached snapshot.
+
+        Args:
+            client: PocketBase client used for freshness probes
+            loader: Builds the solver input from PocketBase on a miss
+        """
+        solver_input = await self._get_value(client, (session_cm_id, year, scenario), SOLVER_INPUT, loader)
+        return cast(DirectSolverInput, solver_input).model_copy(deep=True)
+
+    async def get_prepared(
+        self,
+        client: PocketBase,
+        session_cm_id: int,
+        year: int,
+        scenario: str | None,
+        kind: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return another value prepared from a session's data, loading it on a miss.
+
+        Shares the solver input's freshness probes and invalidation. The
+        returned value is a deep copy, so callers may mutate it.
+
+        Args:
+            client: PocketBase client used for freshness probes
+            kind: Name of the prepared value (e.g. "validation_inputs")
+            loader: Builds the value from PocketBase on a miss
+        """
+        return copy.deepcopy(await self._get_value(client, (session_cm_id, year, scenario), kind, loader))
+
+    async def _get_value(
+        self, client: PocketBase, key: SnapshotKey, kind: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for (key, kind) when fresh, else load and cache it."""
+        entry_key = (key, kind)
+        now = time.time()
+        with self._lock:
+            snapshot = self._snapshots.get(entry_key)
+            if snapshot and now - snapshot.created_at > self._ttl:
+                del self._snapshots[entry_key]
+                snapshot = None
+
+        if snapshot and now - snapshot.checked_at <= self._revalidate:
+            return self._hit(snapshot)
+
+        # Probe before loading so changes made during the load invalidate the result
+        session_cm_id, year, scenario = key
+        try:
+            versions = await probe_versions(client, year, scenario)
+        except Exception as e:
+            # Without versions freshness cannot be judged; load and do not cache
+            logger.warning(f"Session snapshot probe failed, loading uncached: {e}")
+            return await loader()
+        if snapshot and snapshot.versions == versions:
+            snapshot.checked_at = time.time()
+            return self._hit(snapshot)
+
+        with self._lock:
+            self._miss_count += 1
+        logger.info(f"Session snapshot miss ({kind}) for session {session_cm_id} year {year} scenario={scenario}")
+        value = await loader()
+        snapshot = SessionSnapshot(key=key, value=value, versions=versions, kind=kind)
+        with self._lock:
+            if len(self._snapshots) >= self._max_size and entry_key not in self._snapshots:
+                oldest = min(self._snapshots, key=lambda k: self._snapshots[k].checked_at)
+                del self._snapshots[oldest]
+            self._snapshots[entry_key] = snapshot
+        return value
+
+    def _hit(self, snapshot: SessionSnapshot) -> Any:
+        with self._lock:
+            self._hit_count += 1
+        logger.debug(f"Session snapshot hit ({snapshot.kind}) for {snapshot.key}")
+        return snapshot.value
+
+    def get_snapshot(
+        self, session_cm_id: int, year: int, scenario: str | None = None, kind: str = SOLVER_INPUT
+    ) -> SessionSnapshot | None:
+        """Return the cached snapshot without checking freshness (None if absent)."""
+        with self._lock:
+            return self._snapshots.get(((session_cm_id, year, scenario), kind))
+
+    def invalidate(self, session_cm_id: int | None = None, year: int | None = None, scenario: str | None = None) -> int:
+        """Drop snapshots whose key matches, see key_matches.
+
+        scenario=None matches production and every scenario of the session,
+        since scenarios share its attendees, bunks and requests.
+
+        Returns:
+            Number of snapshots removed
+        """
+        with self._lock:
+            matching = [
+                entry_key
+                for entry_key, snapshot in self._snapshots.items()
+                if key_matches(snapshot.key, session_cm_id, year, scenario)
+            ]
+            for entry_key in matching:
+                del self._snapshots[entry_key]
+        if matching:
+            logger.info(f"Invalidated {len(matching)} session snapshots")
+        return len(matching)
+
+    def clear(self) -> int:
+        """Drop every snapshot."""
+        return self.invalidate()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache stats
+        """
+        with self._lock:
+            total_requests = self._hit_count + self._miss_count
+            hit_rate = self._hit_count / total_requests if total_requests > 0 else 0.0
+
+            return {
+                "cache_size": len(self._snapshots),
+                "hit_count": self._hit_count,
+                "miss_count": self._miss_count,
+                "hit_rate": round(hit_rate, 3),
+                "total_requests": total_requests,
+                "ttl_seconds": self._ttl,
+                "max_size": self._max_size,
+                "revalidate_seconds": self._revalidate,
+            }
@@ -0,0 +1,335 @@
+"""
+Solver Executor Service - Runs the bunking solver in worker processes.
+
+A CP-SAT solve is CPU-bound and can take the full time limit (60s+). Running it
+inside a FastAPI background task blocks the event loop, so every other request
+stalls while a session solves. This service moves model build and solve into a
+ProcessPoolExecutor so the API stays responsive and several sessions can solve
+on separate cores.
+
+Features:
+- Bounded queue: at most `max_pending` runs may be reserved, queued or running
+- Cancellation: queued runs are dropped, running solves are stopped early
+- Progress: solver progress is streamed back to the API process as dicts
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.managers import SyncManager
+from typing import Any
+
+from bunking.models_v2 import DirectSolverInput, DirectSolverOutput
+
+logger = logging.getLogger(__name__)
+
+# How often the API process drains worker progress messages
+PROGRESS_POLL_SECONDS = 0.5
+
+
+class SolverQueueFullError(Exception):
+    """Raised when the solver queue has no room for another run."""
+
+
+@dataclass
+class SolveJob:
+    """Everything a worker process needs to build and solve one model.
+
+    Must stay picklable - it is sent to the worker process as-is.
+    """
+
+    solver_input: DirectSolverInput
+    time_limit: float
+    debug_constraints: dict[str, Any] = field(default_factory=dict)
+    analyze_infeasibility: bool = True
+    # CP-SAT search workers; None uses the SOLVER_NUM_WORKERS default
+    num_workers: int | None = None
+
+
+@dataclass
+class SolveOutcome:
+    """Result returned from a worker process."""
+
+    output: DirectSolverOutput | None
+    cancelled: bool = False
+    infeasibility_cause: str | None = None
+
+
+def solve_in_worker(job: SolveJob, progress_queue: Any, cancel_event: Any) -> SolveOutcome:
+    """Build and solve the model. Runs inside a worker process.
+
+    Args:
+        job: The solve job
+        progress_queue: Manager queue receiving progress dicts
+        cancel_event: Manager event set by the API process to cancel the run
+
+    Returns:
+        SolveOutcome with the solver output (None if no solution was found)
+    """
+    # Imported here so the API process does not pay for OR-Tools at import time
+    from bunking.config import ConfigLoader
+    from bunking.solver import DirectBunkingSolver
+
+    def report(progress: dict[str, Any]) -> None:
+        try:
+            progress_queue.put_nowait(progress)
+        except Exception:
+            # Progress is best-effort; never fail a solve because of it
+            pass
+
+    # The pool hands a job to a worker before it is picked up, so a run
+    # cancelled while "queued" may still arrive here
+    if cancel_event.is_set():
+        return SolveOutcome(output=None, cancelled=True)
+
+    report({"phase": "started"})
+
+    # Worker processes outlive a single run; drop cached values so config
+    # overrides written by the API process for this run are picked up, then
+    # pin that snapshot so config cannot change mid-run
+    loader = ConfigLoader.get_instance()
+    loader.clear_cache()
+    config_service = loader.pin()
+    solver = DirectBunkingSolver(
+        input_data=job.solver_input,
+        config_service=config_service,
+        debug_constraints=job.debug_constraints,
+    )
+
+    # Watch for cancellation from the API process while the solve runs
+    finished = threading.Event()
+
+    def watch_for_cancel() -> None:
+        while not finished.is_set():
+            if cancel_event.wait(PROGRESS_POLL_SECONDS):
+                solver.stop()
+                return
+
+    watcher = threading.Thread(target=watch_for_cancel, name="solver-cancel-watcher", daemon=True)
+    watcher.start()
+
+    try:
+        output = solver.solve(time_limit_seconds=job.time_limit, progress_callback=report, num_workers=job.num_workers)
+    finally:
+        finished.set()
+
+    if cancel_event.is_set():
+        return SolveOutcome(output=None, cancelled=True)
+
+    cause = None
+    if output is None and job.analyze_infeasibility:
+        report({"phase": "analyzing_infeasibility"})
+        try:
+            cause = solver.find_infeasibility_cause(time_limit_seconds=10)
+        except Exception as e:
+            logger.error(f"Failed to run infeasibility analysis: {e}")
+
+    return SolveOutcome(output=output, infeasibility_cause=cause)
+
+
+def _init_worker() -> None:
+    """Configure logging in freshly spawned worker processes."""
+    from bunking.logging_config import configure_logging
+
+    configure_logging(source="solver")
+
+
+@dataclass
+class _ActiveRun:
+    """Bookkeeping for a submitted run."""
+
+    future: Future[SolveOutcome]
+    cancel_event: Any
+    progress_queue: Any
+
+
+class SolverExecutor:
+    """Runs solver jobs in a process pool with a bounded queue.
+
+    The pool and its multiprocessing manager are started lazily on first use,
+    so importing the API (and its tests) does not spawn processes.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 8,
+        worker: Callable[[SolveJob, Any, Any], SolveOutcome] = solve_in_worker,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of worker processes (concurrent solves)
+            max_pending: Maximum runs queued or running at once
+            worker: Function executed in the worker process
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._worker = worker
+        self._pool: ProcessPoolExecutor | None = None
+        self._manager: SyncManager | None = None
+        self._runs: dict[str, _ActiveRun] = {}
+        # Runs holding a slot before they are submitted -> cancel requested
+        self._reserved: dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of runs currently reserved, queued or running."""
+        return len(self._runs) + len(self._reserved)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the queue has reached max_pending."""
+        return not self.has_capacity()
+
+    def has_capacity(self, runs: int = 1) -> bool:
+        """Whether `runs` more runs can be queued without exceeding max_pending."""
+        return self.pending_count + runs <= self.max_pending
+
+    def reserve(self, run_id: str) -> bool:
+        """Hold a slot for a run that is accepted now but submitted later.
+
+        Endpoints reserve before answering, so a run that fetches its data
+        first cannot be accepted and then rejected by a full queue. The slot
+        passes to the run when run() is called with the same run_id.
+
+        Returns:
+            False if the queue is full
+        """
+        if run_id in self._reserved:
+            return True
+        if self.is_full:
+            return False
+        self._reserved[run_id] = False
+        return True
+
+    def release(self, run_id: str) -> None:
+        """Free a reserved slot whose run will not reach run()."""
+        self._reserved.pop(run_id, None)
+
+    def _ensure_started(self) -> tuple[ProcessPoolExecutor, SyncManager]:
+        """Start the process pool and manager if needed."""
+        with self._lock:
+            if self._pool is None or self._manager is None:
+                # spawn, not fork: the API process runs threads and an event loop
+                ctx = multiprocessing.get_context("spawn")
+                self._manager = ctx.Manager()
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=ctx, initializer=_init_worker)
+                logger.info(f"Started solver process pool with {self.max_workers} workers")
+            return self._pool, self._manager
+
+    async def run(
+        self,
+        run_id: str,
+        job: SolveJob,
+        on_progress: Callable[[dict[str, Any]], None] | None = None,
+    ) -> SolveOutcome:
+        """Submit a job and wait for its outcome without blocking the event loop.
+
+        Args:
+            run_id: Solver run ID (used for cancellation)
+            job: The solve job
+            on_progress: Called in the API process for each progress message
+
+        Returns:
+            The SolveOutcome from the worker
+
+        Raises:
+            SolverQueueFullError: If the run has no reserved slot and max_pending
+                runs are already reserved, queued or running
+        """
+        if not self.reserve(run_id):
+            raise SolverQueueFullError(f"Solver queue is full ({self.max_pending} runs queued or running)")
+
+        try:
+            pool, manager = await asyncio.to_thread(self._ensure_started)
+            if self._reserved.get(run_id):
+                logger.info(f"Solver run {run_id} cancelled before it was queued")
+                return SolveOutcome(output=None, cancelled=True)
+
+            cancel_event = manager.Event()
+            progress_queue = manager.Queue()
+            future = pool.submit(self._worker, job, progress_queue, cancel_event)
+            self._runs[run_id] = _ActiveRun(future=future, cancel_event=cancel_event, progress_queue=progress_queue)
+            self._reserved.pop(run_id, None)
+            logger.info(f"Queued solver run {run_id} ({self.pending_count}/{self.max_pending} slots used)")
+
+            wrapped = asyncio.wrap_future(future)
+            while not wrapped.done():
+                await asyncio.wait({wrapped}, timeout=PROGRESS_POLL_SECONDS)
+                await self._drain_progress(progress_queue, on_progress)
+            await self._drain_progress(progress_queue, on_progress)
+
+            if future.cancelled():
+                return SolveOutcome(output=None, cancelled=True)
+            return wrapped.result()
+        finally:
+            self._runs.pop(run_id, None)
+            self._reserved.pop(run_id, None)
+
+    async def _drain_progress(self, progress_queue: Any, on_progress: Callable[[dict[str, Any]], None] | None) -> None:
+        """Deliver queued progress messages to the callback."""
+        messages = await asyncio.to_thread(_drain_queue, progress_queue)
+        if on_progress is None:
+            return
+        for message in messages:
+            try:
+                on_progress(message)
+            except Exception as e:
+                logger.warning(f"Solver progress handler failed: {e}")
+
+    def cancel(self, run_id: str) -> bool:
+        """Cancel a queued or running solve.
+
+        Returns:
+            True if the run was found (reserved and queued runs are dropped,
+            running solves are asked to stop), False if the run is not active.
+        """
+        if run_id in self._reserved:
+            self._reserved[run_id] = True
+            logger.info(f"Cancellation requested for reserved solver run {run_id}")
+            return True
+
+        active = self._runs.get(run_id)
+        if active is None:
+            return False
+
+        if not active.future.cancel():
+            # Already running - signal the worker to stop the search
+            active.cancel_event.set()
+        logger.info(f"Cancellation requested for solver run {run_id}")
+        return True
+
+    def shutdown(self) -> None:
+        """Stop all workers. Running solves are cancelled."""
+        for run_id in [*self._runs, *self._reserved]:
+            self.cancel(run_id)
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+
+
+def _drain_queue(progress_queue: Any) -> list[dict[str, Any]]:
+    """Pull every message currently waiting in a manager queue."""
+    messages: list[dict[str, Any]] = []
+    while True:
+        try:
+            messages.append(progress_queue.get_nowait())
+        except queue.Empty:
+            return messages
+        except (EOFError, BrokenPipeError, ConnectionError):
+            # Manager went away during shutdown
+            return messages
@@ -3,6 +3,8 @@ Solver Runner Service - Functions for running the bunking solver.
 
 This service handles running solver tasks in background.
 Main + AG sessions are automatically fetched together via get_related_session_ids.
+The solve itself runs in a worker process via SolverExecutor so the API event
+loop is never blocked by CP-SAT.
 """
 
 from __future__ import annotations
@@ -14,16 +16,114 @@ from datetime import UTC, datetime
 from typing import Any
 
 from bunking.config import ConfigLoader
-from bunking.direct_solver import DirectBunkingSolver
+from bunking.models_v2 import DirectSolverInput
 from pocketbase import PocketBase
 
-from ..dependencies import pb_url, solver_runs
+from ..dependencies import pb_url, session_snapshots, solver_executor, solver_runs
 from ..settings import get_settings
-from .data_fetcher import fetch_historical_bunking, fetch_session_data_v2, prepare_direct_solver_input
+from .data_fetcher import (
+    fetch_historical_bunking,
+    fetch_last_solver_run_assignments,
+    fetch_session_data_v2,
+    prepare_direct_solver_input,
+)
+from .solver_executor import SolveJob
 
 logger = logging.getLogger(__name__)
 
 
+class SolverRunCancelledError(Exception):
+    """Raised when a solver run is cancelled before producing a result."""
+
+
+async def load_solver_input(
+    task_pb: PocketBase,
+    session_cm_id: int,
+    year: int,
+    respect_locks: bool,
+    scenario: str | None = None,
+    warm_start: str | None = None,
+    change_penalty: int = 0,
+) -> DirectSolverInput:
+    """Build the solver input for one session, reusing the session snapshot when fresh.
+
+    Args:
+        warm_start: Seed the solve with "current" assignments (production or the
+            scenario draft) or the "last_run" completed solver result
+        change_penalty: Objective penalty per warm-started camper who is moved
+    """
+    solver_input = await session_snapshots.get_solver_input(
+        task_pb,
+        session_cm_id,
+        year,
+        scenario,
+        loader=lambda: _fetch_solver_input(task_pb, session_cm_id, year, scenario),
+    )
+
+    if warm_start:
+        solver_input.solution_hints = await _load_solution_hints(
+            task_pb, solver_input, session_cm_id, scenario, warm_start
+        )
+        solver_input.change_penalty = change_penalty
+        logger.info(f"Warm start from {warm_start}: {len(solver_input.solution_hints)} campers hinted")
+
+    # Apply manual locks if requested
+    if not respect_locks:
+        solver_input.existing_assignments = [a for a in solver_input.existing_assignments if not a.is_locked]
+
+    return solver_input
+
+
+async def _fetch_solver_input(
+    task_pb: PocketBase,
+    session_cm_id: int,
+    year: int,
+    scenario: str | None,
+) -> DirectSolverInput:
+    """Fetch session data from PocketBase and prepare the solver input."""
+    # Fetch data (from draft table if scenario provided)
+    logger.info(f"Fetching data for session CM ID {session_cm_id} year {year} scenario={scenario}")
+    attendees_data, bunks_data, requests_data, assignments_data, bunk_plans_data = await fetch_session_data_v2(
+        session_cm_id, year, task_pb, scenario=scenario
+    )
+
+    # Fetch historical bunking data for level progression constraint
+    historical_bunking = await fetch_historical_bunking(session_cm_id, year, task_pb)
+
+    # Prepare direct solver input
+    return prepare_direct_solver_input(
+        attendees_data,
+        bunks_data,
+        requests_data,
+        assignments_data,
+        bunk_plans_data,
+        historical_bunking=historical_bunking,
+    )
+
+
+async def _load_solution_hints(
+    task_pb: PocketBase,
+    solver_input: DirectSolverInput,
+    session_cm_id: int,
+    scenario: str | None,
+    warm_start: str,
+) -> dict[int, int]:
+    """Build warm-start hints (person_cm_id -> bunk_cm_id) for a solve."""
+    if warm_start == "current":
+        return {a.person_cm_id: a.bunk_cm_id for a in solver_input.existing_assignments}
+
+    if warm_start == "last_run":
+        last_run = await fetch_last_solver_run_assignments(session_cm_id, task_pb, scenario)
+        # Run results store bunk names (or the cm_id as a string when the name was unknown)
+        bunk_ids = {b.name: b.campminder_id for b in solver_input.bunks}
+        bunk_ids.update({str(b.campminder_id): b.campminder_id for b in solver_input.bunks})
+        return {
+            person_cm_id: bunk_ids[bunk_name] for person_cm_id, bunk_name in last_run.items() if bunk_name in bunk_ids
+        }
+
+    raise ValueError(f"Unknown warm start source: {warm_start}")
+
+
 async def run_solver_task_v2(
     run_id: str,
     session_cm_id: int,
@@ -34,8 +134,19 @@ async def run_solver_task_v2(
     scenario: str | None = None,
     debug_constraints: dict[str, Any] | None = None,
     config_overrides: dict[str, Any] | None = None,
+    solver_input: DirectSolverInput | None = None,
+    num_workers: int | None = None,
+    warm_start: str | None = None,
+    change_penalty: int = 0,
 ) -> None:
-    """Background task to run the solver with direct bunk_requests data."""
+    """Background task to run the solver with direct bunk_requests data.
+
+    Args:
+        solver_input: Pre-fetched input (skips the data fetch when provided)
+        num_workers: CP-SAT search workers for this run (None uses the default)
+        warm_start: Solution hint source ("current" or "last_run"), see load_solver_input
+        change_penalty: Objective penalty per warm-started camper who is moved
+    """
     # Create a new PocketBase client for this background task
     task_pb = PocketBase(pb_url)
     settings = get_settings()
@@ -53,36 +164,17 @@ async def run_solver_task_v2(
         solver_runs[run_id]["started_at"] = datetime.now(UTC)
         solver_runs[run_id]["status"] = "running"
 
-        # Fetch data (from draft table if scenario provided)
-        logger.info(f"Fetching data for session CM ID {session_cm_id} year {year} scenario={scenario}")
-        attendees_data, bunks_data, requests_data, assignments_data, bunk_plans_data = await fetch_session_data_v2(
-            session_cm_id, year, task_pb, scenario=scenario
-        )
-
-        # Fetch historical bunking data for level progression constraint
-        historical_bunking = await fetch_historical_bunking(session_cm_id, year, task_pb)
-
-        # Prepare direct solver input
-        solver_input = prepare_direct_solver_input(
-            attendees_data,
-            bunks_data,
-            requests_data,
-            assignments_data,
-            bunk_plans_data,
-            historical_bunking=historical_bunking,
-        )
-
-        # Apply manual locks if requested
-        if not respect_locks:
-            solver_input.existing_assignments = [a for a in solver_input.existing_assignments if not a.is_locked]
+        if solver_input is None:
+            solver_input = await load_solver_input(
+                task_pb, session_cm_id, year, respect_locks, scenario, warm_start, change_penalty
+            )
 
         # Run solver
         logger.info(
             f"Running direct solver with {len(solver_input.persons)} persons and {len(solver_input.requests)} requests"
         )
 
-        # Initialize ConfigLoader for solver
-        logger.info("Initializing ConfigLoader for solver")
+        # Config overrides are persisted here; the worker reloads config per run
         config_service = ConfigLoader.get_instance()
 
         # Apply config overrides if provided
@@ -94,26 +186,28 @@ async def run_solver_task_v2(
                 actual_value = config_service.get_str(key)
                 logger.info(f"Config {key} is now: {actual_value}")
 
-        # Run solver (main + AG sessions are automatically fetched together)
-        logger.info("Creating DirectBunkingSolver instance")
+        # Run solver in a worker process (main + AG sessions are fetched together)
         if debug_constraints:
             logger.info(f"DEBUG MODE: Constraints disabled: {list(debug_constraints.keys())}")
-        solver = DirectBunkingSolver(
-            input_data=solver_input, config_service=config_service, debug_constraints=debug_constraints or {}
+        job = SolveJob(
+            solver_input=solver_input,
+            time_limit=time_limit,
+            debug_constraints=debug_constraints or {},
+            num_workers=num_workers,
         )
 
-        # Run solver with time limit
-        result = solver.solve(time_limit_seconds=time_limit)
+        def on_progress(progress: dict[str, Any]) -> None:
+            solver_runs[run_id]["progress"] = progress
 
-        if result is None:
-            # Try to identify the cause of infeasibility
-            logger.warning("Solver failed - running infeasibility analysis...")
-            try:
-                cause = solver.find_infeasibility_cause(time_limit_seconds=10)
-                logger.error(f"Infeasibility analysis result: {cause}")
-            except Exception as e:
-                logger.error(f"Failed to run infeasibility analysis: {e}")
+        outcome = await solver_executor.run(run_id, job, on_progress=on_progress)
 
+        if outcome.cancelled:
+            raise SolverRunCancelledError("Solver run cancelled")
+
+        result = outcome.output
+        if result is None:
+            if outcome.infeasibility_cause:
+                logger.error(f"Infeasibility analysis result: {outcome.infeasibility_cause}")
             raise ValueError("Solver failed to find a solution")
 
         # Build bunk name map for results
@@ -195,6 +289,8 @@ async def run_solver_task_v2(
         logger.error(f"Solver run {run_id} failed: {e}", exc_info=True)
         solver_runs[run_id]["status"] = "failed"
         solver_runs[run_id]["error_message"] = str(e)
+        if isinstance(e, SolverRunCancelledError):
+            solver_runs[run_id]["cancelled"] = True
         solver_runs[run_id]["completed_at"] = datetime.now(UTC)
 
         # Record failure in PocketBase
@@ -211,3 +307,7 @@ async def run_solver_task_v2(
             )
         except Exception:
             pass
+
+    finally:
+        # Frees the slot reserved when the run was accepted if it failed before reaching the executor
+        solver_executor.release(run_id)
@@ -0,0 +1,166 @@
+"""Tests for MetricsDataCache and its use by MetricsRepository."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.services.metrics_cache import MetricsDataCache
+
+
+def _counting_fetch(records: list[Any], calls: list[int], delay: float = 0.0) -> Callable[[], Awaitable[list[Any]]]:
+    async def fetch() -> list[Any]:
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return records
+
+    return fetch
+
+
+class TestMetricsDataCache:
+    """Tests for per-year memoization."""
+
+    @pytest.mark.asyncio
+    async def test_past_year_uses_past_year_ttl(self) -> None:
+        """Past years are served from cache with a zero current-year TTL, and expire on their own TTL."""
+        cache = MetricsDataCache(ttl_seconds=0)
+        calls: list[int] = []
+        past_year = datetime.now().year - 1
+
+        first = await cache.get_or_fetch("persons", past_year, (), _counting_fetch([1, 2], calls))
+        second = await cache.get_or_fetch("persons", past_year, (), _counting_fetch([3], calls))
+
+        assert first == second == [1, 2]
+        assert len(calls) == 1
+
+        expiring = MetricsDataCache(past_year_ttl_seconds=0)
+        await expiring.get_or_fetch("persons", past_year, (), _counting_fetch([1], calls))
+        assert await expiring.get_or_fetch("persons", past_year, (), _counting_fetch([2], calls)) == [2]
+
+    @pytest.mark.asyncio
+    async def test_current_year_refreshed_after_ttl(self) -> None:
+        """The current year is refetched once its TTL has passed."""
+        cache = MetricsDataCache(ttl_seconds=0)
+        calls: list[int] = []
+        year = datetime.now().year
+
+        await cache.get_or_fetch("persons", year, (), _counting_fetch([1], calls))
+        second = await cache.get_or_fetch("persons", year, (), _counting_fetch([2], calls))
+
+        assert second == [2]
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self) -> None:
+        """Concurrent requests for the same query fetch once."""
+        cache = MetricsDataCache()
+        calls: list[int] = []
+        fetch = _counting_fetch([1], calls, delay=0.01)
+
+        results = await asyncio.gather(*(cache.get_or_fetch("attendees", 2020, (), fetch) for _ in range(5)))
+
+        assert results == [[1]] * 5
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_year(self) -> None:
+        """Invalidating a year drops only that year's entries."""
+        cache = MetricsDataCache()
+        calls: list[int] = []
+        await cache.get_or_fetch("persons", 2020, (), _counting_fetch([1], calls))
+        await cache.get_or_fetch("persons", 2021, (), _counting_fetch([2], calls))
+
+        assert cache.invalidate(2020) == 1
+        assert cache.get_stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_evicted_at_max_size(self) -> None:
+        """Beyond max_size the least recently used entry is dropped."""
+        cache = MetricsDataCache(max_size=2)
+        calls: list[int] = []
+        await cache.get_or_fetch("persons", 2019, (), _counting_fetch([1], calls))
+        await cache.get_or_fetch("persons", 2020, (), _counting_fetch([2], calls))
+        await cache.get_or_fetch("persons", 2019, (), _counting_fetch([1], calls))
+        await cache.get_or_fetch("persons", 2021, (), _counting_fetch([3], calls))
+
+        assert cache.get_stats()["entries"] == 2
+        assert await cache.get_or_fetch("persons", 2019, (), _counting_fetch([9], calls)) == [1]
+        assert await cache.get_or_fetch("persons", 2020, (), _counting_fetch([9], calls)) == [9]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_fetch_only_skips_matching_key(self) -> None:
+        """A fetch in flight is not cached if its year is invalidated; other years still are."""
+        cache = MetricsDataCache()
+        calls: list[int] = []
+        fetches = [
+            asyncio.ensure_future(cache.get_or_fetch("persons", 2020, (), _counting_fetch([1], calls, delay=0.01))),
+            asyncio.ensure_future(cache.get_or_fetch("persons", 2021, (), _counting_fetch([2], calls, delay=0.01))),
+        ]
+        await asyncio.sleep(0)
+        cache.invalidate(2020)
+        await asyncio.gather(*fetches)
+
+        assert await cache.get_or_fetch("persons", 2020, (), _counting_fetch([3], calls)) == [3]
+        assert await cache.get_or_fetch("persons", 2021, (), _counting_fetch([4], calls)) == [2]
+
+    @pytest.mark.asyncio
+    async def test_by_person_fetches_only_new_persons(self) -> None:
+        """Overlapping person sets share one entry and only fetch persons not cached yet."""
+        cache = MetricsDataCache()
+        requested: list[list[int]] = []
+
+        async def fetch_missing(missing: list[int]) -> dict[int, list[Any]]:
+            requested.append(missing)
+            return {pid: [f"r{pid}"] for pid in missing if pid != 3}
+
+        first = await cache.get_or_fetch_by_person("attendees", 2020, ("h",), {1, 2, 3}, fetch_missing)
+        second = await cache.get_or_fetch_by_person("attendees", 2020, ("h",), {2, 3, 4}, fetch_missing)
+
+        assert first == {1: ["r1"], 2: ["r2"], 3: []}
+        assert second == {2: ["r2"], 3: [], 4: ["r4"]}
+        assert requested == [[1, 2, 3], [4]]
+        assert cache.get_stats()["entries"] == 1
+
+
+class TestMetricsRepositoryCaching:
+    """Tests for MetricsRepository reads going through the shared cache."""
+
+    @pytest.mark.asyncio
+    async def test_repositories_on_same_client_share_cache(self) -> None:
+        """A second repository on the same client reuses past-year reads."""
+        from api.services.metrics_repository import MetricsRepository
+
+        mock_pb = MagicMock()
+        mock_collection = MagicMock()
+        mock_pb.collection.return_value = mock_collection
+        mock_collection.get_full_list.return_value = []
+
+        await MetricsRepository(mock_pb).fetch_persons(2020)
+        await MetricsRepository(mock_pb).fetch_persons(2020)
+        await MetricsRepository(mock_pb).fetch_persons(2021)
+
+        assert mock_collection.get_full_list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_summer_history_reuses_cached_persons(self) -> None:
+        """A later request for an overlapping person set only queries the new persons."""
+        from api.services.metrics_repository import MetricsRepository
+
+        mock_pb = MagicMock()
+        mock_collection = MagicMock()
+        mock_pb.collection.return_value = mock_collection
+        mock_collection.get_full_list.return_value = []
+        repo = MetricsRepository(mock_pb, cache=MetricsDataCache())
+
+        await repo.fetch_summer_enrollment_history(set(range(1, 151)), 2020)
+        await repo.fetch_summer_enrollment_history(set(range(100, 161)), 2020)
+
+        assert mock_collection.get_full_list.call_count == 3
+        last_filter = mock_collection.get_full_list.call_args.kwargs["query_params"]["filter"]
+        assert "person_id = 151" in last_filter
+        assert "person_id = 150 " not in last_filter
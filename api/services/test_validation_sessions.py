@@ -0,0 +1,69 @@
+"""Tests for ValidationSessionStore."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.services.validation_sessions import ValidationSessionStore, VersionConflictError
+
+
+def _validation(version: int = 0) -> MagicMock:
+    validation = MagicMock()
+    validation.version = version
+    return validation
+
+
+class TestValidationSessionStore:
+    """Tests for opening, expiring and invalidating validation sessions."""
+
+    def test_open_replaces_session_for_same_key(self) -> None:
+        """Reopening a session/year/scenario drops the previous session."""
+        store = ValidationSessionStore()
+        first = store.open((1, 2025, None), _validation())
+        second = store.open((1, 2025, None), _validation())
+
+        assert store.get(first.session_id) is None
+        assert store.get(second.session_id) is second
+
+    def test_expired_sessions_dropped(self) -> None:
+        """Sessions unused past the TTL are gone."""
+        store = ValidationSessionStore(ttl_seconds=0)
+        stored = store.open((1, 2025, None), _validation())
+        stored.used_at -= 1
+
+        assert store.get(stored.session_id) is None
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Opening beyond max_size evicts the least recently used session."""
+        store = ValidationSessionStore(max_size=2)
+        oldest = store.open((1, 2025, None), _validation())
+        oldest.used_at -= 10
+        kept = store.open((2, 2025, None), _validation())
+        store.open((3, 2025, None), _validation())
+
+        assert store.get(oldest.session_id) is None
+        assert store.get(kept.session_id) is kept
+
+    def test_invalidate_by_scenario(self) -> None:
+        """Invalidation matches on the given fields only."""
+        store = ValidationSessionStore()
+        production = store.open((1, 2025, None), _validation())
+        scenario = store.open((1, 2025, "scn1"), _validation())
+
+        assert store.invalidate(scenario="scn1") == 1
+        assert store.get(scenario.session_id) is None
+        assert store.get(production.session_id) is production
+
+    def test_apply_moves_checks_expected_version(self) -> None:
+        """Moves sent against an old version are rejected."""
+        store = ValidationSessionStore()
+        validation = _validation(version=3)
+        stored = store.open((1, 2025, None), validation)
+
+        with pytest.raises(VersionConflictError):
+            stored.apply_moves([], expected_version=2)
+        stored.apply_moves([], expected_version=3)
+
+        validation.apply_moves.assert_called_once_with([])
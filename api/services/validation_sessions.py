@@ -0,0 +1,127 @@
+"""
+Validation Session Store - Keeps incremental validation state between calls.
+
+The bunking board opens a ValidationSession once (a full load and
+validation), then sends each drag-and-drop move as a small delta request.
+Sessions live in process memory, expire after `ttl_seconds` without use and
+are evicted least-recently-used beyond `max_size`; clients re-open an expired
+session.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from bunking.validation_session import AssignmentMove, ValidationDelta, ValidationSession
+
+from .session_snapshot import SnapshotKey, key_matches
+
+logger = logging.getLogger(__name__)
+
+StoreKey = SnapshotKey  # (session_cm_id, year, scenario)
+
+
+class VersionConflictError(Exception):
+    """Moves were sent against an older version of the session."""
+
+
+@dataclass
+class StoredValidationSession:
+    """A ValidationSession plus bookkeeping for the store."""
+
+    session_id: str
+    key: StoreKey
+    validation: ValidationSession
+    used_at: float = field(default_factory=time.time)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def apply_moves(self, moves: Iterable[AssignmentMove], expected_version: int | None = None) -> ValidationDelta:
+        """Apply moves under the session lock.
+
+        Raises:
+            VersionConflictError: If expected_version is not the current version
+            ValueError: If a move names an unknown camper or bunk
+        """
+        with self.lock:
+            if expected_version is not None and expected_version != self.validation.version:
+                raise VersionConflictError(
+                    f"Validation session is at version {self.validation.version}, not {expected_version}"
+                )
+            self.used_at = time.time()
+            return self.validation.apply_moves(moves)
+
+
+class ValidationSessionStore:
+    """In-process store of open validation sessions."""
+
+    def __init__(self, ttl_seconds: int = 900, max_size: int = 20):
+        """Initialize the store.
+
+        Args:
+            ttl_seconds: Sessions unused for this long are dropped
+            max_size: Maximum open sessions (least recently used are evicted)
+        """
+        self._sessions: dict[str, StoredValidationSession] = {}
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._lock = threading.RLock()
+
+    def open(self, key: StoreKey, validation: ValidationSession) -> StoredValidationSession:
+        """Store a new session, replacing any open one for the same key."""
+        stored = StoredValidationSession(session_id=uuid.uuid4().hex, key=key, validation=validation)
+        with self._lock:
+            self._expire()
+            for session_id in [s.session_id for s in self._sessions.values() if s.key == key]:
+                del self._sessions[session_id]
+            if len(self._sessions) >= self._max_size:
+                oldest = min(self._sessions.values(), key=lambda s: s.used_at)
+                del self._sessions[oldest.session_id]
+            self._sessions[stored.session_id] = stored
+        logger.info(f"Opened validation session {stored.session_id} for {key}")
+        return stored
+
+    def get(self, session_id: str) -> StoredValidationSession | None:
+        """Return an open session, or None if unknown or expired."""
+        with self._lock:
+            self._expire()
+            return self._sessions.get(session_id)
+
+    def close(self, session_id: str) -> bool:
+        """Drop a session. Returns whether it was open."""
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def invalidate(self, session_cm_id: int | None = None, year: int | None = None, scenario: str | None = None) -> int:
+        """Drop sessions whose key matches, see key_matches.
+
+        Returns:
+            Number of sessions removed
+        """
+        with self._lock:
+            matching = [
+                stored.session_id
+                for stored in self._sessions.values()
+                if key_matches(stored.key, session_cm_id, year, scenario)
+            ]
+            for session_id in matching:
+                del self._sessions[session_id]
+        if matching:
+            logger.info(f"Invalidated {len(matching)} validation sessions")
+        return len(matching)
+
+    def _expire(self) -> None:
+        """Drop sessions past their TTL. Caller holds the lock."""
+        cutoff = time.time() - self._ttl
+        for session_id in [s.session_id for s in self._sessions.values() if s.used_at < cutoff]:
+            del self._sessions[session_id]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            return {"open_sessions": len(self._sessions), "max_size": self._max_size, "ttl_seconds": self._ttl}
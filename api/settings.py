@@ -7,6 +7,7 @@ and sensible defaults. Settings are loaded once at startup and cached.
 
 from __future__ import annotations
 
+import os
 from functools import lru_cache
 from pathlib import Path
 
@@ -34,11 +35,14 @@ def _is_github_actions() -> bool:
     Returns True only when BOTH CI=true AND GITHUB_ACTIONS=true are set.
     This dual-signal requirement prevents accidental bypass in production.
     """
-    import os
-
     return os.getenv("CI") == "true" and os.getenv("GITHUB_ACTIONS") == "true"
 
 
+def _default_solver_worker_budget() -> int:
+    """Default CP-SAT worker budget: one search worker per CPU core."""
+    return os.cpu_count() or 8
+
+
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
@@ -96,6 +100,33 @@ class Settings(BaseSettings):
         description="PocketBase admin password (required - no default for security)",
     )
 
+    pocketbase_page_size: int = Field(
+        default=500,
+        ge=1,
+        le=1000,
+        description="Records per page for bulk PocketBase reads",
+    )
+    pocketbase_page_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Pages fetched at once by bulk PocketBase reads after the first page",
+    )
+    metrics_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="How long metrics queries for the current year are cached",
+    )
+    metrics_cache_past_year_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        description="How long metrics queries for past years are cached",
+    )
+    metrics_cache_max_entries: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum cached metrics queries (least recently used are evicted)",
+    )
+
     @field_validator("pocketbase_admin_password", mode="after")
     @classmethod
     def validate_admin_password(cls, v: str) -> str:
@@ -141,6 +172,23 @@ class Settings(BaseSettings):
         description="Random seed for reproducible graph algorithms (community detection, layout)",
     )
 
+    # === Solver Execution ===
+    solver_max_processes: int = Field(
+        default=2,
+        ge=1,
+        description="Worker processes available for concurrent solver runs",
+    )
+    solver_max_pending: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum solver runs queued or running before new runs are rejected",
+    )
+    solver_worker_budget: int = Field(
+        default_factory=_default_solver_worker_budget,
+        ge=1,
+        description="CP-SAT search workers shared across the concurrent solves of a multi-session run",
+    )
+
     @property
     def allowed_origins(self) -> list[str]:
         """Parse comma-separated origins string into list."""
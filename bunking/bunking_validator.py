@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import json
 import logging
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -14,6 +14,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from bunking.graph.request_graph import RequestGraph
 from bunking.models import Bunk, BunkAssignment, BunkRequest, FriendGroup, Person, Session
 from bunking.solver.constraints.helpers import extract_bunk_level, get_level_order
 from bunking.utils.age_preference import is_age_preference_satisfied
@@ -31,6 +32,9 @@ class HistoricalBunkingRecord:
 
 logger = logging.getLogger(__name__)
 
+# Request statuses that count toward satisfaction ('resolved' = accepted/approved)
+VALID_REQUEST_STATUSES = frozenset({"resolved"})
+
 
 class ValidationSeverity(str, Enum):
     ERROR = "error"
@@ -229,6 +233,30 @@ class BunkingValidator:
         stats.locked_bunks = sum(1 for b in bunks if b.is_locked)
 
         # Find campers with no requests
+        self._validate_no_requests(persons, requests, stats, issues)
+
+        # Compute per-session breakdown if multiple sessions provided
+        if all_sessions and bunk_plans:
+            self._compute_session_breakdown(
+                all_sessions, bunk_plans, persons, assignments_by_person, bunks, assignments_by_bunk, stats, attendees
+            )
+
+        # Calculate total capacity and utilization
+        stats.total_capacity = sum(bunk.max_size for bunk in bunks)
+        stats.used_capacity = stats.assigned_campers
+        if stats.total_capacity > 0:
+            stats.capacity_utilization_rate = stats.used_capacity / stats.total_capacity
+
+        return ValidationResult(statistics=stats, issues=issues, session_id=session.campminder_id, scenario=scenario)
+
+    def _validate_no_requests(
+        self,
+        persons: list[Person],
+        requests: list[BunkRequest],
+        stats: ValidationStatistics,
+        issues: list[ValidationIssue],
+    ) -> None:
+        """Report campers who neither made nor received a request."""
         persons_with_requests = set()
         for request in requests:
             persons_with_requests.add(request.requester_person_cm_id)
@@ -252,20 +280,6 @@ class BunkingValidator:
                 )
             )
 
-        # Compute per-session breakdown if multiple sessions provided
-        if all_sessions and bunk_plans:
-            self._compute_session_breakdown(
-                all_sessions, bunk_plans, persons, assignments_by_person, bunks, assignments_by_bunk, stats, attendees
-            )
-
-        # Calculate total capacity and utilization
-        stats.total_capacity = sum(bunk.max_size for bunk in bunks)
-        stats.used_capacity = stats.assigned_campers
-        if stats.total_capacity > 0:
-            stats.capacity_utilization_rate = stats.used_capacity / stats.total_capacity
-
-        return ValidationResult(statistics=stats, issues=issues, session_id=session.campminder_id, scenario=scenario)
-
     def _validate_bunk_capacities(
         self,
         bunks: list[Bunk],
@@ -305,10 +319,14 @@ class BunkingValidator:
         person_by_id: dict[str, Person],
         stats: ValidationStatistics,
         issues: list[ValidationIssue],
+        assignments_by_bunk: dict[str, list[BunkAssignment]] | None = None,
     ) -> None:
-        """Validate request satisfaction - tracking by source field."""
-        # Valid statuses are 'resolved' (accepted/approved)
-        valid_statuses = {"resolved"}
+        """Validate request satisfaction - tracking by source field.
+
+        assignments_by_bunk may be passed when the caller already has it, so
+        validating a few requesters does not regroup every assignment.
+        """
+        valid_statuses = VALID_REQUEST_STATUSES
 
         # Define explicit CSV fields for must-satisfy-one constraint (using normalized names)
         explicit_csv_fields = {
@@ -321,9 +339,10 @@ class BunkingValidator:
         }
 
         # Build assignments_by_bunk for age_preference satisfaction checking
-        assignments_by_bunk: dict[str, list[BunkAssignment]] = defaultdict(list)
-        for assignment in assignments_by_person.values():
-            assignments_by_bunk[assignment.bunk_cm_id].append(assignment)
+        if assignments_by_bunk is None:
+            assignments_by_bunk = defaultdict(list)
+            for assignment in assignments_by_person.values():
+                assignments_by_bunk[assignment.bunk_cm_id].append(assignment)
 
         # Track requests per person
         requests_by_person = defaultdict(list)
@@ -331,6 +350,8 @@ class BunkingValidator:
         satisfied_requests_by_person = defaultdict(list)
         explicit_requests_by_person = defaultdict(list)
         satisfied_explicit_by_person = defaultdict(list)
+        # Parsed once per request; reporting below reuses them
+        source_fields_by_request: dict[int, list[str]] = {}
 
         def normalize_source_field(raw_field: str) -> str | None:
             """Normalize database source_field values to consistent snake_case keys.
@@ -487,6 +508,7 @@ class BunkingValidator:
 
                 # Get source fields (only known fields, unknown fields filtered out)
                 source_fields = get_source_fields(request)
+                source_fields_by_request[id(request)] = source_fields
 
                 # Check if this is an explicit CSV field request
                 is_explicit = any(field in explicit_csv_fields for field in source_fields)
@@ -537,7 +559,7 @@ class BunkingValidator:
 
                 # Report each unsatisfied valid request for this person
                 for request in valid_requests:
-                    source_fields = get_source_fields(request)
+                    source_fields = source_fields_by_request[id(request)]
                     if request.request_type == "bunk_with" and request.requested_person_cm_id:
                         requested_person = person_by_id.get(request.requested_person_cm_id)
                         requested_name = (
@@ -611,20 +633,35 @@ class BunkingValidator:
         if campers_with_unsatisfied_valid_requests:
             issues.insert(
                 0,
-                ValidationIssue(
-                    severity=ValidationSeverity.WARNING,
-                    type="campers_with_unsatisfied_valid_requests",
-                    message=f"{len(campers_with_unsatisfied_valid_requests)} campers have valid requests but NONE are satisfied",
-                    details={
-                        "count": len(campers_with_unsatisfied_valid_requests),
-                        "total_valid_requests": total_valid_requests,
-                        "total_satisfied": total_satisfied_valid_requests,
-                        "explicit_unsatisfied_count": len(campers_with_unsatisfied_explicit_requests),
-                    },
-                    affected_ids=campers_with_unsatisfied_valid_requests[:10],  # First 10 for UI
+                self._unsatisfied_requests_summary(
+                    campers_with_unsatisfied_valid_requests,
+                    total_valid_requests,
+                    total_satisfied_valid_requests,
+                    len(campers_with_unsatisfied_explicit_requests),
                 ),
             )
 
+    def _unsatisfied_requests_summary(
+        self,
+        campers: list[str],
+        total_valid_requests: int,
+        total_satisfied: int,
+        explicit_unsatisfied_count: int,
+    ) -> ValidationIssue:
+        """Summary issue for campers whose valid requests are all unsatisfied."""
+        return ValidationIssue(
+            severity=ValidationSeverity.WARNING,
+            type="campers_with_unsatisfied_valid_requests",
+            message=f"{len(campers)} campers have valid requests but NONE are satisfied",
+            details={
+                "count": len(campers),
+                "total_valid_requests": total_valid_requests,
+                "total_satisfied": total_satisfied,
+                "explicit_unsatisfied_count": explicit_unsatisfied_count,
+            },
+            affected_ids=campers[:10],  # First 10 for UI
+        )
+
     def _validate_spreads(
         self,
         bunks: list[Bunk],
@@ -975,69 +1012,27 @@ class BunkingValidator:
         for h in historical_bunking:
             prior_bunks[h.person_cm_id] = (h.bunk_name, h.session_cm_id)
 
-        regressions = []
+        regressions: list[dict[str, Any]] = []
         progressions = 0
         same_level = 0
         returning_count = 0
         skipped_different_session = 0
 
         for person_cm_id, assignment in assignments_by_person.items():
-            # Convert person_cm_id to int if needed for lookup
-            person_key = int(person_cm_id) if isinstance(person_cm_id, str) else person_cm_id
-
-            if person_key not in prior_bunks:
-                continue  # New camper
-
-            prior_bunk, prior_session_cm_id = prior_bunks[person_key]
-
-            # Get current session from assignment
-            current_session_cm_id_raw = assignment.session_cm_id
-            # Convert to int for comparison if needed
-            current_session_cm_id: int | str = current_session_cm_id_raw
-            if isinstance(current_session_cm_id_raw, str):
-                try:
-                    current_session_cm_id = int(current_session_cm_id_raw)
-                except ValueError:
-                    current_session_cm_id = current_session_cm_id_raw
-
-            # ONLY compare same-session campers
-            # Different sessions have different age ranges - G-10 in Session 4 ≠ G-10 in ToC
-            if prior_session_cm_id is None or prior_session_cm_id != current_session_cm_id:
+            change, regression = self._level_change(
+                person_cm_id, assignment, prior_bunks, bunk_by_cm_id, person_by_id, level_order
+            )
+            if change == "different_session":
                 skipped_different_session += 1
-                continue
-
-            returning_count += 1
-            prior_level = extract_bunk_level(prior_bunk)
-
-            # Get current bunk name from lookup (BunkAssignment has bunk_cm_id, not bunk_name)
-            current_bunk = bunk_by_cm_id.get(assignment.bunk_cm_id)
-            current_bunk_name = current_bunk.name if current_bunk else None
-            current_level = extract_bunk_level(current_bunk_name) if current_bunk_name else None
-
-            if not prior_level or not current_level:
-                continue
-
-            prior_idx = level_order.get(prior_level, -1)
-            current_idx = level_order.get(current_level, -1)
-
-            if prior_idx == -1 or current_idx == -1:
-                continue
-
-            if current_idx < prior_idx:
-                person = person_by_id.get(person_cm_id)
-                regressions.append(
-                    {
-                        "person_cm_id": str(person_cm_id),
-                        "person_name": person.name if person else f"Person {person_cm_id}",
-                        "prior_bunk": prior_bunk,
-                        "current_bunk": current_bunk_name,
-                        "levels_regressed": prior_idx - current_idx,
-                    }
-                )
-            elif current_idx > prior_idx:
-                progressions += 1
-            else:
-                same_level += 1
+            elif change != "new":
+                returning_count += 1
+                if change == "regressed":
+                    if regression is not None:
+                        regressions.append(regression)
+                elif change == "progressed":
+                    progressions += 1
+                elif change == "same_level":
+                    same_level += 1
 
         # Log skipped campers for debugging
         if skipped_different_session > 0:
@@ -1055,16 +1050,87 @@ class BunkingValidator:
 
         # Create issues for regressions
         for reg in regressions:
-            person_cm_id_val = reg["person_cm_id"]
-            issues.append(
-                ValidationIssue(
-                    severity=ValidationSeverity.WARNING,
-                    type="level_regression",
-                    message=f"{reg['person_name']} was in {reg['prior_bunk']} last year but is now in {reg['current_bunk']} (regression of {reg['levels_regressed']} level(s))",
-                    details=reg,
-                    affected_ids=[str(person_cm_id_val)] if person_cm_id_val is not None else [],
-                )
-            )
+            issues.append(self._level_regression_issue(reg))
+
+    def _level_change(
+        self,
+        person_cm_id: str,
+        assignment: BunkAssignment,
+        prior_bunks: dict[int, tuple[str, int | None]],
+        bunk_by_cm_id: dict[str, Bunk],
+        person_by_id: dict[str, Person],
+        level_order: dict[str, int],
+    ) -> tuple[str, dict[str, Any] | None]:
+        """Classify one camper's level change against last year.
+
+        Returns:
+            (change, regression) where change is one of "new",
+            "different_session", "unknown_level", "progressed", "same_level"
+            or "regressed", and regression holds the issue details for
+            "regressed" (None otherwise)
+        """
+        # Convert person_cm_id to int if needed for lookup
+        person_key = int(person_cm_id) if isinstance(person_cm_id, str) else person_cm_id
+
+        if person_key not in prior_bunks:
+            return "new", None
+
+        prior_bunk, prior_session_cm_id = prior_bunks[person_key]
+
+        # Get current session from assignment
+        current_session_cm_id_raw = assignment.session_cm_id
+        # Convert to int for comparison if needed
+        current_session_cm_id: int | str = current_session_cm_id_raw
+        if isinstance(current_session_cm_id_raw, str):
+            try:
+                current_session_cm_id = int(current_session_cm_id_raw)
+            except ValueError:
+                current_session_cm_id = current_session_cm_id_raw
+
+        # ONLY compare same-session campers
+        # Different sessions have different age ranges - G-10 in Session 4 ≠ G-10 in ToC
+        if prior_session_cm_id is None or prior_session_cm_id != current_session_cm_id:
+            return "different_session", None
+
+        prior_level = extract_bunk_level(prior_bunk)
+
+        # Get current bunk name from lookup (BunkAssignment has bunk_cm_id, not bunk_name)
+        current_bunk = bunk_by_cm_id.get(assignment.bunk_cm_id)
+        current_bunk_name = current_bunk.name if current_bunk else None
+        current_level = extract_bunk_level(current_bunk_name) if current_bunk_name else None
+
+        if not prior_level or not current_level:
+            return "unknown_level", None
+
+        prior_idx = level_order.get(prior_level, -1)
+        current_idx = level_order.get(current_level, -1)
+
+        if prior_idx == -1 or current_idx == -1:
+            return "unknown_level", None
+
+        if current_idx < prior_idx:
+            person = person_by_id.get(person_cm_id)
+            return "regressed", {
+                "person_cm_id": str(person_cm_id),
+                "person_name": person.name if person else f"Person {person_cm_id}",
+                "prior_bunk": prior_bunk,
+                "current_bunk": current_bunk_name,
+                "levels_regressed": prior_idx - current_idx,
+            }
+        if current_idx > prior_idx:
+            return "progressed", None
+        return "same_level", None
+
+    def _level_regression_issue(self, regression: dict[str, Any]) -> ValidationIssue:
+        """Issue for a camper placed in a lower level than last year."""
+        person_cm_id_val = regression["person_cm_id"]
+        return ValidationIssue(
+            severity=ValidationSeverity.WARNING,
+            type="level_regression",
+            message=f"{regression['person_name']} was in {regression['prior_bunk']} last year but is now in {regression['current_bunk']} (regression of {regression['levels_regressed']} level(s))",
+            details=regression,
+            affected_ids=[str(person_cm_id_val)] if person_cm_id_val is not None else [],
+        )
 
     def _validate_age_grade_flow(
         self,
@@ -1156,108 +1222,95 @@ class BunkingValidator:
         issues: list[ValidationIssue],
     ) -> None:
         """Detect isolation risk: 1-2 isolated campers in bunks dominated by large friend groups."""
-        # Build request graph (same approach as solver isolation.py)
-        request_graph: dict[int, set[int]] = defaultdict(set)
+        # Request graph with union-find components: linear in requests + campers
+        request_graph = RequestGraph.from_requests(requests)
 
-        for request in requests:
-            if request.request_type == "bunk_with" and request.requested_person_cm_id:
-                requester = (
-                    int(request.requester_person_cm_id)
-                    if isinstance(request.requester_person_cm_id, str)
-                    else request.requester_person_cm_id
-                )
-                requestee = (
-                    int(request.requested_person_cm_id)
-                    if isinstance(request.requested_person_cm_id, str)
-                    else request.requested_person_cm_id
-                )
-                request_graph[requester].add(requestee)
-
-        # Find connected components via BFS
-        def find_component(start: int, visited: set[int]) -> set[int]:
-            component: set[int] = set()
-            queue: deque[int] = deque([start])
-
-            while queue:
-                node = queue.popleft()
-                if node in visited:
-                    continue
-                visited.add(node)
-                component.add(node)
-
-                # Follow outgoing edges
-                for neighbor in request_graph.get(node, set()):
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-
-                # Follow incoming edges (bidirectional)
-                for other, targets in request_graph.items():
-                    if node in targets and other not in visited:
-                        queue.append(other)
-
-            return component
-
-        # Find all large components (9+ people)
-        visited: set[int] = set()
-        large_components: list[set[int]] = []
-
-        for person in request_graph:
-            if person not in visited:
-                comp = find_component(person, visited)
-                if len(comp) >= 9:
-                    large_components.append(comp)
+        # Large components (9+ people), in discovery order
+        large_components = request_graph.components(min_size=9)
+        component_order = {request_graph.component_of(next(iter(c))): i for i, c in enumerate(large_components)}
 
         # Check each bunk for isolation risk
         isolation_risks: list[dict[str, Any]] = []
-
         for bunk in bunks:
-            bunk_assignments = assignments_by_bunk.get(bunk.campminder_id, [])
-            bunk_people = set()
-            for a in bunk_assignments:
-                person_id = int(a.person_cm_id) if isinstance(a.person_cm_id, str) else a.person_cm_id
-                bunk_people.add(person_id)
-
-            for component in large_components:
-                group_in_bunk = bunk_people & component
-                others_in_bunk = bunk_people - component
-
-                # Risk: 9-10 from group + 1-2 isolated others
-                if 9 <= len(group_in_bunk) <= 10 and 1 <= len(others_in_bunk) <= 2:
-                    # Check if "others" have any connections to group
-                    isolated: list[dict[str, Any]] = []
-                    for other in others_in_bunk:
-                        connections = request_graph.get(other, set()) & group_in_bunk
-                        incoming = {p for p, t in request_graph.items() if other in t} & group_in_bunk
-                        if not connections and not incoming:
-                            person_record = person_by_id.get(str(other))
-                            isolated.append(
-                                {
-                                    "cm_id": other,
-                                    "name": person_record.name if person_record else f"Person {other}",
-                                }
-                            )
-
-                    if isolated:
-                        isolation_risks.append(
-                            {
-                                "bunk_name": bunk.name,
-                                "group_size": len(group_in_bunk),
-                                "isolated_campers": isolated,
-                            }
-                        )
+            isolation_risks.extend(
+                self._bunk_isolation_risks(
+                    bunk,
+                    assignments_by_bunk.get(bunk.campminder_id, []),
+                    request_graph,
+                    component_order,
+                    person_by_id,
+                )
+            )
 
         # Update statistics
         stats.isolation_risks = len(isolation_risks)
 
         for risk in isolation_risks:
-            isolated_campers: list[dict[str, Any]] = risk.get("isolated_campers", [])
-            isolated_names = [str(c.get("name", "")) for c in isolated_campers]
-            issues.append(
-                ValidationIssue(
-                    severity=ValidationSeverity.WARNING,
-                    type="isolation_risk",
-                    message=f"{risk['bunk_name']} has {risk['group_size']} connected friends + {len(isolated_campers)} isolated camper(s): {', '.join(isolated_names)}",
-                    details=risk,
-                    affected_ids=[str(c.get("cm_id", "")) for c in isolated_campers],
-                )
-            )
+            issues.append(self._isolation_risk_issue(risk))
+
+    def _bunk_isolation_risks(
+        self,
+        bunk: Bunk,
+        bunk_assignments: list[BunkAssignment],
+        request_graph: RequestGraph,
+        component_order: dict[int | None, int],
+        person_by_id: dict[str, Person],
+    ) -> list[dict[str, Any]]:
+        """Isolation risks in one bunk.
+
+        Args:
+            component_order: Root of each large (9+) request component -> its
+                position in RequestGraph.components order
+        """
+        bunk_people = set()
+        for a in bunk_assignments:
+            person_id = int(a.person_cm_id) if isinstance(a.person_cm_id, str) else a.person_cm_id
+            bunk_people.add(person_id)
+
+        # Group bunk members by the large component they belong to
+        groups_in_bunk: dict[int, set[int]] = defaultdict(set)
+        for person_id in bunk_people:
+            root = request_graph.component_of(person_id)
+            if root is not None and root in component_order:
+                groups_in_bunk[root].add(person_id)
+
+        risks: list[dict[str, Any]] = []
+        for root in sorted(groups_in_bunk, key=component_order.__getitem__):
+            group_in_bunk = groups_in_bunk[root]
+            others_in_bunk = bunk_people - group_in_bunk
+
+            # Risk: 9-10 from group + 1-2 isolated others
+            if 9 <= len(group_in_bunk) <= 10 and 1 <= len(others_in_bunk) <= 2:
+                # Check if "others" have any connections to group
+                isolated: list[dict[str, Any]] = []
+                for other in others_in_bunk:
+                    if not request_graph.neighbors(other) & group_in_bunk:
+                        person_record = person_by_id.get(str(other))
+                        isolated.append(
+                            {
+                                "cm_id": other,
+                                "name": person_record.name if person_record else f"Person {other}",
+                            }
+                        )
+
+                if isolated:
+                    risks.append(
+                        {
+                            "bunk_name": bunk.name,
+                            "group_size": len(group_in_bunk),
+                            "isolated_campers": isolated,
+                        }
+                    )
+        return risks
+
+    def _isolation_risk_issue(self, risk: dict[str, Any]) -> ValidationIssue:
+        """Issue for one isolation risk found by _bunk_isolation_risks."""
+        isolated_campers: list[dict[str, Any]] = risk.get("isolated_campers", [])
+        isolated_names = [str(c.get("name", "")) for c in isolated_campers]
+        return ValidationIssue(
+            severity=ValidationSeverity.WARNING,
+            type="isolation_risk",
+            message=f"{risk['bunk_name']} has {risk['group_size']} connected friends + {len(isolated_campers)} isolated camper(s): {', '.join(isolated_names)}",
+            details=risk,
+            affected_ids=[str(c.get("cm_id", "")) for c in isolated_campers],
+        )
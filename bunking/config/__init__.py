@@ -16,6 +16,9 @@ Usage:
     # Typed accessors
     timeout = config.get_int("solver.time_limit.seconds")
     enabled = config.get_bool("smart_local_resolution.enabled")
+
+    # One consistent view for a whole solver run
+    run_config = config.pin()
 """
 
 from __future__ import annotations
@@ -29,11 +32,13 @@ from .errors import (
 )
 from .loader import ConfigLoader
 from .schema import CONFIG_SCHEMA, get_all_required_keys, get_schema_key, validate_key
+from .snapshot import ConfigSnapshot
 from .types import ConfigKey, ConfigType
 
 __all__ = [
     # Main loader
     "ConfigLoader",
+    "ConfigSnapshot",
     # Error classes
     "ConfigError",
     "MissingKeyError",
@@ -4,12 +4,16 @@ ConfigLoader - Unified fast-fail configuration management.
 Loads configuration from environment variables and PocketBase database.
 Requires database access and properly populated config values.
 No silent fallbacks - fails immediately on missing/invalid config.
+
+The whole config collection is read in one query into an immutable
+ConfigSnapshot, refreshed after the cache TTL or an update_config call.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -25,6 +29,7 @@ from .errors import (
     ValidationError,
 )
 from .schema import CONFIG_SCHEMA, get_all_required_keys
+from .snapshot import ConfigSnapshot, next_version
 from .types import ConfigType
 
 if TYPE_CHECKING:
@@ -51,6 +56,9 @@ class ConfigLoader:
         timeout = loader.get_int("solver.time_limit.seconds")
         enabled = loader.get_bool("smart_local_resolution.enabled")
 
+        # Pin one snapshot for a run (config cannot change mid-run)
+        run_config = loader.pin()
+
         # Test substitution
         with ConfigLoader.use(mock_loader):
             # Tests run with mock
@@ -78,7 +86,9 @@ class ConfigLoader:
             self._pb = self._create_pb_client()
 
         self._cache_ttl = cache_ttl_seconds
-        self._cache: dict[str, tuple[Any, float]] = {}
+        self._snapshot: ConfigSnapshot | None = None
+        self._refresh_lock = threading.Lock()
+        self._pinned = False
         self._validated = False
 
     def _create_pb_client(self) -> PocketBase:
@@ -201,34 +211,16 @@ class ConfigLoader:
             DatabaseUnavailableError: If database cannot be reached
             ConfigError: If any required keys are missing or invalid
         """
-        missing_keys: list[str] = []
-        invalid_values: list[str] = []
-
         required_keys = get_all_required_keys()
 
-        for key in required_keys:
-            schema = CONFIG_SCHEMA[key]
-
-            try:
-                raw_value = self._query_database_raw(key)
-
-                if raw_value is None:
-                    missing_keys.append(key)
-                    continue
-
-                # Convert and validate
-                try:
-                    typed_value = self._convert_type(raw_value, schema.config_type)
-                    error = schema.validate(typed_value)
-                    if error:
-                        invalid_values.append(f"{key}: {error}")
-                except (ValueError, TypeError) as e:
-                    invalid_values.append(f"{key}: type conversion failed - {e}")
+        try:
+            snapshot = self._load_snapshot()
+        except Exception as e:
+            raise DatabaseUnavailableError(f"Database error while validating config: {e}") from e
+        self._snapshot = snapshot
 
-            except DatabaseUnavailableError:
-                raise
-            except Exception as e:
-                raise DatabaseUnavailableError(f"Database error while validating config key '{key}': {e}") from e
+        missing_keys = [key for key in required_keys if key not in snapshot and key not in snapshot.errors]
+        invalid_values = [snapshot.errors[key] for key in required_keys if key in snapshot.errors]
 
         if missing_keys or invalid_values:
             error_parts = []
@@ -262,53 +254,137 @@ class ConfigLoader:
             MissingKeyError: If required key not in database
             ValidationError: If value fails validation
         """
-        # Validate key is known
-        if key not in CONFIG_SCHEMA:
-            raise UnknownKeyError(f"Unknown config key: '{key}'")
+        return self.snapshot().get(key)
 
-        schema = CONFIG_SCHEMA[key]
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Get the current config snapshot, reloading it once the TTL has passed.
+
+        A pinned loader (see pin) always returns the snapshot it was pinned to.
+
+        Returns:
+            The current ConfigSnapshot
 
-        # Check environment first (highest priority override)
-        env_key = self._get_env_key(key)
-        env_value = os.environ.get(env_key)
-        if env_value is not None:
+        Raises:
+            DatabaseUnavailableError: If no snapshot has loaded yet and the
+                database cannot be read (after a successful load, a failed
+                reload keeps serving the previous snapshot)
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and (self._pinned or time.time() - snapshot.loaded_at < self._cache_ttl):
+            return snapshot
+
+        with self._refresh_lock:
+            # Another thread may have reloaded while we waited
+            snapshot = self._snapshot
+            if snapshot is not None and time.time() - snapshot.loaded_at < self._cache_ttl:
+                return snapshot
             try:
-                typed_value = self._convert_type(env_value, schema.config_type)
-                return typed_value
-            except (ValueError, TypeError) as e:
-                raise ValidationError(f"Environment variable {env_key} has invalid type: {e}") from e
+                self._snapshot = self._load_snapshot()
+            except Exception as e:
+                if snapshot is not None:
+                    # Keep serving the last loaded values; retry after another TTL
+                    logger.warning(f"Failed to reload config, keeping version {snapshot.version}: {e}")
+                    self._snapshot = ConfigSnapshot(snapshot.version, values=snapshot.values, errors=snapshot.errors)
+                    return self._snapshot
+                # Nothing loaded yet: fail rather than let typed accessor defaults
+                # stand in for config; the next lookup retries
+                raise DatabaseUnavailableError(f"Failed to load config from database: {e}") from e
+            return self._snapshot
 
-        # Check cache
-        if key in self._cache:
-            value, timestamp = self._cache[key]
-            if time.time() - timestamp < self._cache_ttl:
-                return value
+    def pin(self) -> ConfigLoader:
+        """
+        Get a loader fixed to the current snapshot.
 
-        # Query database
-        try:
-            raw_value = self._query_database_raw(key)
-        except Exception as e:
-            raise DatabaseUnavailableError(f"Database error fetching config key '{key}': {e}") from e
+        Use for a solver run so every lookup during the run sees the same
+        config, even if the TTL passes or config is updated meanwhile.
+
+        Returns:
+            A ConfigLoader whose snapshot never refreshes
+
+        Raises:
+            DatabaseUnavailableError: If no config could be loaded
+            ConfigError: If the snapshot holds no config at all
+        """
+        snapshot = self.snapshot()
+        if not snapshot.values and not snapshot.errors:
+            raise ConfigError(f"Refusing to pin empty config snapshot (version {snapshot.version})")
+        pinned = ConfigLoader(self._pb, cache_ttl_seconds=self._cache_ttl)
+        pinned._snapshot = snapshot
+        pinned._pinned = True
+        pinned._validated = self._validated
+        return pinned
+
+    def _load_snapshot(self) -> ConfigSnapshot:
+        """
+        Load every config record in one query and build a snapshot.
+
+        Environment overrides (CONFIG_<KEY>) take priority over the database.
+
+        Raises:
+            Exception: If the config collection cannot be read
+        """
+        records = self._pb.collection("config").get_full_list(batch=500)
 
-        # Handle missing values
-        if raw_value is None:
-            raise MissingKeyError(
-                f"Required config key '{key}' not found in database. Run migrations or add key to config table."
+        raw_values: dict[tuple[str, str, str], Any] = {}
+        for record in records:
+            # First record wins, as get_first_list_item would return it
+            raw_key = (
+                getattr(record, "category", ""),
+                getattr(record, "subcategory", None) or "",
+                getattr(record, "config_key", ""),
             )
+            raw_values.setdefault(raw_key, getattr(record, "value", None))
+
+        values: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for key, schema in CONFIG_SCHEMA.items():
+            env_key = self._get_env_key(key)
+            env_value = os.environ.get(env_key)
+            if env_value is not None:
+                try:
+                    values[key] = self._convert_type(env_value, schema.config_type)
+                except (ValueError, TypeError) as e:
+                    errors[key] = f"Environment variable {env_key} has invalid type: {e}"
+                continue
 
-        # Convert and validate
-        try:
-            typed_value = self._convert_type(raw_value, schema.config_type)
-        except (ValueError, TypeError) as e:
-            raise ValidationError(f"Config key '{key}' has invalid type: {e}") from e
+            raw_value = raw_values.get(self._split_key(key))
+            if raw_value is None:
+                continue
 
-        error = schema.validate(typed_value)
-        if error:
-            raise ValidationError(f"Config key '{key}': {error}")
+            try:
+                typed_value = self._convert_type(raw_value, schema.config_type)
+            except (ValueError, TypeError) as e:
+                errors[key] = f"Config key '{key}' has invalid type: {e}"
+                continue
+
+            error = schema.validate(typed_value)
+            if error:
+                errors[key] = f"Config key '{key}': {error}"
+            else:
+                values[key] = typed_value
 
-        # Cache and return
-        self._cache[key] = (typed_value, time.time())
-        return typed_value
+        snapshot = ConfigSnapshot(next_version(), values=values, errors=errors)
+        logger.debug(f"Loaded config version {snapshot.version}: {len(values)} keys from {len(records)} records")
+        return snapshot
+
+    @staticmethod
+    def _split_key(key: str) -> tuple[str, str, str]:
+        """
+        Split a dot-notation key into (category, subcategory, config_key).
+
+        Subcategory is "" for one- and two-part keys; deeper keys join the
+        middle parts with underscores.
+        """
+        parts = key.split(".")
+
+        if len(parts) == 1:
+            return "general", "", parts[0]
+        if len(parts) == 2:
+            return parts[0], "", parts[1]
+        if len(parts) == 3:
+            return parts[0], parts[1], parts[2]
+        return parts[0], "_".join(parts[1:-1]), parts[-1]
 
     def get_int(self, key: str, default: int | None = None) -> int:
         """Get an integer config value."""
@@ -418,41 +494,16 @@ class ConfigLoader:
         key = weight_mappings.get(constraint_name, f"constraint.{constraint_name}.weight")
         return self.get_int(key, default=default)
 
-    def _query_database_raw(self, key: str) -> Any | None:
-        """
-        Query PocketBase for a config value.
-
-        Args:
-            key: The dot-notation config key
-
-        Returns:
-            The raw value from database, or None if not found
-        """
-        parts = key.split(".")
-
-        if len(parts) == 1:
-            category, subcategory, config_key = "general", None, parts[0]
-        elif len(parts) == 2:
-            category, subcategory, config_key = parts[0], None, parts[1]
-        elif len(parts) == 3:
-            category, subcategory, config_key = parts[0], parts[1], parts[2]
-        else:
-            category = parts[0]
-            subcategory = "_".join(parts[1:-1])
-            config_key = parts[-1]
+    def _record_filter(self, key: str) -> str:
+        """Build the PocketBase filter selecting a key's config record."""
+        category, subcategory, config_key = self._split_key(key)
 
         filter_str = f'category = "{category}" && config_key = "{config_key}"'
         if subcategory:
             filter_str += f' && subcategory = "{subcategory}"'
         else:
             filter_str += ' && (subcategory = null || subcategory = "")'
-
-        try:
-            record = self._pb.collection("config").get_first_list_item(filter_str)
-            return record.value
-        except Exception:
-            # Record not found
-            return None
+        return filter_str
 
     def _convert_type(self, value: Any, config_type: ConfigType) -> Any:
         """Convert a raw value to the specified type."""
@@ -550,17 +601,18 @@ class ConfigLoader:
         """
         Invalidate cached values.
 
+        The snapshot is loaded as a whole, so any invalidation drops it and
+        the next lookup reloads every key. Pinned loaders are unaffected.
+
         Args:
-            key: Specific key to invalidate, or None for all
+            key: Key that changed, or None for all
         """
-        if key is None:
-            self._cache.clear()
-        elif key in self._cache:
-            del self._cache[key]
+        if not self._pinned:
+            self._snapshot = None
 
     def clear_cache(self) -> None:
         """Clear the configuration cache (alias for invalidate_cache)."""
-        self._cache.clear()
+        self.invalidate_cache()
 
     def reload(self) -> None:
         """Reload configuration from sources."""
@@ -589,28 +641,10 @@ class ConfigLoader:
         if error:
             raise ValidationError(f"Cannot update '{key}': {error}")
 
-        parts = key.split(".")
-        if len(parts) == 1:
-            category, subcategory, config_key = "general", None, parts[0]
-        elif len(parts) == 2:
-            category, subcategory, config_key = parts[0], None, parts[1]
-        elif len(parts) == 3:
-            category, subcategory, config_key = parts[0], parts[1], parts[2]
-        else:
-            category = parts[0]
-            subcategory = "_".join(parts[1:-1])
-            config_key = parts[-1]
-
-        filter_str = f'category = "{category}" && config_key = "{config_key}"'
-        if subcategory:
-            filter_str += f' && subcategory = "{subcategory}"'
-        else:
-            filter_str += ' && (subcategory = null || subcategory = "")'
-
-        record = self._pb.collection("config").get_first_list_item(filter_str)
+        record = self._pb.collection("config").get_first_list_item(self._record_filter(key))
         self._pb.collection("config").update(record.id, {"value": value})
 
-        # Invalidate cache entry
+        # Next lookup loads a new snapshot
         self.invalidate_cache(key)
 
         logger.info(f"Updated config '{key}' to '{value}'")
@@ -626,7 +660,8 @@ class ConfigLoader:
             "status": "healthy",
             "database_connected": False,
             "validated": self._validated,
-            "cached_keys": len(self._cache),
+            "cached_keys": len(self._snapshot) if self._snapshot else 0,
+            "config_version": self._snapshot.version if self._snapshot else None,
             "issues": [],
         }
 
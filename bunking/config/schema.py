@@ -345,6 +345,14 @@ CONFIG_SCHEMA: dict[str, ConfigKey] = {
         min_value=1,
         max_value=600,
     ),
+    "solver.symmetry_breaking.enabled": ConfigKey(
+        key="solver.symmetry_breaking.enabled",
+        config_type=ConfigType.INT,
+        required=False,
+        description="Order interchangeable bunks to break search symmetry (1=enabled)",
+        min_value=0,
+        max_value=1,
+    ),
     # =========================================================================
     # SMART LOCAL RESOLUTION (NetworkX-based name resolution)
     # =========================================================================
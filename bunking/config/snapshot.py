@@ -0,0 +1,72 @@
+"""Immutable, versioned view of the whole configuration.
+
+ConfigLoader builds a snapshot from one query over the config collection,
+with environment overrides applied and every schema key converted and
+validated up front, so lookups are plain dict reads.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+from .errors import MissingKeyError, UnknownKeyError, ValidationError
+from .schema import CONFIG_SCHEMA
+
+_versions = itertools.count(1)
+
+
+def next_version() -> int:
+    """Allocate a snapshot version (unique per process, increasing)."""
+    return next(_versions)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Typed config values as of one load.
+
+    Attributes:
+        version: Increasing load counter
+        loaded_at: time.time() of the load
+        values: Typed, validated values by dot-notation key
+        errors: Keys whose stored value failed conversion or validation
+    """
+
+    version: int
+    loaded_at: float = field(default_factory=time.time)
+    values: Mapping[str, Any] = field(default_factory=dict)
+    errors: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Read-only views so a pinned snapshot cannot drift
+        object.__setattr__(self, "values", MappingProxyType(dict(self.values)))
+        object.__setattr__(self, "errors", MappingProxyType(dict(self.errors)))
+
+    def get(self, key: str) -> Any:
+        """
+        Get a configuration value.
+
+        Raises:
+            UnknownKeyError: If key is not in schema
+            MissingKeyError: If key had no value when the snapshot was loaded
+            ValidationError: If the stored value was invalid
+        """
+        if key in self.values:
+            return self.values[key]
+        if key in self.errors:
+            raise ValidationError(self.errors[key])
+        if key not in CONFIG_SCHEMA:
+            raise UnknownKeyError(f"Unknown config key: '{key}'")
+        raise MissingKeyError(
+            f"Required config key '{key}' not found in database. Run migrations or add key to config table."
+        )
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.values
+
+    def __len__(self) -> int:
+        return len(self.values)
@@ -2,6 +2,7 @@
 Graph analysis components for bunking intelligence system
 """
 
+from .request_graph import RequestGraph
 from .social_graph_builder import FriendGroupDetection, SocialGraphBuilder
 
-__all__ = ["SocialGraphBuilder", "FriendGroupDetection"]
+__all__ = ["SocialGraphBuilder", "FriendGroupDetection", "RequestGraph"]
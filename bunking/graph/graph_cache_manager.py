@@ -2,14 +2,26 @@
 Backend caching system for social graphs.
 
 Provides server-side caching of NetworkX graphs with TTL and invalidation.
+Values derived from a session graph (person details, serialized responses)
+are cached alongside it and dropped whenever the graph is evicted or
+replaced; writers pass the version of the graph they derived from, so a
+value derived from a stale graph is not attached to its replacement.
 Thread-safe implementation for concurrent access.
+
+Async callers use get_or_build_*: graphs are built in a worker thread, so
+NetworkX analysis and the builder's blocking PocketBase reads stay off the
+event loop; concurrent misses for the same graph share one build; and an
+expired graph is served while its replacement is built in the background.
 """
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
 import threading
 import time
+from collections.abc import Callable
 from typing import Any
 
 import networkx as nx
@@ -20,19 +32,33 @@ logger = logging.getLogger(__name__)
 class GraphCacheManager:
     """Thread-safe cache manager for social graphs."""
 
-    def __init__(self, ttl_seconds: int = 900, max_cache_size: int = 100):
+    def __init__(self, ttl_seconds: int = 900, max_cache_size: int = 100, stale_ttl_seconds: int | None = None):
         """Initialize cache manager.
 
         Args:
             ttl_seconds: Time to live for cached graphs (default: 15 minutes)
             max_cache_size: Maximum number of graphs to cache
+            stale_ttl_seconds: How long past its TTL a graph may still be served
+                by get_or_build_* while it is rebuilt (default: ttl_seconds)
         """
         self._cache: dict[str, nx.DiGraph] = {}
         self._cache_times: dict[str, float] = {}
         self._access_times: dict[str, float] = {}
+        # graph cache key -> {derived name -> value}
+        self._derived: dict[str, dict[str, Any]] = {}
+        # graph cache key -> version of the stored graph, new on every store
+        self._versions: dict[str, int] = {}
+        self._version_counter = itertools.count(1)
         self._ttl = ttl_seconds
+        self._stale_ttl = ttl_seconds if stale_ttl_seconds is None else stale_ttl_seconds
         self._max_size = max_cache_size
         self._lock = threading.RLock()
+        # cache key -> build shared by every caller waiting on that graph
+        self._inflight: dict[str, asyncio.Task[tuple[nx.DiGraph, int | None]]] = {}
+        # cache key -> invalidations seen while its build is in flight, so a
+        # build that started before an invalidation of its key is not cached
+        self._generations: dict[str, int] = {}
+        self._stale_served = 0
         self._hit_count = 0
         self._miss_count = 0
 
@@ -104,19 +130,7 @@ class GraphCacheManager:
             year: Year
             graph: NetworkX graph to cache
         """
-        cache_key = f"session_{session_cm_id}_{year}"
-
-        with self._lock:
-            # Evict LRU if at capacity
-            if len(self._cache) >= self._max_size and cache_key not in self._cache:
-                self._evict_lru()
-
-            # Store a copy to prevent external mutations
-            self._cache[cache_key] = graph.copy()
-            self._cache_times[cache_key] = time.time()
-            self._access_times[cache_key] = time.time()
-
-            logger.debug(f"Cached session graph {cache_key} with {graph.number_of_nodes()} nodes")
+        self._store(f"session_{session_cm_id}_{year}", graph)
 
     def cache_bunk_graph(self, bunk_cm_id: int, session_cm_id: int, year: int, graph: nx.DiGraph) -> None:
         """Cache a bunk graph.
@@ -127,19 +141,98 @@ class GraphCacheManager:
             year: Year
             graph: NetworkX graph to cache
         """
-        cache_key = f"bunk_{bunk_cm_id}_{session_cm_id}_{year}"
+        self._store(f"bunk_{bunk_cm_id}_{session_cm_id}_{year}", graph)
 
+    def has_session_graph(self, session_cm_id: int, year: int) -> bool:
+        """Whether get_or_build_session_graph can answer without waiting for a build.
+
+        True for fresh graphs and for expired ones still within the stale window.
+        """
+        cache_key = f"session_{session_cm_id}_{year}"
         with self._lock:
-            # Evict LRU if at capacity
-            if len(self._cache) >= self._max_size and cache_key not in self._cache:
-                self._evict_lru()
+            return (
+                cache_key in self._cache and time.time() - self._cache_times[cache_key] <= self._ttl + self._stale_ttl
+            )
 
-            # Store a copy to prevent external mutations
-            self._cache[cache_key] = graph.copy()
-            self._cache_times[cache_key] = time.time()
-            self._access_times[cache_key] = time.time()
+    async def get_or_build_session_graph(
+        self, session_cm_id: int, year: int, build: Callable[[], nx.DiGraph]
+    ) -> nx.DiGraph:
+        """Get a session graph, building it in a worker thread on a miss.
+
+        Args:
+            session_cm_id: Session ID
+            year: Year
+            build: Blocking function that builds the graph
+
+        Returns:
+            Graph copy (possibly stale while a rebuild is running)
+        """
+        graph, _ = await self._get_or_build(f"session_{session_cm_id}_{year}", build)
+        return graph
+
+    async def get_or_build_versioned_session_graph(
+        self, session_cm_id: int, year: int, build: Callable[[], nx.DiGraph]
+    ) -> tuple[nx.DiGraph, int | None]:
+        """Like get_or_build_session_graph, plus the version of the returned graph.
+
+        Pass the version to cache_session_persons / cache_session_response so
+        values derived from this graph are dropped if it has been replaced
+        meanwhile (None if the graph was not cached).
+        """
+        return await self._get_or_build(f"session_{session_cm_id}_{year}", build)
+
+    async def get_or_build_bunk_graph(
+        self, bunk_cm_id: int, session_cm_id: int, year: int, build: Callable[[], nx.DiGraph]
+    ) -> nx.DiGraph:
+        """Get a bunk graph, building it in a worker thread on a miss.
+
+        Empty graphs are returned but not cached.
+        """
+        graph, _ = await self._get_or_build(
+            f"bunk_{bunk_cm_id}_{session_cm_id}_{year}", build, cacheable=lambda graph: graph.number_of_nodes() > 0
+        )
+        return graph
+
+    def get_session_persons(self, session_cm_id: int, year: int) -> dict[int, Any] | None:
+        """Get cached person details for a session graph's nodes.
+
+        Returns:
+            person_cm_id -> details mapping, or None if not cached
+        """
+        return self._get_derived(f"session_{session_cm_id}_{year}", "persons")
+
+    def cache_session_persons(
+        self, session_cm_id: int, year: int, persons: dict[int, Any], version: int | None = None
+    ) -> None:
+        """Cache person details for a session graph's nodes.
 
-            logger.debug(f"Cached bunk graph {cache_key} with {graph.number_of_nodes()} nodes")
+        Ignored if the session graph itself is not cached, or if version is
+        given and the cached graph is no longer that version.
+        """
+        self._set_derived(f"session_{session_cm_id}_{year}", "persons", persons, version)
+
+    def get_session_response(self, session_cm_id: int, year: int, variant: str) -> bytes | None:
+        """Get a cached serialized response built from a session graph.
+
+        Args:
+            session_cm_id: Session ID
+            year: Year
+            variant: Identifies the request options the response was built for
+
+        Returns:
+            Serialized response or None if not cached
+        """
+        return self._get_derived(f"session_{session_cm_id}_{year}", f"response:{variant}")
+
+    def cache_session_response(
+        self, session_cm_id: int, year: int, variant: str, response: bytes, version: int | None = None
+    ) -> None:
+        """Cache a serialized response built from a session graph.
+
+        Ignored if the session graph itself is not cached, or if version is
+        given and the cached graph is no longer that version.
+        """
+        self._set_derived(f"session_{session_cm_id}_{year}", f"response:{variant}", response, version)
 
     def invalidate_for_person(self, person_cm_id: int) -> int:
         """Invalidate all cached graphs containing a specific person.
@@ -159,6 +252,8 @@ class GraphCacheManager:
             for key in keys_to_remove:
                 self._evict(key)
 
+            # An in-flight build's graph is not known yet, so any of them may contain the person
+            self._bump_generations(lambda key: True)
             if keys_to_remove:
                 logger.info(f"Invalidated {len(keys_to_remove)} graphs containing person {person_cm_id}")
 
@@ -174,13 +269,17 @@ class GraphCacheManager:
             keys_to_remove = []
             session_prefix = f"session_{session_cm_id}_{year}"
 
+            def matches(key: str) -> bool:
+                return key.startswith(session_prefix) or f"_{session_cm_id}_{year}" in key
+
             for key in self._cache:
-                if key.startswith(session_prefix) or f"_{session_cm_id}_{year}" in key:
+                if matches(key):
                     keys_to_remove.append(key)
 
             for key in keys_to_remove:
                 self._evict(key)
 
+            self._bump_generations(matches)
             if keys_to_remove:
                 logger.info(f"Invalidated {len(keys_to_remove)} graphs for session {session_cm_id}")
 
@@ -202,6 +301,7 @@ class GraphCacheManager:
             for key in keys_to_remove:
                 self._evict(key)
 
+            self._bump_generations(lambda key: f"bunk_{bunk_cm_id}_" in key)
             if keys_to_remove:
                 logger.info(f"Invalidated {len(keys_to_remove)} graphs for bunk {bunk_cm_id}")
 
@@ -214,6 +314,9 @@ class GraphCacheManager:
             self._cache.clear()
             self._cache_times.clear()
             self._access_times.clear()
+            self._derived.clear()
+            self._versions.clear()
+            self._bump_generations(lambda key: True)
             logger.info(f"Cleared {count} cached graphs")
 
     def cleanup_expired(self) -> int:
@@ -256,6 +359,9 @@ class GraphCacheManager:
                 "total_requests": total_requests,
                 "ttl_seconds": self._ttl,
                 "max_size": self._max_size,
+                "derived_entries": sum(len(d) for d in self._derived.values()),
+                "stale_served": self._stale_served,
+                "builds_in_flight": len(self._inflight),
             }
 
     def _evict(self, key: str) -> None:
@@ -264,6 +370,136 @@ class GraphCacheManager:
             del self._cache[key]
             del self._cache_times[key]
             self._access_times.pop(key, None)
+            self._derived.pop(key, None)
+            self._versions.pop(key, None)
+
+    def _store(self, cache_key: str, graph: nx.DiGraph) -> None:
+        """Cache a graph under cache_key, evicting LRU at capacity."""
+        with self._lock:
+            # Evict LRU if at capacity
+            if len(self._cache) >= self._max_size and cache_key not in self._cache:
+                self._evict_lru()
+
+            # Store a copy to prevent external mutations; values derived from
+            # a previous version of this graph are stale
+            self._cache[cache_key] = graph.copy()
+            self._cache_times[cache_key] = time.time()
+            self._access_times[cache_key] = time.time()
+            self._derived.pop(cache_key, None)
+            self._versions[cache_key] = next(self._version_counter)
+
+            logger.debug(f"Cached graph {cache_key} with {graph.number_of_nodes()} nodes")
+
+    async def _get_or_build(
+        self,
+        cache_key: str,
+        build: Callable[[], nx.DiGraph],
+        cacheable: Callable[[nx.DiGraph], bool] = lambda graph: True,
+    ) -> tuple[nx.DiGraph, int | None]:
+        """Serve cache_key from cache, or from a single shared build.
+
+        Fresh graphs are returned directly. Expired graphs within the stale
+        window are returned immediately and trigger a background rebuild.
+        Otherwise the caller waits for the build, joining one that is
+        already running for the same key.
+
+        Returns:
+            Graph copy and the version it was cached as (None if not cached)
+        """
+        with self._lock:
+            stale: nx.DiGraph | None = None
+            if cache_key in self._cache:
+                age = time.time() - self._cache_times[cache_key]
+                if age <= self._ttl + self._stale_ttl:
+                    self._access_times[cache_key] = time.time()
+                    self._hit_count += 1
+                    version = self._versions.get(cache_key)
+                    if age <= self._ttl:
+                        return self._cache[cache_key].copy(), version
+                    stale = self._cache[cache_key].copy()
+                    self._stale_served += 1
+                else:
+                    self._evict(cache_key)
+            if stale is None:
+                self._miss_count += 1
+
+            task = self._inflight.get(cache_key)
+            if task is None:
+                generation = self._generations.setdefault(cache_key, 0)
+                task = asyncio.ensure_future(self._build(cache_key, build, cacheable, generation))
+                task.add_done_callback(lambda done: self._build_finished(cache_key, done))
+                self._inflight[cache_key] = task
+
+        if stale is not None:
+            logger.debug(f"Serving stale graph {cache_key} while it is rebuilt")
+            return stale, version
+
+        # Shield the shared build from cancellation of any one waiter
+        graph, version = await asyncio.shield(task)
+        return graph.copy(), version
+
+    async def _build(
+        self,
+        cache_key: str,
+        build: Callable[[], nx.DiGraph],
+        cacheable: Callable[[nx.DiGraph], bool],
+        generation: int,
+    ) -> tuple[nx.DiGraph, int | None]:
+        """Run a blocking build in a worker thread and cache the result.
+
+        Returns:
+            The graph and its cached version (None if it was not cached)
+        """
+        graph = await asyncio.to_thread(build)
+        with self._lock:
+            # Invalidated while building: the graph may reflect old data
+            if cacheable(graph) and generation == self._generations.get(cache_key, 0):
+                self._store(cache_key, graph)
+                return graph, self._versions[cache_key]
+        return graph, None
+
+    def _build_finished(self, cache_key: str, task: asyncio.Task[tuple[nx.DiGraph, int | None]]) -> None:
+        """Forget a finished build; log failures nobody else will see."""
+        with self._lock:
+            if self._inflight.get(cache_key) is task:
+                del self._inflight[cache_key]
+                self._generations.pop(cache_key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Building graph {cache_key} failed: {task.exception()}")
+
+    def _bump_generations(self, matches: Callable[[str], bool]) -> None:
+        """Mark in-flight builds whose key matches as invalidated (caller holds the lock)."""
+        for key in self._inflight:
+            if matches(key):
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def _get_derived(self, key: str, name: str) -> Any | None:
+        """Get a value derived from a cached graph, honouring the graph's TTL.
+
+        An expired graph is kept (not evicted) so get_or_build_* can still
+        serve it while it is rebuilt.
+        """
+        with self._lock:
+            if key not in self._cache:
+                return None
+            if time.time() - self._cache_times[key] > self._ttl:
+                return None
+            self._access_times[key] = time.time()
+            return self._derived.get(key, {}).get(name)
+
+    def _set_derived(self, key: str, name: str, value: Any, version: int | None = None) -> None:
+        """Store a value derived from a cached graph.
+
+        No-op if the graph is absent, or if version is given and the cached
+        graph has been replaced since that version was read.
+        """
+        with self._lock:
+            if key not in self._cache:
+                return
+            if version is not None and self._versions.get(key) != version:
+                logger.debug(f"Dropping {name} derived from a replaced graph {key}")
+                return
+            self._derived.setdefault(key, {})[name] = value
 
     def _evict_lru(self) -> None:
         """Evict least recently used entry."""
@@ -0,0 +1,116 @@
+"""
+Compact directed graph of bunk requests with union-find components.
+
+Keeps forward (requester -> requestees) and reverse (requestee -> requesters)
+adjacency so both directions are O(degree) lookups, and maintains weakly
+connected components incrementally with a union-find as edges are added.
+Lightweight enough for validation passes that do not need NetworkX.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+
+class RequestGraph:
+    """Directed request graph with forward/reverse adjacency and components."""
+
+    def __init__(self, edges: Iterable[tuple[int, int]] = ()) -> None:
+        self.successors: dict[int, set[int]] = defaultdict(set)
+        self.predecessors: dict[int, set[int]] = defaultdict(set)
+        # Union-find over every node seen, in insertion order
+        self._parent: dict[int, int] = {}
+        self._size: dict[int, int] = {}
+        for requester, requestee in edges:
+            self.add_edge(requester, requestee)
+
+    @classmethod
+    def from_requests(cls, requests: Iterable[Any], request_type: str = "bunk_with") -> RequestGraph:
+        """
+        Build a graph from bunk request records.
+
+        Args:
+            requests: Objects with request_type, requester_person_cm_id and
+                requested_person_cm_id (int or numeric string IDs)
+            request_type: Only requests of this type become edges
+
+        Returns:
+            RequestGraph with one edge per matching request
+        """
+        graph = cls()
+        for request in requests:
+            if request.request_type == request_type and request.requested_person_cm_id:
+                graph.add_edge(int(request.requester_person_cm_id), int(request.requested_person_cm_id))
+        return graph
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._parent
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def add_node(self, node: int) -> None:
+        """Add a node with no edges."""
+        if node not in self._parent:
+            self._parent[node] = node
+            self._size[node] = 1
+
+    def add_edge(self, requester: int, requestee: int) -> None:
+        """Add a request edge and merge the two nodes' components."""
+        self.add_node(requester)
+        self.add_node(requestee)
+        self.successors[requester].add(requestee)
+        self.predecessors[requestee].add(requester)
+        self._union(requester, requestee)
+
+    def neighbors(self, node: int) -> set[int]:
+        """Nodes connected to node by an edge in either direction."""
+        return self.successors.get(node, set()) | self.predecessors.get(node, set())
+
+    def component_of(self, node: int) -> int | None:
+        """Representative of node's component, or None if node is not in the graph."""
+        if node not in self._parent:
+            return None
+        return self._find(node)
+
+    def component_size(self, node: int) -> int:
+        """Number of nodes in node's component (0 if node is not in the graph)."""
+        root = self.component_of(node)
+        return self._size[root] if root is not None else 0
+
+    def components(self, min_size: int = 1) -> list[set[int]]:
+        """
+        Weakly connected components, ordered by their first inserted node.
+
+        Args:
+            min_size: Skip components smaller than this
+
+        Returns:
+            List of node sets
+        """
+        members: dict[int, set[int]] = {}
+        for node in self._parent:
+            root = self._find(node)
+            if self._size[root] >= min_size:
+                members.setdefault(root, set()).add(node)
+        return list(members.values())
+
+    def _find(self, node: int) -> int:
+        parent = self._parent
+        while parent[node] != node:
+            # Path halving
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def _union(self, a: int, b: int) -> None:
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a == root_b:
+            return
+        # Union by size
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
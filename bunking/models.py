@@ -217,6 +217,17 @@ class UpdateScenarioRequest(BaseModel):
     is_active: bool | None = None
 
 
+class IncrementalSolveRequest(BaseModel):
+    """Request to re-optimize the neighborhood of edited campers in a scenario"""
+
+    session_cm_id: int  # CampMinder session ID
+    year: int
+    person_ids: list[int] = Field(min_length=1)  # CampMinder person IDs that were just edited
+    bunk_ids: list[int] = Field(default_factory=list)  # Extra affected bunks (e.g. the bunk a camper left)
+    pin_edited: bool = True  # Keep edited campers in the bunk staff put them in
+    time_limit_ms: int = Field(default=800, ge=100, le=10000)
+
+
 class ClearScenarioRequest(BaseModel):
     """Request to clear all assignments in a scenario"""
 
@@ -119,6 +119,10 @@ class DirectSolverInput(BaseModel):
     bunks: list[DirectBunk]
     existing_assignments: list[DirectBunkAssignment] = Field(default_factory=list)
     historical_bunking: list[HistoricalBunkingRecord] = Field(default_factory=list)
+    # Warm start: person_cm_id -> bunk_cm_id fed to CP-SAT as a solution hint
+    solution_hints: dict[int, int] = Field(default_factory=dict)
+    # Objective penalty per hinted camper placed in a different bunk (0 disables)
+    change_penalty: int = 0
 
     @property
     def person_by_cm_id(self) -> dict[int, DirectPerson]:
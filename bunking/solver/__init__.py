@@ -7,12 +7,14 @@ This package contains:
 - SolverProgressCallback: Real-time solver progress monitoring
 - Constraint builders: Modular constraint implementations
 - Preprocessing: Friend group detection and splitting
+- Neighborhood selection: Locking all but a few campers for incremental re-solves
 - Solution analysis: Post-solve result analysis
 """
 
 from .callbacks import SolverProgressCallback
 from .direct_solver import DirectBunkingSolver
 from .logging import ConstraintLogger
+from .neighborhood import build_neighborhood_input, select_neighborhood
 from .solution import (
     analyze_bunk_health,
     analyze_level_progressions,
@@ -26,6 +28,9 @@ __all__ = [
     "ConstraintLogger",
     "DirectBunkingSolver",
     "SolverProgressCallback",
+    # Incremental re-solve
+    "build_neighborhood_input",
+    "select_neighborhood",
     # Solution analysis functions
     "analyze_bunk_health",
     "analyze_level_progressions",
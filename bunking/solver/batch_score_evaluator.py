@@ -0,0 +1,352 @@
+"""Batch Score Evaluator - Score many assignment scenarios in one vectorized pass.
+
+evaluate_scenario_score walks the request, assignment and bunk dicts (and
+re-reads its config) on every call. When comparing many candidate
+assignments for the same session - saved scenarios, solver runs, a
+drag-and-drop preview - everything except the assignments is fixed, so this
+module encodes persons, bunks, requests and config once into integer NumPy
+arrays and then scores N assignment vectors together.
+
+Scores are identical to evaluate_scenario_score and returned as the same
+ScoreBreakdown.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from bunking.config import ConfigLoader
+
+from .score_evaluator import ScoreBreakdown, _get_source_fields
+
+logger = logging.getLogger(__name__)
+
+# Request type codes
+_BUNK_WITH = 0
+_NOT_BUNK_WITH = 1
+_AGE_PREFER_OLDER = 2
+_AGE_PREFER_YOUNGER = 3
+_NEVER_SATISFIED = 4
+
+IntArray = npt.NDArray[np.int64]
+
+
+class BatchScoreEvaluator:
+    """Scores assignment scenarios against a fixed set of requests, persons and bunks.
+
+    Person and bunk IDs seen only in scenarios are indexed on first use (no
+    grade, standard capacity), mirroring evaluate_scenario_score.
+    """
+
+    def __init__(
+        self,
+        requests: list[dict[str, Any]],
+        persons: list[dict[str, Any]],
+        bunks: list[dict[str, Any]],
+        config: Any | None = None,
+    ):
+        """Encode the fixed inputs.
+
+        Args:
+            requests: Bunk requests (same fields as evaluate_scenario_score)
+            persons: Persons with cm_id and grade
+            bunks: Bunks with cm_id and max_size
+            config: Config loader (defaults to the shared instance)
+        """
+        if config is None:
+            config = ConfigLoader.get_instance()
+
+        # Config is read once for every scenario scored by this evaluator
+        self._enable_diminishing = config.get_int("objective.enable_diminishing_returns", default=1)
+        self._first_multiplier = config.get_int("objective.first_request_multiplier", default=10)
+        self._second_multiplier = config.get_int("objective.second_request_multiplier", default=5)
+        self._third_plus_multiplier = config.get_int("objective.third_plus_request_multiplier", default=1)
+        source_multipliers = {
+            "share_bunk_with": config.get_float("objective.source_multipliers.share_bunk_with", default=1.5),
+            "do_not_share_with": config.get_float("objective.source_multipliers.do_not_share_with", default=1.5),
+            "bunking_notes": config.get_float("objective.source_multipliers.bunking_notes", default=1.2),
+            "internal_notes": config.get_float("objective.source_multipliers.internal_notes", default=1.0),
+            "socialize_with": config.get_float("objective.source_multipliers.socialize_with", default=0.8),
+        }
+        self._grade_spread_penalty = config.get_int("penalty.grade_spread", default=100)
+        self._max_grade_spread = config.get_int("constraint.grade_spread.max_spread", default=2)
+        self._capacity_penalty = config.get_int("penalty.over_capacity", default=500)
+        self._standard_capacity = config.get_int("constraint.cabin_capacity.standard", default=12)
+        self._min_occupancy = config.get_int("constraint.cabin_occupancy.minimum", default=8)
+        self._under_occupancy_penalty = config.get_int("penalty.under_occupancy", default=50)
+
+        # Persons: cm_id -> person_idx, grade per person (None = ungraded)
+        self._person_idx: dict[int, int] = {}
+        self._person_grades: list[int | None] = []
+        for person in persons:
+            if person.get("cm_id"):
+                person_idx = self._index_person(int(person["cm_id"]))
+                self._person_grades[person_idx] = person.get("grade")
+
+        # Bunks: cm_id -> bunk_idx, capacity per bunk
+        self._bunk_idx: dict[int, int] = {}
+        self._bunk_capacities: list[int] = []
+        for bunk in bunks:
+            if bunk.get("cm_id"):
+                bunk_idx = self._index_bunk(int(bunk["cm_id"]))
+                self._bunk_capacities[bunk_idx] = bunk.get("max_size") or self._standard_capacity
+
+        # Grade values present among persons; grade_pos maps a grade to its column
+        self._grade_values = np.array(sorted({g for g in self._person_grades if g is not None}), dtype=np.int64)
+        grade_pos = {int(g): i for i, g in enumerate(self._grade_values)}
+
+        # Requests, one column each
+        requesters: list[int] = []
+        requestees: list[int] = []
+        types: list[int] = []
+        weights: list[int] = []
+        fields: list[int] = []
+        requester_grade_pos: list[int] = []
+        self._field_names: list[str] = []
+        field_pos: dict[str, int] = {}
+        for request in requests:
+            requester_id = int(request.get("requester_id") or request.get("requester_person_cm_id") or 0)
+            if requester_id == 0:
+                continue
+            requestee_id = request.get("requestee_id") or request.get("requested_person_cm_id")
+            request_type = request.get("request_type", "")
+            priority = int(request.get("priority", 5))
+
+            source_fields = _get_source_fields(request)
+            primary_field = source_fields[0] if source_fields else "other"
+            if primary_field not in field_pos:
+                field_pos[primary_field] = len(self._field_names)
+                self._field_names.append(primary_field)
+
+            requester_idx = self._index_person(requester_id)
+            requestee_idx = 0
+            grade_col = 0
+            type_code = _NEVER_SATISFIED
+            if request_type in ("bunk_with", "not_bunk_with") and requestee_id:
+                type_code = _BUNK_WITH if request_type == "bunk_with" else _NOT_BUNK_WITH
+                requestee_idx = self._index_person(int(requestee_id))
+            elif request_type == "age_preference":
+                requester_grade = self._person_grades[requester_idx]
+                target = request.get("age_preference_target")
+                if requester_grade is not None and target in ("older", "younger"):
+                    type_code = _AGE_PREFER_OLDER if target == "older" else _AGE_PREFER_YOUNGER
+                    grade_col = grade_pos[requester_grade]
+
+            multiplier = max(source_multipliers.get(f, 1.0) for f in source_fields) if source_fields else 1.0
+            requesters.append(requester_idx)
+            requestees.append(requestee_idx)
+            types.append(type_code)
+            weights.append(int(priority * 10 * multiplier))
+            fields.append(field_pos[primary_field])
+            requester_grade_pos.append(grade_col)
+
+        # Order requests by requester, highest weight first, so diminishing
+        # returns can be applied with a running count per requester
+        order = sorted(range(len(requesters)), key=lambda r: (requesters[r], -weights[r]))
+        self._requesters = np.array([requesters[r] for r in order], dtype=np.int64)
+        self._requestees = np.array([requestees[r] for r in order], dtype=np.int64)
+        self._types = np.array([types[r] for r in order], dtype=np.int64)
+        self._weights = np.array([weights[r] for r in order], dtype=np.int64)
+        self._requester_grade_pos = np.array([requester_grade_pos[r] for r in order], dtype=np.int64)
+        # One-hot request -> primary field, for per-field sums as a matrix product
+        self._field_matrix = np.zeros((len(order), len(self._field_names)), dtype=np.int64)
+        self._field_matrix[np.arange(len(order)), [fields[r] for r in order]] = 1
+        self._field_totals = self._field_matrix.sum(axis=0)
+        # Column where each request's requester group starts
+        starts = np.ones(len(order), dtype=bool)
+        starts[1:] = self._requesters[1:] != self._requesters[:-1]
+        self._group_start = np.maximum.accumulate(np.where(starts, np.arange(len(order)), 0))
+
+    def _index_person(self, person_cm_id: int) -> int:
+        person_idx = self._person_idx.get(person_cm_id)
+        if person_idx is None:
+            person_idx = self._person_idx[person_cm_id] = len(self._person_grades)
+            self._person_grades.append(None)
+        return person_idx
+
+    def _index_bunk(self, bunk_cm_id: int) -> int:
+        bunk_idx = self._bunk_idx.get(bunk_cm_id)
+        if bunk_idx is None:
+            bunk_idx = self._bunk_idx[bunk_cm_id] = len(self._bunk_capacities)
+            self._bunk_capacities.append(self._standard_capacity)
+        return bunk_idx
+
+    def encode(self, scenarios: Sequence[Mapping[int, int]]) -> IntArray:
+        """Encode person_cm_id -> bunk_cm_id maps as an (N, persons) bunk index matrix (-1 = unassigned)."""
+        cells = [
+            (row, self._index_person(int(person_cm_id)), self._index_bunk(int(bunk_cm_id)))
+            for row, scenario in enumerate(scenarios)
+            for person_cm_id, bunk_cm_id in scenario.items()
+            if person_cm_id and bunk_cm_id
+        ]
+        matrix = np.full((len(scenarios), len(self._person_grades)), -1, dtype=np.int64)
+        if cells:
+            rows, person_idxs, bunk_idxs = zip(*cells, strict=True)
+            matrix[list(rows), list(person_idxs)] = bunk_idxs
+        return matrix
+
+    def score(self, assignments: Mapping[int, int]) -> ScoreBreakdown:
+        """Score a single person_cm_id -> bunk_cm_id map."""
+        return self.score_many([assignments])[0]
+
+    def score_many(self, scenarios: Sequence[Mapping[int, int]]) -> list[ScoreBreakdown]:
+        """Score person_cm_id -> bunk_cm_id maps, one ScoreBreakdown per scenario."""
+        if not scenarios:
+            return []
+        return self.score_matrix(self.encode(scenarios))
+
+    def score_matrix(self, matrix: IntArray) -> list[ScoreBreakdown]:
+        """Score an encoded (N, persons) bunk index matrix from encode()."""
+        num_scenarios = matrix.shape[0]
+        num_bunks = len(self._bunk_capacities)
+        num_grades = len(self._grade_values)
+        rows = np.arange(num_scenarios)[:, None]
+
+        # Occupancy and graded-camper counts per (scenario, bunk[, grade])
+        assigned = matrix >= 0
+        scenario_rows = np.broadcast_to(rows, matrix.shape)[assigned]
+        occupancy = np.zeros((num_scenarios, num_bunks), dtype=np.int64)
+        np.add.at(occupancy, (scenario_rows, matrix[assigned]), 1)
+
+        grades = self._person_grades[: matrix.shape[1]]
+        graded_cols = np.array([g is not None for g in grades], dtype=bool)
+        grade_col_by_person = np.array(
+            [int(np.searchsorted(self._grade_values, g)) if g is not None else 0 for g in grades], dtype=np.int64
+        )
+        graded = assigned & graded_cols[None, :]
+        grade_counts = np.zeros((num_scenarios, num_bunks, num_grades), dtype=np.int64)
+        np.add.at(
+            grade_counts,
+            (
+                np.broadcast_to(rows, matrix.shape)[graded],
+                matrix[graded],
+                np.broadcast_to(grade_col_by_person, matrix.shape)[graded],
+            ),
+            1,
+        )
+        cumulative_grades = np.cumsum(grade_counts, axis=2)
+
+        satisfied = self._satisfied(matrix, cumulative_grades)
+        request_scores = self._request_scores(satisfied)
+        satisfied_by_field = satisfied.astype(np.int64) @ self._field_matrix
+        raw_by_field = (satisfied * self._weights) @ self._field_matrix
+
+        # Penalties
+        if num_grades:
+            graded_in_bunk = cumulative_grades[:, :, -1]
+            present = grade_counts > 0
+            low = self._grade_values[np.argmax(present, axis=2)]
+            high = self._grade_values[num_grades - 1 - np.argmax(present[:, :, ::-1], axis=2)]
+            spread_violations = ((graded_in_bunk >= 2) & (high - low > self._max_grade_spread)).sum(axis=1)
+        else:
+            spread_violations = np.zeros(num_scenarios, dtype=np.int64)
+        capacities = np.array(self._bunk_capacities, dtype=np.int64)
+        over_capacity = np.clip(occupancy - capacities, 0, None).sum(axis=1)
+        under_occupancy = np.where(
+            (occupancy > 0) & (occupancy < self._min_occupancy), self._min_occupancy - occupancy, 0
+        ).sum(axis=1)
+
+        total_requests = len(self._requesters)
+        satisfied_counts = satisfied.sum(axis=1)
+        results = []
+        for n in range(num_scenarios):
+            penalties: dict[str, int] = {}
+            if spread_violations[n] > 0:
+                penalties["grade_spread"] = int(spread_violations[n]) * self._grade_spread_penalty
+            if over_capacity[n] > 0:
+                penalties["over_capacity"] = int(over_capacity[n]) * self._capacity_penalty
+            if under_occupancy[n] > 0:
+                penalties["under_occupancy"] = int(under_occupancy[n]) * self._under_occupancy_penalty
+            total_penalty = sum(penalties.values())
+            request_score = int(request_scores[n])
+            results.append(
+                ScoreBreakdown(
+                    total_score=request_score - total_penalty,
+                    request_satisfaction_score=request_score,
+                    soft_penalty_score=total_penalty,
+                    total_requests=total_requests,
+                    satisfied_requests=int(satisfied_counts[n]),
+                    satisfaction_rate=int(satisfied_counts[n]) / total_requests if total_requests > 0 else 0.0,
+                    field_scores={
+                        name: {
+                            "total": int(self._field_totals[f]),
+                            "satisfied": int(satisfied_by_field[n, f]),
+                            "raw_score": int(raw_by_field[n, f]),
+                        }
+                        for f, name in enumerate(self._field_names)
+                    },
+                    penalties=penalties,
+                )
+            )
+        return results
+
+    def _satisfied(self, matrix: IntArray, cumulative_grades: IntArray) -> npt.NDArray[np.bool_]:
+        """(N, requests) mask of satisfied requests."""
+        requester_bunk = matrix[:, self._requesters]
+        requestee_bunk = matrix[:, self._requestees]
+        requester_assigned = requester_bunk >= 0
+
+        satisfied = (self._types == _BUNK_WITH) & (requestee_bunk >= 0) & (requester_bunk == requestee_bunk)
+        satisfied |= (self._types == _NOT_BUNK_WITH) & ((requestee_bunk < 0) | (requester_bunk != requestee_bunk))
+
+        age_cols = np.flatnonzero((self._types == _AGE_PREFER_OLDER) | (self._types == _AGE_PREFER_YOUNGER))
+        if len(age_cols):
+            # Bunkmates younger/older than the requester, from cumulative grade counts
+            # (the requester's own grade is counted in neither)
+            bunk = np.clip(requester_bunk[:, age_cols], 0, None)
+            rows = np.arange(matrix.shape[0])[:, None]
+            grade_col = self._requester_grade_pos[age_cols]
+            at_or_below = cumulative_grades[rows, bunk, grade_col]
+            below = np.where(grade_col > 0, cumulative_grades[rows, bunk, np.maximum(grade_col - 1, 0)], 0)
+            total = cumulative_grades[rows, bunk, -1]
+            younger = below
+            older = total - at_or_below
+            has_bunkmates = total > 1
+            prefers_older = self._types[age_cols] == _AGE_PREFER_OLDER
+            satisfied[:, age_cols] = has_bunkmates & np.where(
+                prefers_older, (older > 0) | (younger == 0), (younger > 0) | (older == 0)
+            )
+
+        return cast(npt.NDArray[np.bool_], satisfied & requester_assigned)
+
+    def _request_scores(self, satisfied: npt.NDArray[np.bool_]) -> IntArray:
+        """Per-scenario request score with diminishing returns per requester."""
+        if not self._enable_diminishing:
+            return cast(IntArray, (satisfied * self._weights).sum(axis=1))
+        # Rank of each satisfied request among its requester's satisfied requests
+        running = np.cumsum(satisfied, axis=1)
+        before_group = np.where(self._group_start > 0, running[:, np.maximum(self._group_start - 1, 0)], 0)
+        rank = running - before_group - 1
+        multipliers = np.where(
+            rank == 0,
+            self._first_multiplier,
+            np.where(rank == 1, self._second_multiplier, self._third_plus_multiplier),
+        )
+        return cast(IntArray, (satisfied * self._weights * multipliers).sum(axis=1))
+
+
+def evaluate_scenario_scores(
+    scenarios: Sequence[Mapping[int, int]],
+    requests: list[dict[str, Any]],
+    persons: list[dict[str, Any]],
+    bunks: list[dict[str, Any]],
+    config: Any | None = None,
+) -> list[ScoreBreakdown]:
+    """Convenience function to score several scenarios at once.
+
+    Args:
+        scenarios: person_cm_id -> bunk_cm_id maps to score
+        requests: List of bunk requests
+        persons: List of persons
+        bunks: List of bunks
+        config: Optional config loader
+
+    Returns:
+        One ScoreBreakdown per scenario, in order
+    """
+    return BatchScoreEvaluator(requests, persons, bunks, config=config).score_many(scenarios)
@@ -5,7 +5,9 @@ Solver Callbacks - Progress monitoring for OR-Tools CP-SAT solver.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 
 from ortools.sat.python import cp_model
 
@@ -17,10 +19,18 @@ logger = logging.getLogger(__name__)
 class SolverProgressCallback(cp_model.CpSolverSolutionCallback):  # type: ignore[misc]
     """Callback to log solver progress in real-time."""
 
-    def __init__(self, constraint_logger: ConstraintLogger, debug_mode: bool = False) -> None:
+    def __init__(
+        self,
+        constraint_logger: ConstraintLogger,
+        debug_mode: bool = False,
+        on_progress: Callable[[dict[str, Any]], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> None:
         cp_model.CpSolverSolutionCallback.__init__(self)
         self.constraint_logger = constraint_logger
         self.debug_mode = debug_mode
+        self.on_progress = on_progress
+        self.should_stop = should_stop
         self.solution_count = 0
         self.start_time = datetime.now()
 
@@ -34,6 +44,22 @@ class SolverProgressCallback(cp_model.CpSolverSolutionCallback):  # type: ignore
 
         self.constraint_logger.log_progress(message)
 
+        # Forward structured progress (e.g. to the API process running this solve)
+        if self.on_progress is not None:
+            self.on_progress(
+                {
+                    "phase": "solving",
+                    "solutions": self.solution_count,
+                    "objective": self.ObjectiveValue(),
+                    "best_bound": self.BestObjectiveBound(),
+                    "elapsed_seconds": round(elapsed, 1),
+                }
+            )
+
+        # Catch stop requests that raced with the start of the search
+        if self.should_stop is not None and self.should_stop():
+            self.StopSearch()
+
         # In debug mode, log more details
         if self.debug_mode and self.solution_count <= 5:
             logger.debug(f"  Best bound: {self.BestObjectiveBound()}")
@@ -15,10 +15,13 @@ from .cabin_occupancy import (
 )
 from .grade_adjacency import add_grade_adjacency_constraints
 from .grade_spread import add_grade_spread_constraints, add_grade_spread_soft_constraint
+from .problem_index import ProblemIndex, build_problem_index
+from .symmetry import add_symmetry_breaking_constraints
 
 __all__ = [
     "ConstraintBuilder",
     "ObjectiveBuilder",
+    "ProblemIndex",
     "SolverContext",
     "add_age_grade_flow_objective",
     "add_age_preference_penalties",
@@ -31,4 +34,6 @@ __all__ = [
     "add_grade_adjacency_constraints",
     "add_grade_spread_constraints",
     "add_grade_spread_soft_constraint",
+    "add_symmetry_breaking_constraints",
+    "build_problem_index",
 ]
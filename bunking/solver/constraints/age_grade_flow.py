@@ -81,7 +81,7 @@ def add_age_grade_flow_objective(ctx: SolverContext, objective_terms: list[Any])
                 and p.session_cm_id == session_cm_id
                 and p.grade is not None
             ],
-            key=lambda p: (p.grade, p.age),
+            key=lambda p: (p.grade, ctx.index.age_months[ctx.person_idx_map[p.campminder_person_id]]),
         )
 
         if not group_campers:
@@ -131,6 +131,9 @@ def add_age_grade_flow_objective(ctx: SolverContext, objective_terms: list[Any])
                     continue
 
                 bunk_idx = ctx.bunk_idx_map[bunk.campminder_id]
+                assignment_var = ctx.assignments.get((person_idx, bunk_idx))
+                if assignment_var is None:
+                    continue
 
                 # Calculate fit: 1.0 when perfect match, 0.0 when max distance
                 grade_diff = abs(camper.grade - target)
@@ -140,7 +143,7 @@ def add_age_grade_flow_objective(ctx: SolverContext, objective_terms: list[Any])
                 bonus = int(fit_score * grade_target_weight)
 
                 if bonus > 0:
-                    objective_terms.append(bonus * ctx.assignments[(person_idx, bunk_idx)])
+                    objective_terms.append(bonus * assignment_var)
                     total_incentives_added += 1
 
                     # DEBUG: Track for G-6B and G-7
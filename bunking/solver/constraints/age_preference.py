@@ -113,10 +113,7 @@ def add_age_preference_penalties(
         return
 
     # Get unique grades present in the solver
-    all_grades = set()
-    for person_cm_id in ctx.person_ids:
-        person = ctx.person_by_cm_id[person_cm_id]
-        all_grades.add(person.grade)
+    all_grades = set(ctx.index.persons_by_grade)
 
     for person_cm_id, requests in requests_by_person.items():
         if person_cm_id not in ctx.person_idx_map:
@@ -147,7 +144,7 @@ def add_age_preference_penalties(
                 continue
 
             # Add penalty for each bunk × bad_grade where camper could be placed
-            for bunk_idx in range(len(ctx.bunks)):
+            for bunk_idx in ctx.person_bunks[person_idx]:
                 for bad_grade in bad_grades:
                     if (bunk_idx, bad_grade) not in bunk_has_grade:
                         continue
@@ -174,25 +171,25 @@ def _build_bunk_has_grade_vars(ctx: SolverContext) -> dict[tuple[int, int], cp_m
     """
     bunk_has_grade: dict[tuple[int, int], cp_model.IntVar] = {}
 
-    # Get unique grades present in the solver
-    grade_to_person_indices: dict[int, list[int]] = {}
-    for person_idx, person_cm_id in enumerate(ctx.person_ids):
-        person = ctx.person_by_cm_id[person_cm_id]
-        if person.grade not in grade_to_person_indices:
-            grade_to_person_indices[person.grade] = []
-        grade_to_person_indices[person.grade].append(person_idx)
+    # Unique grades present in the solver (grouped once in the problem index)
+    grade_to_person_indices = ctx.index.persons_by_grade
 
     num_bunks = len(ctx.bunks)
 
     # For each bunk × grade, create a variable tracking presence
     for bunk_idx in range(num_bunks):
         for grade, person_indices in grade_to_person_indices.items():
+            # Sum of assignments for all persons of this grade to this bunk
+            grade_assignments = [
+                ctx.assignments[(p_idx, bunk_idx)] for p_idx in person_indices if (p_idx, bunk_idx) in ctx.assignments
+            ]
+            if not grade_assignments:
+                # Nobody of this grade can be placed here - grade is never present
+                continue
+
             # bunk_has_grade = 1 if ANY person of this grade is in this bunk
             has_grade = ctx.model.NewBoolVar(f"bunk_{bunk_idx}_has_grade_{grade}")
 
-            # Sum of assignments for all persons of this grade to this bunk
-            grade_assignments = [ctx.assignments[(p_idx, bunk_idx)] for p_idx in person_indices]
-
             # has_grade = 1 iff sum >= 1
             ctx.model.Add(sum(grade_assignments) >= 1).OnlyEnforceIf(has_grade)
             ctx.model.Add(sum(grade_assignments) == 0).OnlyEnforceIf(has_grade.Not())
@@ -228,10 +225,7 @@ def _create_age_preference_satisfaction_var(
         BoolVar that's true when request is satisfied, or None if no valid check
     """
     # Get all grades present in the solver
-    all_grades = set()
-    for person_cm_id in ctx.person_ids:
-        person = ctx.person_by_cm_id[person_cm_id]
-        all_grades.add(person.grade)
+    all_grades = set(ctx.index.persons_by_grade)
 
     # Determine which grades would violate this preference
     if preference == "older":
@@ -252,7 +246,7 @@ def _create_age_preference_satisfaction_var(
     sat_var = ctx.model.NewBoolVar(f"age_req_{request.id}_satisfied")
 
     # For each bunk the person might be in, check if it contains bad grades
-    for bunk_idx in range(len(ctx.bunks)):
+    for bunk_idx in ctx.person_bunks[person_idx]:
         # Check: person in this bunk AND bunk has NO bad grades
         person_in_bunk = ctx.assignments[(person_idx, bunk_idx)]
 
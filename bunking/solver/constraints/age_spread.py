@@ -16,13 +16,6 @@ from .helpers import get_eligible_campers_for_bunk, is_ag_session_bunk
 logger = logging.getLogger(__name__)
 
 
-def _age_to_months(age: float) -> int:
-    """Convert CampMinder age format (years.months) to total months."""
-    years = int(age)
-    months = round((age - years) * 100)
-    return years * 12 + months
-
-
 def add_age_spread_constraints(ctx: SolverContext) -> None:
     """Add aggregated soft constraints for age spread within bunks.
 
@@ -57,15 +50,8 @@ def add_age_spread_constraints(ctx: SolverContext) -> None:
         if len(eligible_campers) < 2:
             continue
 
-        # Convert ages to months for all eligible campers
-        age_months_data = []
-        for person_idx, person in eligible_campers:
-            if hasattr(person, "age"):
-                age_months = _age_to_months(person.age)
-            else:
-                # Fallback: estimate based on grade
-                age_months = person.grade * 12 + 120  # Assume grade 1 = 10 years old
-            age_months_data.append((person_idx, age_months))
+        # Ages in months are precomputed once per solve in the problem index
+        age_months_data = [(person_idx, ctx.index.age_months[person_idx]) for person_idx, _ in eligible_campers]
 
         # Find possible min/max age values
         all_ages = [age for _, age in age_months_data]
@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from ortools.sat.python import cp_model
 
+from .problem_index import ProblemIndex, build_problem_index
+
 if TYPE_CHECKING:
     from bunking.config import ConfigLoader
     from bunking.models_v2 import DirectBunk, DirectBunkRequest, DirectPerson, DirectSolverInput
@@ -31,6 +33,8 @@ class SolverContext:
 
     # Decision variables
     # assignments[(person_idx, bunk_idx)] = BoolVar (1 if person in bunk)
+    # Sparse: only (person, bunk) pairs the person may be placed in have a
+    # variable. A missing key means the assignment is fixed to 0.
     assignments: dict[tuple[int, int], cp_model.IntVar]
     # person_bunk_assignment[person_idx] = IntVar (which bunk index)
     person_bunk_assignment: dict[int, cp_model.IntVar]
@@ -65,6 +69,21 @@ class SolverContext:
     # Soft constraint tracking
     soft_constraint_violations: dict[str, Any] = field(default_factory=dict)
 
+    # Sparse index over assignments (derived from its keys when not supplied)
+    person_bunks: dict[int, list[int]] = field(default_factory=dict)  # person_idx -> bunk idxs with a var
+    bunk_persons: dict[int, list[int]] = field(default_factory=dict)  # bunk_idx -> person idxs with a var
+
+    # Precomputed eligibility/grade/age/edge lookups (built from the above when not supplied)
+    index: ProblemIndex = None  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        if not self.person_bunks and not self.bunk_persons:
+            self.person_bunks, self.bunk_persons = build_assignment_index(
+                self.assignments, len(self.person_ids), len(self.bunks)
+            )
+        if self.index is None:
+            self.index = build_problem_index(self.person_ids, self.person_by_cm_id, self.bunks, self.bunk_persons)
+
     def is_constraint_disabled(self, constraint_name: str) -> bool:
         """Check if a constraint is disabled in debug mode."""
         return self.debug_constraints.get(constraint_name, False)
@@ -78,6 +97,30 @@ class SolverContext:
         """Get bunk object by solver index."""
         return self.bunks[idx]
 
+    def bunk_vars(self, bunk_idx: int) -> list[cp_model.IntVar]:
+        """Get the assignment variables of every person who may be in this bunk."""
+        return [self.assignments[(person_idx, bunk_idx)] for person_idx in self.bunk_persons[bunk_idx]]
+
+    def person_vars(self, person_idx: int) -> list[cp_model.IntVar]:
+        """Get the assignment variables of every bunk this person may be in."""
+        return [self.assignments[(person_idx, bunk_idx)] for bunk_idx in self.person_bunks[person_idx]]
+
+
+def build_assignment_index(
+    assignments: dict[tuple[int, int], Any], num_persons: int, num_bunks: int
+) -> tuple[dict[int, list[int]], dict[int, list[int]]]:
+    """Build person -> bunks and bunk -> persons maps from sparse assignment keys.
+
+    Every person and bunk index gets an entry (possibly empty), with indices in
+    ascending order so constraint generation stays deterministic.
+    """
+    person_bunks: dict[int, list[int]] = {person_idx: [] for person_idx in range(num_persons)}
+    bunk_persons: dict[int, list[int]] = {bunk_idx: [] for bunk_idx in range(num_bunks)}
+    for person_idx, bunk_idx in sorted(assignments):
+        person_bunks[person_idx].append(bunk_idx)
+        bunk_persons[bunk_idx].append(person_idx)
+    return person_bunks, bunk_persons
+
 
 class ConstraintBuilder(Protocol):
     """
@@ -0,0 +1,67 @@
+"""
+Bunk level and age helpers with no solver dependencies.
+
+Kept separate from helpers so that problem_index can use them without
+importing the SolverContext machinery.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bunking.models_v2 import DirectBunk
+
+
+def extract_bunk_level(bunk_name: str) -> str | None:
+    """Extract level from bunk name (e.g., 'B-3' -> '3', 'B-Aleph' -> 'Aleph', 'G-6A' -> '6').
+
+    Handles bunks with letter suffixes (e.g., G-6A, G-6B) by stripping the suffix
+    and treating them as the same level as their base (e.g., G-6).
+    """
+    if not bunk_name or "-" not in bunk_name:
+        return None
+
+    parts = bunk_name.split("-")
+    if len(parts) < 2:
+        return None
+
+    level = parts[1]
+
+    # Check for empty level (e.g., "G-")
+    if not level:
+        return None
+
+    # Strip any letter suffix (e.g., "6A" -> "6", "6B" -> "6")
+    # This ensures G-6A and G-6B are treated as level 6
+    if level and level[-1].isalpha() and level[:-1].isdigit():
+        level = level[:-1]
+
+    return level
+
+
+def age_to_months(age: float) -> int:
+    """Convert CampMinder age format (years.months) to total months."""
+    years = int(age)
+    months = round((age - years) * 100)
+    return years * 12 + months
+
+
+def get_level_order() -> dict[str, int]:
+    """Get the ordering of bunk levels (lower index = lower level)."""
+    levels = ["Aleph", "Bet"] + [str(i) for i in range(1, 20)]
+    return {level: idx for idx, level in enumerate(levels)}
+
+
+def is_ag_session_bunk(bunk: DirectBunk) -> bool:
+    """Check if this bunk is for an AG (Any Gender) session.
+
+    AG bunks are completely exempt from all constraints except basic assignment.
+    They simply take whoever is enrolled in that AG session.
+    """
+    # Check if bunk gender is AG
+    if bunk.gender == "AG":
+        return True
+
+    # Also check if the bunk name contains "AG" (as backup)
+    return "AG" in bunk.name.upper()
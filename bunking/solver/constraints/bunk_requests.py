@@ -100,8 +100,11 @@ def _create_bunk_with_satisfaction_var(
     sat_var = ctx.model.NewBoolVar(f"req_{request.id}_satisfied")
 
     # Request is satisfied if both are in the same bunk
-    # For each bunk, create a helper variable tracking if both are there
-    for bunk_idx in range(len(ctx.bunks)):
+    # For each bunk both may be placed in, create a helper variable tracking if both are there
+    requested_bunks = set(ctx.person_bunks[requested_idx])
+    for bunk_idx in ctx.person_bunks[requester_idx]:
+        if bunk_idx not in requested_bunks:
+            continue
         both_in_bunk = ctx.model.NewBoolVar(f"req_{request.id}_bunk_{bunk_idx}")
 
         # Both must be in this bunk
@@ -151,11 +154,13 @@ def _create_not_bunk_with_satisfaction_var(
     # We need to check they're in different bunks
     different_bunks_vars = []
 
-    for bunk_idx in range(len(ctx.bunks)):
+    for bunk_idx in ctx.person_bunks[requester_idx]:
         # Check if person is in this bunk but requested is not
         person_in_bunk = ctx.assignments[(requester_idx, bunk_idx)]
         requested_not_in_bunk = ctx.model.NewBoolVar(f"req_{request.id}_diff_bunk_{bunk_idx}")
-        ctx.model.Add(ctx.assignments[(requested_idx, bunk_idx)] == 0).OnlyEnforceIf(requested_not_in_bunk)
+        requested_in_bunk = ctx.assignments.get((requested_idx, bunk_idx))
+        if requested_in_bunk is not None:
+            ctx.model.Add(requested_in_bunk == 0).OnlyEnforceIf(requested_not_in_bunk)
 
         # If person in bunk and requested not, they're separated
         separated = ctx.model.NewBoolVar(f"req_{request.id}_separated_{bunk_idx}")
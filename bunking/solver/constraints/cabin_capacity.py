@@ -35,7 +35,7 @@ def add_cabin_capacity_constraints(ctx: SolverContext) -> None:
 
     for bunk_idx, bunk in enumerate(ctx.bunks):
         # Calculate total assignments to this bunk
-        total = sum(ctx.assignments[(person_idx, bunk_idx)] for person_idx in range(len(ctx.person_ids)))
+        total = sum(ctx.bunk_vars(bunk_idx))
 
         # Hard limit: cannot exceed max capacity
         capacity = min(bunk.capacity, max_capacity)
@@ -127,7 +127,7 @@ def add_cabin_capacity_soft_constraint(ctx: SolverContext, objective_terms: list
             continue
 
         # Calculate occupancy
-        occupancy_expr = sum(ctx.assignments[(person_idx, bunk_idx)] for person_idx in range(len(ctx.person_ids)))
+        occupancy_expr = sum(ctx.bunk_vars(bunk_idx))
 
         # Create variable for overcrowding
         overcrowd_amount = ctx.model.NewIntVar(0, max_capacity - standard_capacity, f"overcrowd_b{bunk_idx}")
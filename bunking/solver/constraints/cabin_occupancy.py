@@ -105,7 +105,7 @@ def add_cabin_minimum_occupancy_constraints(
             continue
 
         # Calculate occupancy expression for this bunk
-        occupancy_expr = sum(ctx.assignments[(person_idx, bunk_idx)] for person_idx in range(len(ctx.person_ids)))
+        occupancy_expr = sum(ctx.bunk_vars(bunk_idx))
 
         # Create "is_used" boolean: is_used = 1 iff occupancy >= 1
         is_used = ctx.model.NewBoolVar(f"bunk_used_{bunk_idx}")
@@ -177,7 +177,7 @@ def add_cabin_minimum_occupancy_soft_penalty(
             continue
 
         # Calculate occupancy for this bunk
-        occupancy_expr = sum(ctx.assignments[(person_idx, bunk_idx)] for person_idx in range(len(ctx.person_ids)))
+        occupancy_expr = sum(ctx.bunk_vars(bunk_idx))
 
         # Create underfill variable: how many spots below preferred
         # Range: 0 to (preferred - min), since hard constraint ensures >= min when used
@@ -46,8 +46,13 @@ def add_gender_constraints(ctx: SolverContext) -> None:
 
             # Check if person's gender matches cabin gender
             if person.gender and person.gender != bunk.gender:
+                # Usually enforced by the sparse model (no variable for this pair)
+                assignment_var = ctx.assignments.get((person_idx, bunk_idx))
+                if assignment_var is None:
+                    continue
+
                 # Person cannot be in this cabin due to gender mismatch
-                ctx.model.Add(ctx.assignments[(person_idx, bunk_idx)] == 0)
+                ctx.model.Add(assignment_var == 0)
                 constraints_added += 1
 
                 # Log constraint for debugging
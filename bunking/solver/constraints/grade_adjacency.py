@@ -160,7 +160,8 @@ def add_grade_adjacency_constraints(ctx: SolverContext) -> None:
             continue
 
         # Get unique grades among eligible campers
-        unique_grades = sorted(set(person.grade for _, person in eligible_campers if person.grade is not None))
+        eligible_by_grade = ctx.index.eligible_by_grade[bunk_idx]
+        unique_grades = sorted(grade for grade in eligible_by_grade if grade is not None)
 
         # Skip if only 1 unique grade (nothing to compare)
         if len(unique_grades) <= 1:
@@ -181,16 +182,8 @@ def add_grade_adjacency_constraints(ctx: SolverContext) -> None:
                 # Non-adjacent grades - FORBID both being present in same bunk
 
                 # Get assignment variables for campers with each grade
-                grade1_vars = [
-                    ctx.assignments[(person_idx, bunk_idx)]
-                    for person_idx, person in eligible_campers
-                    if person.grade == grade1
-                ]
-                grade2_vars = [
-                    ctx.assignments[(person_idx, bunk_idx)]
-                    for person_idx, person in eligible_campers
-                    if person.grade == grade2
-                ]
+                grade1_vars = [ctx.assignments[(person_idx, bunk_idx)] for person_idx in eligible_by_grade[grade1]]
+                grade2_vars = [ctx.assignments[(person_idx, bunk_idx)] for person_idx in eligible_by_grade[grade2]]
 
                 if not grade1_vars or not grade2_vars:
                     continue
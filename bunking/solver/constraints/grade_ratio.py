@@ -8,7 +8,6 @@ makes up more than the configured percentage (default 67%) of the cabin.
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
 
 from ortools.sat.python import cp_model
 
@@ -66,7 +65,7 @@ def add_grade_ratio_constraints(ctx: SolverContext) -> None:
         # in edge bunks, making grade dominance by adjacent grade unavoidable
         eligible_persons = [person for _, person in eligible_campers]
         should_exempt, reason = should_exempt_edge_bunk_from_ratio(
-            bunk, ctx.bunks, eligible_persons, standard_capacity, max_percentage
+            bunk, ctx.bunks, eligible_persons, standard_capacity, max_percentage, edge=ctx.index.is_edge_bunk(bunk_idx)
         )
         if should_exempt:
             logger.debug(f"Edge exemption for {bunk.name}: {reason}")
@@ -74,10 +73,10 @@ def add_grade_ratio_constraints(ctx: SolverContext) -> None:
             continue  # Skip grade_ratio constraints for this bunk
 
         # Count students per grade in this bunk (only eligible ones)
-        grade_counts: dict[int, list[cp_model.IntVar]] = defaultdict(list)  # grade -> list of assignment vars
-
-        for person_idx, person in eligible_campers:
-            grade_counts[person.grade].append(ctx.assignments[(person_idx, bunk_idx)])
+        grade_counts: dict[int, list[cp_model.IntVar]] = {
+            grade: [ctx.assignments[(person_idx, bunk_idx)] for person_idx in person_idxs]
+            for grade, person_idxs in ctx.index.eligible_by_grade[bunk_idx].items()
+        }  # grade -> list of assignment vars
 
         # Skip single-grade constraint if only one grade exists among eligible campers
         if len(grade_counts) <= 1:
@@ -102,12 +101,12 @@ def add_grade_ratio_constraints(ctx: SolverContext) -> None:
         ctx.model.Add(sum(grade_present_vars) >= 2).OnlyEnforceIf(has_multiple_grades)
         ctx.model.Add(sum(grade_present_vars) <= 1).OnlyEnforceIf(has_multiple_grades.Not())
 
+        # Count total eligible students in bunk (only those who can be assigned)
+        total_in_bunk = sum(ctx.assignments[(p_idx, bunk_idx)] for p_idx, _ in eligible_campers)
+
         # Only apply ratio constraint if cabin has multiple grades
         # For each grade, check if it exceeds max percentage
         for grade, assignment_vars in grade_counts.items():
-            # Count total eligible students in bunk (only those who can be assigned)
-            total_in_bunk = sum(ctx.assignments[(p_idx, bunk_idx)] for p_idx, _ in eligible_campers)
-
             # Count students of this grade in bunk
             grade_count = sum(assignment_vars)
 
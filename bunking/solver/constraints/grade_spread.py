@@ -48,7 +48,7 @@ def add_grade_spread_constraints(ctx: SolverContext) -> None:
             continue
 
         # Get all unique grades among eligible campers
-        unique_grades = sorted(set(person.grade for _, person in eligible_campers))
+        unique_grades = sorted(ctx.index.eligible_by_grade[bunk_idx])
 
         # Skip if all eligible campers have same grade
         if len(unique_grades) == 1:
@@ -59,9 +59,7 @@ def add_grade_spread_constraints(ctx: SolverContext) -> None:
         for grade in unique_grades:
             # Grade is present if at least one camper with that grade is assigned
             campers_with_grade = [
-                ctx.assignments[(person_idx, bunk_idx)]
-                for person_idx, person in eligible_campers
-                if person.grade == grade
+                ctx.assignments[(person_idx, bunk_idx)] for person_idx in ctx.index.eligible_by_grade[bunk_idx][grade]
             ]
 
             # Only create constraint if there are actually campers with this grade
@@ -122,7 +120,7 @@ def add_grade_spread_soft_constraint(ctx: SolverContext, objective_terms: list[A
             continue
 
         # Get all unique grades among eligible campers
-        unique_grades = sorted(set(person.grade for _, person in eligible_campers))
+        unique_grades = sorted(ctx.index.eligible_by_grade[bunk_idx])
 
         # Skip if impossible to exceed limit
         if len(unique_grades) <= max_unique_grades:
@@ -132,9 +130,7 @@ def add_grade_spread_soft_constraint(ctx: SolverContext, objective_terms: list[A
         grade_present_vars = {}
         for grade in unique_grades:
             campers_with_grade = [
-                ctx.assignments[(person_idx, bunk_idx)]
-                for person_idx, person in eligible_campers
-                if person.grade == grade
+                ctx.assignments[(person_idx, bunk_idx)] for person_idx in ctx.index.eligible_by_grade[bunk_idx][grade]
             ]
 
             if campers_with_grade:
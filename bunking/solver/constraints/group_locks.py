@@ -40,28 +40,31 @@ def add_group_lock_constraints(ctx: SolverContext) -> None:
 
         # For each bunk, either all group members are in or none are in
         for bunk_idx, bunk in enumerate(ctx.bunks):
-            # Check if bunk has capacity for the group
-            if bunk.capacity >= len(group_indices):
+            member_vars = [
+                ctx.assignments[(person_idx, bunk_idx)]
+                for person_idx in group_indices
+                if (person_idx, bunk_idx) in ctx.assignments
+            ]
+            if not member_vars:
+                continue  # No group member can be placed in this bunk
+
+            # Check if bunk has capacity for the group and every member may be placed here
+            if bunk.capacity >= len(group_indices) and len(member_vars) == len(group_indices):
                 # Create variable for "group is in this bunk"
                 group_in_bunk = ctx.model.NewBoolVar(f"group_lock_{group_lock_id}_in_bunk_{bunk_idx}")
 
                 # If group_in_bunk, all members must be in this bunk
-                for person_idx in group_indices:
-                    ctx.model.Add(ctx.assignments[(person_idx, bunk_idx)] == 1).OnlyEnforceIf(group_in_bunk)
+                for member_var in member_vars:
+                    ctx.model.Add(member_var == 1).OnlyEnforceIf(group_in_bunk)
 
                 # If any member is in this bunk, all must be
                 # This ensures they stay together
-                for i, person_idx in enumerate(group_indices):
-                    others_in_bunk = []
-                    for j, other_idx in enumerate(group_indices):
-                        if i != j:
-                            others_in_bunk.append(ctx.assignments[(other_idx, bunk_idx)])
+                for i, member_var in enumerate(member_vars):
+                    others_in_bunk = [other_var for j, other_var in enumerate(member_vars) if i != j]
 
                     # If this person is in bunk, all others must be too
-                    ctx.model.Add(sum(others_in_bunk) == len(others_in_bunk)).OnlyEnforceIf(
-                        ctx.assignments[(person_idx, bunk_idx)]
-                    )
+                    ctx.model.Add(sum(others_in_bunk) == len(others_in_bunk)).OnlyEnforceIf(member_var)
             else:
-                # Bunk too small for group - none can be assigned
-                for person_idx in group_indices:
-                    ctx.model.Add(ctx.assignments[(person_idx, bunk_idx)] == 0)
+                # Bunk too small for group (or off-limits to a member) - none can be assigned
+                for member_var in member_vars:
+                    ctx.model.Add(member_var == 0)
@@ -9,57 +9,46 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .bunk_levels import age_to_months, extract_bunk_level, get_level_order, is_ag_session_bunk
+
 if TYPE_CHECKING:
     from bunking.models_v2 import DirectBunk, DirectPerson
 
     from .base import SolverContext
 
-
-def extract_bunk_level(bunk_name: str) -> str | None:
-    """Extract level from bunk name (e.g., 'B-3' -> '3', 'B-Aleph' -> 'Aleph', 'G-6A' -> '6').
-
-    Handles bunks with letter suffixes (e.g., G-6A, G-6B) by stripping the suffix
-    and treating them as the same level as their base (e.g., G-6).
+__all__ = [
+    "age_to_months",
+    "calculate_edge_extreme_threshold",
+    "extract_bunk_level",
+    "get_eligible_campers_for_bunk",
+    "get_level_order",
+    "is_ag_session_bunk",
+    "is_assignment_allowed",
+    "is_edge_bunk_for_grades",
+    "should_exempt_edge_bunk_from_ratio",
+]
+
+
+def is_assignment_allowed(
+    person: DirectPerson,
+    bunk: DirectBunk,
+    check_session: bool = True,
+    check_gender: bool = True,
+) -> bool:
+    """Check whether a camper may be placed in a bunk at all.
+
+    Used to decide which assignment variables exist. Mirrors the hard
+    session boundary and gender constraints: a bunk with no gender, a
+    Mixed/AG bunk, or a camper with no gender data is never excluded on gender.
     """
-    if not bunk_name or "-" not in bunk_name:
-        return None
-
-    parts = bunk_name.split("-")
-    if len(parts) < 2:
-        return None
-
-    level = parts[1]
-
-    # Check for empty level (e.g., "G-")
-    if not level:
-        return None
-
-    # Strip any letter suffix (e.g., "6A" -> "6", "6B" -> "6")
-    # This ensures G-6A and G-6B are treated as level 6
-    if level and level[-1].isalpha() and level[:-1].isdigit():
-        level = level[:-1]
-
-    return level
-
+    if check_session and person.session_cm_id != bunk.session_cm_id:
+        return False
 
-def get_level_order() -> dict[str, int]:
-    """Get the ordering of bunk levels (lower index = lower level)."""
-    levels = ["Aleph", "Bet"] + [str(i) for i in range(1, 20)]
-    return {level: idx for idx, level in enumerate(levels)}
+    if check_gender and bunk.gender and bunk.gender not in ["Mixed", "AG"]:
+        if person.gender and person.gender != bunk.gender:
+            return False
 
-
-def is_ag_session_bunk(bunk: DirectBunk) -> bool:
-    """Check if this bunk is for an AG (Any Gender) session.
-
-    AG bunks are completely exempt from all constraints except basic assignment.
-    They simply take whoever is enrolled in that AG session.
-    """
-    # Check if bunk gender is AG
-    if bunk.gender == "AG":
-        return True
-
-    # Also check if the bunk name contains "AG" (as backup)
-    return "AG" in bunk.name.upper()
+    return True
 
 
 def calculate_edge_extreme_threshold(standard_capacity: int, max_percentage: float) -> int:
@@ -115,6 +104,7 @@ def should_exempt_edge_bunk_from_ratio(
     eligible_persons: list[DirectPerson],
     standard_capacity: int,
     max_percentage: float,
+    edge: tuple[bool, str] | None = None,
 ) -> tuple[bool, str]:
     """Check if edge bunk should be exempt from grade_ratio penalty.
 
@@ -131,10 +121,13 @@ def should_exempt_edge_bunk_from_ratio(
     MUST go in the edge bunk as a small minority, making grade dominance
     by the adjacent grade unavoidable.
 
+    A precomputed (is_edge, edge_type) from the problem index may be passed
+    as `edge` to skip the per-call scan of `bunks`.
+
     Returns (should_exempt, reason_for_logging).
     """
     # Step 1: Is this an edge bunk?
-    is_edge, edge_type = is_edge_bunk_for_grades(bunk, bunks)
+    is_edge, edge_type = edge if edge is not None else is_edge_bunk_for_grades(bunk, bunks)
 
     if not is_edge:
         return False, "not_edge_bunk"
@@ -175,20 +168,8 @@ def get_eligible_campers_for_bunk(ctx: SolverContext, bunk: DirectBunk) -> list[
     - Gender match (for non-Mixed bunks, camper gender must match bunk gender)
 
     This dramatically reduces constraint generation by only considering
-    valid assignments that respect session and gender boundaries.
+    valid assignments that respect session and gender boundaries. Only
+    campers with an assignment variable for the bunk are considered.
+    Reads the precomputed list from the context's problem index.
     """
-    eligible = []
-    for person_idx, person_cm_id in enumerate(ctx.person_ids):
-        person = ctx.person_by_cm_id[person_cm_id]
-
-        # Check session match
-        if person.session_cm_id != bunk.session_cm_id:
-            continue
-
-        # Check gender match (Mixed/AG bunks accept all genders)
-        if bunk.gender not in ["Mixed", "AG"] and person.gender != bunk.gender:
-            continue
-
-        eligible.append((person_idx, person))
-
-    return eligible
+    return list(ctx.index.eligible_campers[ctx.bunk_idx_map[bunk.campminder_id]])
@@ -71,7 +71,8 @@ def add_level_progression_constraints(ctx: SolverContext) -> None:
         person = ctx.person_by_cm_id[person_cm_id]
 
         # Apply constraints only for bunks the camper is eligible for
-        for bunk_idx, bunk in enumerate(ctx.bunks):
+        for bunk_idx in ctx.person_bunks[person_idx]:
+            bunk = ctx.bunks[bunk_idx]
             # Check eligibility (session and gender match)
             if person.session_cm_id != bunk.session_cm_id:
                 continue
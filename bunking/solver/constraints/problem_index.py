@@ -0,0 +1,138 @@
+"""
+Precomputed problem index shared by all constraint modules.
+
+Built once per solve from the person/bunk lists and the sparse assignment
+layout. Constraint modules read eligible campers, grade groupings, ages and
+edge-bunk classification from here instead of rescanning every camper per bunk.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from .bunk_levels import age_to_months, extract_bunk_level, get_level_order, is_ag_session_bunk
+
+if TYPE_CHECKING:
+    from bunking.models_v2 import DirectBunk, DirectPerson
+
+
+@dataclass(frozen=True)
+class ProblemIndex:
+    """Immutable per-solve lookup tables keyed by solver indices."""
+
+    # bunk_idx -> ((person_idx, person), ...) for campers eligible for the bunk
+    eligible_campers: Mapping[int, tuple[tuple[int, DirectPerson], ...]]
+    # bunk_idx -> {grade: (person_idx, ...)} over the bunk's eligible campers
+    eligible_by_grade: Mapping[int, Mapping[int, tuple[int, ...]]]
+    # grade -> (person_idx, ...) over all campers
+    persons_by_grade: Mapping[int, tuple[int, ...]]
+    # person_idx -> age in months
+    age_months: tuple[int, ...]
+    # bunk_idx -> 'low', 'high', 'only' or 'none' (see is_edge_bunk_for_grades)
+    edge_types: Mapping[int, str]
+    # (session_cm_id, gender) -> bunk idxs a camper of that session/gender may share
+    _pair_bunks: Mapping[tuple[int, str | None], tuple[int, ...]]
+    # person_idx -> (session_cm_id, gender)
+    _person_keys: tuple[tuple[int, str | None], ...]
+
+    def is_edge_bunk(self, bunk_idx: int) -> tuple[bool, str]:
+        """Edge classification of a bunk as (is_edge, edge_type)."""
+        edge_type = self.edge_types[bunk_idx]
+        return edge_type != "none", edge_type
+
+    def valid_bunks_for_pair(self, person1_idx: int, person2_idx: int) -> list[int]:
+        """Bunk indices where both campers can be validly assigned.
+
+        Both campers must share a session, and a single-gender bunk must match
+        both of their genders (Mixed/AG bunks accept anyone).
+        """
+        session1, gender1 = self._person_keys[person1_idx]
+        session2, gender2 = self._person_keys[person2_idx]
+        if session1 != session2:
+            return []
+        if gender1 == gender2:
+            return list(self._pair_bunks.get((session1, gender1), ()))
+        # Different genders can only share Mixed/AG bunks
+        return list(self._pair_bunks.get((session1, None), ()))
+
+
+def build_problem_index(
+    person_ids: Sequence[int],
+    person_by_cm_id: Mapping[int, DirectPerson],
+    bunks: Sequence[DirectBunk],
+    bunk_persons: Mapping[int, Sequence[int]],
+) -> ProblemIndex:
+    """Build the problem index for one solve.
+
+    Args:
+        person_ids: Sorted person CampMinder IDs (position = person_idx)
+        person_by_cm_id: cm_id -> DirectPerson
+        bunks: Sorted bunks (position = bunk_idx)
+        bunk_persons: bunk_idx -> person idxs with an assignment variable
+    """
+    persons = [person_by_cm_id[cm_id] for cm_id in person_ids]
+
+    eligible_campers: dict[int, tuple[tuple[int, DirectPerson], ...]] = {}
+    eligible_by_grade: dict[int, Mapping[int, tuple[int, ...]]] = {}
+    for bunk_idx, bunk in enumerate(bunks):
+        eligible = tuple(
+            (person_idx, persons[person_idx])
+            for person_idx in bunk_persons.get(bunk_idx, [])
+            if persons[person_idx].session_cm_id == bunk.session_cm_id
+            and (bunk.gender in ["Mixed", "AG"] or persons[person_idx].gender == bunk.gender)
+        )
+        eligible_campers[bunk_idx] = eligible
+
+        by_grade: dict[int, list[int]] = {}
+        for person_idx, person in eligible:
+            by_grade.setdefault(person.grade, []).append(person_idx)
+        eligible_by_grade[bunk_idx] = MappingProxyType({g: tuple(idxs) for g, idxs in by_grade.items()})
+
+    persons_by_grade: dict[int, list[int]] = {}
+    for person_idx, person in enumerate(persons):
+        persons_by_grade.setdefault(person.grade, []).append(person_idx)
+
+    age_months = tuple(age_to_months(person.age) for person in persons)
+
+    # Edge classification: lowest/highest level bunk per non-AG gender/session group
+    level_order = get_level_order()
+    groups: dict[tuple[str | None, int], list[int]] = {}
+    for bunk_idx, bunk in enumerate(bunks):
+        if not is_ag_session_bunk(bunk):
+            groups.setdefault((bunk.gender, bunk.session_cm_id), []).append(bunk_idx)
+    for group in groups.values():
+        group.sort(key=lambda b: level_order.get(extract_bunk_level(bunks[b].name) or "", 999))
+    edge_types: dict[int, str] = {}
+    for bunk_idx, bunk in enumerate(bunks):
+        ordered = groups.get((bunk.gender, bunk.session_cm_id), [])
+        if len(ordered) <= 1:
+            edge_types[bunk_idx] = "only"
+        elif bunk.campminder_id == bunks[ordered[0]].campminder_id:
+            edge_types[bunk_idx] = "low"
+        elif bunk.campminder_id == bunks[ordered[-1]].campminder_id:
+            edge_types[bunk_idx] = "high"
+        else:
+            edge_types[bunk_idx] = "none"
+
+    # Pair-valid bunks per (session, gender); gender None = Mixed/AG bunks only
+    pair_bunks: dict[tuple[int, str | None], list[int]] = {}
+    genders = {person.gender for person in persons}
+    for bunk_idx, bunk in enumerate(bunks):
+        if bunk.gender in ["Mixed", "AG"]:
+            for gender in genders | {None}:
+                pair_bunks.setdefault((bunk.session_cm_id, gender), []).append(bunk_idx)
+        elif bunk.gender:
+            pair_bunks.setdefault((bunk.session_cm_id, bunk.gender), []).append(bunk_idx)
+
+    return ProblemIndex(
+        eligible_campers=MappingProxyType(eligible_campers),
+        eligible_by_grade=MappingProxyType(eligible_by_grade),
+        persons_by_grade=MappingProxyType({g: tuple(idxs) for g, idxs in persons_by_grade.items()}),
+        age_months=age_months,
+        edge_types=MappingProxyType(edge_types),
+        _pair_bunks=MappingProxyType({key: tuple(idxs) for key, idxs in pair_bunks.items()}),
+        _person_keys=tuple((person.session_cm_id, person.gender) for person in persons),
+    )
@@ -0,0 +1,118 @@
+"""
+Symmetry Breaking - Order interchangeable bunks.
+
+Bunks in the same session with the same gender, capacity and level (e.g. G-6A
+and G-6B) are interchangeable whenever no constraint or objective term tells
+them apart: any solution can be turned into another of equal score by swapping
+their campers. This module groups such bunks into equivalence classes and
+requires the lowest camper index in each bunk to increase along the class
+(empty bunks last), so CP-SAT explores one representative per permutation.
+
+Optional - enabled by solver.symmetry_breaking.enabled.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ..bunk_ordering import get_bunk_rank
+from .base import SolverContext
+from .helpers import extract_bunk_level, is_ag_session_bunk
+
+if TYPE_CHECKING:
+    from bunking.models_v2 import DirectBunk
+
+logger = logging.getLogger(__name__)
+
+
+def find_interchangeable_bunks(ctx: SolverContext) -> list[list[int]]:
+    """Group bunk indices into classes of interchangeable bunks.
+
+    Bunks are excluded (never grouped) when something in the model refers to
+    that specific bunk:
+    - an individual lock targets it
+    - it is a camper's warm-start bunk and the minimal-change penalty is on
+    - it is a single-gender bunk and age/grade flow is on (flow gives each
+      bunk its own target grade by position, even within a level)
+
+    Returns:
+        Classes of 2+ bunk indices, each ordered by bunk rank then name
+    """
+    excluded: set[int] = set()
+    for bunk_cm_id in ctx.input.locked_assignments.values():
+        if bunk_cm_id in ctx.bunk_idx_map:
+            excluded.add(ctx.bunk_idx_map[bunk_cm_id])
+    if ctx.input.change_penalty > 0:
+        for bunk_cm_id in ctx.input.solution_hints.values():
+            if bunk_cm_id in ctx.bunk_idx_map:
+                excluded.add(ctx.bunk_idx_map[bunk_cm_id])
+    flow_enabled = ctx.config.get_int("constraint.age_grade_flow.weight", default=300) > 0
+
+    classes: dict[tuple[int, str | None, int, str | None, bool, str], list[int]] = {}
+    for bunk_idx, bunk in enumerate(ctx.bunks):
+        if bunk_idx in excluded or (flow_enabled and bunk.gender in ["M", "F"]):
+            continue
+        key = (
+            bunk.session_cm_id,
+            bunk.gender,
+            bunk.capacity,
+            extract_bunk_level(bunk.name),
+            is_ag_session_bunk(bunk),
+            # grade_ratio exempts the low/high edge bunk, which can fall inside a level
+            ctx.index.edge_types[bunk_idx],
+        )
+        classes.setdefault(key, []).append(bunk_idx)
+
+    def rank_key(bunk_idx: int) -> tuple[tuple[int, int], str]:
+        bunk: DirectBunk = ctx.bunks[bunk_idx]
+        return get_bunk_rank(bunk.name) or (999, 0), bunk.name
+
+    return [sorted(bunk_idxs, key=rank_key) for bunk_idxs in classes.values() if len(bunk_idxs) > 1]
+
+
+def add_symmetry_breaking_constraints(ctx: SolverContext) -> None:
+    """Add lexicographic ordering constraints over interchangeable bunks.
+
+    For each class [b1, b2, ...], min_person(b1) <= min_person(b2) <= ...,
+    where min_person of an empty bunk is the number of campers (sorts last).
+    Two non-empty bunks can never tie, so the order is strict between them.
+    """
+    if not ctx.config.get_int("solver.symmetry_breaking.enabled", default=0):
+        return
+    if ctx.is_constraint_disabled("symmetry_breaking"):
+        logger.info("Symmetry breaking DISABLED via debug settings")
+        return
+
+    bunk_classes = find_interchangeable_bunks(ctx)
+    if not bunk_classes:
+        logger.info("Symmetry breaking: no interchangeable bunks found")
+        return
+
+    empty_marker = len(ctx.person_ids)
+    for bunk_idxs in bunk_classes:
+        min_person_vars = []
+        for bunk_idx in bunk_idxs:
+            min_person = ctx.model.NewIntVar(0, empty_marker, f"min_person_b{bunk_idx}")
+            # Each camper contributes their index when in the bunk, else the empty marker
+            ctx.model.AddMinEquality(
+                min_person,
+                [
+                    empty_marker - (empty_marker - person_idx) * ctx.assignments[(person_idx, bunk_idx)]
+                    for person_idx in ctx.bunk_persons[bunk_idx]
+                ]
+                + [empty_marker],
+            )
+            min_person_vars.append(min_person)
+        for lower, higher in zip(min_person_vars, min_person_vars[1:], strict=False):
+            ctx.model.Add(lower <= higher)
+
+    ctx.constraint_logger.log_constraint(
+        "hard",
+        "symmetry_breaking",
+        f"Ordered {sum(len(c) for c in bunk_classes)} interchangeable bunks in {len(bunk_classes)} classes",
+    )
+    logger.info(
+        "Symmetry breaking classes: "
+        + "; ".join(", ".join(ctx.bunks[b].name for b in bunk_idxs) for bunk_idxs in bunk_classes)
+    )
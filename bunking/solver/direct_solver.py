@@ -8,6 +8,8 @@ from __future__ import annotations
 import logging
 import os
 from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from ortools.sat.python import cp_model
@@ -24,7 +26,7 @@ from campminder.client import get_current_season
 from .callbacks import SolverProgressCallback
 from .constraints.age_grade_flow import add_age_grade_flow_objective
 from .constraints.age_spread import add_age_spread_constraints
-from .constraints.base import SolverContext
+from .constraints.base import SolverContext, build_assignment_index
 from .constraints.cabin_capacity import add_cabin_capacity_soft_constraint
 from .constraints.cabin_occupancy import (
     add_cabin_minimum_occupancy_constraints,
@@ -35,8 +37,11 @@ from .constraints.grade_adjacency import add_grade_adjacency_constraints
 from .constraints.grade_ratio import add_grade_ratio_constraints
 from .constraints.grade_spread import add_grade_spread_constraints, add_grade_spread_soft_constraint
 from .constraints.group_locks import add_group_lock_constraints
+from .constraints.helpers import is_assignment_allowed
 from .constraints.level_progression import add_level_progression_constraints
 from .constraints.must_satisfy import add_must_satisfy_one_request_constraints
+from .constraints.problem_index import build_problem_index
+from .constraints.symmetry import add_symmetry_breaking_constraints
 from .feasibility import check_feasibility as _check_feasibility
 from .feasibility import find_infeasibility_cause as _find_infeasibility_cause
 from .logging import ConstraintLogger
@@ -53,12 +58,27 @@ class DirectBunkingSolver:
         input_data: DirectSolverInput,
         config_service: ConfigLoader,
         debug_constraints: dict[str, bool] | None = None,
+        track_assumptions: bool = False,
     ):
+        """Build the assignment variables for a solve.
+
+        Args:
+            input_data: Campers, bunks, requests and locks to solve for
+            config_service: Solver configuration
+            debug_constraints: Constraint names to disable (True = disabled)
+            track_assumptions: Gate each hard constraint family, lock and hard
+                not_bunk_with behind an assumption literal (see self.assumptions)
+                so an infeasible model can report a conflicting set
+        """
         self.input = input_data
         self.config = config_service
         self.model = cp_model.CpModel()
         self.debug_constraints = debug_constraints or {}  # Dict of constraint names to disable
 
+        # Assumption literal index -> human-readable description of what it gates
+        self.track_assumptions = track_assumptions
+        self.assumptions: dict[int, str] = {}
+
         # Debug mode from SOLVER_LOG_LEVEL env var (consolidates solver.debug.enabled and log_level)
         solver_log_level = os.getenv("SOLVER_LOG_LEVEL", "INFO").upper()
         self.debug_mode = solver_log_level == "DEBUG"
@@ -73,23 +93,62 @@ class DirectBunkingSolver:
         self.bunk_idx_map = {b.campminder_id: idx for idx, b in enumerate(self.bunks)}
 
         # Decision variables: person_idx -> bunk_idx
-        self.assignments = {}
-        for person_idx in range(len(self.person_ids)):
-            for bunk_idx in range(len(self.bunks)):
+        # Sparse - only bunks the person may be placed in (session and gender
+        # match) get a variable, so session_boundary and gender are enforced by
+        # the variable layout rather than by n×m "== 0" constraints.
+        # A camper locked to an eligible bunk only gets that bunk's variable, which
+        # keeps incremental re-solves (everyone but a neighborhood locked) small.
+        self.assignments: dict[tuple[int, int], cp_model.IntVar] = {}
+        # When tracking assumptions, gender and locks become explicit (gated) constraints
+        # instead of being baked into the variable layout
+        check_session = not self.debug_constraints.get("session_boundary", False)
+        check_gender = not self.debug_constraints.get("gender", False) and not track_assumptions
+        locked_assignments = self.input.locked_assignments
+        self._person_by_cm_id = self.input.person_by_cm_id
+        for person_idx, person_cm_id in enumerate(self.person_ids):
+            person = self._person_by_cm_id[person_cm_id]
+            eligible = [
+                bunk_idx
+                for bunk_idx, bunk in enumerate(self.bunks)
+                if is_assignment_allowed(person, bunk, check_session=check_session, check_gender=check_gender)
+            ]
+            locked_bunk_idx = self.bunk_idx_map.get(locked_assignments.get(person_cm_id, -1))
+            if locked_bunk_idx in eligible and not track_assumptions:
+                eligible = [locked_bunk_idx]
+            for bunk_idx in eligible:
                 self.assignments[(person_idx, bunk_idx)] = self.model.NewBoolVar(
                     f"person_{person_idx}_in_bunk_{bunk_idx}"
                 )
+        self.person_bunks, self.bunk_persons = build_assignment_index(
+            self.assignments, len(self.person_ids), len(self.bunks)
+        )
+        logger.info(
+            f"Created {len(self.assignments)} assignment variables "
+            f"({len(self.person_ids)} campers × {len(self.bunks)} bunks dense)"
+        )
+
+        # Eligibility, grade, age and edge lookups shared by every constraint module
+        self.problem_index = build_problem_index(self.person_ids, self._person_by_cm_id, self.bunks, self.bunk_persons)
+        self._solver_context: SolverContext | None = None
 
         # Also create integer variables representing which bunk each person is in
         # This allows for direct comparison in bunk_with/not_bunk_with constraints
         self.person_bunk_assignment = {}
         for person_idx in range(len(self.person_ids)):
-            self.person_bunk_assignment[person_idx] = self.model.NewIntVar(
-                0, len(self.bunks) - 1, f"person_{person_idx}_bunk"
+            eligible_bunks = self.person_bunks[person_idx]
+            if eligible_bunks:
+                domain = cp_model.Domain.FromValues(eligible_bunks)
+            else:
+                # No bunk can take this camper; the assignment constraint makes the
+                # model infeasible, but the variable itself must stay valid
+                logger.warning(f"Camper {self.person_ids[person_idx]} has no eligible bunks")
+                domain = cp_model.Domain(0, max(len(self.bunks) - 1, 0))
+            self.person_bunk_assignment[person_idx] = self.model.NewIntVarFromDomain(
+                domain, f"person_{person_idx}_bunk"
             )
             # Link the integer variable to the boolean assignments
             # person_bunk_assignment[i] == j iff assignments[(i,j)] == 1
-            for bunk_idx in range(len(self.bunks)):
+            for bunk_idx in eligible_bunks:
                 self.model.Add(self.person_bunk_assignment[person_idx] == bunk_idx).OnlyEnforceIf(
                     self.assignments[(person_idx, bunk_idx)]
                 )
@@ -97,6 +156,10 @@ class DirectBunkingSolver:
         # Track soft constraint violations for penalty-based optimization
         self.soft_constraint_violations: dict[str, tuple[cp_model.IntVar, int]] = {}
 
+        # Active CP-SAT solver (set during solve) so stop() can interrupt the search
+        self._cp_solver: cp_model.CpSolver | None = None
+        self._stop_requested = False
+
         # Validate requests and categorize as possible/impossible
         self.possible_requests: dict[int, list[DirectBunkRequest]] = {}  # person_cm_id -> list of possible requests
         self.impossible_requests: dict[int, list[DirectBunkRequest]] = {}  # person_cm_id -> list of impossible requests
@@ -107,7 +170,11 @@ class DirectBunkingSolver:
 
         This allows extracted constraint modules to access solver state
         in a structured way without tight coupling to the solver class.
+        The context is built once and shared by every constraint module.
         """
+        if self._solver_context is not None:
+            return self._solver_context
+
         # Build requests_by_person from input
         requests_by_person: dict[int, list[DirectBunkRequest]] = {}
         for request in self.input.requests:
@@ -116,7 +183,7 @@ class DirectBunkingSolver:
                 requests_by_person[cm_id] = []
             requests_by_person[cm_id].append(request)
 
-        return SolverContext(
+        self._solver_context = SolverContext(
             model=self.model,
             assignments=self.assignments,
             person_bunk_assignment=self.person_bunk_assignment,
@@ -134,7 +201,11 @@ class DirectBunkingSolver:
             constraint_logger=self.constraint_logger,
             debug_constraints=self.debug_constraints,
             soft_constraint_violations=self.soft_constraint_violations,
+            person_bunks=self.person_bunks,
+            bunk_persons=self.bunk_persons,
+            index=self.problem_index,
         )
+        return self._solver_context
 
     def _get_valid_bunks_for_pair(self, person1_idx: int, person2_idx: int) -> list[int]:
         """Get list of bunk indices where both campers can be validly assigned.
@@ -144,47 +215,9 @@ class DirectBunkingSolver:
         - Gender compatibility (both must match bunk gender or bunk is Mixed)
 
         This dramatically reduces the search space for bunk_with/not_bunk_with constraints.
+        Looked up from the problem index rather than scanning every bunk per pair.
         """
-        person1_cm_id = self.person_ids[person1_idx]
-        person2_cm_id = self.person_ids[person2_idx]
-
-        person1 = self.input.person_by_cm_id[person1_cm_id]
-        person2 = self.input.person_by_cm_id[person2_cm_id]
-
-        # They must be in the same session to bunk together
-        if person1.session_cm_id != person2.session_cm_id:
-            return []
-
-        session_id = person1.session_cm_id
-
-        valid_bunks = []
-        for bunk_idx, bunk in enumerate(self.bunks):
-            # Bunk must be in their session
-            if bunk.session_cm_id != session_id:
-                continue
-
-            # Check gender compatibility
-            if bunk.gender in ["Mixed", "AG"]:
-                # Mixed/AG bunks accept anyone
-                valid_bunks.append(bunk_idx)
-            elif bunk.gender:
-                # Single-gender bunk - both campers must match
-                if person1.gender == bunk.gender and person2.gender == bunk.gender:
-                    valid_bunks.append(bunk_idx)
-            # If bunk has no gender specified, skip it (shouldn't happen)
-
-        # Log reduction for debugging (only first few times)
-        if not hasattr(self, "_pair_reduction_logged"):
-            self._pair_reduction_logged = 0
-        if self._pair_reduction_logged < 5:
-            logger.debug(
-                f"Valid bunks for pair {person1_cm_id}-{person2_cm_id} "
-                f"(session {session_id}, genders {person1.gender}/{person2.gender}): "
-                f"{len(valid_bunks)}/{len(self.bunks)} bunks"
-            )
-            self._pair_reduction_logged += 1
-
-        return valid_bunks
+        return self.problem_index.valid_bunks_for_pair(person1_idx, person2_idx)
 
     def _validate_requests(self) -> None:
         """Validate requests and categorize as possible (can be satisfied) or impossible (reference out-of-session people)."""
@@ -271,24 +304,17 @@ class DirectBunkingSolver:
             )
             for person_idx in range(len(self.person_ids)):
                 self.model.Add(
-                    sum(self.assignments[(person_idx, bunk_idx)] for bunk_idx in range(len(self.bunks))) == 1
+                    sum(self.assignments[(person_idx, bunk_idx)] for bunk_idx in self.person_bunks[person_idx]) == 1
                 )
         else:
             logger.warning("DEBUG: Assignment constraints DISABLED")
 
         # 2. Session boundary constraints - campers can only be assigned to bunks in their session
+        # Enforced by the sparse variable layout built in __init__ (no variable for out-of-session bunks)
         if not self.debug_constraints.get("session_boundary", False):
             self.constraint_logger.log_constraint(
                 "hard", "session_boundary", "Campers can only be assigned to bunks within their enrolled session"
             )
-            for person_idx, person_cm_id in enumerate(self.person_ids):
-                person = self.input.person_by_cm_id[person_cm_id]
-                person_session = person.session_cm_id
-
-                for bunk_idx, bunk in enumerate(self.bunks):
-                    # If bunk is not in the person's session, prohibit assignment
-                    if bunk.session_cm_id != person_session:
-                        self.model.Add(self.assignments[(person_idx, bunk_idx)] == 0)
         else:
             logger.warning("DEBUG: Session boundary constraints DISABLED")
 
@@ -300,10 +326,11 @@ class DirectBunkingSolver:
                 "hard", "cabin_capacity", f"Cabin capacity constraints for {len(self.bunks)} bunks"
             )
             for bunk_idx, bunk in enumerate(self.bunks):
-                self.model.Add(
-                    sum(self.assignments[(person_idx, bunk_idx)] for person_idx in range(len(self.person_ids)))
-                    <= bunk.capacity
-                )
+                with self._assumption(f"cabin_capacity: {bunk.name} holds at most {bunk.capacity}"):
+                    self.model.Add(
+                        sum(self.assignments[(person_idx, bunk_idx)] for person_idx in self.bunk_persons[bunk_idx])
+                        <= bunk.capacity
+                    )
         else:
             # Soft mode - enforce max capacity as hard limit, penalize over standard
             max_capacity = self.config.get_int("constraint.cabin_capacity.max", default=14)
@@ -314,12 +341,13 @@ class DirectBunkingSolver:
             )
             for bunk_idx, bunk in enumerate(self.bunks):
                 occupancy_expr = sum(
-                    self.assignments[(person_idx, bunk_idx)] for person_idx in range(len(self.person_ids))
+                    self.assignments[(person_idx, bunk_idx)] for person_idx in self.bunk_persons[bunk_idx]
                 )
 
                 # Hard constraint: In soft mode, allow up to max_capacity
                 # This allows overflow beyond the bunk's standard capacity
-                self.model.Add(occupancy_expr <= max_capacity)
+                with self._assumption(f"cabin_capacity: {bunk.name} holds at most {max_capacity}"):
+                    self.model.Add(occupancy_expr <= max_capacity)
 
                 # Soft constraint: Track overcrowding beyond standard capacity
                 # This will be penalized in the objective function
@@ -327,7 +355,8 @@ class DirectBunkingSolver:
         # 3.5. Minimum occupancy constraint for non-AG bunks
         # Staff never put fewer than ~8 campers in a cabin
         ctx = self._build_solver_context()
-        self.bunk_is_used = add_cabin_minimum_occupancy_constraints(ctx)
+        with self._assumption("cabin_minimum_occupancy"):
+            self.bunk_is_used = add_cabin_minimum_occupancy_constraints(ctx)
 
         # 4. Manual locks (individual)
         if self.input.locked_assignments:
@@ -338,11 +367,23 @@ class DirectBunkingSolver:
             if person_cm_id in self.person_idx_map and bunk_cm_id in self.bunk_idx_map:
                 person_idx = self.person_idx_map[person_cm_id]
                 bunk_idx = self.bunk_idx_map[bunk_cm_id]
-                self.model.Add(self.assignments[(person_idx, bunk_idx)] == 1)
+                lock_description = f"manual_lock: {self._person_name(person_idx)} locked to {self.bunks[bunk_idx].name}"
+                with self._assumption(lock_description):
+                    if (person_idx, bunk_idx) in self.assignments:
+                        self.model.Add(self.assignments[(person_idx, bunk_idx)] == 1)
+                    else:
+                        # Locked into a bunk outside the camper's session/gender - bunk_idx is
+                        # outside the int var's domain, so this keeps the model infeasible
+                        logger.warning(f"Camper {person_cm_id} is locked to ineligible bunk {bunk_cm_id}")
+                        self.model.Add(self.person_bunk_assignment[person_idx] == bunk_idx)
 
         # 5. Group locks
         # Uses extracted constraint module - debug check is internal
-        add_group_lock_constraints(self._build_solver_context())
+        with self._assumption("group_locks"):
+            add_group_lock_constraints(self._build_solver_context())
+
+        # 5b. Symmetry breaking between interchangeable bunks (optional, skips locked bunks)
+        add_symmetry_breaking_constraints(self._build_solver_context())
 
         # 6. Grade/age spread constraints - NOW ENABLED with aggregation
         # Check if grade spread should be hard or soft constraint
@@ -350,7 +391,8 @@ class DirectBunkingSolver:
         logger.info(f"Grade spread mode from config: '{grade_spread_mode}'")
         if grade_spread_mode == "hard":
             # Uses extracted constraint module - debug check is internal
-            add_grade_spread_constraints(self._build_solver_context())
+            with self._assumption("grade_spread"):
+                add_grade_spread_constraints(self._build_solver_context())
         else:
             logger.info("Grade spread will be handled as SOFT constraint in objective function")
         # If soft, it will be handled in the objective function
@@ -361,7 +403,8 @@ class DirectBunkingSolver:
 
         # 7b. Grade adjacency constraints - penalize non-adjacent grades in bunks
         # Uses extracted constraint module - debug check is internal
-        add_grade_adjacency_constraints(self._build_solver_context())
+        with self._assumption("grade_adjacency"):
+            add_grade_adjacency_constraints(self._build_solver_context())
 
         # 8. Age spread soft constraints - NOW ENABLED with aggregation
         # Uses extracted constraint module - debug check is internal
@@ -369,15 +412,48 @@ class DirectBunkingSolver:
 
         # 10. Must satisfy one request constraints
         # Uses extracted constraint module - debug check is internal
-        add_must_satisfy_one_request_constraints(self._build_solver_context())
+        with self._assumption("must_satisfy_one"):
+            add_must_satisfy_one_request_constraints(self._build_solver_context())
 
         # 11. Level progression constraints
         # Uses extracted constraint module - debug check is internal
-        add_level_progression_constraints(self._build_solver_context())
+        with self._assumption("level_progression"):
+            add_level_progression_constraints(self._build_solver_context())
 
         # 12. Gender constraints - CRITICAL for safety
         # Uses extracted constraint module - debug check is internal
-        add_gender_constraints(self._build_solver_context())
+        with self._assumption("gender"):
+            add_gender_constraints(self._build_solver_context())
+
+    @contextmanager
+    def _assumption(self, description: str) -> Iterator[None]:
+        """Gate every constraint added inside the block behind one assumption literal.
+
+        No-op unless track_assumptions is set. Only linear and boolean clauses
+        accept an enforcement literal; other constraint types added in the block
+        (e.g. min/max equalities) only define auxiliary variables and stay ungated.
+        """
+        if not self.track_assumptions:
+            yield
+            return
+
+        first_index = len(self.model.Proto().constraints)
+        yield
+        proto = self.model.Proto()
+        if len(proto.constraints) == first_index:
+            return
+
+        literal = self.model.NewBoolVar(f"assumption_{len(self.assumptions)}")
+        for index in range(first_index, len(proto.constraints)):
+            constraint = proto.constraints[index]
+            if constraint.has_linear() or constraint.has_bool_or() or constraint.has_bool_and():
+                cp_model.Constraint(self.model, index).OnlyEnforceIf(literal)
+        self.assumptions[literal.Index()] = description
+
+    def _person_name(self, person_idx: int) -> str:
+        """Display name of a camper by solver index."""
+        person = self._person_by_cm_id[self.person_ids[person_idx]]
+        return f"{person.name} ({person.campminder_person_id})"
 
     def _get_csv_field_multiplier(self, request: DirectBunkRequest) -> float:
         """Get the appropriate multiplier based on CSV source fields.
@@ -475,9 +551,14 @@ class DirectBunkingSolver:
                             if valid_bunks:
                                 # Only add constraint if they could potentially be together
                                 # This is a single constraint instead of 20+ constraints!
-                                self.model.Add(
-                                    self.person_bunk_assignment[person_idx] != self.person_bunk_assignment[target_idx]
-                                )
+                                with self._assumption(
+                                    f"not_bunk_with: {self._person_name(person_idx)} "
+                                    f"apart from {self._person_name(target_idx)}"
+                                ):
+                                    self.model.Add(
+                                        self.person_bunk_assignment[person_idx]
+                                        != self.person_bunk_assignment[target_idx]
+                                    )
                         else:
                             # Soft constraint - create satisfaction variable
                             request_satisfied = self.model.NewBoolVar(f"req_satisfied_{request.id}")
@@ -572,6 +653,9 @@ class DirectBunkingSolver:
         # Add cabin minimum occupancy soft penalty (prefer fuller bunks)
         add_cabin_minimum_occupancy_soft_penalty(ctx, objective_terms, self.bunk_is_used)
 
+        # Minimal-change term: penalize moving campers away from their warm-start bunk
+        self._add_change_penalty()
+
         # Subtract penalties for soft constraint violations
         for _violation_name, (violation_var, penalty) in self.soft_constraint_violations.items():
             objective_terms.append(-penalty * violation_var)
@@ -579,6 +663,50 @@ class DirectBunkingSolver:
         # Maximize objective
         self.model.Maximize(sum(objective_terms))
 
+    def _hinted_bunks(self) -> dict[int, int]:
+        """Warm-start hints as person_idx -> bunk_idx, skipping campers or bunks not in this model."""
+        hinted = {}
+        for person_cm_id, bunk_cm_id in self.input.solution_hints.items():
+            person_idx = self.person_idx_map.get(person_cm_id)
+            bunk_idx = self.bunk_idx_map.get(bunk_cm_id)
+            if person_idx is not None and bunk_idx is not None:
+                hinted[person_idx] = bunk_idx
+        return hinted
+
+    def _add_change_penalty(self) -> None:
+        """Penalize each hinted camper who ends up outside their hinted bunk.
+
+        Only active when change_penalty > 0. Campers whose hinted bunk is no
+        longer eligible must move anyway, so they carry no penalty.
+        """
+        penalty = self.input.change_penalty
+        if penalty <= 0:
+            return
+        count = 0
+        for person_idx, bunk_idx in self._hinted_bunks().items():
+            stay_var = self.assignments.get((person_idx, bunk_idx))
+            if stay_var is None:
+                continue
+            self.soft_constraint_violations[f"minimal_change_{self.person_ids[person_idx]}"] = (stay_var.Not(), penalty)
+            count += 1
+        logger.info(f"Added minimal-change penalty ({penalty}) for {count} campers")
+
+    def _add_solution_hints(self) -> int:
+        """Seed CP-SAT with the warm-start assignment. Returns the number of campers hinted.
+
+        Hints are partial - campers without a hint (e.g. new enrollments) are
+        left for the search.
+        """
+        count = 0
+        for person_idx, hint_bunk_idx in self._hinted_bunks().items():
+            if (person_idx, hint_bunk_idx) not in self.assignments:
+                continue
+            for bunk_idx in self.person_bunks[person_idx]:
+                self.model.AddHint(self.assignments[(person_idx, bunk_idx)], bunk_idx == hint_bunk_idx)
+            self.model.AddHint(self.person_bunk_assignment[person_idx], hint_bunk_idx)
+            count += 1
+        return count
+
     def find_infeasibility_cause(self, time_limit_seconds: int = 10) -> str:
         """Try to identify which constraint is causing infeasibility.
 
@@ -588,6 +716,7 @@ class DirectBunkingSolver:
             input_data=self.input,
             config=self.config,
             time_limit_seconds=time_limit_seconds,
+            debug_constraints=self.debug_constraints,
         )
 
     def _solve_single_bunk_session(self) -> DirectSolverOutput:
@@ -653,8 +782,36 @@ class DirectBunkingSolver:
             },
         )
 
-    def solve(self, time_limit_seconds: int = 60) -> DirectSolverOutput | None:
-        """Solve the bunking problem."""
+    def stop(self) -> None:
+        """Request that an in-progress solve stop as soon as possible.
+
+        Safe to call from another thread. If the search has already started,
+        CP-SAT returns the best solution found so far; if called before the
+        search starts, solve() returns None without searching.
+        """
+        self._stop_requested = True
+        if self._cp_solver is not None:
+            self._cp_solver.StopSearch()
+
+    def solve(
+        self,
+        time_limit_seconds: float = 60,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
+        num_workers: int | None = None,
+    ) -> DirectSolverOutput | None:
+        """Solve the bunking problem.
+
+        Args:
+            time_limit_seconds: CP-SAT wall time limit
+            progress_callback: Optional callable receiving progress dicts
+                (phase, solutions found, objective, elapsed time)
+            num_workers: CP-SAT search workers (defaults to SOLVER_NUM_WORKERS env var)
+        """
+
+        def report(phase: str, **fields: Any) -> None:
+            if progress_callback is not None:
+                progress_callback({"phase": phase, **fields})
+
         # Check if this is a single-bunk session (like AG sessions)
         if len(self.bunks) == 1:
             logger.info("Single-bunk session detected - using simplified solving")
@@ -664,14 +821,22 @@ class DirectBunkingSolver:
         self.check_feasibility()
 
         # Add constraints and objective
+        report("building_model")
         self.constraint_logger.log_progress("Adding constraints to model...")
         self.add_constraints()
 
         self.constraint_logger.log_progress("Setting up objective function...")
         self.add_objective()
 
+        hinted_count = self._add_solution_hints() if self.input.solution_hints else 0
+
         # Create solver and set time limit
         solver = cp_model.CpSolver()
+        self._cp_solver = solver
+        if self._stop_requested:
+            logger.info("Solve cancelled before search started")
+            self._cp_solver = None
+            return None
         solver.parameters.max_time_in_seconds = time_limit_seconds
 
         # Enable detailed logging for debugging
@@ -679,15 +844,26 @@ class DirectBunkingSolver:
         solver.log_callback = lambda msg: logger.info(f"OR-Tools: {msg}")
 
         # Add optimization parameters for better performance
-        # Read worker count from env (default 8 for good parallelism)
-        num_workers = int(os.getenv("SOLVER_NUM_WORKERS", "8"))
+        # Read worker count from env (default 8 for good parallelism) unless the caller
+        # assigned one (e.g. a share of the multi-session worker budget)
+        if num_workers is None:
+            num_workers = int(os.getenv("SOLVER_NUM_WORKERS", "8"))
         solver.parameters.num_search_workers = num_workers
         solver.parameters.linearization_level = 2  # Better for circuit/boolean constraints
         solver.parameters.cp_model_presolve = True  # Enable preprocessing
         solver.parameters.search_branching = cp_model.FIXED_SEARCH  # Try different search strategies
+        if hinted_count:
+            # repair_hint aborts under FIXED_SEARCH; a hint that staff edits made
+            # infeasible is simply not used as a starting solution
+            logger.info(f"Warm start: hinted {hinted_count} of {len(self.person_ids)} campers")
 
         # Add callback for progress tracking
-        callback = SolverProgressCallback(self.constraint_logger, self.debug_mode)
+        callback = SolverProgressCallback(
+            self.constraint_logger,
+            self.debug_mode,
+            on_progress=progress_callback,
+            should_stop=lambda: self._stop_requested,
+        )
 
         # Log solver start
         self.constraint_logger.log_progress(f"Starting solver with {time_limit_seconds}s time limit...")
@@ -701,7 +877,11 @@ class DirectBunkingSolver:
         )
 
         # Solve with callback
-        status = solver.Solve(self.model, callback)
+        report("solving", time_limit_seconds=time_limit_seconds)
+        try:
+            status = solver.Solve(self.model, callback)
+        finally:
+            self._cp_solver = None
 
         # If infeasible, export the model and try to find conflicts
         if status == cp_model.INFEASIBLE:
@@ -755,7 +935,8 @@ class DirectBunkingSolver:
         # Extract solution
         assignments = []
         for person_idx, person_cm_id in enumerate(self.person_ids):
-            for bunk_idx, bunk in enumerate(self.bunks):
+            for bunk_idx in self.person_bunks[person_idx]:
+                bunk = self.bunks[bunk_idx]
                 if solver.Value(self.assignments[(person_idx, bunk_idx)]) == 1:
                     # Get the person's actual enrolled session
                     person = self.input.person_by_cm_id[person_cm_id]
@@ -823,6 +1004,7 @@ class DirectBunkingSolver:
                 "total_bunks": len(self.bunks),
                 "total_requests": len(self.input.requests),
                 "satisfied_request_count": sum(len(reqs) for reqs in satisfied_requests.values()),
+                "warm_start_hints": hinted_count,
                 # Request validation statistics
                 "request_validation": self.request_validation_summary,
             },
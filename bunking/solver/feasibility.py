@@ -255,16 +255,24 @@ def find_infeasibility_cause(
     input_data: DirectSolverInput,
     config: ConfigLoader,
     time_limit_seconds: int = 10,
+    debug_constraints: dict[str, bool] | None = None,
 ) -> str:
-    """Try to identify which constraint is causing infeasibility.
+    """Try to identify which constraints are causing infeasibility.
 
-    Creates new solver instances with different constraint combinations
-    to identify which constraint is causing the problem.
+    Builds the model once with every hard constraint family, manual lock and
+    hard not_bunk_with gated behind an assumption literal, then solves the
+    feasibility problem (no objective) under those assumptions. If it is
+    infeasible, CP-SAT reports a subset of the assumptions that is already
+    infeasible on its own - that subset is the explanation.
+
+    Session boundaries stay structural (baked into the variable layout) and
+    soft constraints are not gated, since they can never cause infeasibility.
 
     Args:
         input_data: The solver input data
         config: Configuration service
-        time_limit_seconds: Time limit for each solver run
+        time_limit_seconds: Time limit for the solver run
+        debug_constraints: Constraint names already disabled for this solve
 
     Returns:
         A description of the likely cause.
@@ -274,56 +282,34 @@ def find_infeasibility_cause(
 
     logger.info("=== Starting Infeasibility Analysis ===")
 
-    # List of constraints to test
-    constraint_types = [
-        "session_boundary",
-        "must_satisfy_one",
-        "grade_spread",
-        "gender",
-        "level_progression",
-        "group_locks",
-    ]
-
-    results = {}
-
-    # First, try with all constraints
-    logger.info("Testing with all constraints enabled...")
-    solver = DirectBunkingSolver(input_data, config, {})
-    solver.check_feasibility()
+    solver = DirectBunkingSolver(input_data, config, debug_constraints, track_assumptions=True)
     solver.add_constraints()
     solver.add_objective()
+    solver.model.ClearObjective()
+    solver.model.AddAssumptions([solver.model.GetBoolVarFromProtoIndex(index) for index in solver.assumptions])
+    logger.info(f"Checking feasibility under {len(solver.assumptions)} assumptions")
 
     cp_solver = cp_model.CpSolver()
     cp_solver.parameters.max_time_in_seconds = time_limit_seconds
+    # Assumption cores are only reported by the sequential search
+    cp_solver.parameters.num_workers = 1
     status = cp_solver.Solve(solver.model)
-
-    all_enabled_status = cp_solver.StatusName(status)
-    logger.info(f"All constraints enabled: {all_enabled_status}")
+    logger.info(f"Assumption solve: {cp_solver.StatusName(status)}")
 
     if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
         return "No infeasibility found - problem is solvable!"
+    if status != cp_model.INFEASIBLE:
+        return f"Infeasibility analysis inconclusive ({cp_solver.StatusName(status)} after {time_limit_seconds}s)"
 
-    # Test disabling each constraint type
-    for constraint in constraint_types:
-        logger.info(f"\nTesting with {constraint} DISABLED...")
-
-        debug_constraints = {constraint: True}  # True means disabled
-        solver = DirectBunkingSolver(input_data, config, debug_constraints)
-        solver.check_feasibility()
-        solver.add_constraints()
-        solver.add_objective()
-
-        cp_solver = cp_model.CpSolver()
-        cp_solver.parameters.max_time_in_seconds = time_limit_seconds
-        status = cp_solver.Solve(solver.model)
-
-        results[constraint] = cp_solver.StatusName(status)
-        logger.info(f"With {constraint} disabled: {results[constraint]}")
-
-        if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-            logger.info(f"FOUND IT! Disabling {constraint} makes the problem feasible.")
-            return f"The {constraint} constraint is causing infeasibility"
+    core = [
+        solver.assumptions[index]
+        for index in cp_solver.SufficientAssumptionsForInfeasibility()
+        if index in solver.assumptions
+    ]
+    if not core:
+        # Infeasible before any assumption is considered
+        return "Infeasibility caused by the session/capacity setup itself (no gated constraint involved)"
 
-    # If still infeasible with each individual constraint disabled, try combinations
-    logger.info("\nNo single constraint removal fixed it. The issue may be a combination.")
-    return "Infeasibility caused by multiple interacting constraints"
+    for description in core:
+        logger.info(f"Conflicting constraint: {description}")
+    return "Conflicting constraints: " + "; ".join(core)
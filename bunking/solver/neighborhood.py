@@ -0,0 +1,106 @@
+"""
+Neighborhood selection for incremental re-solves.
+
+When staff move a single camper in a scenario, only a handful of campers are
+worth re-optimizing: the occupants of the bunks involved and the camper's
+request partners. Everyone else is locked in place, which shrinks the model
+to a few campers and lets CP-SAT answer within a sub-second budget.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from ..models_v2 import DirectBunkAssignment, DirectSolverInput
+
+
+def select_neighborhood(
+    input_data: DirectSolverInput,
+    person_cm_ids: Iterable[int],
+    bunk_cm_ids: Iterable[int] = (),
+) -> set[int]:
+    """Pick the campers an incremental solve may move.
+
+    The neighborhood is:
+    - Every camper currently in an affected bunk (the given bunks plus the
+      bunks the edited campers are in)
+    - Request partners of the edited campers, in either direction
+    - Campers with no assignment yet, since the solver must place them
+    - All members of any group lock touched by the above
+
+    Args:
+        input_data: Full solver input for the session
+        person_cm_ids: Campers that were just edited
+        bunk_cm_ids: Additional affected bunks (e.g. the bunk a camper left)
+
+    Returns:
+        Set of person_cm_ids that stay free
+    """
+    edited = set(person_cm_ids)
+    current = {a.person_cm_id: a.bunk_cm_id for a in input_data.existing_assignments}
+    affected_bunks = set(bunk_cm_ids) | {current[p] for p in edited if p in current}
+
+    free = set(edited)
+    free.update(person for person, bunk in current.items() if bunk in affected_bunks)
+    for request in input_data.requests:
+        if request.requested_person_cm_id is None:
+            continue
+        if request.requester_person_cm_id in edited:
+            free.add(request.requested_person_cm_id)
+        elif request.requested_person_cm_id in edited:
+            free.add(request.requester_person_cm_id)
+    free.update(p.campminder_person_id for p in input_data.persons if p.campminder_person_id not in current)
+
+    # Group-locked campers move together, so a group is free only as a whole
+    for members in input_data.group_locks.values():
+        if free.intersection(members):
+            free.update(members)
+
+    return free & {p.campminder_person_id for p in input_data.persons}
+
+
+def build_neighborhood_input(
+    input_data: DirectSolverInput,
+    free_person_cm_ids: set[int],
+    pinned: dict[int, int] | None = None,
+) -> DirectSolverInput:
+    """Lock every camper outside the neighborhood to their current bunk.
+
+    Free campers keep their existing assignment (and its lock state) and are
+    hinted towards it, so the solver starts from the current arrangement.
+
+    Args:
+        input_data: Full solver input for the session
+        free_person_cm_ids: Campers the solve may move
+        pinned: Extra person_cm_id -> bunk_cm_id locks (e.g. the edited camper)
+
+    Returns:
+        A copy of input_data with the fixed campers locked
+    """
+    pinned = pinned or {}
+    assignments: list[DirectBunkAssignment] = []
+    for assignment in input_data.existing_assignments:
+        person_cm_id = assignment.person_cm_id
+        if person_cm_id in pinned:
+            continue
+        if person_cm_id in free_person_cm_ids:
+            assignments.append(assignment)
+        else:
+            # Individual lock; any group the camper belongs to is entirely fixed
+            assignments.append(assignment.model_copy(update={"is_locked": True, "group_lock_id": None}))
+
+    sessions = {p.campminder_person_id: p.session_cm_id for p in input_data.persons}
+    year = input_data.existing_assignments[0].year if input_data.existing_assignments else 0
+    for person_cm_id, bunk_cm_id in pinned.items():
+        assignments.append(
+            DirectBunkAssignment(
+                person_cm_id=person_cm_id,
+                session_cm_id=sessions.get(person_cm_id, 0),
+                bunk_cm_id=bunk_cm_id,
+                year=year,
+                is_locked=True,
+            )
+        )
+
+    hints = {a.person_cm_id: a.bunk_cm_id for a in assignments if a.person_cm_id in free_person_cm_ids}
+    return input_data.model_copy(update={"existing_assignments": assignments, "solution_hints": hints})
@@ -0,0 +1,363 @@
+"""Native async PocketBase client on a pooled httpx.AsyncClient.
+
+The pocketbase SDK is synchronous, so async code either blocks the event loop
+or hops to a thread per call (asyncio.to_thread), and each SDK client opens
+its own connections. AsyncPocketBase sends the same REST calls directly from
+the event loop over one keep-alive connection pool and returns the SDK's own
+Record / ListResult models and ClientResponseError, so callers can switch
+without changing how they read results.
+
+Like PocketBaseWrapper, query strings are encoded with %20 for spaces (not
+'+'), which PocketBase expects in filter expressions.
+
+Connections are pooled per PocketBase URL: every async twin of a sync client
+pointing at the same server shares one pool, so per-request clients (e.g.
+background-task clients in the API) do not each open and leak their own.
+
+Usage:
+    apb = AsyncPocketBase.from_client(pb)  # shares URL and auth with a sync client
+    persons = await apb.collection("persons").get_full_list(query_params={"filter": "year = 2025"})
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections.abc import AsyncIterator
+from typing import Any
+from urllib.parse import quote, urlencode
+
+import httpx
+from pocketbase.errors import ClientResponseError
+from pocketbase.models.record import Record
+from pocketbase.models.utils.list_result import ListResult
+from pocketbase.stores.base_auth_store import AuthStore, BaseAuthStore
+
+from bunking.logging_config import TRACE
+from pocketbase import PocketBase
+
+from .pocketbase_wrapper import DEFAULT_PAGE_CONCURRENCY, PocketBaseWrapper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 20
+
+# Async twins of sync clients and their shared pools, see AsyncPocketBase.from_client
+_twins: weakref.WeakKeyDictionary[Any, AsyncPocketBase] = weakref.WeakKeyDictionary()
+_pools: dict[str, ConnectionPool] = {}
+
+
+def encode_query(params: dict[str, Any] | None) -> str:
+    """Encode query parameters with %20 for spaces (PocketBase filter syntax)"""
+    if not params:
+        return ""
+    cleaned = {key: value for key, value in params.items() if value is not None}
+    return urlencode(cleaned, quote_via=quote)
+
+
+class ConnectionPool:
+    """Keep-alive httpx.AsyncClient shared by the clients of one server.
+
+    Pooled connections belong to the loop that opened them, so a new client
+    is created when the pool is used from a different loop (e.g. a later
+    asyncio.run in the sync pipeline). The replaced client is closed by the
+    request that replaces it rather than dropped with its sockets still open.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 120,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+        self._stale: list[httpx.AsyncClient] = []
+
+    def client(self) -> httpx.AsyncClient:
+        """The HTTP client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop:
+            if self._http is not None:
+                self._stale.append(self._http)
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                ),
+                transport=self._transport,
+            )
+            self._http_loop = loop
+        return self._http
+
+    async def close_stale(self) -> None:
+        """Close clients replaced after an event loop change"""
+        while self._stale:
+            stale = self._stale.pop()
+            try:
+                await stale.aclose()
+            except Exception as e:
+                # Its loop may already be closed; the sockets go with it
+                logger.debug(f"Error closing stale PocketBase connection pool: {e}")
+
+    async def aclose(self) -> None:
+        """Close all pooled connections"""
+        await self.close_stale()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._http_loop = None
+
+
+class AsyncRecordService:
+    """Async CRUD access to one collection's records"""
+
+    def __init__(self, client: AsyncPocketBase, collection_id_or_name: str) -> None:
+        self.client = client
+        self.collection_id_or_name = collection_id_or_name
+
+    def base_crud_path(self) -> str:
+        """Get the base CRUD path for this collection"""
+        return f"/api/collections/{quote(self.collection_id_or_name)}/records"
+
+    def decode(self, data: dict[str, Any]) -> Record:
+        """Decode a record from the API response"""
+        return Record(data)
+
+    async def get_list(
+        self,
+        page: int = 1,
+        per_page: int = 30,
+        query_params: dict[str, Any] | None = None,
+    ) -> ListResult[Record]:
+        """Fetch one page of records"""
+        params = query_params.copy() if query_params else {}
+        params.update({"page": page, "perPage": per_page})
+        response_data = await self.client.send(self.base_crud_path(), {"method": "GET", "params": params})
+
+        items = [self.decode(item) for item in response_data.get("items") or []]
+        return ListResult(
+            response_data.get("page", 1),
+            response_data.get("perPage", 0),
+            response_data.get("totalItems", 0),
+            response_data.get("totalPages", 0),
+            items,
+        )
+
+    async def get_full_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Record]:
+        """Fetch every matching record.
+
+        The first page reports totalPages; the remaining pages are then
+        fetched with up to `concurrency` requests in flight and returned in
+        page order.
+        """
+        first = await self.get_list(1, batch, query_params)
+        if first.total_pages <= 1:
+            return list(first.items)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(page: int) -> list[Record]:
+            async with semaphore:
+                return list((await self.get_list(page, batch, query_params)).items)
+
+        pages = await asyncio.gather(*(fetch(page) for page in range(2, first.total_pages + 1)))
+
+        result = list(first.items)
+        for items in pages:
+            result.extend(items)
+        return result
+
+    async def iter_full_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> AsyncIterator[Record]:
+        """Stream every matching record as its page arrives.
+
+        Like get_full_list, but records are yielded page by page in
+        completion order instead of being collected in page order.
+        """
+        first = await self.get_list(1, batch, query_params)
+        for record in first.items:
+            yield record
+        if first.total_pages <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(page: int) -> ListResult[Record]:
+            async with semaphore:
+                return await self.get_list(page, batch, query_params)
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, first.total_pages + 1)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                for record in (await next_page).items:
+                    yield record
+        finally:
+            # Consumer stopped early
+            for task in tasks:
+                task.cancel()
+
+    async def get_one(self, id: str, query_params: dict[str, Any] | None = None) -> Record:
+        """Fetch a single record by ID"""
+        return self.decode(
+            await self.client.send(f"{self.base_crud_path()}/{quote(id)}", {"method": "GET", "params": query_params})
+        )
+
+    async def get_first_list_item(self, filter: str, query_params: dict[str, Any] | None = None) -> Record:
+        """Fetch the first record matching filter; raises a 404 ClientResponseError if none"""
+        params = query_params.copy() if query_params else {}
+        params["filter"] = filter
+        result = await self.get_list(1, 1, params)
+        if not result.items:
+            raise ClientResponseError("The requested resource wasn't found.", status=404)
+        return result.items[0]
+
+    async def create(
+        self, body_params: dict[str, Any] | None = None, query_params: dict[str, Any] | None = None
+    ) -> Record:
+        """Create a record"""
+        return self.decode(
+            await self.client.send(
+                self.base_crud_path(), {"method": "POST", "params": query_params, "body": body_params}
+            )
+        )
+
+    async def update(
+        self, id: str, body_params: dict[str, Any] | None = None, query_params: dict[str, Any] | None = None
+    ) -> Record:
+        """Update a record"""
+        return self.decode(
+            await self.client.send(
+                f"{self.base_crud_path()}/{quote(id)}",
+                {"method": "PATCH", "params": query_params, "body": body_params},
+            )
+        )
+
+    async def delete(self, id: str, query_params: dict[str, Any] | None = None) -> bool:
+        """Delete a record"""
+        await self.client.send(f"{self.base_crud_path()}/{quote(id)}", {"method": "DELETE", "params": query_params})
+        return True
+
+    async def auth_with_password(self, identity: str, password: str) -> dict[str, Any]:
+        """Authenticate against this auth collection and store the token"""
+        response_data = await self.client.send(
+            f"/api/collections/{quote(self.collection_id_or_name)}/auth-with-password",
+            {"method": "POST", "body": {"identity": identity, "password": password}},
+        )
+        record = response_data.get("record")
+        self.client.auth_store.save(response_data.get("token", ""), self.decode(record) if record else None)
+        return dict(response_data)
+
+
+class AsyncPocketBase:
+    """Async PocketBase client with a shared keep-alive connection pool"""
+
+    def __init__(
+        self,
+        base_url: str,
+        auth_store: AuthStore | None = None,
+        timeout: float = 120,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        transport: httpx.AsyncBaseTransport | None = None,
+        pool: ConnectionPool | None = None,
+    ) -> None:
+        """Create the client; connections are opened lazily.
+
+        Args:
+            base_url: PocketBase server URL
+            auth_store: Token store; pass a sync client's auth_store to share its login
+            timeout: Request timeout in seconds
+            max_connections: Connection pool size
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
+            pool: Connection pool to share; timeout, max_connections and transport
+                are ignored when given
+        """
+        self.base_url = base_url.rstrip("/")
+        self.auth_store: AuthStore = auth_store or BaseAuthStore()
+        self._pool = pool or ConnectionPool(timeout, max_connections, transport)
+        self._services: dict[str, AsyncRecordService] = {}
+
+    @classmethod
+    def from_client(cls, client: PocketBase | PocketBaseWrapper, **kwargs: Any) -> AsyncPocketBase:
+        """Get the async twin of a sync client, sharing its URL and auth store.
+
+        The twin is created once per sync client and all twins for the same
+        server share one connection pool, so callers that are handed a sync
+        client (including short-lived per-task clients) never open their own.
+        kwargs configure the pool when it is first created for that server.
+        """
+        twin = _twins.get(client)
+        if twin is None:
+            base_url = client.base_url.rstrip("/")
+            pool = _pools.get(base_url)
+            if pool is None:
+                pool = _pools[base_url] = ConnectionPool(**kwargs)
+            twin = cls(base_url, auth_store=client.auth_store, pool=pool)
+            _twins[client] = twin
+        return twin
+
+    def collection(self, id_or_name: str) -> AsyncRecordService:
+        """Return the record service for a collection"""
+        if id_or_name not in self._services:
+            self._services[id_or_name] = AsyncRecordService(self, id_or_name)
+        return self._services[id_or_name]
+
+    async def send(self, path: str, req_config: dict[str, Any]) -> Any:
+        """Send an API request and return the decoded JSON body.
+
+        Raises:
+            ClientResponseError: On transport errors and 4xx/5xx responses
+        """
+        method = req_config.get("method", "GET")
+        headers = dict(req_config.get("headers") or {})
+        if self.auth_store.token and "Authorization" not in headers:
+            headers["Authorization"] = self.auth_store.token
+
+        url = self.base_url + path
+        query = encode_query(req_config.get("params"))
+        if query:
+            url = f"{url}?{query}"
+        logger.log(TRACE, f"{method} {url}")
+
+        http = self._pool.client()
+        await self._pool.close_stale()
+        try:
+            response = await http.request(method, url, headers=headers, json=req_config.get("body"))
+        except Exception as e:
+            raise ClientResponseError(f"General request error. Original error: {e}", original_error=e) from e
+
+        try:
+            data = response.json()
+        except Exception:
+            data = None
+        if response.status_code >= 400:
+            raise ClientResponseError(
+                f"Response error. Status code:{response.status_code}",
+                url=str(response.url),
+                status=response.status_code,
+                data=data,
+            )
+        return data
+
+    async def aclose(self) -> None:
+        """Close pooled connections (shared with other twins of the same server)"""
+        await self._pool.aclose()
+
+    async def __aenter__(self) -> AsyncPocketBase:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -4,6 +4,16 @@ from __future__ import annotations
 
 from .cache_manager import CacheManager
 from .cache_monitor import CacheMonitor, create_cache_monitor
+from .parse_cache import PersistentParseCache, create_parse_cache
+from .phonetic_index import PhoneticIndex
 from .temporal_name_cache import TemporalNameCache
 
-__all__ = ["CacheManager", "CacheMonitor", "create_cache_monitor", "TemporalNameCache"]
+__all__ = [
+    "CacheManager",
+    "CacheMonitor",
+    "create_cache_monitor",
+    "create_parse_cache",
+    "PersistentParseCache",
+    "PhoneticIndex",
+    "TemporalNameCache",
+]
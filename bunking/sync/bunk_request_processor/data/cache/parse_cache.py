@@ -0,0 +1,258 @@
+"""Persistent, content-addressed cache of Phase 1 AI parse results.
+
+CacheManager's parse cache only lives for one orchestrator run, so every run
+re-sends unchanged request fields to the AI provider. This cache stores
+successful parse results in a local SQLite file keyed by a hash of
+everything that goes into the prompt (normalized request text, field type,
+requester details, prompt set version and model), so a re-run only pays for
+fields whose text - or prompt - actually changed.
+
+Entries are evicted by age and, beyond max_entries, least recently used first."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ...core.models import AgePreference, ParsedRequest, ParseRequest, ParseResult, RequestSource, RequestType
+
+logger = logging.getLogger(__name__)
+
+# bunking/sync/bunk_request_processor/data/cache/parse_cache.py -> <project>/.cache/
+DEFAULT_PARSE_CACHE_PATH = Path(__file__).parents[5] / ".cache" / "ai_parse_cache.sqlite3"
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_ENTRIES = 50000
+
+
+def normalize_request_text(text: str) -> str:
+    """Collapse whitespace so formatting-only edits still hit the cache"""
+    return " ".join(text.split())
+
+
+def build_parse_cache_key(request: ParseRequest, prompt_version: str, model: str) -> str:
+    """Content hash of every input that reaches the parse prompt.
+
+    Args:
+        request: The (sanitized) parse request
+        prompt_version: Version of the prompt templates (see get_prompts_version)
+        model: AI model name
+
+    Returns:
+        Hex digest cache key
+    """
+    key_data = {
+        "text": normalize_request_text(request.request_text),
+        "field": request.field_name,
+        "requester": request.requester_name,
+        "grade": str(request.requester_grade),
+        "session": request.session_name,
+        # Temporal dates in the response are resolved against the year
+        "year": request.year,
+        "prompt_version": prompt_version,
+        "model": model,
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+def serialize_parse_result(result: ParseResult) -> dict[str, Any]:
+    """Convert a successful parse result to JSON-safe data.
+
+    The request text, source field and staff metadata are not stored; they
+    are taken from the current parse request on a cache hit.
+    """
+    parsed_requests = []
+    for parsed in result.parsed_requests:
+        metadata = {k: v for k, v in parsed.metadata.items() if k != "staff_metadata"}
+        parsed_requests.append(
+            {
+                "request_type": parsed.request_type.value,
+                "target_name": parsed.target_name,
+                "age_preference": parsed.age_preference.value if parsed.age_preference else None,
+                "source": parsed.source.value,
+                "confidence": parsed.confidence,
+                "csv_position": parsed.csv_position,
+                "metadata": metadata,
+                "notes": parsed.notes,
+                "temporal_date": parsed.temporal_date.isoformat() if parsed.temporal_date else None,
+                "is_superseded": parsed.is_superseded,
+                "supersedes_reason": parsed.supersedes_reason,
+            }
+        )
+    return {
+        "parsed_requests": parsed_requests,
+        "needs_historical_context": result.needs_historical_context,
+        "metadata": result.metadata,
+    }
+
+
+def deserialize_parse_result(data: dict[str, Any], request: ParseRequest) -> ParseResult:
+    """Rebuild a parse result from serialize_parse_result() data for the given request"""
+    parsed_requests = []
+    for item in data["parsed_requests"]:
+        metadata = dict(item["metadata"])
+        if request.staff_metadata:
+            metadata["staff_metadata"] = request.staff_metadata
+        parsed_requests.append(
+            ParsedRequest(
+                raw_text=request.request_text,
+                request_type=RequestType(item["request_type"]),
+                target_name=item["target_name"],
+                age_preference=AgePreference(item["age_preference"]) if item["age_preference"] else None,
+                source_field=request.field_name,
+                source=RequestSource(item["source"]),
+                confidence=item["confidence"],
+                csv_position=item["csv_position"],
+                metadata=metadata,
+                notes=item["notes"],
+                temporal_date=datetime.fromisoformat(item["temporal_date"]) if item["temporal_date"] else None,
+                is_superseded=item["is_superseded"],
+                supersedes_reason=item["supersedes_reason"],
+            )
+        )
+    return ParseResult(
+        parsed_requests=parsed_requests,
+        needs_historical_context=data["needs_historical_context"],
+        is_valid=True,
+        parse_request=request,
+        metadata={**data["metadata"], "cache_hit": True},
+    )
+
+
+class PersistentParseCache:
+    """SQLite-backed parse result cache shared across sync runs"""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Open (or create) the cache and evict stale entries.
+
+        Args:
+            path: SQLite file path (default: AI_PARSE_CACHE_PATH env or <project>/.cache/)
+            max_age_days: Entries older than this are evicted
+            max_entries: Least recently used entries beyond this count are evicted
+        """
+        self.path = Path(path or os.getenv("AI_PARSE_CACHE_PATH") or DEFAULT_PARSE_CACHE_PATH)
+        self.max_age_seconds = max_age_days * 86400
+        self.max_entries = max_entries
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS parse_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, last_accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_parse_cache_accessed ON parse_cache (last_accessed)")
+        self._conn.commit()
+        self.evict()
+
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """Look up several keys at once, returning only the fresh hits"""
+        if not keys:
+            return {}
+        now = time.time()
+        found: dict[str, dict[str, Any]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(unique_keys), 500):
+            chunk = unique_keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM parse_cache WHERE key IN ({placeholders}) AND created_at >= ?",
+                [*chunk, now - self.max_age_seconds],
+            ).fetchall()
+            for key, value in rows:
+                found[key] = json.loads(value)
+        if found:
+            self._conn.executemany(
+                "UPDATE parse_cache SET last_accessed = ? WHERE key = ?", [(now, key) for key in found]
+            )
+            self._conn.commit()
+        self._stats["hits"] += sum(1 for key in keys if key in found)
+        self._stats["misses"] += sum(1 for key in keys if key not in found)
+        return found
+
+    def set_many(self, items: dict[str, dict[str, Any]]) -> None:
+        """Store several entries in one transaction"""
+        if not items:
+            return
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO parse_cache (key, value, created_at, last_accessed) VALUES (?, ?, ?, ?)",
+            [(key, json.dumps(value, default=str), now, now) for key, value in items.items()],
+        )
+        self._conn.commit()
+        self._stats["writes"] += len(items)
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove expired entries, then the least recently used beyond max_entries"""
+        cursor = self._conn.execute(
+            "DELETE FROM parse_cache WHERE created_at < ?", (time.time() - self.max_age_seconds,)
+        )
+        evicted = cursor.rowcount
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()
+        if count > self.max_entries:
+            cursor = self._conn.execute(
+                "DELETE FROM parse_cache WHERE key IN (SELECT key FROM parse_cache ORDER BY last_accessed LIMIT ?)",
+                (count - self.max_entries,),
+            )
+            evicted += cursor.rowcount
+        # Commit even when nothing was deleted so the DELETE's write lock is released
+        self._conn.commit()
+        if evicted:
+            self._stats["evictions"] += evicted
+            logger.debug(f"Evicted {evicted} entries from parse cache")
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._conn.execute("DELETE FROM parse_cache")
+        self._conn.commit()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics"""
+        (size,) = self._conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()
+        total = self._stats["hits"] + self._stats["misses"]
+        return {
+            "name": "persistent_parse",
+            "path": str(self.path),
+            "size": size,
+            "max_size": self.max_entries,
+            **self._stats,
+            "hit_rate": self._stats["hits"] / total if total > 0 else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
+
+
+def create_parse_cache(config: dict[str, Any] | None = None) -> PersistentParseCache | None:
+    """Create the persistent parse cache from the ai config's cache.parse_cache section.
+
+    Returns None when disabled or when the cache file cannot be opened - parsing
+    then simply goes to the provider as before.
+    """
+    config = config or {}
+    if not config.get("enabled", True):
+        return None
+    try:
+        return PersistentParseCache(
+            path=config.get("path"),
+            max_age_days=config.get("max_age_days", DEFAULT_MAX_AGE_DAYS),
+            max_entries=config.get("max_entries", DEFAULT_MAX_ENTRIES),
+        )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Persistent parse cache unavailable, continuing without it: {e}")
+        return None
@@ -0,0 +1,78 @@
+"""Phonetic index for O(1) sound-alike name lookups.
+
+Built once per run from the same persons as TemporalNameCache. Maps
+Soundex/Metaphone codes of (first, last) names and of parent surnames to
+the persons carrying them, so phonetic resolution no longer re-encodes
+every person for every unresolved name.
+
+Lookups return persons in the order they were indexed, matching the order
+a linear scan over the same list would produce."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from ...core.models import Person
+from ...shared.phonetic import metaphone, soundex
+
+logger = logging.getLogger(__name__)
+
+
+class PhoneticIndex:
+    """Soundex/Metaphone code -> persons index."""
+
+    def __init__(self, persons: Iterable[Person]) -> None:
+        """Build the index.
+
+        Args:
+            persons: Persons to index (kept as `persons` in the given order)
+        """
+        self.persons: list[Person] = list(persons)
+
+        # (first code, last code) -> person positions
+        self._by_soundex: dict[tuple[str, str], list[int]] = {}
+        self._by_metaphone: dict[tuple[str, str], list[int]] = {}
+        # parent surname code -> person positions
+        self._by_parent_soundex: dict[str, list[int]] = {}
+        self._by_parent_metaphone: dict[str, list[int]] = {}
+
+        for position, person in enumerate(self.persons):
+            first = person.first_name
+            last = person.last_name
+            self._by_soundex.setdefault((soundex(first), soundex(last)), []).append(position)
+            self._by_metaphone.setdefault((metaphone(first), metaphone(last)), []).append(position)
+
+            for surname in person.parent_last_names:
+                self._add_once(self._by_parent_soundex, soundex(surname), position)
+                self._add_once(self._by_parent_metaphone, metaphone(surname), position)
+
+        logger.debug(
+            f"Built phonetic index over {len(self.persons)} persons: "
+            f"{len(self._by_soundex)} soundex keys, {len(self._by_metaphone)} metaphone keys"
+        )
+
+    @staticmethod
+    def _add_once(index: dict[str, list[int]], code: str, position: int) -> None:
+        positions = index.setdefault(code, [])
+        if not positions or positions[-1] != position:
+            positions.append(position)
+
+    def find_by_soundex(self, first_name: str, last_name: str) -> list[Person]:
+        """Persons whose first and last names both match by Soundex."""
+        positions = self._by_soundex.get((soundex(first_name), soundex(last_name)), [])
+        return [self.persons[p] for p in positions]
+
+    def find_by_metaphone(self, first_name: str, last_name: str) -> list[Person]:
+        """Persons whose first and last names both match by Metaphone."""
+        positions = self._by_metaphone.get((metaphone(first_name), metaphone(last_name)), [])
+        return [self.persons[p] for p in positions]
+
+    def find_by_parent_surname(self, last_name: str) -> list[Person]:
+        """Persons with a parent surname matching last_name by Soundex or Metaphone."""
+        positions = set(self._by_parent_soundex.get(soundex(last_name), []))
+        positions.update(self._by_parent_metaphone.get(metaphone(last_name), []))
+        return [self.persons[p] for p in sorted(positions)]
+
+    def __len__(self) -> int:
+        return len(self.persons)
@@ -17,6 +17,8 @@ from typing import Any
 from ...core.models import Person
 from ...shared import parse_date
 from ...shared.name_utils import normalize_name
+from ..pocketbase_wrapper import BULK_PAGE_SIZE
+from .phonetic_index import PhoneticIndex
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,9 @@ class TemporalNameCache:
         # Reverse index: session_cm_id -> [person_cm_id, ...]
         self._session_to_persons: dict[int, list[int]] = {}
 
+        # Soundex/Metaphone index over the same persons (built in initialize)
+        self._phonetic_index: PhoneticIndex | None = None
+
         # Statistics
         self._stats = {
             "persons_loaded": 0,
@@ -83,6 +88,7 @@ class TemporalNameCache:
         self._load_historical_bunking()
         self._build_name_index()
         self._build_session_to_persons_index()
+        self._phonetic_index = PhoneticIndex(self._person_cache.values())
 
         logger.info(
             f"Temporal name cache initialized: "
@@ -99,7 +105,9 @@ class TemporalNameCache:
             # Load all persons for the current year
 
             # This is more efficient and prevents duplicate entries across years
-            persons = self.pb.collection("persons").get_full_list(query_params={"filter": f"year = {self.year}"})
+            persons = self.pb.collection("persons").get_full_list(
+                batch=BULK_PAGE_SIZE, query_params={"filter": f"year = {self.year}"}
+            )
 
             for person_record in persons:
                 cm_id = getattr(person_record, "cm_id", None)
@@ -144,10 +152,11 @@ class TemporalNameCache:
 
             # Load attendees for current year with session expanded
             attendees = self.pb.collection("attendees").get_full_list(
+                batch=BULK_PAGE_SIZE,
                 query_params={
                     "filter": f"year = {self.year}",
                     "expand": "session",
-                }
+                },
             )
 
             for attendee in attendees:
@@ -203,10 +212,11 @@ class TemporalNameCache:
             # For bunk request processing, 2 years is sufficient for name disambiguation
             min_year = self.year - 2
             assignments = self.pb.collection("bunk_assignments").get_full_list(
+                batch=BULK_PAGE_SIZE,
                 query_params={
                     "filter": f"year >= {min_year} && year < {self.year}",
                     "expand": "person,bunk,session",
-                }
+                },
             )
 
             for assignment in assignments:
@@ -460,6 +470,14 @@ class TemporalNameCache:
         """
         return self._person_cache.get(cm_id)
 
+    def get_phonetic_index(self) -> PhoneticIndex | None:
+        """Get the phonetic index over all cached persons.
+
+        Returns:
+            PhoneticIndex, or None before initialize() has run
+        """
+        return self._phonetic_index
+
     def get_session_info(self, cm_id: int) -> dict[str, Any] | None:
         """Get session info for a person.
 
@@ -2,11 +2,16 @@
 
 The PocketBase Python SDK v0.15.0 has an issue where query parameters
 are URL-encoded with '+' for spaces, but PocketBase server expects
-%20 for spaces in filter parameters. This wrapper fixes that issue."""
+%20 for spaces in filter parameters. This wrapper fixes that issue.
+
+It also reads multi-page results concurrently: get_full_list fetches the
+first page to learn totalPages, then the remaining pages in parallel."""
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from pocketbase.models.utils.list_result import ListResult
@@ -18,6 +23,11 @@ from pocketbase import PocketBase
 
 logger = logging.getLogger(__name__)
 
+# Pages fetched at once by get_full_list / iter_full_list after the first page
+DEFAULT_PAGE_CONCURRENCY = 4
+# Page size for bulk reads of whole collections (PocketBase caps perPage at 1000)
+BULK_PAGE_SIZE = 500
+
 
 class WrappedRecordService(RecordService):
     """Wrapped RecordService that fixes filter encoding issues"""
@@ -99,20 +109,47 @@ class WrappedRecordService(RecordService):
         self,
         batch: int = 100,
         query_params: dict[str, Any] | None = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
     ) -> list[Any]:
-        """Override get_full_list to use our fixed get_list"""
-        result: list[Any] = []
-
-        def request(result: list[Any], page: int) -> list[Any]:
-            list_result = self.get_list(page, batch, query_params)
-            items = list_result.items
-            total_items = list_result.total_items
-            result += items
-            if len(items) > 0 and total_items > len(result):
-                return request(result, page + 1)
+        """Fetch every matching record, in page order.
+
+        Args:
+            batch: Page size
+            query_params: Filter, sort, expand, ...
+            concurrency: Pages fetched at once after the first
+        """
+        first = self.get_list(1, batch, query_params)
+        result = list(first.items)
+        remaining = range(2, first.total_pages + 1)
+        if not first.items or not remaining:
             return result
 
-        return request(result, 1)
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(remaining)))) as executor:
+            for page in executor.map(lambda page: self.get_list(page, batch, query_params), remaining):
+                result.extend(page.items)
+        return result
+
+    def iter_full_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> Iterator[Any]:
+        """Stream every matching record as its page arrives.
+
+        Records come page by page in completion order, not page order, so
+        callers can start processing before the slowest page is in.
+        """
+        first = self.get_list(1, batch, query_params)
+        yield from first.items
+        remaining = range(2, first.total_pages + 1)
+        if not first.items or not remaining:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(remaining)))) as executor:
+            futures = [executor.submit(self.get_list, page, batch, query_params) for page in remaining]
+            for future in as_completed(futures):
+                yield from future.result().items
 
     def __getattr__(self, name: str) -> Any:
         """Delegate all other attributes to the original service"""
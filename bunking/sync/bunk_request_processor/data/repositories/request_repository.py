@@ -37,7 +37,11 @@ class RequestRepository:
         try:
             data = self._map_to_db(request)
             result = self.pb.collection("bunk_requests").create(data)
-            return result is not None
+            if result is None:
+                return False
+            # Callers link sources to the new record, so keep its ID
+            request.id = getattr(result, "id", None) or request.id
+            return True
 
         except Exception as e:
             logger.warning(
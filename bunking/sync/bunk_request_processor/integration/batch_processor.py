@@ -14,11 +14,12 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import itertools
 import json
 import logging
 import random
 import time
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -271,6 +272,68 @@ class BatchProcessor:
 
         return parse_results
 
+    async def iter_batch_parse_requests(
+        self,
+        requests: list[ParseRequest],
+        contexts: list[AIRequestContext],
+        progress_callback: Callable[..., Any] | None = None,
+    ) -> AsyncIterator[tuple[int, list[ParseResult]]]:
+        """Process parse requests in batches, yielding each batch as it completes.
+
+        Like batch_parse_requests, but a batch's results are available as soon
+        as its AI call returns, so callers can start on them while later
+        batches are still in flight. Batches arrive in completion order.
+
+        Args:
+            requests: List of parse requests
+            contexts: List of contexts (one per request)
+            progress_callback: Optional callback for progress updates
+
+        Yields:
+            (index of the batch's first request, parse results for the batch)
+        """
+        if not requests:
+            return
+
+        items = list(zip(requests, contexts, strict=False))
+        batches = self._create_batches(items)
+        logger.info(f"Created {len(batches)} batches from {len(items)} items")
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+        async def process(batch_id: int, start: int, batch: list[Any]) -> tuple[int, list[Any], BatchResult]:
+            try:
+                result = await self._process_batch_with_semaphore(batch_id, batch, semaphore, progress_callback, False)
+            except Exception as e:
+                logger.error(f"Batch {batch_id} failed with exception: {e}")
+                result = BatchResult(batch_id=batch_id, status=BatchStatus.FAILED, error=str(e))
+            return start, batch, result
+
+        starts = itertools.accumulate((len(batch) for batch in batches), initial=0)
+        tasks = [
+            asyncio.ensure_future(process(batch_id, start, batch))
+            for batch_id, (start, batch) in enumerate(zip(starts, batches, strict=False))
+        ]
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                start, batch, batch_result = await next_batch
+                completed = batch_result.status == BatchStatus.COMPLETED
+                responses = (batch_result.results or []) if completed else []
+                parse_results = []
+                for offset, (parse_request, _context) in enumerate(batch):
+                    if offset < len(responses):
+                        parse_results.append(self._convert_to_parse_result(parse_request, responses[offset]))
+                    else:
+                        reason = batch_result.error or "AI returned no result for request"
+                        parse_results.append(self._create_failed_result(parse_request, f"Batch failed: {reason}"))
+                yield start, parse_results
+        finally:
+            # Consumer stopped early
+            for task in tasks:
+                task.cancel()
+
+        self._log_statistics()
+
     async def batch_disambiguate(
         self,
         disambiguation_requests: list[tuple[ParsedRequest, dict[str, Any]]],
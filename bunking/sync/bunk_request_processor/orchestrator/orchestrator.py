@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import warnings
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from bunking.config.loader import ConfigLoader
@@ -28,6 +30,7 @@ from ..core.models import (
     RequestStatus,
     RequestType,
 )
+from ..data.async_pocketbase import AsyncPocketBase
 from ..data.cache.temporal_name_cache import TemporalNameCache
 from ..data.repositories.request_repository import RequestRepository
 from ..data.repositories.session_repository import SessionRepository
@@ -63,6 +66,9 @@ from ..validation.rules.self_reference import SelfReferenceRule
 
 logger = logging.getLogger(__name__)
 
+# Concurrent PocketBase writers used when saving bunk requests
+SAVE_MAX_WORKERS = 8
+
 
 def generate_unresolved_person_id(name_text: str) -> int:
     """Generate a deterministic negative ID for unresolved names.
@@ -209,7 +215,10 @@ class RequestOrchestrator:
             "declined_other": 0,
             "ai_high_confidence": 0,
             "ai_manual_review": 0,
+            "save_failures": 0,
         }
+        # Per-record failures from the last _save_bunk_requests call
+        self.save_failures: list[dict[str, Any]] = []
 
     def _load_ai_config(self) -> dict[str, Any]:
         """Load AI configuration via ConfigLoader with constant fallbacks.
@@ -564,11 +573,14 @@ class RequestOrchestrator:
 
     def _init_cache_system(self) -> None:
         """Initialize cache manager, monitor, and temporal name cache."""
-        from ..data.cache import CacheManager, CacheMonitor, create_cache_monitor
+        from ..data.cache import CacheManager, CacheMonitor, create_cache_monitor, create_parse_cache
 
         cache_config = self.ai_config.get("cache", {})
         self.cache_manager = CacheManager(cache_config)
 
+        # Parse results persisted across runs so unchanged request text skips the AI
+        self.parse_cache = create_parse_cache(cache_config.get("parse_cache", {}))
+
         # Create cache monitor if monitoring is enabled
         monitor: CacheMonitor | None
         if cache_config.get("enable_monitoring", False):
@@ -662,8 +674,17 @@ class RequestOrchestrator:
             self.social_graph = None
             return
 
-        # SocialGraph expects PocketBase - use the underlying client
-        self.social_graph = SocialGraph(pb=self.pb, year=self.year, session_cm_ids=self.session_cm_ids)  # type: ignore[arg-type]
+        # SocialGraph expects PocketBase - use the underlying client; its graph
+        # builds read attendees and bunking history over the pooled async client
+        # of the client's server (clients without a server URL keep the sync reads)
+        has_server = isinstance(getattr(self.pb, "base_url", None), str)
+        async_pb = AsyncPocketBase.from_client(self.pb) if has_server else None
+        self.social_graph = SocialGraph(
+            pb=self.pb,  # type: ignore[arg-type]
+            year=self.year,
+            session_cm_ids=self.session_cm_ids,
+            async_pb=async_pb,
+        )
 
         # Create adapter that wraps SocialGraph for confidence scorer
         # Pass a getter so adapter always sees current _person_sessions
@@ -692,7 +713,9 @@ class RequestOrchestrator:
             FuzzyMatchStrategy(self._person_repo, self._attendee_repo, config=fuzzy_config)
         )
         self.resolution_pipeline.add_strategy(
-            PhoneticMatchStrategy(self._person_repo, self._attendee_repo, config=phonetic_config)
+            PhoneticMatchStrategy(
+                self._person_repo, self._attendee_repo, config=phonetic_config, name_cache=self.temporal_name_cache
+            )
         )
         self.resolution_pipeline.add_strategy(SchoolDisambiguationStrategy(self._person_repo, self._attendee_repo))
 
@@ -710,6 +733,7 @@ class RequestOrchestrator:
             context_builder=self.context_builder,
             batch_processor=self.batch_processor,
             cache_manager=self.cache_manager,
+            parse_cache=self.parse_cache,
         )
 
         self.phase2_service = Phase2ResolutionService(
@@ -839,6 +863,7 @@ class RequestOrchestrator:
         raw_requests: list[dict[str, Any]],
         clear_existing: bool = True,
         progress_callback: Callable[..., Any] | None = None,
+        streaming: bool = False,
     ) -> dict[str, Any]:
         """Process bunk requests through all three phases.
 
@@ -848,6 +873,8 @@ class RequestOrchestrator:
                            Uses granular per-field clearing to only remove requests
                            from source_fields being reprocessed, preserving others.
             progress_callback: Optional callback for progress updates
+            streaming: Resolve each Phase 1 batch as it returns instead of waiting
+                       for all of Phase 1 (same results, shorter wall time)
 
         Returns:
             Processing results with statistics
@@ -865,6 +892,90 @@ class RequestOrchestrator:
         # Convert raw requests to ParseRequest objects
         parse_requests, pre_parsed_results = await self._prepare_parse_requests(raw_requests)
 
+        # Phases 1-3: parse, resolve locally, disambiguate
+        if streaming:
+            resolution_results = await self._run_phases_streaming(parse_requests, pre_parsed_results, progress_callback)
+        else:
+            resolution_results = await self._run_phases(parse_requests, pre_parsed_results, progress_callback)
+
+        # Convert to request format for conflict detection
+        resolved_requests = self._prepare_for_conflict_detection(resolution_results)
+
+        # Detect conflicts
+        logger.info("=== Conflict Detection ===")
+        conflict_result = self.conflict_detector.detect_conflicts(resolved_requests)
+        self._stats["conflicts_detected"] = len(conflict_result.conflicts)
+
+        if conflict_result.has_conflicts:
+            logger.info(self.conflict_detector.get_conflict_summary(conflict_result))
+            # Apply conflict resolution
+            resolved_requests = self.conflict_detector.apply_conflict_resolution(resolved_requests, conflict_result)
+
+        # Create bunk requests
+        logger.info("=== Creating Bunk Requests ===")
+        created_requests = await self._create_bunk_requests(resolved_requests)
+        self._stats["requests_created"] = len(created_requests)
+
+        # Log final statistics
+        logger.info(
+            f"Processing complete: "
+            f"{self._stats['phase1_parsed']} parsed, "
+            f"{self._stats['phase2_resolved']} resolved locally, "
+            f"{self._stats['phase2_ambiguous']} ambiguous, "
+            f"{self._stats['phase3_disambiguated']} disambiguated, "
+            f"{self._stats['conflicts_detected']} conflicts, "
+            f"{self._stats['requests_created']} created"
+        )
+
+        if self._stats["requests_created"] > 0:
+            logger.info(
+                f"Status breakdown: "
+                f"resolved={self._stats['status_resolved']}, "
+                f"pending={self._stats['status_pending']}, "
+                f"declined={self._stats['status_declined']}"
+            )
+            logger.info(
+                f"Type breakdown: "
+                f"bunk_with={self._stats['type_bunk_with']}, "
+                f"not_bunk_with={self._stats['type_not_bunk_with']}, "
+                f"age_preference={self._stats['type_age_preference']}"
+            )
+            if self._stats["status_declined"] > 0:
+                logger.info(
+                    f"Declined reasons: "
+                    f"cross_session={self._stats['declined_cross_session']}, "
+                    f"not_attending={self._stats['declined_not_attending']}, "
+                    f"other={self._stats['declined_other']}"
+                )
+            logger.info(
+                f"AI quality: "
+                f"high_confidence={self._stats['ai_high_confidence']}, "
+                f"manual_review={self._stats['ai_manual_review']}"
+            )
+
+        # Log cache statistics if monitor is available
+        if self.cache_monitor:
+            self.cache_monitor.log_statistics()
+            self.cache_monitor.log_cache_recommendation()
+
+        return {
+            "success": True,
+            "requests_created": created_requests,
+            "statistics": self._stats,
+            "conflicts": conflict_result.conflicts if conflict_result.has_conflicts else [],
+        }
+
+    async def _run_phases(
+        self,
+        parse_requests: list[ParseRequest],
+        pre_parsed_results: list[ParseResult],
+        progress_callback: Callable[..., Any] | None,
+    ) -> list[tuple[ParseResult, list[ResolutionResult]]]:
+        """Run Phases 1-3 one after another, each over every request.
+
+        Returns:
+            Resolution results after disambiguation, in request order
+        """
         # Phase 1: AI Parse-Only (skip if no requests need AI)
         if parse_requests:
             logger.info(f"=== Phase 1: AI Parse-Only ({len(parse_requests)} requests) ===")
@@ -981,72 +1092,153 @@ class RequestOrchestrator:
         # Store phase3_processed for later use
         self._phase3_indices = phase3_processed
 
-        # Convert to request format for conflict detection
-        resolved_requests = self._prepare_for_conflict_detection(resolution_results)
+        return resolution_results
 
-        # Detect conflicts
-        logger.info("=== Conflict Detection ===")
-        conflict_result = self.conflict_detector.detect_conflicts(resolved_requests)
-        self._stats["conflicts_detected"] = len(conflict_result.conflicts)
+    async def _run_phases_streaming(
+        self,
+        parse_requests: list[ParseRequest],
+        pre_parsed_results: list[ParseResult],
+        progress_callback: Callable[..., Any] | None,
+    ) -> list[tuple[ParseResult, list[ResolutionResult]]]:
+        """Run Phases 1-3 as a pipeline rather than one phase at a time.
 
-        if conflict_result.has_conflicts:
-            logger.info(self.conflict_detector.get_conflict_summary(conflict_result))
-            # Apply conflict resolution
-            resolved_requests = self.conflict_detector.apply_conflict_resolution(resolved_requests, conflict_result)
+        Each Phase 1 batch goes through validation, Phase 2 and historical
+        verification as soon as the AI returns it, while later batches are
+        still in flight. The temporal name cache and social graph load during
+        Phase 1, and unresolved cases are queued for Phase 3 as they appear.
 
-        # Create bunk requests
-        logger.info("=== Creating Bunk Requests ===")
-        created_requests = await self._create_bunk_requests(resolved_requests)
-        self._stats["requests_created"] = len(created_requests)
+        Every step up to Phase 3 works on one ParseResult at a time, so the
+        results match _run_phases, in the same order.
 
-        # Log final statistics
-        logger.info(
-            f"Processing complete: "
-            f"{self._stats['phase1_parsed']} parsed, "
-            f"{self._stats['phase2_resolved']} resolved locally, "
-            f"{self._stats['phase2_ambiguous']} ambiguous, "
-            f"{self._stats['phase3_disambiguated']} disambiguated, "
-            f"{self._stats['conflicts_detected']} conflicts, "
-            f"{self._stats['requests_created']} created"
-        )
+        Returns:
+            Resolution results after disambiguation, in request order
+        """
+        logger.info(f"=== Phases 1-3: Streaming ({len(parse_requests)} requests to AI) ===")
+        if pre_parsed_results:
+            logger.info(f"Pre-parsed {len(pre_parsed_results)} requests without AI (e.g., socialize preferences)")
 
-        if self._stats["requests_created"] > 0:
-            logger.info(
-                f"Status breakdown: "
-                f"resolved={self._stats['status_resolved']}, "
-                f"pending={self._stats['status_pending']}, "
-                f"declined={self._stats['status_declined']}"
-            )
-            logger.info(
-                f"Type breakdown: "
-                f"bunk_with={self._stats['type_bunk_with']}, "
-                f"not_bunk_with={self._stats['type_not_bunk_with']}, "
-                f"age_preference={self._stats['type_age_preference']}"
-            )
-            if self._stats["status_declined"] > 0:
-                logger.info(
-                    f"Declined reasons: "
-                    f"cross_session={self._stats['declined_cross_session']}, "
-                    f"not_attending={self._stats['declined_not_attending']}, "
-                    f"other={self._stats['declined_other']}"
-                )
-            logger.info(
-                f"AI quality: "
-                f"high_confidence={self._stats['ai_high_confidence']}, "
-                f"manual_review={self._stats['ai_manual_review']}"
-            )
+        # Resolution results by request position (pre-parsed after AI-parsed, as in _run_phases)
+        resolved: dict[int, list[tuple[ParseResult, list[ResolutionResult]]]] = {}
+        phase3_queue: asyncio.Queue[list[tuple[int, int]] | None] = asyncio.Queue()
+        queued: set[tuple[int, int]] = set()
+        parsed_count = 0
+
+        warm_up = asyncio.ensure_future(self._warm_resolution_caches())
+        phase3 = asyncio.ensure_future(self._disambiguate_queued(phase3_queue, resolved, progress_callback))
+
+        async def resolve(positions: list[int], parse_results: list[ParseResult]) -> None:
+            nonlocal parsed_count
+            parsed_count += sum(1 for r in parse_results if r.is_valid)
+            self._validate_request_types(parse_results)
+            self._filter_temporal_conflicts(parse_results)
+
+            await warm_up
+            resolution_results = await self.phase2_service.batch_resolve(parse_results)
+            expanded = [await self.placeholder_expander.expand([entry]) for entry in resolution_results]
+            flat = [entry for group in expanded for entry in group]
+            flat, _, _ = self._filter_post_expansion_conflicts(flat)
+            flat = await self.historical_verification_service.verify(flat)
+
+            entries = iter(flat)
+            cases = []
+            for position, group in zip(positions, expanded, strict=True):
+                resolved[position] = [next(entries) for _ in group]
+                for offset, (_pr, resolution_list) in enumerate(resolved[position]):
+                    for res_result in resolution_list:
+                        if res_result.is_resolved:
+                            self._stats["phase2_resolved"] += 1
+                        elif res_result.is_ambiguous:
+                            self._stats["phase2_ambiguous"] += 1
+                    if any(not rr.is_resolved and rr.method != "age_preference" for rr in resolution_list):
+                        cases.append((position, offset))
+            if cases:
+                queued.update(cases)
+                phase3_queue.put_nowait(cases)
 
-        # Log cache statistics if monitor is available
-        if self.cache_monitor:
-            self.cache_monitor.log_statistics()
-            self.cache_monitor.log_cache_recommendation()
+        try:
+            async for indices, parse_results in self.phase1_service.iter_parse(parse_requests, progress_callback):
+                await resolve(indices, parse_results)
+            if pre_parsed_results:
+                first = len(parse_requests)
+                await resolve([first + i for i in range(len(pre_parsed_results))], pre_parsed_results)
+            await warm_up
+            phase3_queue.put_nowait(None)
+            await phase3
+        finally:
+            warm_up.cancel()
+            phase3.cancel()
+
+        self._stats["phase1_parsed"] = parsed_count
+
+        resolution_results: list[tuple[ParseResult, list[ResolutionResult]]] = []
+        phase3_processed = set()
+        for position in sorted(resolved):
+            for offset, entry in enumerate(resolved[position]):
+                if (position, offset) in queued:
+                    phase3_processed.add(len(resolution_results))
+                resolution_results.append(entry)
+        self._phase3_indices = phase3_processed
 
-        return {
-            "success": True,
-            "requests_created": created_requests,
-            "statistics": self._stats,
-            "conflicts": conflict_result.conflicts if conflict_result.has_conflicts else [],
-        }
+        return resolution_results
+
+    async def _warm_resolution_caches(self) -> None:
+        """Load the temporal name cache and social graph alongside Phase 1.
+
+        The temporal name cache is a blocking PocketBase read, so it runs in a
+        worker thread; the social graph offloads its own reads and is awaited
+        on the running loop. Both overlap Phase 1's AI calls.
+        """
+        logger.info("=== Initializing Temporal Name Cache ===")
+        loads = [asyncio.to_thread(self.temporal_name_cache.initialize)]
+        if self._smart_resolution_enabled and self.social_graph:
+            logger.info("=== Initializing Social Graph ===")
+            loads.append(self.social_graph.initialize())
+        else:
+            logger.info("=== Skipping Social Graph (disabled via config) ===")
+        await asyncio.gather(*loads)
+
+        cache_stats = self.temporal_name_cache.get_stats()
+        logger.info(f"Cache ready: {cache_stats['persons_loaded']} persons, {cache_stats['unique_names']} name keys")
+
+    async def _disambiguate_queued(
+        self,
+        queue: asyncio.Queue[list[tuple[int, int]] | None],
+        resolved: dict[int, list[tuple[ParseResult, list[ResolutionResult]]]],
+        progress_callback: Callable[..., Any] | None,
+    ) -> None:
+        """Run Phase 3 over cases as they are queued, until a None arrives.
+
+        Cases queued while a disambiguation call is in flight are sent
+        together in the next call. Results replace the entries in resolved.
+
+        Args:
+            queue: (position, offset) references into resolved, then None
+            resolved: Resolution results by request position
+            progress_callback: Optional callback for progress updates
+        """
+        finished = False
+        while not finished:
+            refs: list[tuple[int, int]] = []
+            item = await queue.get()
+            while True:
+                if item is None:
+                    finished = True
+                else:
+                    refs.extend(item)
+                if queue.empty():
+                    break
+                item = queue.get_nowait()
+            if not refs:
+                continue
+
+            logger.info(f"=== Phase 3: AI Disambiguation for {len(refs)} cases ===")
+            cases = [resolved[position][offset] for position, offset in refs]
+            disambiguated_results = await self.phase3_service.batch_disambiguate(cases, progress_callback)
+            for (position, offset), (pr, resolution_list) in zip(refs, disambiguated_results, strict=False):
+                resolved[position][offset] = (pr, resolution_list)
+                for rr in resolution_list:
+                    if rr.is_resolved:
+                        self._stats["phase3_disambiguated"] += 1
 
     def _parse_socialize_preference(self, value: str) -> ParsedRequest | None:
         """Parse the ret_parent_socialize_with_best field directly without AI.
@@ -1435,8 +1627,8 @@ class RequestOrchestrator:
         else:
             validated_requests = []
 
-        # Save validated requests to database
-        return self._save_bunk_requests(validated_requests)
+        # Save validated requests to database (blocking HTTP, keep it off the event loop)
+        return await asyncio.to_thread(self._save_bunk_requests, validated_requests)
 
     def _save_bunk_requests(self, validated_requests: list[BunkRequest]) -> list[BunkRequest]:
         """Save validated bunk requests to the database.
@@ -1446,38 +1638,109 @@ class RequestOrchestrator:
         - Database match (unlocked): Merge into existing, add source link
         - Database match (locked): Create new, flag for manual review
 
+        Each save is a few blocking PocketBase round-trips, so requests are
+        written by up to SAVE_MAX_WORKERS threads. Merges into the same
+        existing record run in order on one thread, since each merge reads
+        the record the previous one updated.
+
+        Per-record failures are collected in self.save_failures and counted
+        in the "save_failures" statistic.
+
         Args:
             validated_requests: List of validated BunkRequest objects
 
         Returns:
-            List of successfully saved requests
+            List of successfully saved requests, in input order
         """
-        saved_requests = []
+        # Group merges by target record; everything else saves independently
+        units: list[list[BunkRequest]] = []
+        merge_units: dict[str, list[BunkRequest]] = {}
+        for bunk_request in validated_requests:
+            if self._save_action(bunk_request) == "merge":
+                target_id = bunk_request.metadata.get("database_duplicate_id")
+                if target_id:
+                    if target_id not in merge_units:
+                        merge_units[target_id] = []
+                        units.append(merge_units[target_id])
+                    merge_units[target_id].append(bunk_request)
+                    continue
+            units.append([bunk_request])
+
+        outcomes: dict[int, tuple[bool, str | None]] = {}
+        if units:
+            with ThreadPoolExecutor(max_workers=min(SAVE_MAX_WORKERS, len(units))) as executor:
+                for unit_outcomes in executor.map(self._save_request_unit, units):
+                    outcomes.update(unit_outcomes)
 
+        # Stats are updated here, on the calling thread
+        saved_requests = []
+        self.save_failures = []
         for bunk_request in validated_requests:
+            saved, error = outcomes[id(bunk_request)]
+            if saved:
+                saved_requests.append(bunk_request)
+                if self._save_action(bunk_request) == "merge":
+                    self._stats["cross_run_merges"] = self._stats.get("cross_run_merges", 0) + 1
+                try:
+                    self._track_request_stats(bunk_request)
+                except Exception as e:
+                    logger.error(f"Failed to track stats for saved request: {e}")
+            else:
+                self.save_failures.append(
+                    {
+                        "requester_cm_id": bunk_request.requester_cm_id,
+                        "requested_cm_id": bunk_request.requested_cm_id,
+                        "request_type": bunk_request.request_type.value,
+                        "source_field": bunk_request.source_field,
+                        "action": self._save_action(bunk_request),
+                        "error": error or "write rejected",
+                    }
+                )
+
+        self._stats["save_failures"] = len(self.save_failures)
+        if self.save_failures:
+            logger.warning(f"Failed to save {len(self.save_failures)} of {len(validated_requests)} bunk requests")
+            for failure in self.save_failures:
+                logger.warning(
+                    f"  {failure['action']} failed for {failure['requester_cm_id']} -> "
+                    f"{failure['requested_cm_id']} ({failure['request_type']}, "
+                    f"{failure['source_field']}): {failure['error']}"
+                )
+
+        return saved_requests
+
+    @staticmethod
+    def _save_action(bunk_request: BunkRequest) -> str:
+        """How a request is persisted: "merge", "locked_merge" or "create" """
+        if bunk_request.metadata.get("database_match_action") == "merge":
+            if bunk_request.metadata.get("database_match_locked"):
+                return "locked_merge"
+            return "merge"
+        return "create"
+
+    def _save_request_unit(self, unit: list[BunkRequest]) -> dict[int, tuple[bool, str | None]]:
+        """Save a group of requests in order on a worker thread.
+
+        Returns:
+            Map of id(request) to (saved, error message)
+        """
+        outcomes: dict[int, tuple[bool, str | None]] = {}
+        for bunk_request in unit:
             try:
-                # Check if this request should be merged with an existing DB record
-                if bunk_request.metadata.get("database_match_action") == "merge":
-                    if bunk_request.metadata.get("database_match_locked"):
-                        # Locked request - create new and flag for manual review
-                        saved = self._save_new_request_for_locked_merge(bunk_request)
-                    else:
-                        # Unlocked - perform auto-merge
-                        saved = self._merge_into_existing(bunk_request)
+                action = self._save_action(bunk_request)
+                if action == "locked_merge":
+                    # Locked request - create new and flag for manual review
+                    saved = self._save_new_request_for_locked_merge(bunk_request)
+                elif action == "merge":
+                    # Unlocked - perform auto-merge
+                    saved = self._merge_into_existing(bunk_request)
                 else:
                     # No database match - create new request with source link
                     saved = self._save_new_request_with_source_link(bunk_request)
-
-                if saved:
-                    saved_requests.append(bunk_request)
-                    self._track_request_stats(bunk_request)
-                else:
-                    logger.warning(f"Failed to save bunk request for {bunk_request.requester_cm_id}")
-
+                outcomes[id(bunk_request)] = (saved, None)
             except Exception as e:
-                logger.error(f"Failed to save bunk request: {e}")
-
-        return saved_requests
+                outcomes[id(bunk_request)] = (False, str(e))
+        return outcomes
 
     def _save_new_request_with_source_link(self, request: BunkRequest) -> bool:
         """Create a new bunk request with primary source link.
@@ -1565,9 +1828,6 @@ class RequestOrchestrator:
                 source_field=request.source_field,
             )
 
-        # Track merge statistics
-        self._stats["cross_run_merges"] = self._stats.get("cross_run_merges", 0) + 1
-
         logger.info(
             f"Merged request into existing {existing_id}: "
             f"source_fields={new_source_fields}, confidence={final_confidence}"
@@ -1669,8 +1929,15 @@ class RequestOrchestrator:
 
         Call this when done processing to ensure proper cleanup of:
         - AI provider HTTP client
+        - Persistent parse cache connection
         - Any other async resources
         """
+        parse_cache = getattr(self, "parse_cache", None)
+        if parse_cache:
+            logger.info(f"Parse cache stats: {parse_cache.get_stats()}")
+            parse_cache.close()
+            self.parse_cache = None
+
         if hasattr(self, "ai_provider") and self.ai_provider:
             # Check if close method exists (OpenAIProvider has it, mock might not)
             if hasattr(self.ai_provider, "close"):
@@ -69,6 +69,7 @@ async def process_bunk_requests(
     source_fields: list[str] | None = None,
     force: bool = False,
     debug: bool = False,
+    streaming: bool = False,
 ) -> dict[str, Any]:
     """Process bunk requests from a data source.
 
@@ -82,6 +83,7 @@ async def process_bunk_requests(
         source_fields: Optional list of source fields to filter by
         force: If True, clear processed flags before fetching (enables reprocessing)
         debug: If True, enable verbose AI parse logging
+        streaming: If True, resolve each AI parse batch as soon as it returns
 
     Returns:
         Processing results
@@ -147,6 +149,7 @@ async def process_bunk_requests(
             raw_requests=raw_requests,
             clear_existing=clear_existing,
             progress_callback=lambda current, total, message: logger.info(f"Progress: {current}/{total} - {message}"),
+            streaming=streaming,
         )
 
         # Add already_processed count to result
@@ -297,6 +300,12 @@ def main() -> None:
         ),
     )
 
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Resolve each AI parse batch as it returns instead of after all parsing finishes",
+    )
+
     args = parser.parse_args()
 
     # Setup logging - import TRACE level for trace mode
@@ -391,6 +400,7 @@ def main() -> None:
                 source_fields=source_fields,
                 force=args.force,
                 debug=args.debug,
+                streaming=args.streaming,
             )
 
         result = asyncio.run(process_with_related_sessions())
@@ -1,5 +1,5 @@
 """Prompt loading utilities for bunk request processor."""
 
-from .loader import format_prompt, load_prompt
+from .loader import format_prompt, get_prompts_version, load_prompt
 
-__all__ = ["load_prompt", "format_prompt"]
+__all__ = ["load_prompt", "format_prompt", "get_prompts_version"]
@@ -12,6 +12,7 @@ and are automatically available as {filename_without_extension} placeholders.
 
 from __future__ import annotations
 
+import hashlib
 from functools import lru_cache
 from pathlib import Path
 
@@ -97,7 +98,29 @@ def format_prompt(name: str, **kwargs: str) -> str:
     return template.format(**all_vars)
 
 
+@lru_cache(maxsize=1)
+def get_prompts_version() -> str:
+    """Content hash of every prompt template, partial and branding variable.
+
+    Changes whenever any text that can end up in a prompt changes, so results
+    cached against this version are invalidated by prompt edits.
+
+    Returns:
+        Hex digest identifying the current prompt set.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(PROMPTS_DIR.glob("*.txt")) + sorted(PARTIALS_DIR.glob("*.txt")):
+        digest.update(path.relative_to(PROMPTS_DIR).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    for key, value in sorted(_get_branding_vars().items()):
+        digest.update(f"{key}={value}\0".encode())
+    return digest.hexdigest()[:16]
+
+
 def clear_cache() -> None:
     """Clear the prompt cache. Useful for testing or hot-reloading."""
     load_prompt.cache_clear()
     _get_partial_vars.cache_clear()
+    get_prompts_version.cache_clear()
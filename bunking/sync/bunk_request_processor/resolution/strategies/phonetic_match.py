@@ -9,15 +9,20 @@ Confidence values are loaded from PocketBase config to avoid hardcoding."""
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ...core.models import Person
+from ...data.cache.phonetic_index import PhoneticIndex
 from ...data.repositories import AttendeeRepository, PersonRepository
 from ...shared import parse_name
 from ...shared.nickname_groups import find_nickname_variations, get_nickname_groups
+from ...shared.phonetic import metaphone, soundex
 from ..interfaces import ResolutionResult
 from .base_match_strategy import BaseMatchStrategy
 
+if TYPE_CHECKING:
+    from ...data.cache.temporal_name_cache import TemporalNameCache
+
 # Default fallback values when config is missing
 DEFAULT_SOUNDEX_BASE = 0.70
 DEFAULT_METAPHONE_BASE = 0.65
@@ -40,6 +45,7 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         person_repository: PersonRepository,
         attendee_repository: AttendeeRepository,
         config: dict[str, Any] | None = None,
+        name_cache: TemporalNameCache | None = None,
     ):
         """Initialize the phonetic match strategy.
 
@@ -47,9 +53,78 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
             person_repository: Repository for person data access
             attendee_repository: Repository for attendee data access
             config: Optional config dict with confidence values from PocketBase
+            name_cache: Optional TemporalNameCache whose run-wide phonetic index
+                replaces per-lookup encoding of every person
         """
         super().__init__(person_repository, attendee_repository, config)
         self._strategy_name = "phonetic_match"
+        self.name_cache = name_cache
+        # Index over the last person pool passed in (reused while the pool is unchanged)
+        self._pool_index: PhoneticIndex | None = None
+        self._pool: list[Person] | None = None
+
+    def _get_phonetic_index(self, persons: list[Person], year: int | None) -> PhoneticIndex:
+        """Get a phonetic index over a full-year person pool.
+
+        Prefers the name cache's run-wide index, which covers the same persons
+        as get_all_for_phonetic_matching() for the cache year. Otherwise an
+        index is built for the pool and reused for as long as the same pool
+        object is passed in (e.g. across one batch_resolve call).
+        """
+        if self.name_cache is not None and (year is None or year == self.name_cache.year):
+            index = self.name_cache.get_phonetic_index()
+            if index is not None and len(index) == len(persons):
+                return index
+        if self._pool_index is None or self._pool is not persons:
+            self._pool_index = PhoneticIndex(persons)
+            self._pool = persons
+        return self._pool_index
+
+    def _soundex_matches(
+        self, first_name: str, last_name: str, persons: list[Person], index: PhoneticIndex | None
+    ) -> list[Person]:
+        """Persons whose first and last names both match by Soundex."""
+        if index is not None:
+            return index.find_by_soundex(first_name, last_name)
+        first_soundex = self._soundex(first_name)
+        last_soundex = self._soundex(last_name)
+        return [
+            person
+            for person in persons
+            if self._soundex(person.first_name) == first_soundex and self._soundex(person.last_name) == last_soundex
+        ]
+
+    def _metaphone_matches(
+        self, first_name: str, last_name: str, persons: list[Person], index: PhoneticIndex | None
+    ) -> list[Person]:
+        """Persons whose first and last names both match by Metaphone."""
+        if index is not None:
+            return index.find_by_metaphone(first_name, last_name)
+        first_metaphone = self._metaphone(first_name)
+        last_metaphone = self._metaphone(last_name)
+        return [
+            person
+            for person in persons
+            if self._metaphone(person.first_name) == first_metaphone
+            and self._metaphone(person.last_name) == last_metaphone
+        ]
+
+    def _parent_surname_matches(
+        self, last_name: str, persons: list[Person], index: PhoneticIndex | None
+    ) -> list[Person]:
+        """Persons with a parent surname matching last_name by Soundex or Metaphone."""
+        if index is not None:
+            return index.find_by_parent_surname(last_name)
+        last_soundex = self._soundex(last_name)
+        last_metaphone = self._metaphone(last_name)
+        return [
+            person
+            for person in persons
+            if any(
+                self._soundex(surname) == last_soundex or self._metaphone(surname) == last_metaphone
+                for surname in person.parent_last_names
+            )
+        ]
 
     def _get_confidence(self, key: str, default: float) -> float:
         """Get confidence value from config with fallback to default.
@@ -120,15 +195,16 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
             # Fetch all persons ONCE and reuse across all phonetic algorithms
             # This is a key optimization - previously each _try_* method fetched independently
             all_persons = self.person_repo.get_all_for_phonetic_matching(year=year)
+            index = self._get_phonetic_index(all_persons, year)
 
             # Convert to list for helper methods (maintains backward compatibility)
             name_parts = [parsed.first, parsed.last]
-            result = self._try_soundex_match(name_parts, requester_cm_id, session_cm_id, year, all_persons)
+            result = self._try_soundex_match(name_parts, requester_cm_id, session_cm_id, year, all_persons, index)
             if result.is_resolved or result.is_ambiguous:
                 return result
 
             # Try Metaphone matching as fallback
-            result = self._try_metaphone_match(name_parts, requester_cm_id, session_cm_id, year, all_persons)
+            result = self._try_metaphone_match(name_parts, requester_cm_id, session_cm_id, year, all_persons, index)
             if result.is_resolved or result.is_ambiguous:
                 return result
 
@@ -139,7 +215,7 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
 
             # Try parent surname phonetic matching (e.g., "Emma Smidt" → Smith parent)
             result = self._try_parent_surname_phonetic_match(
-                name_parts, requester_cm_id, session_cm_id, year, all_persons
+                name_parts, requester_cm_id, session_cm_id, year, all_persons, index
             )
             if result.is_resolved or result.is_ambiguous:
                 return result
@@ -154,20 +230,13 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         session_cm_id: int | None,
         year: int | None,
         all_persons: list[Person],
+        index: PhoneticIndex | None = None,
     ) -> ResolutionResult:
         """Try matching using Soundex algorithm"""
         first_name = name_parts[0]
         last_name = name_parts[-1]
 
-        # Generate Soundex codes
-        first_soundex = self._soundex(first_name)
-        last_soundex = self._soundex(last_name)
-
-        matches = []
-        for person in all_persons:
-            # Check if Soundex codes match
-            if self._soundex(person.first_name) == first_soundex and self._soundex(person.last_name) == last_soundex:
-                matches.append(person)
+        matches = self._soundex_matches(first_name, last_name, all_persons, index)
 
         # Filter out self-references
         matches = self._filter_self_references(matches, requester_cm_id)
@@ -211,23 +280,13 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         session_cm_id: int | None,
         year: int | None,
         all_persons: list[Person],
+        index: PhoneticIndex | None = None,
     ) -> ResolutionResult:
         """Try matching using Metaphone algorithm"""
         first_name = name_parts[0]
         last_name = name_parts[-1]
 
-        # Generate Metaphone codes
-        first_metaphone = self._metaphone(first_name)
-        last_metaphone = self._metaphone(last_name)
-
-        matches = []
-        for person in all_persons:
-            # Check if Metaphone codes match
-            if (
-                self._metaphone(person.first_name) == first_metaphone
-                and self._metaphone(person.last_name) == last_metaphone
-            ):
-                matches.append(person)
+        matches = self._metaphone_matches(first_name, last_name, all_persons, index)
 
         # Filter out self-references
         matches = self._filter_self_references(matches, requester_cm_id)
@@ -343,6 +402,7 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         session_cm_id: int | None,
         year: int | None,
         all_persons: list[Person],
+        index: PhoneticIndex | None = None,
     ) -> ResolutionResult:
         """Try matching using phonetic comparison of last name against parent surnames.
 
@@ -352,16 +412,12 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         first_name = name_parts[0]
         last_name = name_parts[-1]
 
-        # Generate phonetic codes for the search last name
-        last_soundex = self._soundex(last_name)
-        last_metaphone = self._metaphone(last_name)
-
         # Get nickname variations for first name
         first_variations = set([first_name.lower()])
         first_variations.update(v.lower() for v in find_nickname_variations(first_name))
 
         matches = []
-        for person in all_persons:
+        for person in self._parent_surname_matches(last_name, all_persons, index):
             # Check first name matches (including nicknames)
             person_first = person.first_name.lower() if person.first_name else ""
             if person_first not in first_variations:
@@ -369,15 +425,7 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
                 person_pref = (person.preferred_name or "").lower()
                 if person_pref not in first_variations:
                     continue
-
-            # Check if any parent surname phonetically matches
-            for parent_surname in person.parent_last_names:
-                parent_soundex = self._soundex(parent_surname)
-                parent_metaphone = self._metaphone(parent_surname)
-
-                if last_soundex == parent_soundex or last_metaphone == parent_metaphone:
-                    matches.append(person)
-                    break  # Found a match, no need to check other parent surnames
+            matches.append(person)
 
         # Filter out self-references
         matches = self._filter_self_references(matches, requester_cm_id)
@@ -442,110 +490,12 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         return any(name1 in group and name2 in group for group in nickname_groups)
 
     def _soundex(self, name: str) -> str:
-        """Generate Soundex code for a name.
-
-        Soundex algorithm:
-        1. Keep the first letter
-        2. Replace consonants with digits
-        3. Remove vowels and h, w, y
-        4. Limit to 4 characters, pad with 0s if needed
-        """
-        if not name:
-            return "0000"
-
-        # Convert to uppercase
-        name = name.upper()
-
-        # Save the first letter
-        soundex = name[0]
-
-        # Mapping of letters to digits
-        mapping = {
-            "B": "1",
-            "F": "1",
-            "P": "1",
-            "V": "1",
-            "C": "2",
-            "G": "2",
-            "J": "2",
-            "K": "2",
-            "Q": "2",
-            "S": "2",
-            "X": "2",
-            "Z": "2",
-            "D": "3",
-            "T": "3",
-            "L": "4",
-            "M": "5",
-            "N": "5",
-            "R": "6",
-        }
-
-        # Process remaining letters
-        last_digit = mapping.get(name[0], "0")  # Get digit for first letter
-        for letter in name[1:]:
-            digit = mapping.get(letter, "0")
-            if digit != "0" and digit != last_digit:
-                soundex += digit
-            last_digit = digit
-
-        # Pad with zeros or truncate to length 4
-        soundex = soundex[:4].ljust(4, "0")
-
-        return soundex
+        """Generate Soundex code for a name (see shared.phonetic.soundex)."""
+        return soundex(name)
 
     def _metaphone(self, name: str) -> str:
-        """Generate simplified Metaphone code for a name.
-
-        This is a simplified version focusing on common patterns.
-        """
-        if not name:
-            return ""
-
-        # Convert to uppercase and remove non-letters
-        name = "".join(c for c in name.upper() if c.isalpha())
-        if not name:
-            return ""
-
-        # Apply transformations
-        result = name
-
-        # Common beginning patterns
-        if result.startswith("KN") or result.startswith("GN") or result.startswith("PN"):
-            result = "N" + result[2:]
-        elif result.startswith("WR"):
-            result = "R" + result[2:]
-
-        # Replace patterns in specific order (longer patterns first)
-        replacements = [
-            ("DGE", "J"),
-            ("TIO", "SH"),
-            ("TIA", "SH"),
-            ("TCH", "CH"),
-            ("CK", "K"),
-            ("PH", "F"),
-            ("GH", ""),  # Silent GH as in Night
-            ("TH", "T"),  # TH often sounds like T
-            ("Q", "K"),
-            ("V", "F"),
-            ("Z", "S"),
-            ("X", "KS"),
-            ("C", "K"),  # Simplified - C usually sounds like K
-            ("H", ""),  # H is often silent
-        ]
-
-        for old, new in replacements:
-            result = result.replace(old, new)
-
-        # Remove duplicate letters
-        simplified = ""
-        last_char = ""
-        for char in result:
-            if char != last_char:
-                simplified += char
-                last_char = char
-
-        return simplified
+        """Generate simplified Metaphone code for a name (see shared.phonetic.metaphone)."""
+        return metaphone(name)
 
     def _disambiguate_with_session(
         self, matches: list[Person], requester_cm_id: int, session_cm_id: int, year: int
@@ -627,25 +577,28 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
 
         # Try phonetic matching with pre-loaded data
         if parsed.is_complete:
+            # The full-year pool is looked up through the phonetic index; a short
+            # candidate list is cheaper to scan
+            index = None if candidates else self._get_phonetic_index(phonetic_pool, year)
             # Convert to list for helper methods
             name_parts = [parsed.first, parsed.last]
             # Try Soundex matching
             result = self._try_soundex_match_with_context(
-                name_parts, requester_cm_id, session_cm_id, year, phonetic_pool, attendee_info
+                name_parts, requester_cm_id, session_cm_id, year, phonetic_pool, attendee_info, index
             )
             if result.is_resolved or result.is_ambiguous:
                 return result
 
             # Try Metaphone matching as fallback
             result = self._try_metaphone_match_with_context(
-                name_parts, requester_cm_id, session_cm_id, year, phonetic_pool, attendee_info
+                name_parts, requester_cm_id, session_cm_id, year, phonetic_pool, attendee_info, index
             )
             if result.is_resolved or result.is_ambiguous:
                 return result
 
             # Try parent surname phonetic matching
             result = self._try_parent_surname_phonetic_match_with_context(
-                name_parts, requester_cm_id, session_cm_id, year, phonetic_pool, attendee_info
+                name_parts, requester_cm_id, session_cm_id, year, phonetic_pool, attendee_info, index
             )
             if result.is_resolved or result.is_ambiguous:
                 return result
@@ -661,21 +614,13 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         year: int | None,
         candidates: list[Person],
         attendee_info: dict[int, dict[str, Any]] | None,
+        index: PhoneticIndex | None = None,
     ) -> ResolutionResult:
         """Try matching using Soundex algorithm with pre-loaded candidates"""
         first_name = name_parts[0]
         last_name = name_parts[-1]
 
-        # Generate Soundex codes
-        first_soundex = self._soundex(first_name)
-        last_soundex = self._soundex(last_name)
-
-        # Filter candidates by Soundex match
-        matches = []
-        for person in candidates:
-            # Check if Soundex codes match
-            if self._soundex(person.first_name) == first_soundex and self._soundex(person.last_name) == last_soundex:
-                matches.append(person)
+        matches = self._soundex_matches(first_name, last_name, candidates, index)
 
         # Filter out self-references
         matches = self._filter_self_references(matches, requester_cm_id)
@@ -724,24 +669,13 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         year: int | None,
         candidates: list[Person],
         attendee_info: dict[int, dict[str, Any]] | None,
+        index: PhoneticIndex | None = None,
     ) -> ResolutionResult:
         """Try matching using Metaphone algorithm with pre-loaded candidates"""
         first_name = name_parts[0]
         last_name = name_parts[-1]
 
-        # Generate Metaphone codes
-        first_metaphone = self._metaphone(first_name)
-        last_metaphone = self._metaphone(last_name)
-
-        # Filter candidates by Metaphone match
-        matches = []
-        for person in candidates:
-            # Check if Metaphone codes match
-            if (
-                self._metaphone(person.first_name) == first_metaphone
-                and self._metaphone(person.last_name) == last_metaphone
-            ):
-                matches.append(person)
+        matches = self._metaphone_matches(first_name, last_name, candidates, index)
 
         # Filter out self-references
         matches = self._filter_self_references(matches, requester_cm_id)
@@ -844,6 +778,7 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         year: int | None,
         candidates: list[Person],
         attendee_info: dict[int, dict[str, Any]] | None,
+        index: PhoneticIndex | None = None,
     ) -> ResolutionResult:
         """Try matching using phonetic comparison of last name against parent surnames.
 
@@ -855,16 +790,12 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
         first_name = name_parts[0]
         last_name = name_parts[-1]
 
-        # Generate phonetic codes for the search last name
-        last_soundex = self._soundex(last_name)
-        last_metaphone = self._metaphone(last_name)
-
         # Get nickname variations for first name
         first_variations = set([first_name.lower()])
         first_variations.update(v.lower() for v in find_nickname_variations(first_name))
 
         matches = []
-        for person in candidates:
+        for person in self._parent_surname_matches(last_name, candidates, index):
             # Check first name matches (including nicknames)
             person_first = person.first_name.lower() if person.first_name else ""
             if person_first not in first_variations:
@@ -872,16 +803,8 @@ class PhoneticMatchStrategy(BaseMatchStrategy):
                 person_pref = (person.preferred_name or "").lower()
                 if person_pref not in first_variations:
                     continue
-
-            # Check if any parent surname phonetically matches
-            for parent_surname in person.parent_last_names:
-                parent_soundex = self._soundex(parent_surname)
-                parent_metaphone = self._metaphone(parent_surname)
-
-                if last_soundex == parent_soundex or last_metaphone == parent_metaphone:
-                    if person.cm_id != requester_cm_id:
-                        matches.append(person)
-                    break  # Found a match, no need to check other parent surnames
+            if person.cm_id != requester_cm_id:
+                matches.append(person)
 
         if not matches:
             return ResolutionResult(confidence=0.0, method=self.name)
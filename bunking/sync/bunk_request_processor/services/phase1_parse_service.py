@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from dataclasses import replace
 from typing import Any
 
 from ..core.models import ParseRequest, ParseResult
+from ..data.cache.parse_cache import (
+    PersistentParseCache,
+    build_parse_cache_key,
+    deserialize_parse_result,
+    serialize_parse_result,
+)
 from ..integration.ai_service import AIProvider, AIRequestContext
 from ..integration.batch_processor import BatchProcessor
+from ..prompts import get_prompts_version
 from ..security import RiskLevel, SecureSanitizer, create_secure_sanitizer
 from .context_builder import ContextBuilder
 
@@ -26,6 +33,7 @@ class Phase1ParseService:
         batch_processor: BatchProcessor | None = None,
         cache_manager: Any | None = None,
         sanitizer: SecureSanitizer | None = None,
+        parse_cache: PersistentParseCache | None = None,
     ):
         """Initialize the Phase 1 parsing service.
 
@@ -35,10 +43,12 @@ class Phase1ParseService:
             batch_processor: Optional batch processor for sophisticated batching
             cache_manager: Optional cache manager for caching parse results
             sanitizer: Optional input sanitizer for prompt injection detection
+            parse_cache: Optional persistent cache of parse results across runs
         """
         self.ai_service = ai_service
         self.context_builder = context_builder
         self.cache_manager = cache_manager
+        self.parse_cache = parse_cache
 
         # Create batch processor if not provided
         if batch_processor is None:
@@ -56,6 +66,7 @@ class Phase1ParseService:
             "needs_historical": 0,
             "suspicious_inputs": 0,
             "high_risk_inputs": 0,
+            "cache_hits": 0,
         }
 
     async def batch_parse(
@@ -82,13 +93,23 @@ class Phase1ParseService:
         # Sanitize inputs before AI processing (security: prompt injection protection)
         requests, security_metadata = self._sanitize_requests(requests)
 
-        # Build parse-only contexts for all requests
-        contexts = self._build_contexts(requests)
+        # Serve unchanged requests from the persistent cache, send the rest to the AI
+        cache_keys = self._get_cache_keys(requests)
+        results_by_index = self._load_cached(requests, cache_keys)
+        uncached = [i for i in range(len(requests)) if i not in results_by_index]
+
+        # Build parse-only contexts for the uncached requests
+        uncached_requests = [requests[i] for i in uncached]
+        contexts = self._build_contexts(uncached_requests)
 
         # Use batch processor for sophisticated batching
         try:
-            results = await self.batch_processor.batch_parse_requests(
-                requests=requests, contexts=contexts, progress_callback=progress_callback
+            ai_results = (
+                await self.batch_processor.batch_parse_requests(
+                    requests=uncached_requests, contexts=contexts, progress_callback=progress_callback
+                )
+                if uncached_requests
+                else []
             )
 
             # Get batch processing statistics
@@ -101,8 +122,18 @@ class Phase1ParseService:
 
         except Exception as e:
             logger.error(f"Phase 1 batch processing failed: {e}")
-            # Return failed results for all requests
-            results = [self._create_failed_result(req, str(e)) for req in requests]
+            # Return failed results for all uncached requests
+            ai_results = [self._create_failed_result(req, str(e)) for req in uncached_requests]
+
+        results_by_index.update(zip(uncached, ai_results, strict=False))
+        results = [results_by_index[i] for i in sorted(results_by_index)]
+        self._store_in_cache(
+            {
+                cache_keys[i]: serialize_parse_result(result)
+                for i, result in zip(uncached, ai_results, strict=False)
+                if result.is_valid
+            }
+        )
 
         # Update statistics
         self._update_stats(results)
@@ -115,6 +146,72 @@ class Phase1ParseService:
 
         return results
 
+    async def iter_parse(
+        self, requests: list[ParseRequest], progress_callback: Callable[..., None] | None = None
+    ) -> AsyncIterator[tuple[list[int], list[ParseResult]]]:
+        """Parse requests like batch_parse, yielding results as each AI batch returns.
+
+        Persistent cache hits are yielded first, then each AI batch in
+        completion order, so Phase 2 can start before the slowest batch is back.
+
+        Args:
+            requests: List of parse requests to process
+            progress_callback: Optional callback for progress updates
+
+        Yields:
+            (indices into requests, parse results for those requests)
+        """
+        if not requests:
+            return
+
+        logger.info(f"Phase 1: Starting streaming parse of {len(requests)} requests")
+
+        requests, security_metadata = self._sanitize_requests(requests)
+
+        cache_keys = self._get_cache_keys(requests)
+        cached = self._load_cached(requests, cache_keys)
+        if cached:
+            hits = sorted(cached)
+            hit_results = [cached[i] for i in hits]
+            self._update_stats(hit_results)
+            yield hits, hit_results
+
+        uncached = [i for i in range(len(requests)) if i not in cached]
+        if not uncached:
+            return
+        uncached_requests = [requests[i] for i in uncached]
+        contexts = self._build_contexts(uncached_requests)
+
+        done: set[int] = set()
+        try:
+            async for start, ai_results in self.batch_processor.iter_batch_parse_requests(
+                requests=uncached_requests, contexts=contexts, progress_callback=progress_callback
+            ):
+                indices = uncached[start : start + len(ai_results)]
+                self._store_in_cache(
+                    {
+                        cache_keys[i]: serialize_parse_result(result)
+                        for i, result in zip(indices, ai_results, strict=True)
+                        if result.is_valid
+                    }
+                )
+                self._update_stats(ai_results)
+                done.update(indices)
+                yield indices, ai_results
+        except Exception as e:
+            logger.error(f"Phase 1 batch processing failed: {e}")
+            # Fail whatever had not come back yet
+            remaining = [i for i in uncached if i not in done]
+            failed = [self._create_failed_result(requests[i], str(e)) for i in remaining]
+            self._update_stats(failed)
+            yield remaining, failed
+
+        logger.info(
+            f"Phase 1 complete: {self._stats['successful_parses']} successful, "
+            f"{self._stats['failed_parses']} failed, "
+            f"{self._stats['needs_historical']} need historical context"
+        )
+
     def _sanitize_requests(self, requests: list[ParseRequest]) -> tuple[list[ParseRequest], dict[int, dict[str, Any]]]:
         """Sanitize all request texts before AI processing.
 
@@ -170,6 +267,39 @@ class Phase1ParseService:
 
         return sanitized_requests, security_metadata
 
+    def _get_cache_keys(self, requests: list[ParseRequest]) -> list[str]:
+        """Persistent cache key per request (empty when the cache is disabled)"""
+        if not self.parse_cache:
+            return [""] * len(requests)
+        prompt_version = get_prompts_version()
+        model = str(getattr(self.ai_service, "model", None) or getattr(self.ai_service, "name", "unknown"))
+        return [build_parse_cache_key(req, prompt_version, model) for req in requests]
+
+    def _load_cached(self, requests: list[ParseRequest], cache_keys: list[str]) -> dict[int, ParseResult]:
+        """Parse results served from the persistent cache, by request index"""
+        cached = self.parse_cache.get_many(cache_keys) if self.parse_cache else {}
+        results_by_index = {
+            i: deserialize_parse_result(cached[key], req)
+            for i, (req, key) in enumerate(zip(requests, cache_keys, strict=False))
+            if key in cached
+        }
+        self._stats["cache_hits"] += len(results_by_index)
+        if self.parse_cache:
+            logger.info(
+                f"Phase 1: {len(results_by_index)} parse cache hits, "
+                f"{len(requests) - len(results_by_index)} requests to AI"
+            )
+        return results_by_index
+
+    def _store_in_cache(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Persist successful parse results; cache failures never fail the parse"""
+        if not self.parse_cache or not entries:
+            return
+        try:
+            self.parse_cache.set_many(entries)
+        except Exception as e:
+            logger.warning(f"Failed to persist {len(entries)} parse results: {e}")
+
     def _build_contexts(self, requests: list[ParseRequest]) -> list[AIRequestContext]:
         """Build parse-only contexts for all requests"""
         contexts = []
@@ -239,4 +369,5 @@ class Phase1ParseService:
             "needs_historical": 0,
             "suspicious_inputs": 0,
             "high_risk_inputs": 0,
+            "cache_hits": 0,
         }
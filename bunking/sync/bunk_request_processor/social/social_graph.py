@@ -6,6 +6,7 @@ confidence scoring and name disambiguation, not for creating new requests."""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from enum import Enum
 from typing import Any
@@ -15,6 +16,7 @@ import networkx as nx
 from pocketbase import PocketBase
 
 from ..core.models import Person
+from ..data.async_pocketbase import AsyncPocketBase
 from ..data.repositories.session_repository import SessionRepository
 from ..resolution.interfaces import ResolutionResult
 
@@ -61,15 +63,24 @@ class SocialGraph:
     scoring and name disambiguation, not for creating new requests.
     """
 
-    def __init__(self, pb: PocketBase, year: int, session_cm_ids: list[int] | None = None):
+    def __init__(
+        self,
+        pb: PocketBase,
+        year: int,
+        session_cm_ids: list[int] | None = None,
+        async_pb: AsyncPocketBase | None = None,
+    ):
         """Initialize the social graph service.
 
         Args:
             pb: PocketBase client
             year: Current year for analysis
             session_cm_ids: List of session CM IDs to analyze
+            async_pb: Async client for the graph reads; without one they run
+                the sync client in a worker thread
         """
         self.pb = pb
+        self._async_pb = async_pb
         self.year = year
         self.session_cm_ids = session_cm_ids or []
 
@@ -168,15 +179,20 @@ class SocialGraph:
 
         return base_weight
 
+    async def _fetch_full_list(self, collection: str, filter_str: str, expand: str) -> list[Any]:
+        """Read a full collection without stalling the event loop during graph builds"""
+        query_params = {"filter": filter_str, "expand": expand}
+        if self._async_pb is not None:
+            return await self._async_pb.collection(collection).get_full_list(query_params=query_params)
+        return await asyncio.to_thread(self.pb.collection(collection).get_full_list, query_params=query_params)
+
     async def _add_informational_relationships(self, G: nx.Graph, session_cm_id: int) -> None:
         """Add family, school, and bunkmate relationships (informational only)"""
         try:
             # Get all attendees for this year with person and session expanded
             filter_str = f"year = {self.year} && status = 'enrolled'"
 
-            attendees = self.pb.collection("attendees").get_full_list(
-                query_params={"filter": filter_str, "expand": "person,session"}
-            )
+            attendees = await self._fetch_full_list("attendees", filter_str, "person,session")
 
             # Create lookup structures
             attendee_data: dict[int, Any] = {}
@@ -281,9 +297,7 @@ class SocialGraph:
                 person_filter = " || ".join([f"person.cm_id = {pid}" for pid in chunk])
                 filter_str = f"year < {self.year} && ({person_filter})"
 
-                assignments = self.pb.collection("bunk_assignments").get_full_list(
-                    query_params={"filter": filter_str, "expand": "person,bunk"}
-                )
+                assignments = await self._fetch_full_list("bunk_assignments", filter_str, "person,bunk")
                 all_assignments.extend(assignments)
 
             # Group assignments by (year, bunk) to find who bunked together
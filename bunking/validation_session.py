@@ -0,0 +1,557 @@
+"""
+Incremental bunking validation for drag-and-drop edits.
+
+A ValidationSession holds one session's validation inputs and caches what
+each BunkingValidator pass found, keyed by what it depends on:
+
+- per bunk: capacity, spread, grade ratio, grade adjacency and isolation
+  issues, plus a BunkSummary of its aggregates
+- per requester: request satisfaction counts and issues
+- per camper: level progression against last year
+
+Applying a move re-runs those passes only for the bunks the camper left and
+joined, the requesters whose requests involve the moved camper (or who share
+a touched bunk and asked for older/younger bunkmates) and the moved camper's
+level check. Cross-bunk summaries (age flow, session breakdown, unassigned
+count) are rebuilt from the cached indexes, which is linear in campers with
+no PocketBase reads. The result equals a full validate_bunking over the
+updated assignments.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import json
+import logging
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from bunking.bunking_validator import (
+    VALID_REQUEST_STATUSES,
+    BunkingValidator,
+    HistoricalBunkingRecord,
+    ValidationIssue,
+    ValidationResult,
+    ValidationSeverity,
+    ValidationStatistics,
+)
+from bunking.graph.request_graph import RequestGraph
+from bunking.models import Bunk, BunkAssignment, BunkRequest, Person, Session
+from bunking.solver.constraints.helpers import get_level_order
+
+logger = logging.getLogger(__name__)
+
+# Per-bunk passes, in the order validate_bunking reports them
+BUNK_PASSES = ("capacity", "spread", "grade_ratio", "grade_adjacency", "isolation")
+
+# Request statistics kept as running totals over requesters
+REQUEST_COUNTERS = (
+    "total_requests",
+    "satisfied_requests",
+    "explicit_csv_requests",
+    "satisfied_explicit_csv_requests",
+    "campers_with_unsatisfied_explicit_requests",
+)
+
+
+class AssignmentMove(BaseModel):
+    """Move one camper to a bunk (bunk_cm_id=None unassigns them)."""
+
+    person_cm_id: str
+    bunk_cm_id: str | None = None
+
+
+class BunkSummary(BaseModel):
+    """Aggregates for one bunk after a change."""
+
+    bunk_cm_id: str
+    bunk_name: str
+    assigned: int = 0
+    max_size: int = 0
+    capacity_status: str = "under"  # over, at, under
+    grade_counts: dict[int, int] = Field(default_factory=dict)
+    min_age: float | None = None
+    max_age: float | None = None
+    issue_count: int = 0
+
+
+class ValidationDelta(BaseModel):
+    """What changed in a validation result after applying moves."""
+
+    version: int
+    added_issues: list[ValidationIssue] = Field(default_factory=list)
+    removed_issues: list[ValidationIssue] = Field(default_factory=list)
+    # Statistics fields whose value changed, with their new value
+    statistics: dict[str, Any] = Field(default_factory=dict)
+    bunks: list[BunkSummary] = Field(default_factory=list)
+
+
+def _issue_key(issue: ValidationIssue) -> str:
+    """Identity of an issue for diffing (details compared order-insensitively)."""
+    return json.dumps(issue.model_dump(mode="json"), sort_keys=True)
+
+
+class ValidationSession:
+    """Validation state for one session that updates as campers move."""
+
+    def __init__(
+        self,
+        session: Session,
+        bunks: list[Bunk],
+        assignments: list[BunkAssignment],
+        persons: list[Person],
+        requests: list[BunkRequest],
+        scenario: str | None = None,
+        all_sessions: list[Session] | None = None,
+        bunk_plans: list[Any] | None = None,
+        attendees: list[Any] | None = None,
+        historical_bunking: list[HistoricalBunkingRecord] | None = None,
+        validator: BunkingValidator | None = None,
+    ) -> None:
+        """Build the indexes and run every pass once.
+
+        Arguments are the same as BunkingValidator.validate_bunking.
+        """
+        self.validator = validator or BunkingValidator()
+        self.session = session
+        self.bunks = bunks
+        self.persons = persons
+        self.requests = requests
+        self.scenario = scenario
+        self.all_sessions = all_sessions
+        self.bunk_plans = bunk_plans
+        self.attendees = attendees
+        self.historical_bunking = historical_bunking
+        self.version = 0
+
+        self._bunk_by_id = {bunk.campminder_id: bunk for bunk in bunks}
+        self._person_by_id = {person.campminder_id: person for person in persons}
+        self._assignments_by_person = {a.person_cm_id: a for a in assignments}
+        self._assignments_by_bunk: dict[str, list[BunkAssignment]] = defaultdict(list)
+        for assignment in assignments:
+            self._assignments_by_bunk[assignment.bunk_cm_id].append(assignment)
+        # Position of each camper in assignment order; bunk lists are kept in
+        # this order so per-bunk sums (average ages) match a full validation
+        self._positions = {person_cm_id: i for i, person_cm_id in enumerate(self._assignments_by_person)}
+        self._next_position = itertools.count(len(self._positions))
+
+        # Session of a camper who is assigned for the first time
+        self._session_by_person: dict[str, str] = {}
+        for attendee in attendees or []:
+            self._session_by_person[str(attendee.person_cm_id)] = str(attendee.session_cm_id)
+        self._session_by_bunk: dict[str, str] = {}
+        for plan in bunk_plans or []:
+            self._session_by_bunk[str(plan.bunk_cm_id)] = str(plan.session_cm_id)
+
+        # Requests grouped by requester, in the order validate_bunking reports them
+        self._requests_by_requester: dict[str, list[BunkRequest]] = defaultdict(list)
+        self._requester_order: dict[str, None] = {}
+        # Camper -> requesters whose bunk_with / not_bunk_with names them
+        self._requesters_by_target: dict[str, set[str]] = defaultdict(set)
+        self._age_preference_requesters: set[str] = set()
+        for request in requests:
+            requester_id = request.requester_person_cm_id
+            self._requests_by_requester[requester_id].append(request)
+            if request.status not in VALID_REQUEST_STATUSES:
+                continue
+            self._requester_order.setdefault(requester_id)
+            if request.request_type == "age_preference":
+                self._age_preference_requesters.add(requester_id)
+            elif request.requested_person_cm_id:
+                self._requesters_by_target[request.requested_person_cm_id].add(requester_id)
+
+        self._request_graph = RequestGraph.from_requests(requests)
+        large_components = self._request_graph.components(min_size=9)
+        self._component_order = {
+            self._request_graph.component_of(next(iter(c))): i for i, c in enumerate(large_components)
+        }
+
+        self._level_order = get_level_order()
+        self._prior_bunks: dict[int, tuple[str, int | None]] = {
+            h.person_cm_id: (h.bunk_name, h.session_cm_id) for h in historical_bunking or []
+        }
+
+        # Static parts of the result
+        self._static_stats = ValidationStatistics()
+        self._no_request_issues: list[ValidationIssue] = []
+        self.validator._validate_no_requests(persons, requests, self._static_stats, self._no_request_issues)
+
+        # Cached pass results
+        self._bunk_issues: dict[str, dict[str, list[ValidationIssue]]] = {name: {} for name in BUNK_PASSES}
+        self._bunk_summaries: dict[str, BunkSummary] = {}
+        self._isolation_counts: dict[str, int] = {}
+        self._requester_counts: dict[str, Counter[str]] = {}
+        # Sum of _requester_counts: REQUEST_COUNTERS plus "<field>.total" / "<field>.satisfied"
+        self._request_totals: Counter[str] = Counter()
+        self._requester_issues: dict[str, list[ValidationIssue]] = {}
+        self._requester_unsatisfied: dict[str, bool] = {}
+        self._level_changes: dict[str, str] = {}
+        self._level_regressions: dict[str, ValidationIssue] = {}
+
+        for bunk in bunks:
+            self._evaluate_bunk(bunk)
+        for requester_id in self._requester_order:
+            self._evaluate_requester(requester_id)
+        if historical_bunking:
+            for person_cm_id in self._assignments_by_person:
+                self._evaluate_level(person_cm_id)
+
+        self._result = self._assemble()
+
+    @property
+    def assignments(self) -> list[BunkAssignment]:
+        """Current assignments, with moves applied."""
+        return list(self._assignments_by_person.values())
+
+    def result(self) -> ValidationResult:
+        """The current validation result."""
+        return self._result
+
+    def bunk_summary(self, bunk_cm_id: str) -> BunkSummary | None:
+        """Aggregates for one bunk (None for unknown bunks)."""
+        return self._bunk_summaries.get(bunk_cm_id)
+
+    def apply_moves(self, moves: Iterable[AssignmentMove]) -> ValidationDelta:
+        """Apply camper moves and revalidate what they affect.
+
+        Moves are checked before any is applied, so an invalid move leaves
+        the session unchanged.
+
+        Raises:
+            ValueError: If a move names an unknown camper or bunk
+        """
+        moves = list(moves)
+        for move in moves:
+            if move.person_cm_id not in self._person_by_id:
+                raise ValueError(f"Unknown camper {move.person_cm_id}")
+            if move.bunk_cm_id is not None and move.bunk_cm_id not in self._bunk_by_id:
+                raise ValueError(f"Unknown bunk {move.bunk_cm_id}")
+
+        touched_bunks: dict[str, None] = {}
+        moved: dict[str, None] = {}
+        for move in moves:
+            current = self._assignments_by_person.get(move.person_cm_id)
+            current_bunk = current.bunk_cm_id if current else None
+            if current_bunk == move.bunk_cm_id:
+                continue
+            moved.setdefault(move.person_cm_id)
+            if current is not None:
+                touched_bunks.setdefault(current.bunk_cm_id)
+                self._assignments_by_bunk[current.bunk_cm_id].remove(current)
+            if move.bunk_cm_id is None:
+                del self._assignments_by_person[move.person_cm_id]
+                del self._positions[move.person_cm_id]
+                continue
+            touched_bunks.setdefault(move.bunk_cm_id)
+            if current is not None:
+                assignment = current.model_copy(update={"bunk_cm_id": move.bunk_cm_id})
+            else:
+                assignment = self._new_assignment(move.person_cm_id, move.bunk_cm_id)
+                self._positions[move.person_cm_id] = next(self._next_position)
+            # Replacing in place keeps the camper's position in assignment order
+            self._assignments_by_person[move.person_cm_id] = assignment
+            bisect.insort(
+                self._assignments_by_bunk[move.bunk_cm_id],
+                assignment,
+                key=lambda a: self._positions[a.person_cm_id],
+            )
+
+        self.version += 1
+        previous = self._result
+        if not moved:
+            return ValidationDelta(version=self.version)
+
+        for bunk_cm_id in touched_bunks:
+            if bunk_cm_id in self._bunk_by_id:
+                self._evaluate_bunk(self._bunk_by_id[bunk_cm_id])
+        for requester_id in self._affected_requesters(moved, touched_bunks):
+            self._evaluate_requester(requester_id)
+        if self.historical_bunking:
+            for person_cm_id in moved:
+                self._evaluate_level(person_cm_id)
+
+        self._result = self._assemble()
+        logger.debug(
+            f"Validation session {self.session.campminder_id} v{self.version}: "
+            f"{len(moved)} moved, {len(touched_bunks)} bunks revalidated"
+        )
+        return self._diff(previous, self._result, touched_bunks)
+
+    def _new_assignment(self, person_cm_id: str, bunk_cm_id: str) -> BunkAssignment:
+        """Assignment for a camper who had none."""
+        session_cm_id = (
+            self._session_by_person.get(person_cm_id)
+            or self._session_by_bunk.get(bunk_cm_id)
+            or self.session.campminder_id
+        )
+        return BunkAssignment(
+            person_cm_id=person_cm_id,
+            session_cm_id=session_cm_id,
+            bunk_cm_id=bunk_cm_id,
+            year=self.session.year,
+            is_manual=True,
+        )
+
+    def _affected_requesters(self, moved: dict[str, None], touched_bunks: dict[str, None]) -> list[str]:
+        """Requesters whose satisfaction may change after moving these campers."""
+        affected: set[str] = set()
+        for person_cm_id in moved:
+            affected.add(person_cm_id)
+            affected.update(self._requesters_by_target.get(person_cm_id, ()))
+        # Older/younger preferences depend on everyone in the requester's bunk
+        for bunk_cm_id in touched_bunks:
+            for assignment in self._assignments_by_bunk.get(bunk_cm_id, []):
+                if assignment.person_cm_id in self._age_preference_requesters:
+                    affected.add(assignment.person_cm_id)
+        return [requester_id for requester_id in affected if requester_id in self._requester_order]
+
+    def _evaluate_bunk(self, bunk: Bunk) -> None:
+        """Re-run the per-bunk passes and aggregates for one bunk."""
+        validator = self.validator
+        bunk_cm_id = bunk.campminder_id
+        assignments = self._assignments_by_bunk.get(bunk_cm_id, [])
+        scratch = ValidationStatistics()
+        found: dict[str, list[ValidationIssue]] = {name: [] for name in BUNK_PASSES}
+
+        validator._validate_bunk_capacities([bunk], self._assignments_by_bunk, scratch, found["capacity"])
+        validator._validate_spreads([bunk], self._assignments_by_bunk, self._person_by_id, scratch, found["spread"])
+        validator._validate_grade_ratios(
+            [bunk], self._assignments_by_bunk, self._person_by_id, scratch, found["grade_ratio"]
+        )
+        validator._validate_grade_adjacency(
+            [bunk], self._assignments_by_bunk, self._person_by_id, scratch, found["grade_adjacency"]
+        )
+        risks = validator._bunk_isolation_risks(
+            bunk, assignments, self._request_graph, self._component_order, self._person_by_id
+        )
+        found["isolation"] = [validator._isolation_risk_issue(risk) for risk in risks]
+        self._isolation_counts[bunk_cm_id] = len(risks)
+
+        for name, issues in found.items():
+            self._bunk_issues[name][bunk_cm_id] = issues
+
+        if scratch.bunks_over_capacity:
+            capacity_status = "over"
+        elif scratch.bunks_at_capacity:
+            capacity_status = "at"
+        else:
+            capacity_status = "under"
+        grade_counts: Counter[int] = Counter()
+        ages: list[float] = []
+        for assignment in assignments:
+            person = self._person_by_id.get(assignment.person_cm_id)
+            if person is None:
+                continue
+            if person.grade is not None:
+                grade_counts[person.grade] += 1
+            if person.age:
+                ages.append(person.age)
+        self._bunk_summaries[bunk_cm_id] = BunkSummary(
+            bunk_cm_id=bunk_cm_id,
+            bunk_name=bunk.name,
+            assigned=len(assignments),
+            max_size=bunk.max_size,
+            capacity_status=capacity_status,
+            grade_counts=dict(sorted(grade_counts.items())),
+            min_age=min(ages) if ages else None,
+            max_age=max(ages) if ages else None,
+            issue_count=sum(len(issues) for issues in found.values()),
+        )
+
+    def _evaluate_requester(self, requester_id: str) -> None:
+        """Re-run request validation for one requester's requests."""
+        stats = ValidationStatistics()
+        issues: list[ValidationIssue] = []
+        self.validator._validate_requests(
+            self._requests_by_requester[requester_id],
+            self._assignments_by_person,
+            self._person_by_id,
+            stats,
+            issues,
+            assignments_by_bunk=self._assignments_by_bunk,
+        )
+        # The summary issue is rebuilt over all requesters in _assemble
+        unsatisfied = bool(issues) and issues[0].type == "campers_with_unsatisfied_valid_requests"
+        counts: Counter[str] = Counter({counter: getattr(stats, counter) for counter in REQUEST_COUNTERS})
+        for field, field_data in stats.field_stats.items():
+            counts[f"{field}.total"] = int(field_data["total"])
+            counts[f"{field}.satisfied"] = int(field_data["satisfied"])
+        previous = self._requester_counts.get(requester_id)
+        if previous is not None:
+            self._request_totals.subtract(previous)
+        self._request_totals.update(counts)
+        self._requester_counts[requester_id] = counts
+        self._requester_issues[requester_id] = issues[1:] if unsatisfied else issues
+        self._requester_unsatisfied[requester_id] = unsatisfied
+
+    def _evaluate_level(self, person_cm_id: str) -> None:
+        """Re-classify one camper's level change against last year."""
+        assignment = self._assignments_by_person.get(person_cm_id)
+        self._level_regressions.pop(person_cm_id, None)
+        if assignment is None:
+            self._level_changes.pop(person_cm_id, None)
+            return
+        change, regression = self.validator._level_change(
+            person_cm_id, assignment, self._prior_bunks, self._bunk_by_id, self._person_by_id, self._level_order
+        )
+        self._level_changes[person_cm_id] = change
+        if regression is not None:
+            self._level_regressions[person_cm_id] = self.validator._level_regression_issue(regression)
+
+    def _assemble(self) -> ValidationResult:
+        """Combine cached pass results into a result matching validate_bunking."""
+        validator = self.validator
+        stats = ValidationStatistics()
+        issues: list[ValidationIssue] = []
+
+        stats.total_campers = len(self.persons)
+        stats.assigned_campers = len(self._assignments_by_person)
+        stats.unassigned_campers = stats.total_campers - stats.assigned_campers
+        if stats.unassigned_campers > 0:
+            unassigned_ids = [
+                p.campminder_id for p in self.persons if p.campminder_id not in self._assignments_by_person
+            ]
+            issues.append(
+                ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    type="unassigned_campers",
+                    message=f"{stats.unassigned_campers} campers are not assigned to any bunk",
+                    details={"count": stats.unassigned_campers},
+                    affected_ids=unassigned_ids[:10],
+                )
+            )
+
+        for summary in self._bunk_summaries.values():
+            if summary.capacity_status == "over":
+                stats.bunks_over_capacity += 1
+            elif summary.capacity_status == "at":
+                stats.bunks_at_capacity += 1
+            else:
+                stats.bunks_under_capacity += 1
+
+        bunk_ids = [bunk.campminder_id for bunk in self.bunks]
+        issues.extend(issue for bunk_cm_id in bunk_ids for issue in self._bunk_issues["capacity"][bunk_cm_id])
+
+        # Requests: running totals, then rates and the summary issue
+        totals = self._request_totals
+        for counter in REQUEST_COUNTERS:
+            setattr(stats, counter, totals[counter])
+        unsatisfied: list[str] = []
+        for requester_id in self._requester_order:
+            issues.extend(self._requester_issues[requester_id])
+            if self._requester_unsatisfied[requester_id]:
+                unsatisfied.append(requester_id)
+        for field, field_data in stats.field_stats.items():
+            field_data["total"] = totals[f"{field}.total"]
+            field_data["satisfied"] = totals[f"{field}.satisfied"]
+            if field_data["total"] > 0:
+                field_data["satisfaction_rate"] = field_data["satisfied"] / field_data["total"]
+        if stats.total_requests > 0:
+            stats.request_satisfaction_rate = stats.satisfied_requests / stats.total_requests
+        if stats.explicit_csv_requests > 0:
+            stats.explicit_csv_request_satisfaction_rate = (
+                stats.satisfied_explicit_csv_requests / stats.explicit_csv_requests
+            )
+        if unsatisfied:
+            issues.insert(
+                0,
+                validator._unsatisfied_requests_summary(
+                    unsatisfied,
+                    stats.total_requests,
+                    stats.satisfied_requests,
+                    stats.campers_with_unsatisfied_explicit_requests,
+                ),
+            )
+
+        for name in ("spread", "grade_ratio", "grade_adjacency"):
+            issues.extend(issue for bunk_cm_id in bunk_ids for issue in self._bunk_issues[name][bunk_cm_id])
+
+        if self.historical_bunking:
+            tally = Counter(self._level_changes[p] for p in self._assignments_by_person)
+            stats.level_progression = {
+                "returning_campers": tally["unknown_level"]
+                + tally["progressed"]
+                + tally["same_level"]
+                + tally["regressed"],
+                "progressed": tally["progressed"],
+                "same_level": tally["same_level"],
+                "regressed": tally["regressed"],
+            }
+            issues.extend(
+                self._level_regressions[p] for p in self._assignments_by_person if p in self._level_regressions
+            )
+
+        # Age flow compares bunks against each other, so it is rerun in full
+        validator._validate_age_grade_flow(self.bunks, self._assignments_by_bunk, self._person_by_id, stats, issues)
+
+        stats.isolation_risks = sum(self._isolation_counts.values())
+        issues.extend(issue for bunk_cm_id in bunk_ids for issue in self._bunk_issues["isolation"][bunk_cm_id])
+
+        stats.locked_bunks = sum(1 for b in self.bunks if b.is_locked)
+        stats.campers_with_no_requests = self._static_stats.campers_with_no_requests
+        issues.extend(self._no_request_issues)
+
+        if self.all_sessions and self.bunk_plans:
+            validator._compute_session_breakdown(
+                self.all_sessions,
+                self.bunk_plans,
+                self.persons,
+                self._assignments_by_person,
+                self.bunks,
+                self._assignments_by_bunk,
+                stats,
+                self.attendees,
+            )
+
+        stats.total_capacity = sum(bunk.max_size for bunk in self.bunks)
+        stats.used_capacity = stats.assigned_campers
+        if stats.total_capacity > 0:
+            stats.capacity_utilization_rate = stats.used_capacity / stats.total_capacity
+
+        return ValidationResult(
+            statistics=stats, issues=issues, session_id=self.session.campminder_id, scenario=self.scenario
+        )
+
+    def _diff(
+        self, previous: ValidationResult, current: ValidationResult, touched_bunks: dict[str, None]
+    ) -> ValidationDelta:
+        """Issues and statistics that differ between two results."""
+        # Cached pass results are reused as-is, so unchanged issues are the
+        # same objects; only the rest need comparing by content
+        previous_ids = {id(issue) for issue in previous.issues}
+        current_ids = {id(issue) for issue in current.issues}
+        candidates_added = [issue for issue in current.issues if id(issue) not in previous_ids]
+        candidates_removed = [issue for issue in previous.issues if id(issue) not in current_ids]
+
+        before = Counter(_issue_key(issue) for issue in candidates_removed)
+        added: list[ValidationIssue] = []
+        for issue in candidates_added:
+            key = _issue_key(issue)
+            if before[key] > 0:
+                before[key] -= 1
+            else:
+                added.append(issue)
+        after = Counter(_issue_key(issue) for issue in candidates_added)
+        removed: list[ValidationIssue] = []
+        for issue in candidates_removed:
+            key = _issue_key(issue)
+            if after[key] > 0:
+                after[key] -= 1
+            else:
+                removed.append(issue)
+
+        old_stats = previous.statistics.model_dump()
+        new_stats = current.statistics.model_dump()
+        changed = {name: value for name, value in new_stats.items() if old_stats.get(name) != value}
+
+        return ValidationDelta(
+            version=self.version,
+            added_issues=added,
+            removed_issues=removed,
+            statistics=changed,
+            bunks=[self._bunk_summaries[b] for b in touched_bunks if b in self._bunk_summaries],
+        )
@@ -1,8 +1,13 @@
 """CampMinder API client for fetching camper data and bunking requests."""
 
 import json
+import logging
 import os
+import re
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, cast
@@ -13,6 +18,13 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Parallel requests used by iter_custom_fields / fetch_all_data
+DEFAULT_CUSTOM_FIELD_WORKERS = 8
+# Times a rate-limited (429) request is retried before giving up
+RATE_LIMIT_RETRIES = 5
+
 
 # Default function for current season
 def get_current_season() -> int:
@@ -51,14 +63,85 @@ class CamperData:
     custom_fields: dict[str, Any] = field(default_factory=dict)
 
 
+class RateLimiter:
+    """Thread-safe token bucket that adapts to the API's rate limiting.
+
+    Every request takes a token; tokens refill at `rate` per second up to
+    `burst`. A 429 halves the rate and pauses all callers for the server's
+    Retry-After; each success then raises the rate again a little, up to
+    max_rate, so throughput settles just under the server's limit.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: float = 10.0, min_rate: float = 0.5):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def backoff(self, retry_after: float | None = None) -> None:
+        """Slow down after a 429, pausing for retry_after seconds if given."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0
+            self._updated = time.monotonic()
+            if retry_after:
+                self._paused_until = max(self._paused_until, self._updated + retry_after)
+
+    def record_success(self) -> None:
+        """Speed back up after a successful request."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.min_rate / 10)
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    """Seconds to wait from a 429's Retry-After header or "Try again in N seconds" message."""
+    header = response.headers.get("Retry-After")
+    if header:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    try:
+        match = re.search(r"Try again in (\d+) seconds", response.json().get("message", ""))
+        if match:
+            return int(match.group(1)) + 1  # Add 1 second buffer
+    except Exception:
+        pass
+    return None
+
+
 class CampMinderClient:
     """Client for interacting with CampMinder API."""
 
-    def __init__(self, config: CampMinderConfig):
+    def __init__(self, config: CampMinderConfig, rate_limiter: RateLimiter | None = None):
         self.config = config
         self.session = requests.Session()
+        # Room for every concurrent custom-field worker to keep its connection alive
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=DEFAULT_CUSTOM_FIELD_WORKERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.rate_limiter = rate_limiter or RateLimiter()
         self.jwt_token: str | None = None
         self.jwt_expiry: float | None = None
+        self._auth_lock = threading.Lock()
 
         # Token cache file path - store in home directory to persist across runs
         self.token_cache_file = os.path.expanduser("~/.campminder_token_cache.json")
@@ -170,8 +253,10 @@ class CampMinderClient:
 
     def _ensure_authenticated(self) -> None:
         """Ensure we have a valid JWT token."""
-        if not self.jwt_token or not self.jwt_expiry or time.time() >= self.jwt_expiry:
-            self.authenticate()
+        # Concurrent workers share one token; only the first refreshes it
+        with self._auth_lock:
+            if not self.jwt_token or not self.jwt_expiry or time.time() >= self.jwt_expiry:
+                self.authenticate()
 
     def _load_cached_token(self) -> None:
         """Load cached JWT token from file if it exists and is still valid."""
@@ -265,34 +350,50 @@ class CampMinderClient:
         if data is not None:
             headers["Content-Type"] = "application/json"
 
-        try:
-            response = self.session.request(
-                method=method, url=url, headers=headers, params=params, json=data if data is not None else None
-            )
-            response.raise_for_status()
-
-            return cast(dict[str, Any], response.json())
-
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                # Token might have expired, try to re-authenticate once
-                self.jwt_token = None  # Force re-authentication
-                self._ensure_authenticated()
-
-                # Retry the request with new token
-                headers["Authorization"] = f"Bearer {self.jwt_token}"
-                retry_response = self.session.request(
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            try:
+                self.rate_limiter.acquire()
+                response = self.session.request(
                     method=method, url=url, headers=headers, params=params, json=data if data is not None else None
                 )
-                retry_response.raise_for_status()
-                return cast(dict[str, Any], retry_response.json())
-            elif e.response.status_code == 429:
-                # Rate limit error - include specific message
-                raise Exception(f"Rate limit exceeded (429): {e.response.text}")
-            else:
-                raise Exception(f"API request failed: {e.response.status_code} - {e.response.text}")
-        except Exception as e:
-            raise Exception(f"Request error: {str(e)}")
+                response.raise_for_status()
+                self.rate_limiter.record_success()
+
+                return cast(dict[str, Any], response.json())
+
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 401:
+                    # Token might have expired, try to re-authenticate once
+                    self.jwt_token = None  # Force re-authentication
+                    self._ensure_authenticated()
+
+                    # Retry the request with new token
+                    headers["Authorization"] = f"Bearer {self.jwt_token}"
+                    self.rate_limiter.acquire()
+                    retry_response = self.session.request(
+                        method=method, url=url, headers=headers, params=params, json=data if data is not None else None
+                    )
+                    retry_response.raise_for_status()
+                    return cast(dict[str, Any], retry_response.json())
+                elif e.response.status_code == 429:
+                    if attempt < RATE_LIMIT_RETRIES:
+                        # Slow every caller down, then retry once the limiter allows
+                        retry_after = _retry_after_seconds(e.response)
+                        self.rate_limiter.backoff(retry_after)
+                        logger.warning(
+                            f"Rate limit hit for {endpoint} (attempt {attempt + 1}/{RATE_LIMIT_RETRIES + 1}), "
+                            f"retry after {retry_after or 'backoff'}s at {self.rate_limiter.rate:.1f} req/s"
+                        )
+                        continue
+                    # Rate limit error - include specific message
+                    raise Exception(f"Rate limit exceeded (429): {e.response.text}")
+                else:
+                    raise Exception(f"API request failed: {e.response.status_code} - {e.response.text}")
+            except Exception as e:
+                raise Exception(f"Request error: {str(e)}")
+
+        # Unreachable: the last attempt either returns or raises
+        raise Exception(f"Request error: rate limit retries exhausted for {endpoint}")
 
     def get_campers(self, page_size: int = 100) -> list[CamperData]:
         """Fetch all campers for the configured season."""
@@ -345,6 +446,35 @@ class CampMinderClient:
 
         return custom_fields
 
+    def iter_custom_fields(
+        self, person_ids: Iterable[int], max_workers: int = DEFAULT_CUSTOM_FIELD_WORKERS
+    ) -> Iterator[tuple[int, dict[str, Any] | Exception]]:
+        """Fetch custom fields for many people concurrently.
+
+        Requests share the client's session and rate limiter, so the request
+        rate adapts to 429s across all workers. Results are yielded as they
+        arrive, not in input order; a failed fetch yields its exception.
+
+        Args:
+            person_ids: People to fetch custom fields for
+            max_workers: Requests in flight at once (1 = sequential)
+
+        Yields:
+            (person_id, custom fields or the exception raised fetching them)
+        """
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="campminder-fields") as pool:
+            futures = {pool.submit(self.get_custom_fields, person_id): person_id for person_id in person_ids}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        yield futures[future], future.result()
+                    except Exception as e:
+                        yield futures[future], e
+            finally:
+                # Consumer stopped early: drop what has not started
+                for future in futures:
+                    future.cancel()
+
     def get_custom_field_definitions(self) -> dict[int, str]:
         """Get mapping of custom field IDs to names."""
         params = {"clientid": self.config.client_id, "pagenumber": 1, "pagesize": 1000}
@@ -443,9 +573,6 @@ class CampMinderClient:
 
             page_number += 1
 
-            # Rate limiting
-            time.sleep(0.5)
-
         return all_attendees
 
     def _parse_camper(self, person_data: dict[str, Any]) -> CamperData:
@@ -481,8 +608,13 @@ class CampMinderClient:
             gender=gender,
         )
 
-    def fetch_all_data(self, fetch_custom_fields: bool = True) -> list[CamperData]:
-        """Fetch all camper data including custom fields and bunk assignments."""
+    def fetch_all_data(
+        self, fetch_custom_fields: bool = True, max_workers: int = DEFAULT_CUSTOM_FIELD_WORKERS
+    ) -> list[CamperData]:
+        """Fetch all camper data including custom fields and bunk assignments.
+
+        Custom fields are fetched for up to max_workers campers at once.
+        """
         print("Fetching campers...")
         campers = self.get_campers()
         print(f"Found {len(campers)} campers")
@@ -497,25 +629,29 @@ class CampMinderClient:
             print("Fetching custom field definitions...")
             field_mapping = self.get_custom_field_definitions()
 
-        # Update campers with assignments and custom fields
-        for i, camper in enumerate(campers):
-            # Add bunk assignment
+        # Add bunk assignments
+        for camper in campers:
             camper.cabin_assignment = person_to_bunk.get(camper.person_id)
 
-            # Fetch custom fields
-            if fetch_custom_fields:
-                if i % 10 == 0:
-                    print(f"Fetching custom fields for camper {i + 1}/{len(campers)}...")
+        # Fetch custom fields
+        if fetch_custom_fields:
+            campers_by_id = {camper.person_id: camper for camper in campers}
+            for done, (person_id, result) in enumerate(
+                self.iter_custom_fields(campers_by_id, max_workers=max_workers), start=1
+            ):
+                if done % 10 == 0:
+                    print(f"Fetched custom fields for {done}/{len(campers_by_id)} campers...")
+
+                camper = campers_by_id[person_id]
+                if isinstance(result, Exception):
+                    print(f"Error fetching custom fields for {camper.name}: {result}")
+                    continue
 
-                try:
-                    raw_fields = self.get_custom_fields(camper.person_id)
-                    # Map field IDs to names
-                    for field_key, value in raw_fields.items():
-                        field_id = int(field_key.split("_")[1])
-                        field_name = field_mapping.get(field_id, field_key)
-                        camper.custom_fields[field_name] = value
-                except Exception as e:
-                    print(f"Error fetching custom fields for {camper.name}: {e}")
+                # Map field IDs to names
+                for field_key, value in result.items():
+                    field_id = int(field_key.split("_")[1])
+                    field_name = field_mapping.get(field_id, field_key)
+                    camper.custom_fields[field_name] = value
 
         return campers
 
@@ -0,0 +1,21 @@
+/// <reference path="../pb_data/types.d.ts" />
+/**
+ * Migration: Enable the batch API
+ * Dependencies: none
+ *
+ * The solver apply endpoint writes assignment changes through
+ * POST /api/batch, one transaction per batch of up to 100 requests.
+ * maxRequests must stay >= BATCH_SIZE in api/services/bulk_apply.py.
+ */
+
+migrate((app) => {
+  const settings = app.settings();
+  settings.batch.enabled = true;
+  settings.batch.maxRequests = 100;
+  settings.batch.timeout = 30;
+  app.save(settings);
+}, (app) => {
+  const settings = app.settings();
+  settings.batch.enabled = false;
+  app.save(settings);
+});
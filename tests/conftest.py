@@ -271,6 +271,9 @@ class MockConfigLoader:
     def reload(self) -> None:
         pass
 
+    def pin(self) -> MockConfigLoader:
+        return self
+
 
 @pytest.fixture
 def mock_config():
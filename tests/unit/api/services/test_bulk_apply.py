@@ -0,0 +1,168 @@
+"""
+Unit tests for the bulk apply service.
+
+Tests that the apply plan writes only changed assignments, and that batched
+and concurrent execution undo earlier writes when a later one fails.
+PocketBase is replaced by a fake client serving fixed records per collection.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from api.services.bulk_apply import BulkApplyError, build_apply_plan, execute_apply_plan
+
+
+class FakeRecords:
+    def __init__(self, client: FakeClient, name: str):
+        self.client = client
+        self.name = name
+
+    def get_full_list(self, query_params: dict[str, Any]) -> list[Any]:
+        return self.client.records.get(self.name, [])
+
+    def create(self, data: dict[str, Any]) -> Any:
+        return self.client.write("create", data)
+
+    def update(self, record_id: str, data: dict[str, Any]) -> Any:
+        return self.client.write("update", record_id, data)
+
+    def delete(self, record_id: str) -> None:
+        self.client.write("delete", record_id)
+
+
+class FakeClient:
+    """Serves fixed records and logs every write; fail_on picks a write to reject."""
+
+    def __init__(self, records: dict[str, list[Any]], batch_status: int | None = None):
+        self.records = records
+        self.batch_status = batch_status
+        self.batches: list[list[dict[str, Any]]] = []
+        self.writes: list[tuple[Any, ...]] = []
+        self.fail_on: int | None = None
+
+    def collection(self, name: str) -> FakeRecords:
+        return FakeRecords(self, name)
+
+    def write(self, *call: Any) -> Any:
+        if self.fail_on is not None and len(self.writes) == self.fail_on:
+            self.fail_on = None
+            raise RuntimeError("write rejected")
+        self.writes.append(call)
+        return SimpleNamespace(id=f"new-{len(self.writes)}")
+
+    def send(self, path: str, req_config: dict[str, Any]) -> Any:
+        if self.batch_status is not None:
+            raise _ResponseError(self.batch_status)
+        requests = req_config["body"]["requests"]
+        if self.fail_on is not None and len(self.batches) == self.fail_on:
+            self.fail_on = None
+            raise _ResponseError(400)
+        self.batches.append(requests)
+        return [{"status": 200, "body": {"id": f"new-{len(self.batches)}-{i}"}} for i in range(len(requests))]
+
+
+class _ResponseError(Exception):
+    def __init__(self, status: int):
+        super().__init__(f"status {status}")
+        self.status = status
+
+
+def _client(**kwargs: Any) -> Any:
+    """Three campers in session s1: 1 already in B-1, 2 in B-1 (moving), 3 unassigned."""
+    records = {
+        "bunks": [SimpleNamespace(id="b1", cm_id=10, name="B-1"), SimpleNamespace(id="b2", cm_id=11, name="B-2")],
+        "persons": [SimpleNamespace(id=f"p{i}", cm_id=i) for i in (1, 2, 3)],
+        "camp_sessions": [SimpleNamespace(id="s1", cm_id=1000)],
+        "attendees": [SimpleNamespace(person_id=i, session="s1") for i in (1, 2, 3)],
+        "bunk_plans": [
+            SimpleNamespace(id="bp1", bunk="b1", session="s1"),
+            SimpleNamespace(id="bp2", bunk="b2", session="s1"),
+        ],
+        "bunk_assignments_draft": [
+            SimpleNamespace(id="a1", person="p1", session="s1", bunk="b1", bunk_plan="bp1", assignment_locked=True),
+            SimpleNamespace(id="a2", person="p2", session="s1", bunk="b1", bunk_plan="bp1", assignment_locked=False),
+        ],
+    }
+    return FakeClient(records, **kwargs)
+
+
+SOLVED = {"1": "B-1", "2": "B-2", "3": "B-2", "4": "B-9"}
+
+
+class TestBuildApplyPlan:
+    """Tests for build_apply_plan."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_assignments_are_written(self):
+        plan = await build_apply_plan(_client(), SOLVED, 2025, [1000], scenario="sc1")
+
+        assert plan.collection == "bunk_assignments_draft"
+        assert plan.unchanged == 1
+        assert [person for person, _ in plan.skipped] == [4]
+        update, create = plan.writes
+        assert update.record_id == "a2"
+        assert update.data == {"session": "s1", "bunk": "b2", "bunk_plan": "bp2", "assignment_locked": False}
+        assert update.previous == {"session": "s1", "bunk": "b1", "bunk_plan": "bp1", "assignment_locked": False}
+        assert create.record_id is None
+        assert create.data["person"] == "p3"
+        assert create.data["scenario"] == "sc1"
+
+    @pytest.mark.asyncio
+    async def test_bunk_without_plan_is_written_with_bunk_plan_cleared(self):
+        client = _client()
+        client.records["bunk_plans"] = [SimpleNamespace(id="bp1", bunk="b1", session="s1")]
+
+        plan = await build_apply_plan(client, SOLVED, 2025, [1000], scenario="sc1")
+
+        assert [person for person, _ in plan.skipped] == [4]
+        update, create = plan.writes
+        assert update.data["bunk"] == "b2"
+        assert update.data["bunk_plan"] == ""
+        assert create.data["bunk_plan"] == ""
+
+
+class TestExecuteApplyPlan:
+    """Tests for execute_apply_plan."""
+
+    @pytest.mark.asyncio
+    async def test_batches_writes(self):
+        client = _client()
+        plan = await build_apply_plan(client, SOLVED, 2025, [1000], scenario="sc1")
+
+        result = await execute_apply_plan(client, plan, batch_size=1)
+
+        assert result.mode == "batch"
+        assert (result.created, result.updated, result.unchanged, result.skipped) == (1, 1, 1, 1)
+        assert [batch[0]["method"] for batch in client.batches] == ["PATCH", "POST"]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_rolls_back_earlier_batches(self):
+        client = _client()
+        plan = await build_apply_plan(client, SOLVED, 2025, [1000], scenario="sc1")
+        client.fail_on = 1
+
+        with pytest.raises(BulkApplyError) as exc_info:
+            await execute_apply_plan(client, plan, batch_size=1)
+
+        assert exc_info.value.rolled_back
+        undo = client.batches[-1][0]
+        assert undo["method"] == "PATCH"
+        assert undo["url"].endswith("/a2")
+        assert undo["body"]["bunk"] == "b1"
+
+    @pytest.mark.asyncio
+    async def test_disabled_batch_api_falls_back_and_compensates(self):
+        client = _client(batch_status=403)
+        plan = await build_apply_plan(client, SOLVED, 2025, [1000], scenario="sc1")
+        client.fail_on = 1
+
+        with pytest.raises(BulkApplyError):
+            await execute_apply_plan(client, plan, max_concurrency=1)
+
+        # The successful update is restored to its previous bunk
+        assert client.writes[0][0] == "update"
+        assert client.writes[-1] == ("update", "a2", plan.writes[0].previous)
@@ -0,0 +1,138 @@
+"""
+Unit tests for the bulk loader service.
+
+Tests filter chunking against the length limit and that chunk queries run
+concurrently without exceeding the concurrency bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from api.services.bulk_loader import (
+    BunkRequestRecord,
+    PersonRecord,
+    chunk_filter_clauses,
+    fetch_by_ids,
+)
+
+
+class FakeCollection:
+    """Collection whose get_full_list echoes one record per ID in the filter."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.filters: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_full_list(self, query_params: dict[str, Any]) -> list[Any]:
+        with self._lock:
+            self.filters.append(query_params["filter"])
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        chunk = query_params["filter"].split(" && ")[0].strip("()")
+        ids = [int(clause.split(" = ")[1]) for clause in chunk.split(" || ")]
+        return [SimpleNamespace(id=f"pb-{i}", cm_id=i, first_name=f"P{i}", grade=5) for i in ids]
+
+
+class FakeClient:
+    def __init__(self, collection: FakeCollection):
+        self._collection = collection
+
+    def collection(self, name: str) -> FakeCollection:
+        return self._collection
+
+
+class TestChunkFilterClauses:
+    """Tests for chunk_filter_clauses."""
+
+    def test_chunks_stay_under_limit(self):
+        chunks = chunk_filter_clauses("cm_id", range(1000, 1100), max_length=200)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 200 + 2 for chunk in chunks)
+        clauses = [c for chunk in chunks for c in chunk.strip("()").split(" || ")]
+        assert clauses == [f"cm_id = {i}" for i in range(1000, 1100)]
+
+    def test_duplicates_dropped_and_empty_input(self):
+        assert chunk_filter_clauses("cm_id", [1, 2, 1]) == ["(cm_id = 1 || cm_id = 2)"]
+        assert chunk_filter_clauses("cm_id", []) == []
+
+
+class TestFetchByIds:
+    """Tests for fetch_by_ids."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_chunks_with_base_filter(self):
+        collection = FakeCollection()
+
+        records = await fetch_by_ids(
+            FakeClient(collection),  # type: ignore[arg-type]
+            "persons",
+            "cm_id",
+            range(1, 301),
+            "year = 2025",
+            max_filter_length=300,
+        )
+
+        assert sorted(r.cm_id for r in records) == list(range(1, 301))
+        assert len(collection.filters) > 1
+        assert all(f.endswith(" && (year = 2025)") for f in collection.filters)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        collection = FakeCollection(delay=0.05)
+
+        await fetch_by_ids(
+            FakeClient(collection),  # type: ignore[arg-type]
+            "persons",
+            "cm_id",
+            range(1, 201),
+            max_filter_length=100,
+            max_concurrency=3,
+        )
+
+        assert len(collection.filters) > 3
+        assert collection.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_shared_semaphore_and_convert(self):
+        collection = FakeCollection(delay=0.02)
+        semaphore = asyncio.Semaphore(2)
+        client: Any = FakeClient(collection)
+
+        first, second = await asyncio.gather(
+            fetch_by_ids(
+                client, "persons", "cm_id", range(1, 50), convert=PersonRecord.from_record, semaphore=semaphore
+            ),
+            fetch_by_ids(client, "persons", "cm_id", range(50, 100), semaphore=semaphore, max_filter_length=100),
+        )
+
+        assert collection.peak <= 2
+        assert isinstance(first[0], PersonRecord)
+        assert first[0].first_name == "P1"
+        assert len(second) == 50
+
+
+class TestCompactRecords:
+    """Tests for the compact record types."""
+
+    def test_bunk_request_defaults(self):
+        record = SimpleNamespace(id="r1", requester_id=1, request_type="bunk_with", session_id=10, year=2025)
+
+        request = BunkRequestRecord.from_record(record)
+
+        assert request.requestee_id is None
+        assert request.priority == 5
+        assert request.status == "pending"
@@ -0,0 +1,197 @@
+"""
+Unit tests for the multi-session scheduler.
+
+Tests worker budget allocation, largest-first ordering and parent run
+aggregation with the data fetch and per-session solve mocked out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.dependencies import solver_runs
+from api.services.multi_session_scheduler import (
+    SessionSolve,
+    allocate_workers,
+    run_multi_session_solve,
+    summarize_children,
+)
+from bunking.models_v2 import DirectPerson, DirectSolverInput
+
+
+def _solver_input(num_persons: int) -> DirectSolverInput:
+    persons = [
+        DirectPerson(
+            campminder_person_id=i,
+            first_name=f"P{i}",
+            last_name="Test",
+            gender="M",
+            grade=5,
+            birthdate="2013-06-15",
+            session_cm_id=1000,
+        )
+        for i in range(num_persons)
+    ]
+    return DirectSolverInput(persons=persons, requests=[], bunks=[])
+
+
+class TestAllocateWorkers:
+    """Tests for allocate_workers."""
+
+    def test_even_split(self):
+        assert allocate_workers(8, 2) == 4
+
+    def test_remainder_goes_to_first(self):
+        assert allocate_workers(7, 2) == 4
+
+    def test_at_least_one_worker(self):
+        assert allocate_workers(0, 3) == 1
+        assert allocate_workers(2, 4) == 1
+
+    def test_never_more_than_available(self):
+        assert allocate_workers(1, 1) == 1
+        assert allocate_workers(3, 1) == 3
+
+
+class TestRunMultiSessionSolve:
+    """Tests for run_multi_session_solve."""
+
+    @pytest.fixture
+    def runs(self):
+        """Create a parent run with three child runs and clean up afterwards."""
+        sizes = {"child-a": 10, "child-b": 50, "child-c": 30}
+        for run_id in sizes:
+            solver_runs[run_id] = {"id": run_id, "status": "pending", "session_cm_id": sizes[run_id]}
+        solver_runs["parent"] = {"id": "parent", "status": "pending", "child_run_ids": list(sizes)}
+        yield sizes
+        for run_id in [*sizes, "parent"]:
+            solver_runs.pop(run_id, None)
+
+    @pytest.mark.asyncio
+    async def test_largest_first_within_budget(self, runs):
+        """Sessions start largest-first and running solves never exceed the budget."""
+        started: list[tuple[str, int]] = []
+        in_use = {"workers": 0, "peak": 0}
+
+        async def fake_load(task_pb, session_cm_id, *args, **kwargs):
+            return _solver_input(session_cm_id)
+
+        async def fake_run(run_id, *args, solver_input=None, num_workers=None, **kwargs):
+            started.append((run_id, num_workers))
+            in_use["workers"] += num_workers
+            in_use["peak"] = max(in_use["peak"], in_use["workers"])
+            await asyncio.sleep(0.01)
+            in_use["workers"] -= num_workers
+            solver_runs[run_id]["status"] = "completed"
+
+        sessions = [SessionSolve(run_id=run_id, session_cm_id=size) for run_id, size in runs.items()]
+        with (
+            patch("api.services.multi_session_scheduler.create_task_pb_client"),
+            patch("api.services.multi_session_scheduler.authenticate_task_pb", new=AsyncMock()),
+            patch("api.services.multi_session_scheduler.load_solver_input", side_effect=fake_load),
+            patch("api.services.multi_session_scheduler.run_solver_task_v2", side_effect=fake_run),
+        ):
+            await run_multi_session_solve("parent", sessions, 2025, True, 10, max_concurrent=2, worker_budget=8)
+
+        assert [run_id for run_id, _ in started] == ["child-b", "child-c", "child-a"]
+        assert started[0][1] == 4
+        assert started[1][1] == 4
+        assert in_use["peak"] <= 8
+        assert solver_runs["parent"]["status"] == "completed"
+        assert solver_runs["parent"]["progress"]["completed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_load_failure_marks_child_failed(self, runs):
+        """A session whose data cannot be loaded fails without blocking the others."""
+
+        async def fake_load(task_pb, session_cm_id, *args, **kwargs):
+            if session_cm_id == 30:
+                raise RuntimeError("boom")
+            return _solver_input(session_cm_id)
+
+        async def fake_run(run_id, *args, **kwargs):
+            solver_runs[run_id]["status"] = "completed"
+
+        sessions = [SessionSolve(run_id=run_id, session_cm_id=size) for run_id, size in runs.items()]
+        with (
+            patch("api.services.multi_session_scheduler.create_task_pb_client"),
+            patch("api.services.multi_session_scheduler.authenticate_task_pb", new=AsyncMock()),
+            patch("api.services.multi_session_scheduler.load_solver_input", side_effect=fake_load),
+            patch("api.services.multi_session_scheduler.run_solver_task_v2", side_effect=fake_run),
+        ):
+            await run_multi_session_solve("parent", sessions, 2025, True, 10, max_concurrent=2, worker_budget=4)
+
+        assert solver_runs["child-c"]["status"] == "failed"
+        assert "boom" in solver_runs["child-c"]["error_message"]
+        assert solver_runs["parent"]["status"] == "completed"
+        assert solver_runs["parent"]["error_message"] == "1 of 3 sessions failed"
+
+    @pytest.mark.asyncio
+    async def test_workers_return_when_solve_ends_before_results_are_recorded(self, runs):
+        """A finished solve frees its workers while its task is still recording results."""
+        started: list[tuple[str, int]] = []
+        recording = asyncio.Event()
+
+        async def fake_load(task_pb, session_cm_id, *args, **kwargs):
+            return _solver_input(session_cm_id)
+
+        async def fake_run(run_id, *args, solver_input=None, num_workers=None, **kwargs):
+            started.append((run_id, num_workers))
+            solver_runs[run_id]["status"] = "completed"
+            if run_id == "child-b":
+                # Still saving results when the next session starts
+                await recording.wait()
+            elif run_id == "child-a":
+                recording.set()
+
+        sessions = [SessionSolve(run_id=run_id, session_cm_id=size) for run_id, size in runs.items()]
+        with (
+            patch("api.services.multi_session_scheduler.PARENT_PROGRESS_INTERVAL_SECONDS", 0.01),
+            patch("api.services.multi_session_scheduler.create_task_pb_client"),
+            patch("api.services.multi_session_scheduler.authenticate_task_pb", new=AsyncMock()),
+            patch("api.services.multi_session_scheduler.load_solver_input", side_effect=fake_load),
+            patch("api.services.multi_session_scheduler.run_solver_task_v2", side_effect=fake_run),
+        ):
+            await run_multi_session_solve("parent", sessions, 2025, True, 10, max_concurrent=1, worker_budget=2)
+
+        assert started == [("child-b", 2), ("child-c", 2), ("child-a", 2)]
+        assert solver_runs["parent"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_parent_is_not_marked_completed(self, runs):
+        """Cancelling mid-run fails the parent even when a running session completed."""
+
+        async def fake_load(task_pb, session_cm_id, *args, **kwargs):
+            return _solver_input(session_cm_id)
+
+        async def fake_run(run_id, *args, **kwargs):
+            solver_runs["parent"]["cancel_requested"] = True
+            solver_runs[run_id]["status"] = "completed"
+
+        sessions = [SessionSolve(run_id=run_id, session_cm_id=size) for run_id, size in runs.items()]
+        with (
+            patch("api.services.multi_session_scheduler.create_task_pb_client"),
+            patch("api.services.multi_session_scheduler.authenticate_task_pb", new=AsyncMock()),
+            patch("api.services.multi_session_scheduler.load_solver_input", side_effect=fake_load),
+            patch("api.services.multi_session_scheduler.run_solver_task_v2", side_effect=fake_run),
+        ):
+            await run_multi_session_solve("parent", sessions, 2025, True, 10, max_concurrent=1, worker_budget=2)
+
+        assert solver_runs["parent"]["status"] == "failed"
+        assert solver_runs["parent"]["cancelled"] is True
+        assert solver_runs["child-c"]["cancelled"] is True
+
+    def test_summarize_children(self, runs):
+        solver_runs["child-a"]["status"] = "running"
+        solver_runs["child-a"]["progress"] = {"phase": "solving"}
+
+        summary: dict[str, Any] = summarize_children(list(runs))
+
+        assert summary["total"] == 3
+        assert summary["running"] == 1
+        assert summary["pending"] == 2
+        assert summary["sessions"]["child-a"]["progress"] == {"phase": "solving"}
@@ -0,0 +1,152 @@
+"""
+Unit tests for the session snapshot cache.
+
+Tests reuse of prepared solver input and other prepared values, change
+detection through collection version probes, and explicit invalidation. PocketBase is replaced by a fake
+client whose per-collection (count, updated) versions can be changed.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from api.services.session_snapshot import SessionSnapshotCache
+from bunking.models_v2 import DirectPerson, DirectSolverInput
+
+
+class FakeVersionedClient:
+    """Client whose get_list reports a settable version per collection."""
+
+    def __init__(self) -> None:
+        self.versions: dict[str, tuple[int, str]] = {}
+        self.probe_count = 0
+
+    def collection(self, name: str) -> Any:
+        def get_list(page: int, per_page: int, query_params: dict[str, Any]) -> Any:
+            self.probe_count += 1
+            total, updated = self.versions.get(name, (1, "2025-01-01 00:00:00.000Z"))
+            return SimpleNamespace(total_items=total, items=[SimpleNamespace(updated=updated)])
+
+        return SimpleNamespace(get_list=get_list)
+
+
+def _solver_input() -> DirectSolverInput:
+    person = DirectPerson(
+        campminder_person_id=1,
+        first_name="A",
+        last_name="B",
+        gender="M",
+        grade=5,
+        birthdate="2013-06-15",
+        session_cm_id=1000,
+    )
+    return DirectSolverInput(persons=[person], requests=[], bunks=[])
+
+
+@pytest.fixture
+def loader_calls() -> list[int]:
+    return []
+
+
+@pytest.fixture
+def loader(loader_calls):
+    async def load() -> DirectSolverInput:
+        loader_calls.append(1)
+        return _solver_input()
+
+    return load
+
+
+class TestSessionSnapshotCache:
+    """Tests for SessionSnapshotCache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_within_revalidate_window_skips_probes(self, loader, loader_calls):
+        client: Any = FakeVersionedClient()
+        cache = SessionSnapshotCache(revalidate_seconds=60)
+
+        await cache.get_solver_input(client, 1000, 2025, None, loader)
+        probes_after_load = client.probe_count
+        await cache.get_solver_input(client, 1000, 2025, None, loader)
+
+        assert len(loader_calls) == 1
+        assert client.probe_count == probes_after_load
+        assert cache.get_stats()["hit_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_versions_hit_and_changes_reload(self, loader, loader_calls):
+        client: Any = FakeVersionedClient()
+        cache = SessionSnapshotCache(revalidate_seconds=0)
+
+        await cache.get_solver_input(client, 1000, 2025, None, loader)
+        await cache.get_solver_input(client, 1000, 2025, None, loader)
+        assert len(loader_calls) == 1
+
+        # A deleted request changes the row count even though `updated` does not move
+        client.versions["bunk_requests"] = (0, "2025-01-01 00:00:00.000Z")
+        await cache.get_solver_input(client, 1000, 2025, None, loader)
+        assert len(loader_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_returned_input_is_a_copy(self, loader):
+        client: Any = FakeVersionedClient()
+        cache = SessionSnapshotCache(revalidate_seconds=60)
+
+        first = await cache.get_solver_input(client, 1000, 2025, None, loader)
+        first.persons.clear()
+        second = await cache.get_solver_input(client, 1000, 2025, None, loader)
+
+        assert len(second.persons) == 1
+        snapshot = cache.get_snapshot(1000, 2025)
+        assert snapshot is not None
+        assert 1 in snapshot.persons_by_cm_id
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_scenario_and_session(self, loader, loader_calls):
+        client: Any = FakeVersionedClient()
+        cache = SessionSnapshotCache(revalidate_seconds=60)
+        await cache.get_solver_input(client, 1000, 2025, None, loader)
+        await cache.get_solver_input(client, 1000, 2025, "scenario-a", loader)
+        await cache.get_solver_input(client, 2000, 2025, None, loader)
+
+        assert cache.invalidate(scenario="scenario-a") == 1
+        assert cache.invalidate(session_cm_id=1000) == 1
+        assert cache.get_snapshot(2000, 2025) is not None
+        assert cache.clear() == 1
+
+    @pytest.mark.asyncio
+    async def test_probe_failure_loads_uncached(self, loader, loader_calls):
+        def failing_collection(name: str) -> Any:
+            raise RuntimeError("pocketbase down")
+
+        client: Any = SimpleNamespace(collection=failing_collection)
+        cache = SessionSnapshotCache()
+
+        await cache.get_solver_input(client, 1000, 2025, None, loader)
+
+        assert len(loader_calls) == 1
+        assert cache.get_snapshot(1000, 2025) is None
+
+    @pytest.mark.asyncio
+    async def test_prepared_values_cached_per_kind_and_invalidated_together(self, loader, loader_calls):
+        client: Any = FakeVersionedClient()
+        cache = SessionSnapshotCache(revalidate_seconds=60)
+        prepared_calls: list[int] = []
+
+        async def load_inputs() -> dict[str, list[int]]:
+            prepared_calls.append(1)
+            return {"persons": [1, 2]}
+
+        await cache.get_solver_input(client, 1000, 2025, None, loader)
+        first = await cache.get_prepared(client, 1000, 2025, None, "validation_inputs", load_inputs)
+        first["persons"].clear()
+        second = await cache.get_prepared(client, 1000, 2025, None, "validation_inputs", load_inputs)
+
+        assert second == {"persons": [1, 2]}
+        assert (len(loader_calls), len(prepared_calls)) == (1, 1)
+        assert cache.invalidate(session_cm_id=1000) == 2
+        await cache.get_prepared(client, 1000, 2025, None, "validation_inputs", load_inputs)
+        assert len(prepared_calls) == 2
@@ -0,0 +1,181 @@
+"""
+Unit tests for SolverExecutor service.
+
+Uses a real process pool with lightweight worker functions in place of the
+solver, so queueing, progress and cancellation are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from api.services.solver_executor import (
+    SolveJob,
+    SolveOutcome,
+    SolverExecutor,
+    SolverQueueFullError,
+)
+from bunking.models_v2 import DirectSolverInput
+
+
+def _reporting_worker(job: Any, progress_queue: Any, cancel_event: Any) -> SolveOutcome:
+    """Worker that reports progress and returns immediately."""
+    progress_queue.put({"phase": "solving", "solutions": 1})
+    return SolveOutcome(output=None, infeasibility_cause=f"limit={job.time_limit}")
+
+
+def _blocking_worker(job: Any, progress_queue: Any, cancel_event: Any) -> SolveOutcome:
+    """Worker that runs until cancelled (or the time limit elapses)."""
+    progress_queue.put({"phase": "solving"})
+    deadline = time.monotonic() + job.time_limit
+    while time.monotonic() < deadline:
+        if cancel_event.wait(0.05):
+            return SolveOutcome(output=None, cancelled=True)
+    return SolveOutcome(output=None)
+
+
+def _make_job(time_limit: int = 1) -> SolveJob:
+    """Build a job; fake workers never look at the solver input."""
+    return SolveJob(solver_input=DirectSolverInput(persons=[], requests=[], bunks=[]), time_limit=time_limit)
+
+
+@pytest.fixture
+def make_executor():
+    """Create executors and make sure their pools are shut down."""
+    executors: list[SolverExecutor] = []
+
+    def factory(**kwargs: Any) -> SolverExecutor:
+        executor = SolverExecutor(**kwargs)
+        executors.append(executor)
+        return executor
+
+    yield factory
+    for executor in executors:
+        executor.shutdown()
+
+
+class TestSolverExecutor:
+    """Tests for SolverExecutor."""
+
+    def test_pool_not_started_until_first_run(self):
+        """Constructing the executor does not spawn processes."""
+        executor = SolverExecutor(max_workers=1, max_pending=2)
+
+        assert executor._pool is None
+        assert executor._manager is None
+        assert executor.pending_count == 0
+        assert not executor.is_full
+
+    @pytest.mark.asyncio
+    async def test_run_returns_outcome_and_progress(self, make_executor):
+        """Outcome comes back from the worker and progress is delivered."""
+        executor = make_executor(max_workers=1, max_pending=2, worker=_reporting_worker)
+        progress: list[dict[str, Any]] = []
+
+        outcome = await executor.run("run-1", _make_job(time_limit=7), on_progress=progress.append)
+
+        assert outcome.infeasibility_cause == "limit=7"
+        assert not outcome.cancelled
+        assert {"phase": "solving", "solutions": 1} in progress
+        assert executor.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job(self, make_executor):
+        """Cancelling a running job signals the worker to stop."""
+        executor = make_executor(max_workers=1, max_pending=2, worker=_blocking_worker)
+        progress: list[dict[str, Any]] = []
+
+        task = asyncio.create_task(executor.run("run-1", _make_job(time_limit=30), on_progress=progress.append))
+        while not progress:
+            await asyncio.sleep(0.05)
+
+        assert executor.cancel("run-1")
+        outcome = await asyncio.wait_for(task, timeout=10)
+
+        assert outcome.cancelled
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_job(self, make_executor):
+        """A job still waiting for a worker is dropped without running."""
+        executor = make_executor(max_workers=1, max_pending=3, worker=_blocking_worker)
+        progress: list[dict[str, Any]] = []
+
+        running = asyncio.create_task(executor.run("run-1", _make_job(time_limit=30), on_progress=progress.append))
+        while not progress:
+            await asyncio.sleep(0.05)
+        queued = asyncio.create_task(executor.run("run-2", _make_job(time_limit=30)))
+        while executor.pending_count < 2:
+            await asyncio.sleep(0.01)
+
+        assert executor.cancel("run-2")
+        executor.cancel("run-1")
+        await asyncio.wait_for(running, timeout=10)
+        queued_outcome = await asyncio.wait_for(queued, timeout=10)
+
+        assert queued_outcome.cancelled
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejects_run(self, make_executor):
+        """Runs beyond max_pending are rejected."""
+        executor = make_executor(max_workers=1, max_pending=1, worker=_blocking_worker)
+        progress: list[dict[str, Any]] = []
+
+        task = asyncio.create_task(executor.run("run-1", _make_job(time_limit=30), on_progress=progress.append))
+        while not progress:
+            await asyncio.sleep(0.05)
+
+        assert executor.is_full
+        assert not executor.has_capacity()
+        with pytest.raises(SolverQueueFullError):
+            await executor.run("run-2", _make_job())
+
+        executor.cancel("run-1")
+        await asyncio.wait_for(task, timeout=10)
+        assert executor.has_capacity()
+
+    @pytest.mark.asyncio
+    async def test_reserved_slot_counts_toward_queue(self, make_executor):
+        """A reserved run holds its slot until it is submitted and finishes."""
+        executor = make_executor(max_workers=1, max_pending=1, worker=_reporting_worker)
+
+        assert executor.reserve("run-1")
+        assert executor.is_full
+        assert not executor.reserve("run-2")
+        with pytest.raises(SolverQueueFullError):
+            await executor.run("run-2", _make_job())
+
+        outcome = await executor.run("run-1", _make_job(time_limit=3))
+
+        assert outcome.infeasibility_cause == "limit=3"
+        assert executor.pending_count == 0
+
+    def test_release_frees_reserved_slot(self):
+        """Releasing a reservation gives its slot back."""
+        executor = SolverExecutor(max_workers=1, max_pending=1)
+
+        assert executor.reserve("run-1")
+        executor.release("run-1")
+
+        assert executor.has_capacity()
+
+    @pytest.mark.asyncio
+    async def test_cancel_reserved_run(self, make_executor):
+        """A run cancelled while reserved is never submitted."""
+        executor = make_executor(max_workers=1, max_pending=1, worker=_reporting_worker)
+        executor.reserve("run-1")
+
+        assert executor.cancel("run-1")
+        outcome = await executor.run("run-1", _make_job())
+
+        assert outcome.cancelled
+        assert executor.pending_count == 0
+
+    def test_cancel_unknown_run(self):
+        """Cancelling a run the executor does not know returns False."""
+        executor = SolverExecutor(max_workers=1, max_pending=1)
+
+        assert executor.cancel("missing") is False
@@ -0,0 +1,45 @@
+"""Tests for RequestGraph adjacency and union-find components."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from bunking.graph.request_graph import RequestGraph
+
+
+class TestRequestGraph:
+    """Tests for RequestGraph"""
+
+    def test_forward_and_reverse_adjacency(self):
+        graph = RequestGraph([(1, 2), (3, 2)])
+
+        assert graph.successors[1] == {2}
+        assert graph.predecessors[2] == {1, 3}
+        assert graph.neighbors(2) == {1, 3}
+        assert graph.neighbors(99) == set()
+
+    def test_components_follow_edges_in_both_directions(self):
+        graph = RequestGraph([(1, 2), (3, 2), (4, 5), (5, 6), (6, 4)])
+
+        assert graph.components() == [{1, 2, 3}, {4, 5, 6}]
+        assert graph.component_of(3) == graph.component_of(1)
+        assert graph.component_of(4) != graph.component_of(1)
+        assert graph.component_size(2) == 3
+        assert graph.component_of(99) is None
+
+    def test_components_min_size(self):
+        graph = RequestGraph([(1, 2), (2, 3), (7, 8)])
+
+        assert graph.components(min_size=3) == [{1, 2, 3}]
+
+    def test_from_requests_keeps_only_matching_type(self):
+        requests = [
+            SimpleNamespace(request_type="bunk_with", requester_person_cm_id="10", requested_person_cm_id="20"),
+            SimpleNamespace(request_type="not_bunk_with", requester_person_cm_id="10", requested_person_cm_id="30"),
+            SimpleNamespace(request_type="bunk_with", requester_person_cm_id="40", requested_person_cm_id=None),
+        ]
+
+        graph = RequestGraph.from_requests(requests)
+
+        assert graph.successors == {10: {20}}
+        assert 30 not in graph and 40 not in graph
@@ -102,6 +102,12 @@ class MinimalConfigLoader:
         key = f"constraint.{constraint_type}.{param}"
         return self.get_int(key, default)
 
+    def get_soft_constraint_weight(self, constraint_name: str, default: int | None = None) -> int:
+        """Get soft constraint weight (penalty keys as in ConfigLoader)."""
+        penalty_keys = {"must_satisfy_one", "grade_spread", "age_spread"}
+        suffix = "penalty" if constraint_name in penalty_keys else "weight"
+        return self.get_int(f"constraint.{constraint_name}.{suffix}", default or 0)
+
 
 def create_person(
     cm_id: int,
@@ -0,0 +1,95 @@
+"""
+Unit tests for symmetry breaking between interchangeable bunks.
+
+Bunks with the same session, gender, capacity and level are grouped unless a
+lock, the minimal-change penalty or age/grade flow tells them apart.
+"""
+
+from __future__ import annotations
+
+from ortools.sat.python import cp_model
+
+from bunking.models_v2 import DirectBunk, DirectBunkAssignment, DirectPerson
+from bunking.solver.constraints.base import SolverContext
+from bunking.solver.constraints.symmetry import add_symmetry_breaking_constraints, find_interchangeable_bunks
+
+from ..conftest import build_solver_context, create_bunk, create_person, is_optimal_or_feasible
+
+NO_FLOW: dict[str, int | float | str | bool] = {
+    "constraint.age_grade_flow.weight": 0,
+    "solver.symmetry_breaking.enabled": 1,
+}
+
+
+def _campers(count: int) -> list[DirectPerson]:
+    return [create_person(1001 + i, f"Camper{i}", "Test", "F", 6) for i in range(count)]
+
+
+def _girls_bunks() -> list[DirectBunk]:
+    """G-5 and G-7 are the edge bunks, so the level-6 bunks are only told apart by name."""
+    return [
+        create_bunk(2000, "G-5", "F"),
+        create_bunk(2002, "G-6B", "F"),
+        create_bunk(2001, "G-6A", "F"),
+        create_bunk(2003, "G-7", "F"),
+    ]
+
+
+def _class_names(ctx: SolverContext) -> list[list[str]]:
+    return [[ctx.bunks[b].name for b in bunk_idxs] for bunk_idxs in find_interchangeable_bunks(ctx)]
+
+
+class TestFindInterchangeableBunks:
+    """Test equivalence class detection."""
+
+    def test_same_level_bunks_grouped_in_rank_order(self):
+        bunks = [*_girls_bunks(), create_bunk(2004, "G-6C", "F", capacity=10)]
+        ctx = build_solver_context(persons=_campers(4), bunks=bunks, config_overrides=NO_FLOW)
+
+        assert _class_names(ctx) == [["G-6A", "G-6B"]]
+
+    def test_age_grade_flow_keeps_gendered_bunks_distinct(self):
+        ctx = build_solver_context(
+            persons=_campers(4), bunks=_girls_bunks(), config_overrides={"solver.symmetry_breaking.enabled": 1}
+        )
+
+        assert _class_names(ctx) == []
+
+    def test_locked_bunk_excluded(self):
+        bunks = [*_girls_bunks(), create_bunk(2004, "G-6C", "F")]
+        ctx = build_solver_context(persons=_campers(4), bunks=bunks, config_overrides=NO_FLOW)
+        ctx.input.existing_assignments.append(
+            DirectBunkAssignment(person_cm_id=1001, session_cm_id=1000, bunk_cm_id=2001, year=2025, is_locked=True)
+        )
+
+        assert _class_names(ctx) == [["G-6B", "G-6C"]]
+
+
+class TestSymmetryBreakingConstraints:
+    """Test the ordering constraints on the model."""
+
+    def test_lowest_camper_goes_to_first_bunk(self):
+        ctx = build_solver_context(persons=_campers(4), bunks=_girls_bunks(), config_overrides=NO_FLOW)
+        g6a, g6b = ctx.bunk_idx_map[2001], ctx.bunk_idx_map[2002]
+        # Everyone goes to G-6A or G-6B, and camper 0 must not share a bunk with camper 1
+        for person_idx in range(4):
+            ctx.model.AddAllowedAssignments([ctx.person_bunk_assignment[person_idx]], [[g6a], [g6b]])
+        ctx.model.Add(ctx.person_bunk_assignment[0] != ctx.person_bunk_assignment[1])
+
+        add_symmetry_breaking_constraints(ctx)
+
+        solver = cp_model.CpSolver()
+        status = solver.Solve(ctx.model)
+
+        assert is_optimal_or_feasible(status)
+        assert solver.Value(ctx.person_bunk_assignment[0]) == g6a
+
+    def test_disabled_by_default(self):
+        ctx = build_solver_context(
+            persons=_campers(2), bunks=_girls_bunks(), config_overrides={"constraint.age_grade_flow.weight": 0}
+        )
+        num_constraints = len(ctx.model.Proto().constraints)
+
+        add_symmetry_breaking_constraints(ctx)
+
+        assert len(ctx.model.Proto().constraints) == num_constraints
@@ -0,0 +1,85 @@
+"""
+Tests for assumption-based infeasibility analysis.
+
+find_infeasibility_cause gates hard constraints behind assumption literals and
+reports the subset CP-SAT proves infeasible, instead of re-solving once per
+disabled constraint family.
+"""
+
+from __future__ import annotations
+
+from bunking.models_v2 import DirectBunkAssignment, DirectSolverInput
+from bunking.solver import DirectBunkingSolver
+from bunking.solver.feasibility import find_infeasibility_cause
+
+from .conftest import MinimalConfigLoader, create_bunk, create_person
+
+
+def _config() -> MinimalConfigLoader:
+    """Small bunks, so the minimum occupancy must not exceed one camper."""
+    return MinimalConfigLoader({"constraint.cabin_minimum_occupancy.min": 1})
+
+
+def _locked(person_cm_id: int, bunk_cm_id: int) -> DirectBunkAssignment:
+    return DirectBunkAssignment(
+        person_cm_id=person_cm_id, session_cm_id=1000, bunk_cm_id=bunk_cm_id, year=2025, is_locked=True
+    )
+
+
+def _input(locks: list[DirectBunkAssignment]) -> DirectSolverInput:
+    """Three boys, a two-bed and a three-bed boys' bunk."""
+    persons = [
+        create_person(1, "Adam", "A", "M", 5),
+        create_person(2, "Ben", "B", "M", 5),
+        create_person(3, "Cal", "C", "M", 5),
+    ]
+    bunks = [create_bunk(10, "B-5", "M", capacity=2), create_bunk(11, "B-6", "M", capacity=3)]
+    return DirectSolverInput(persons=persons, requests=[], bunks=bunks, existing_assignments=locks)
+
+
+class TestAssumptionTracking:
+    """Tests for gating constraints behind assumption literals."""
+
+    def test_no_assumptions_by_default(self):
+        solver = DirectBunkingSolver(_input([_locked(1, 10)]), MinimalConfigLoader())  # type: ignore[arg-type]
+        solver.add_constraints()
+
+        assert solver.assumptions == {}
+        # Locked camper only gets a variable for the locked bunk
+        assert solver.person_bunks[solver.person_idx_map[1]] == [solver.bunk_idx_map[10]]
+
+    def test_locks_gated_individually(self):
+        locks = [_locked(1, 10), _locked(2, 10)]
+        solver = DirectBunkingSolver(_input(locks), MinimalConfigLoader(), track_assumptions=True)  # type: ignore[arg-type]
+        solver.add_constraints()
+
+        descriptions = set(solver.assumptions.values())
+        assert "manual_lock: Adam A (1) locked to B-5" in descriptions
+        assert "manual_lock: Ben B (2) locked to B-5" in descriptions
+        assert "cabin_capacity: B-5 holds at most 2" in descriptions
+
+
+class TestFindInfeasibilityCause:
+    """Tests for the single-solve infeasibility explanation."""
+
+    def test_feasible_problem(self):
+        result = find_infeasibility_cause(_input([_locked(1, 10)]), _config())  # type: ignore[arg-type]
+
+        assert result == "No infeasibility found - problem is solvable!"
+
+    def test_conflicting_locks_reported(self):
+        locks = [_locked(1, 10), _locked(2, 10), _locked(3, 10)]
+
+        result = find_infeasibility_cause(_input(locks), _config())  # type: ignore[arg-type]
+
+        assert result.startswith("Conflicting constraints: ")
+        assert "cabin_capacity: B-5 holds at most 2" in result
+        assert "locked to B-5" in result
+        # The other bunk plays no part in the conflict
+        assert "B-6" not in result
+
+    def test_minimum_occupancy_reported(self):
+        # Default minimum of 8 per used bunk cannot be met with three campers
+        result = find_infeasibility_cause(_input([]), MinimalConfigLoader())  # type: ignore[arg-type]
+
+        assert result == "Conflicting constraints: cabin_minimum_occupancy"
@@ -0,0 +1,92 @@
+"""
+Tests for neighborhood selection used by incremental scenario re-solves.
+
+Only the occupants of affected bunks, request partners of the edited campers
+and unassigned campers stay free; everyone else is locked in place.
+"""
+
+from __future__ import annotations
+
+from bunking.models_v2 import DirectBunkAssignment, DirectBunkRequest, DirectSolverInput
+from bunking.solver import DirectBunkingSolver
+from bunking.solver.neighborhood import build_neighborhood_input, select_neighborhood
+
+from .conftest import MinimalConfigLoader, create_bunk, create_person
+
+
+def _assignment(person_cm_id: int, bunk_cm_id: int, group_lock_id: str | None = None) -> DirectBunkAssignment:
+    return DirectBunkAssignment(
+        person_cm_id=person_cm_id,
+        session_cm_id=1000,
+        bunk_cm_id=bunk_cm_id,
+        year=2025,
+        is_locked=group_lock_id is not None,
+        group_lock_id=group_lock_id,
+    )
+
+
+def _request(requester: int, requested: int) -> DirectBunkRequest:
+    return DirectBunkRequest(
+        id=f"req-{requester}-{requested}",
+        requester_person_cm_id=requester,
+        requested_person_cm_id=requested,
+        request_type="bunk_with",
+        session_cm_id=1000,
+        year=2025,
+    )
+
+
+def _session() -> DirectSolverInput:
+    """Eight boys over three bunks; camper 8 is unassigned, 6 and 7 are group-locked."""
+    persons = [create_person(i, f"P{i}", "Test", "M", 5) for i in range(1, 9)]
+    bunks = [create_bunk(10, "B-1", "M"), create_bunk(11, "B-2", "M"), create_bunk(12, "B-3", "M")]
+    assignments = [
+        _assignment(1, 10),
+        _assignment(2, 10),
+        _assignment(3, 11),
+        _assignment(4, 11),
+        _assignment(5, 12),
+        _assignment(6, 12, group_lock_id="g1"),
+        _assignment(7, 11, group_lock_id="g1"),
+    ]
+    requests = [_request(1, 5), _request(4, 3)]
+    return DirectSolverInput(persons=persons, requests=requests, bunks=bunks, existing_assignments=assignments)
+
+
+class TestSelectNeighborhood:
+    """Tests for select_neighborhood."""
+
+    def test_bunkmates_partners_and_unassigned(self):
+        free = select_neighborhood(_session(), [1])
+
+        # 2 shares camper 1's bunk, 5 is a request partner, 8 has no bunk yet
+        assert free == {1, 2, 5, 8}
+
+    def test_extra_bunks_and_whole_groups(self):
+        free = select_neighborhood(_session(), [1], bunk_cm_ids=[11])
+
+        # Bunk 11 frees 3, 4 and 7; 7's group lock pulls in 6
+        assert free == {1, 2, 3, 4, 5, 6, 7, 8}
+
+
+class TestBuildNeighborhoodInput:
+    """Tests for build_neighborhood_input."""
+
+    def test_fixed_campers_locked_and_free_campers_hinted(self):
+        input_data = _session()
+
+        result = build_neighborhood_input(input_data, {1, 2, 5, 8}, pinned={1: 11})
+
+        assert result.locked_assignments == {1: 11, 3: 11, 4: 11, 6: 12, 7: 11}
+        assert result.group_locks == {}
+        assert result.solution_hints == {1: 11, 2: 10, 5: 12}
+        # The full input is left untouched
+        assert input_data.locked_assignments == {}
+
+    def test_locked_campers_get_a_single_variable(self):
+        result = build_neighborhood_input(_session(), {1, 2, 5, 8})
+
+        solver = DirectBunkingSolver(result, MinimalConfigLoader())  # type: ignore[arg-type]
+
+        assert len(solver.person_bunks[solver.person_idx_map[3]]) == 1
+        assert len(solver.person_bunks[solver.person_idx_map[1]]) == 3
@@ -0,0 +1,78 @@
+"""
+Tests for the precomputed problem index.
+
+The index is built once per solve and must agree with the per-call helpers
+it replaces (eligible campers, edge bunk classification, pair-valid bunks).
+"""
+
+from __future__ import annotations
+
+from bunking.models_v2 import DirectSolverInput
+from bunking.solver import DirectBunkingSolver
+from bunking.solver.constraints.helpers import is_edge_bunk_for_grades
+
+from .conftest import MinimalConfigLoader, build_solver_context, create_bunk, create_person
+
+
+def _session_input() -> DirectSolverInput:
+    """Three boys bunks, one girls bunk and a Mixed bunk in one session."""
+    persons = [
+        create_person(1, "Adam", "A", "M", 4),
+        create_person(2, "Ben", "B", "M", 5),
+        create_person(3, "Cal", "C", "M", 5),
+        create_person(4, "Dina", "D", "F", 5),
+        create_person(5, "Eve", "E", "F", 6, session_cm_id=2000),
+    ]
+    bunks = [
+        create_bunk(10, "B-4", "M"),
+        create_bunk(11, "B-5", "M"),
+        create_bunk(12, "B-6", "M"),
+        create_bunk(13, "G-5", "F"),
+        create_bunk(14, "Mixed-1", "Mixed"),
+    ]
+    return DirectSolverInput(persons=persons, requests=[], bunks=bunks)
+
+
+class TestProblemIndex:
+    """Tests for ProblemIndex lookups."""
+
+    def test_eligible_by_grade_groups_eligible_campers(self):
+        solver = DirectBunkingSolver(_session_input(), MinimalConfigLoader())  # type: ignore[arg-type]
+        index = solver.problem_index
+
+        b5 = solver.bunk_idx_map[11]
+        assert [solver.person_ids[p] for p, _ in index.eligible_campers[b5]] == [1, 2, 3]
+        assert {grade: len(idxs) for grade, idxs in index.eligible_by_grade[b5].items()} == {4: 1, 5: 2}
+
+    def test_edge_types_match_helper(self):
+        solver = DirectBunkingSolver(_session_input(), MinimalConfigLoader())  # type: ignore[arg-type]
+
+        for bunk_idx, bunk in enumerate(solver.bunks):
+            assert solver.problem_index.is_edge_bunk(bunk_idx) == is_edge_bunk_for_grades(bunk, solver.bunks)
+
+    def test_valid_bunks_for_pair(self):
+        solver = DirectBunkingSolver(_session_input(), MinimalConfigLoader())  # type: ignore[arg-type]
+        index = solver.problem_index
+
+        def names(cm_id1: int, cm_id2: int) -> set[str]:
+            bunk_idxs = index.valid_bunks_for_pair(solver.person_idx_map[cm_id1], solver.person_idx_map[cm_id2])
+            return {solver.bunks[b].name for b in bunk_idxs}
+
+        assert names(1, 2) == {"B-4", "B-5", "B-6", "Mixed-1"}
+        assert names(1, 4) == {"Mixed-1"}
+        assert names(4, 5) == set()
+
+    def test_context_is_built_once(self):
+        solver = DirectBunkingSolver(_session_input(), MinimalConfigLoader())  # type: ignore[arg-type]
+
+        ctx = solver._build_solver_context()
+
+        assert solver._build_solver_context() is ctx
+        assert ctx.index is solver.problem_index
+
+    def test_standalone_context_builds_index(self):
+        persons = [create_person(1, "A", "A", "M", 5), create_person(2, "B", "B", "M", 6)]
+        ctx = build_solver_context(persons, [create_bunk(10, "B-5", "M")])
+
+        assert dict(ctx.index.persons_by_grade) == {5: (0,), 6: (1,)}
+        assert len(ctx.index.eligible_campers[0]) == 2
@@ -0,0 +1,122 @@
+"""
+Tests for the sparse assignment-variable layout.
+
+DirectBunkingSolver only creates assignment variables for bunks a camper may
+be placed in (same session, compatible gender). Constraint modules consume
+the sparse map through SolverContext.person_bunks / bunk_persons.
+"""
+
+from __future__ import annotations
+
+from bunking.models_v2 import DirectSolverInput
+from bunking.solver import DirectBunkingSolver
+from bunking.solver.constraints.base import build_assignment_index
+from bunking.solver.constraints.helpers import is_assignment_allowed
+
+from .conftest import MinimalConfigLoader, build_solver_context, create_bunk, create_person
+
+
+def _two_session_input() -> DirectSolverInput:
+    """Main session with B/G bunks plus an AG session with one AG bunk."""
+    persons = [
+        create_person(1, "Adam", "A", "M", 5, session_cm_id=1000),
+        create_person(2, "Beth", "B", "F", 5, session_cm_id=1000),
+        create_person(3, "Cal", "C", None, 5, session_cm_id=1000),
+        create_person(4, "Dana", "D", "F", 5, session_cm_id=2000),
+    ]
+    bunks = [
+        create_bunk(10, "B-5", "M", session_cm_id=1000),
+        create_bunk(11, "G-5", "F", session_cm_id=1000),
+        create_bunk(12, "AG-1", "AG", session_cm_id=2000),
+    ]
+    return DirectSolverInput(persons=persons, requests=[], bunks=bunks)
+
+
+def _eligible_names(solver: DirectBunkingSolver, person_cm_id: int) -> set[str]:
+    person_idx = solver.person_idx_map[person_cm_id]
+    return {solver.bunks[b].name for b in solver.person_bunks[person_idx]}
+
+
+class TestIsAssignmentAllowed:
+    """Tests for the eligibility rule that decides which variables exist."""
+
+    def test_session_mismatch_not_allowed(self):
+        person = create_person(1, "A", "A", "M", 5, session_cm_id=1000)
+        bunk = create_bunk(10, "B-5", "M", session_cm_id=2000)
+
+        assert not is_assignment_allowed(person, bunk)
+        assert is_assignment_allowed(person, bunk, check_session=False)
+
+    def test_gender_mismatch_not_allowed(self):
+        person = create_person(1, "A", "A", "M", 5)
+        bunk = create_bunk(10, "G-5", "F")
+
+        assert not is_assignment_allowed(person, bunk)
+        assert is_assignment_allowed(person, bunk, check_gender=False)
+
+    def test_missing_gender_and_mixed_bunks_allowed(self):
+        no_gender = create_person(1, "A", "A", None, 5)
+        male = create_person(2, "B", "B", "M", 5)
+
+        assert is_assignment_allowed(no_gender, create_bunk(10, "G-5", "F"))
+        assert is_assignment_allowed(male, create_bunk(11, "AG-1", "AG"))
+        assert is_assignment_allowed(male, create_bunk(12, "X-1", None))
+
+
+class TestSparseSolverVariables:
+    """Tests for the variables DirectBunkingSolver creates."""
+
+    def test_only_eligible_pairs_get_variables(self):
+        solver = DirectBunkingSolver(_two_session_input(), MinimalConfigLoader())  # type: ignore[arg-type]
+
+        assert len(solver.assignments) == 5
+        assert _eligible_names(solver, 1) == {"B-5"}
+        assert _eligible_names(solver, 2) == {"G-5"}
+        assert _eligible_names(solver, 3) == {"B-5", "G-5"}
+        assert _eligible_names(solver, 4) == {"AG-1"}
+
+    def test_int_var_domain_matches_eligible_bunks(self):
+        solver = DirectBunkingSolver(_two_session_input(), MinimalConfigLoader())  # type: ignore[arg-type]
+
+        proto = solver.model.Proto()
+        for person_idx, bunk_idxs in solver.person_bunks.items():
+            var_index = solver.person_bunk_assignment[person_idx].Index()
+            domain = list(proto.variables[var_index].domain)
+            values = {v for lo, hi in zip(domain[::2], domain[1::2], strict=True) for v in range(lo, hi + 1)}
+            assert values == set(bunk_idxs)
+
+    def test_disabled_debug_constraints_keep_pairs(self):
+        solver = DirectBunkingSolver(
+            _two_session_input(),
+            MinimalConfigLoader(),  # type: ignore[arg-type]
+            debug_constraints={"session_boundary": True, "gender": True},
+        )
+
+        assert len(solver.assignments) == 4 * 3
+
+    def test_context_shares_sparse_index(self):
+        solver = DirectBunkingSolver(_two_session_input(), MinimalConfigLoader())  # type: ignore[arg-type]
+        ctx = solver._build_solver_context()
+
+        ag_idx = solver.bunk_idx_map[12]
+        assert ctx.bunk_persons[ag_idx] == [solver.person_idx_map[4]]
+        assert len(ctx.bunk_vars(ag_idx)) == 1
+
+
+class TestAssignmentIndex:
+    """Tests for deriving the sparse index from assignment keys."""
+
+    def test_build_assignment_index_includes_empty_entries(self):
+        person_bunks, bunk_persons = build_assignment_index({(0, 1): None, (2, 1): None, (0, 0): None}, 3, 3)
+
+        assert person_bunks == {0: [0, 1], 1: [], 2: [1]}
+        assert bunk_persons == {0: [0], 1: [0, 2], 2: []}
+
+    def test_dense_context_derives_index(self):
+        persons = [create_person(1, "A", "A", "M", 5), create_person(2, "B", "B", "M", 5)]
+        bunks = [create_bunk(10, "B-5", "M"), create_bunk(11, "B-6", "M")]
+
+        ctx = build_solver_context(persons, bunks)
+
+        assert ctx.person_bunks == {0: [0, 1], 1: [0, 1]}
+        assert ctx.bunk_persons == {0: [0, 1], 1: [0, 1]}
@@ -0,0 +1,87 @@
+"""
+Tests for warm-starting DirectBunkingSolver.
+
+DirectSolverInput.solution_hints (person_cm_id -> bunk_cm_id) is fed to CP-SAT
+as a solution hint, and change_penalty adds a minimal-change objective term
+for each hinted camper placed in a different bunk.
+"""
+
+from __future__ import annotations
+
+from bunking.models_v2 import DirectSolverInput
+from bunking.solver import DirectBunkingSolver
+
+from .conftest import MinimalConfigLoader, create_bunk, create_person
+
+
+def _warm_start_input(hints: dict[int, int], change_penalty: int = 0) -> DirectSolverInput:
+    """Three boys and two boys' bunks, plus a girls' bunk nobody may use."""
+    persons = [
+        create_person(1, "Adam", "A", "M", 5),
+        create_person(2, "Ben", "B", "M", 5),
+        create_person(3, "Cal", "C", "M", 5),
+    ]
+    bunks = [
+        create_bunk(10, "B-5", "M"),
+        create_bunk(11, "B-6", "M"),
+        create_bunk(12, "G-5", "F"),
+    ]
+    return DirectSolverInput(
+        persons=persons, requests=[], bunks=bunks, solution_hints=hints, change_penalty=change_penalty
+    )
+
+
+def _hint_values(solver: DirectBunkingSolver) -> dict[int, int]:
+    """Read the model's solution hint as variable index -> hinted value."""
+    hint = solver.model.Proto().solution_hint
+    return dict(zip(list(hint.vars), list(hint.values), strict=True))
+
+
+class TestSolutionHints:
+    """Tests for feeding warm-start assignments to CP-SAT."""
+
+    def test_hints_set_for_every_eligible_bunk(self):
+        solver = DirectBunkingSolver(_warm_start_input({1: 11, 2: 10}), MinimalConfigLoader())  # type: ignore[arg-type]
+
+        assert solver._add_solution_hints() == 2
+
+        values = _hint_values(solver)
+        adam, b5, b6 = solver.person_idx_map[1], solver.bunk_idx_map[10], solver.bunk_idx_map[11]
+        assert values[solver.assignments[(adam, b6)].Index()] == 1
+        assert values[solver.assignments[(adam, b5)].Index()] == 0
+        assert values[solver.person_bunk_assignment[adam].Index()] == b6
+        # Cal has no hint and is left to the search
+        cal = solver.person_idx_map[3]
+        assert solver.assignments[(cal, b5)].Index() not in values
+
+    def test_unknown_and_ineligible_hints_skipped(self):
+        # 99 is not in the session, 12 is a girls' bunk, 404 is not a bunk
+        hints = {99: 10, 1: 12, 2: 404, 3: 10}
+        solver = DirectBunkingSolver(_warm_start_input(hints), MinimalConfigLoader())  # type: ignore[arg-type]
+
+        assert solver._add_solution_hints() == 1
+
+
+class TestChangePenalty:
+    """Tests for the minimal-change objective term."""
+
+    def test_disabled_by_default(self):
+        solver = DirectBunkingSolver(_warm_start_input({1: 10}), MinimalConfigLoader())  # type: ignore[arg-type]
+
+        solver._add_change_penalty()
+
+        assert not any(name.startswith("minimal_change") for name in solver.soft_constraint_violations)
+
+    def test_penalty_per_hinted_camper(self):
+        hints = {1: 10, 2: 11, 3: 12}
+        solver = DirectBunkingSolver(_warm_start_input(hints, change_penalty=50), MinimalConfigLoader())  # type: ignore[arg-type]
+
+        solver._add_change_penalty()
+
+        penalties = {
+            name: penalty
+            for name, (_, penalty) in solver.soft_constraint_violations.items()
+            if "minimal_change" in name
+        }
+        # Cal's hinted bunk is ineligible, so moving him is not penalized
+        assert penalties == {"minimal_change_1": 50, "minimal_change_2": 50}
@@ -0,0 +1,115 @@
+"""Tests for ConfigLoader snapshot loading.
+
+Verifies the config collection is read once into a snapshot, that lookups
+are served from it until the TTL passes or config is updated, and that a
+pinned loader keeps one snapshot for a whole run.
+"""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from bunking.config import ConfigLoader
+from bunking.config.errors import (
+    ConfigError,
+    DatabaseUnavailableError,
+    MissingKeyError,
+    UnknownKeyError,
+    ValidationError,
+)
+
+
+def _record(category: str, subcategory: str | None, config_key: str, value: object) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=f"{category}-{config_key}", category=category, subcategory=subcategory, config_key=config_key, value=value
+    )
+
+
+@pytest.fixture
+def mock_pb():
+    pb = MagicMock()
+    pb.collection.return_value.get_full_list.return_value = [
+        _record("solver", "time_limit", "seconds", 30),
+        _record("constraint", "cabin_capacity", "standard", "12"),
+        _record("constraint", "grade_ratio", "max_percentage", 500),
+    ]
+    return pb
+
+
+class TestConfigLoaderSnapshot:
+    """Tests for snapshot-backed lookups"""
+
+    def test_one_query_serves_all_keys(self, mock_pb):
+        loader = ConfigLoader(mock_pb)
+
+        assert loader.get_int("solver.time_limit.seconds") == 30
+        assert loader.get_int("constraint.cabin_capacity.standard") == 12
+        assert mock_pb.collection.return_value.get_full_list.call_count == 1
+
+    def test_missing_invalid_and_unknown_keys(self, mock_pb):
+        loader = ConfigLoader(mock_pb)
+
+        with pytest.raises(MissingKeyError):
+            loader.get("smart_local_resolution.enabled")
+        with pytest.raises(ValidationError):
+            loader.get("constraint.grade_ratio.max_percentage")
+        with pytest.raises(UnknownKeyError):
+            loader.get("not.a.key")
+        assert loader.get_int("smart_local_resolution.enabled", default=1) == 1
+
+    def test_env_override_applied_at_load(self, mock_pb, monkeypatch):
+        monkeypatch.setenv("CONFIG_SOLVER_TIME_LIMIT_SECONDS", "45")
+
+        assert ConfigLoader(mock_pb).get_int("solver.time_limit.seconds") == 45
+
+    def test_reloads_after_ttl(self, mock_pb):
+        loader = ConfigLoader(mock_pb, cache_ttl_seconds=60)
+        first = loader.snapshot()
+        object.__setattr__(first, "loaded_at", time.time() - 61)
+
+        second = loader.snapshot()
+
+        assert second.version > first.version
+        assert mock_pb.collection.return_value.get_full_list.call_count == 2
+
+    def test_update_config_refreshes_but_pinned_does_not(self, mock_pb):
+        loader = ConfigLoader(mock_pb)
+        pinned = loader.pin()
+        mock_pb.collection.return_value.get_first_list_item.return_value = _record(
+            "solver", "time_limit", "seconds", 30
+        )
+        mock_pb.collection.return_value.get_full_list.return_value = [_record("solver", "time_limit", "seconds", 90)]
+
+        loader.update_config("solver.time_limit.seconds", 90)
+
+        assert loader.get_int("solver.time_limit.seconds") == 90
+        assert pinned.get_int("solver.time_limit.seconds") == 30
+
+    def test_failed_reload_keeps_last_snapshot(self, mock_pb):
+        loader = ConfigLoader(mock_pb, cache_ttl_seconds=0)
+        loader.get_int("solver.time_limit.seconds")
+        mock_pb.collection.return_value.get_full_list.side_effect = Exception("connection refused")
+
+        assert loader.get_int("solver.time_limit.seconds") == 30
+
+    def test_failed_first_load_raises_instead_of_defaults(self, mock_pb):
+        mock_pb.collection.return_value.get_full_list.side_effect = Exception("connection refused")
+        loader = ConfigLoader(mock_pb)
+
+        with pytest.raises(DatabaseUnavailableError):
+            loader.get_int("solver.time_limit.seconds", default=5)
+        with pytest.raises(DatabaseUnavailableError):
+            loader.pin()
+
+        mock_pb.collection.return_value.get_full_list.side_effect = None
+        assert loader.get_int("solver.time_limit.seconds") == 30
+
+    def test_pin_refuses_empty_snapshot(self, mock_pb):
+        mock_pb.collection.return_value.get_full_list.return_value = []
+
+        with pytest.raises(ConfigError):
+            ConfigLoader(mock_pb).pin()
@@ -0,0 +1,89 @@
+"""Tests for batch_score_evaluator module.
+
+The batch evaluator must produce exactly the same ScoreBreakdown as
+evaluate_scenario_score for every scenario it scores.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from bunking.solver.batch_score_evaluator import BatchScoreEvaluator, evaluate_scenario_scores
+from bunking.solver.score_evaluator import evaluate_scenario_score
+
+
+@pytest.fixture
+def mock_config():
+    """Config mock that returns every key's default."""
+    config = MagicMock()
+    config.get_int.side_effect = lambda key, default=0: default
+    config.get_float.side_effect = lambda key, default=0.0: default
+    return config
+
+
+def _as_assignment_list(scenario: dict[int, int]) -> list[dict[str, Any]]:
+    return [{"person_cm_id": p, "bunk_cm_id": b} for p, b in scenario.items()]
+
+
+class TestBatchScoreEvaluator:
+    """Test batch scoring against the per-scenario evaluator."""
+
+    def test_empty_scenarios(self, mock_config):
+        assert evaluate_scenario_scores([], [], [], [], config=mock_config) == []
+
+    def test_diminishing_returns_per_requester(self, mock_config):
+        requests = [
+            {"requester_id": 100, "requestee_id": 200, "request_type": "bunk_with", "priority": 3},
+            {"requester_id": 100, "requestee_id": 300, "request_type": "bunk_with", "priority": 9},
+        ]
+        persons = [{"cm_id": pid, "grade": 5} for pid in (100, 200, 300)]
+        bunks = [{"cm_id": 1, "max_size": 12}, {"cm_id": 2, "max_size": 12}]
+        evaluator = BatchScoreEvaluator(requests, persons, bunks, config=mock_config)
+
+        together, split = evaluator.score_many([{100: 1, 200: 1, 300: 1}, {100: 1, 200: 1, 300: 2}])
+
+        # Highest priority first: 90 * 10 + 30 * 5
+        assert together.request_satisfaction_score == 1050
+        # Only the lower priority request is satisfied, so it gets the first multiplier
+        assert split.request_satisfaction_score == 300
+        assert split.satisfied_requests == 1
+
+    def test_unknown_ids_in_scenario(self, mock_config):
+        evaluator = BatchScoreEvaluator([], [{"cm_id": 100, "grade": 5}], [], config=mock_config)
+
+        result = evaluator.score({100: 7, 999: 7})
+
+        assert result == evaluate_scenario_score(
+            [], _as_assignment_list({100: 7, 999: 7}), [{"cm_id": 100, "grade": 5}], [], config=mock_config
+        )
+        assert result.penalties == {"under_occupancy": 6 * 50}
+
+    def test_matches_scenario_score(self, mock_config):
+        rng = random.Random(7)
+        person_ids = list(range(100, 130))
+        persons = [{"cm_id": pid, "grade": rng.choice([None, 4, 5, 6, 7, 8])} for pid in person_ids[:-3]]
+        bunks = [{"cm_id": b, "max_size": rng.choice([None, 3, 12])} for b in range(1, 6)]
+        requests = [
+            {
+                "requester_id": rng.choice([0, *person_ids]),
+                "requestee_id": rng.choice([None, *person_ids]),
+                "request_type": rng.choice(["bunk_with", "not_bunk_with", "age_preference", "unknown"]),
+                "age_preference_target": rng.choice([None, "older", "younger"]),
+                "priority": rng.randint(1, 10),
+                "source_field": rng.choice([None, "share_bunk_with", "bunking_notes", "socialize_with"]),
+            }
+            for _ in range(60)
+        ]
+        scenarios = [{pid: rng.randint(1, 6) for pid in person_ids if rng.random() < 0.8} for _ in range(20)]
+
+        results = evaluate_scenario_scores(scenarios, requests, persons, bunks, config=mock_config)
+
+        for scenario, result in zip(scenarios, results, strict=True):
+            expected = evaluate_scenario_score(
+                requests, _as_assignment_list(scenario), persons, bunks, config=mock_config
+            )
+            assert result == expected
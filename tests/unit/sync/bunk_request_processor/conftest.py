@@ -1,6 +1,7 @@
 """Shared fixtures for orchestrator tests.
 
-Auto-mocks ProviderFactory and ConfigLoader to avoid external dependencies in unit tests.
+Auto-mocks ProviderFactory and ConfigLoader to avoid external dependencies in unit tests,
+and isolates the persistent parse cache per test.
 """
 
 from __future__ import annotations
@@ -45,3 +46,13 @@ def mock_config_loader():
     # Patch at the source module level - used by `from bunking.config.loader import ConfigLoader`
     with patch("bunking.config.loader.ConfigLoader", return_value=mock_loader):
         yield mock_loader
+
+
+@pytest.fixture(autouse=True)
+def isolated_parse_cache(tmp_path, monkeypatch):
+    """Point the persistent AI parse cache at a per-test file.
+
+    Orchestrators create the cache by default; without this, tests would share
+    (and be served results from) the project-level cache file.
+    """
+    monkeypatch.setenv("AI_PARSE_CACHE_PATH", str(tmp_path / "ai_parse_cache.sqlite3"))
@@ -83,7 +83,7 @@ class TestSessionPeersIndex:
             Mock(person_id=1002, expand={"session": Mock(cm_id=100, campminder_id=100)}, year=2025),
         ]
 
-        def mock_get_full_list(query_params=None):
+        def mock_get_full_list(batch=100, query_params=None):
             collection_name = mock_pb.collection.call_args[0][0]
             if collection_name == "camp_sessions":
                 return mock_sessions
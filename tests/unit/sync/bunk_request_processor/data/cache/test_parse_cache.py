@@ -0,0 +1,134 @@
+"""Tests for the persistent parse cache.
+
+Verifies content-addressed keys, round-tripping parse results through
+SQLite, and eviction by age and entry count."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Any
+
+from bunking.sync.bunk_request_processor.core.models import (
+    AgePreference,
+    ParsedRequest,
+    ParseRequest,
+    ParseResult,
+    RequestSource,
+    RequestType,
+)
+from bunking.sync.bunk_request_processor.data.cache.parse_cache import (
+    PersistentParseCache,
+    build_parse_cache_key,
+    deserialize_parse_result,
+    serialize_parse_result,
+)
+
+
+def _request(text: str = "Sarah Smith", field_name: str = "Share Bunk With", **kwargs: Any) -> ParseRequest:
+    defaults: dict[str, Any] = {
+        "requester_name": "John Doe",
+        "requester_cm_id": 12345,
+        "requester_grade": "3",
+        "session_cm_id": 1000002,
+        "session_name": "Session 2",
+        "year": 2025,
+        "row_data": {},
+    }
+    defaults.update(kwargs)
+    return ParseRequest(request_text=text, field_name=field_name, **defaults)
+
+
+class TestParseCacheKey:
+    """Tests for build_parse_cache_key"""
+
+    def test_whitespace_insensitive(self):
+        key = build_parse_cache_key(_request("Sarah  Smith "), "v1", "gpt-4.1-nano")
+
+        assert key == build_parse_cache_key(_request("Sarah Smith"), "v1", "gpt-4.1-nano")
+
+    def test_prompt_model_and_field_change_key(self):
+        key = build_parse_cache_key(_request(), "v1", "gpt-4.1-nano")
+
+        assert key != build_parse_cache_key(_request(), "v2", "gpt-4.1-nano")
+        assert key != build_parse_cache_key(_request(), "v1", "gpt-4.1-mini")
+        assert key != build_parse_cache_key(_request(field_name="Do Not Share Bunk With"), "v1", "gpt-4.1-nano")
+
+    def test_requester_cm_id_not_part_of_key(self):
+        # Only what reaches the prompt matters
+        key = build_parse_cache_key(_request(requester_cm_id=1), "v1", "m")
+
+        assert key == build_parse_cache_key(_request(requester_cm_id=2), "v1", "m")
+
+
+class TestParseResultSerialization:
+    """Tests for serialize/deserialize round trip"""
+
+    def test_round_trip_uses_current_request(self):
+        parsed = ParsedRequest(
+            raw_text="old text",
+            request_type=RequestType.AGE_PREFERENCE,
+            target_name=None,
+            age_preference=AgePreference.OLDER,
+            source_field="old field",
+            source=RequestSource.STAFF,
+            confidence=0.85,
+            csv_position=1,
+            metadata={"reasoning": "prefers older", "staff_metadata": {"staff_name": "Old"}},
+            temporal_date=datetime(2025, 6, 5),
+        )
+        stored = serialize_parse_result(ParseResult(parsed_requests=[parsed], metadata={"ai_model": "m"}))
+        request = _request("prefers older kids", staff_metadata={"staff_name": "New"})
+
+        result = deserialize_parse_result(stored, request)
+
+        restored = result.parsed_requests[0]
+        assert result.is_valid and result.parse_request is request
+        assert result.metadata == {"ai_model": "m", "cache_hit": True}
+        assert restored.raw_text == "prefers older kids"
+        assert restored.source_field == "Share Bunk With"
+        assert restored.age_preference == AgePreference.OLDER
+        assert restored.source == RequestSource.STAFF
+        assert restored.temporal_date == datetime(2025, 6, 5)
+        assert restored.metadata == {"reasoning": "prefers older", "staff_metadata": {"staff_name": "New"}}
+
+
+class TestPersistentParseCache:
+    """Tests for SQLite storage and eviction"""
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "parse.sqlite3"
+        cache = PersistentParseCache(path)
+        cache.set_many({"a": {"value": 1}})
+        cache.close()
+
+        reopened = PersistentParseCache(path)
+
+        assert reopened.get_many(["a", "b"]) == {"a": {"value": 1}}
+        stats = reopened.get_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+    def test_open_instance_does_not_hold_write_lock(self, tmp_path):
+        path = tmp_path / "parse.sqlite3"
+        first = PersistentParseCache(path)
+        second = PersistentParseCache(path)
+
+        assert not first._conn.in_transaction
+        second.set_many({"a": {"value": 1}})
+        assert first.get_many(["a"]) == {"a": {"value": 1}}
+
+    def test_expired_entries_evicted(self, tmp_path):
+        cache = PersistentParseCache(tmp_path / "parse.sqlite3", max_age_days=1)
+        cache.set_many({"a": {"value": 1}})
+        cache._conn.execute("UPDATE parse_cache SET created_at = ?", (time.time() - 2 * 86400,))
+
+        assert cache.get_many(["a"]) == {}
+        assert cache.evict() == 1
+
+    def test_least_recently_used_evicted_beyond_max_entries(self, tmp_path):
+        cache = PersistentParseCache(tmp_path / "parse.sqlite3", max_entries=2)
+        cache.set_many({"a": {"value": 1}})
+        cache._conn.execute("UPDATE parse_cache SET last_accessed = 0")
+        cache.set_many({"b": {"value": 2}, "c": {"value": 3}})
+
+        assert cache.get_many(["a", "b", "c"]) == {"b": {"value": 2}, "c": {"value": 3}}
@@ -0,0 +1,59 @@
+"""Tests for PhoneticIndex.
+
+Tests that index lookups return the same persons, in the same order, as a
+linear phonetic scan, and that TemporalNameCache builds the index once."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import Mock
+
+from bunking.sync.bunk_request_processor.core.models import Person
+from bunking.sync.bunk_request_processor.data.cache.phonetic_index import PhoneticIndex
+from bunking.sync.bunk_request_processor.data.cache.temporal_name_cache import TemporalNameCache
+
+
+def _person(cm_id: int, first: str, last: str, *parent_surnames: str) -> Person:
+    parents = [{"first": "P", "last": surname, "relationship": "Parent"} for surname in parent_surnames]
+    return Person(cm_id=cm_id, first_name=first, last_name=last, parent_names=json.dumps(parents))
+
+
+PERSONS = [
+    _person(1, "John", "Smythe"),
+    _person(2, "Jane", "Doe", "Smith"),
+    _person(3, "Jon", "Smith", "Smith", "Smyth"),
+    _person(4, "Philip", "Knight"),
+]
+
+
+class TestPhoneticIndex:
+    """Tests for the PhoneticIndex class"""
+
+    def test_soundex_and_metaphone_lookups(self):
+        index = PhoneticIndex(PERSONS)
+
+        assert [p.cm_id for p in index.find_by_soundex("John", "Smith")] == [1, 3]
+        assert [p.cm_id for p in index.find_by_metaphone("Phillip", "Night")] == [4]
+        assert index.find_by_soundex("Zed", "Nobody") == []
+
+    def test_parent_surname_lookup_is_ordered_and_deduplicated(self):
+        index = PhoneticIndex(PERSONS)
+
+        # Person 3 has two parent surnames matching "Smidt" but appears once
+        matches = index.find_by_parent_surname("Smidt")
+
+        assert [p.cm_id for p in matches] == [2, 3]
+
+    def test_temporal_name_cache_builds_index_on_initialize(self):
+        cache = TemporalNameCache(Mock(), year=2025)
+        assert cache.get_phonetic_index() is None
+
+        cache._load_person_cache = Mock()  # type: ignore[method-assign]
+        cache._load_attendees_with_sessions = Mock()  # type: ignore[method-assign]
+        cache._load_historical_bunking = Mock()  # type: ignore[method-assign]
+        cache._person_cache = {p.cm_id: p for p in PERSONS}
+        cache.initialize()
+
+        index = cache.get_phonetic_index()
+        assert index is not None
+        assert len(index) == len(PERSONS)
@@ -0,0 +1,172 @@
+"""Tests for AsyncPocketBase
+
+Tests cover:
+1. Query encoding (%20 for spaces, like PocketBaseWrapper)
+2. Concurrent paged get_full_list
+3. Auth sharing with sync clients and error mapping
+4. One connection pool per server, closed when replaced
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable, Coroutine
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+from pocketbase.errors import ClientResponseError
+
+from bunking.sync.bunk_request_processor.data.async_pocketbase import AsyncPocketBase, encode_query
+from pocketbase import PocketBase
+
+
+def _paged_handler(
+    total_items: int, seen: list[httpx.Request], delay: float = 0.0
+) -> Callable[[httpx.Request], Coroutine[None, None, httpx.Response]]:
+    """Transport handler serving cm_id 0..total_items-1 in pages"""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        query = parse_qs(urlsplit(str(request.url)).query)
+        page, per_page = int(query["page"][0]), int(query["perPage"][0])
+        # Later pages answer first, so ordering must not depend on arrival
+        await asyncio.sleep(delay / page)
+        start = (page - 1) * per_page
+        items = [{"id": f"rec{i}", "cm_id": i} for i in range(start, min(start + per_page, total_items))]
+        return httpx.Response(
+            200,
+            json={
+                "page": page,
+                "perPage": per_page,
+                "totalItems": total_items,
+                "totalPages": -(-total_items // per_page),
+                "items": items,
+            },
+        )
+
+    return handler
+
+
+class TestEncodeQuery:
+    """Tests for encode_query"""
+
+    def test_spaces_encoded_as_percent_20(self):
+        assert encode_query({"filter": 'year = 2025 && name = "A B"', "page": 1}) == (
+            "filter=year%20%3D%202025%20%26%26%20name%20%3D%20%22A%20B%22&page=1"
+        )
+
+    def test_none_values_dropped(self):
+        assert encode_query({"expand": None, "page": 2}) == "page=2"
+
+
+class TestAsyncPocketBase:
+    """Tests for the async client"""
+
+    @pytest.mark.asyncio
+    async def test_get_full_list_fetches_pages_in_order(self):
+        seen: list[httpx.Request] = []
+        client = AsyncPocketBase("http://pb.test", transport=httpx.MockTransport(_paged_handler(250, seen, delay=0.01)))
+
+        records = await client.collection("persons").get_full_list(
+            batch=50, query_params={"filter": "year = 2025"}, concurrency=3
+        )
+        await client.aclose()
+
+        assert [getattr(r, "cm_id", None) for r in records] == list(range(250))
+        assert len(seen) == 5
+        assert all("filter=year%20%3D%202025" in str(r.url) for r in seen)
+
+    @pytest.mark.asyncio
+    async def test_iter_full_list_streams_all_records(self):
+        seen: list[httpx.Request] = []
+        client = AsyncPocketBase("http://pb.test", transport=httpx.MockTransport(_paged_handler(100, seen, delay=0.2)))
+
+        records = [
+            getattr(r, "cm_id", None)
+            async for r in client.collection("persons").iter_full_list(batch=25, concurrency=3)
+        ]
+        await client.aclose()
+
+        # First page first, then the rest in completion order (later pages answer sooner)
+        assert records == [*range(25), *range(75, 100), *range(50, 75), *range(25, 50)]
+
+    @pytest.mark.asyncio
+    async def test_shares_auth_with_sync_client(self):
+        seen: list[httpx.Request] = []
+        pb = PocketBase("http://auth.pb.test")
+        pb.auth_store.save("token-123", None)
+        client = AsyncPocketBase.from_client(pb, transport=httpx.MockTransport(_paged_handler(1, seen)))
+
+        await client.collection("persons").get_list()
+        await client.aclose()
+
+        assert AsyncPocketBase.from_client(pb) is client
+        assert seen[0].headers["Authorization"] == "token-123"
+
+    @pytest.mark.asyncio
+    async def test_auth_with_password_saves_token(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/collections/_superusers/auth-with-password"
+            assert json.loads(request.content) == {"identity": "admin@camp", "password": "pw"}
+            return httpx.Response(200, json={"token": "tok", "record": {"id": "su1", "email": "admin@camp"}})
+
+        client = AsyncPocketBase("http://pb.test", transport=httpx.MockTransport(handler))
+
+        await client.collection("_superusers").auth_with_password("admin@camp", "pw")
+        await client.aclose()
+
+        assert client.auth_store.token == "tok"
+        model = client.auth_store.model
+        assert model is not None
+        assert model.id == "su1"
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises_client_response_error(self):
+        client = AsyncPocketBase(
+            "http://pb.test",
+            transport=httpx.MockTransport(lambda request: httpx.Response(404, json={"message": "Not found"})),
+        )
+
+        with pytest.raises(ClientResponseError) as exc_info:
+            await client.collection("persons").get_one("missing")
+        await client.aclose()
+
+        assert exc_info.value.status == 404
+        assert exc_info.value.data == {"message": "Not found"}
+
+    @pytest.mark.asyncio
+    async def test_twins_of_one_server_share_a_pool(self):
+        seen: list[httpx.Request] = []
+        pb = PocketBase("http://shared.pb.test")
+        task_pb = PocketBase("http://shared.pb.test/")
+        pb.auth_store.save("token-pb", None)
+        task_pb.auth_store.save("token-task", None)
+        client = AsyncPocketBase.from_client(pb, transport=httpx.MockTransport(_paged_handler(1, seen)))
+        task_client = AsyncPocketBase.from_client(task_pb)
+
+        await client.collection("persons").get_list()
+        await task_client.collection("persons").get_list()
+        await client.aclose()
+
+        assert task_client is not client
+        assert task_client._pool is client._pool
+        assert [r.headers["Authorization"] for r in seen] == ["token-pb", "token-task"]
+
+    def test_new_pool_per_event_loop(self):
+        seen: list[httpx.Request] = []
+        client = AsyncPocketBase("http://pb.test", transport=httpx.MockTransport(_paged_handler(1, seen)))
+
+        async def fetch() -> httpx.AsyncClient | None:
+            await client.collection("persons").get_list()
+            return client._pool._http
+
+        # Each asyncio.run is a new loop; the second call must not reuse the first loop's pool
+        first = asyncio.run(fetch())
+        second = asyncio.run(fetch())
+
+        assert len(seen) == 2
+        assert first is not second
+        assert first is not None and first.is_closed
+        assert second is not None and not second.is_closed
@@ -107,6 +107,8 @@ class TestRequestRepository:
         result = repository.create(request)
 
         assert result is True
+        # The new record ID is kept for source linking
+        assert request.id == "abc123"
 
         # Verify the data sent to create uses new field names
         # create() is called with positional arg: create(data)
@@ -14,10 +14,14 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
+from typing import cast
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from bunking.sync.bunk_request_processor.core.models import ParseRequest
+from bunking.sync.bunk_request_processor.integration.ai_service import AIRequestContext
 from bunking.sync.bunk_request_processor.integration.batch_processor import (
     BatchProcessor,
     BatchResult,
@@ -513,6 +517,54 @@ class TestBatchParseRequests:
         mock_provider.batch_parse_requests.assert_called()
 
 
+class TestIterBatchParseRequests:
+    """Tests for iter_batch_parse_requests method."""
+
+    @staticmethod
+    def _requests(count: int) -> tuple[list[ParseRequest], list[AIRequestContext]]:
+        requests = [Mock(request_text=f"text {i}", field_name="bunk_with") for i in range(count)]
+        contexts = [Mock(requester_name=f"Person {i}") for i in range(count)]
+        return cast(list[ParseRequest], requests), cast(list[AIRequestContext], contexts)
+
+    @pytest.mark.asyncio
+    async def test_yields_batches_in_completion_order(self):
+        """A fast later batch is yielded before a slow earlier one."""
+
+        async def parse(batch_items):
+            if batch_items[0][0] == "text 0":
+                await asyncio.sleep(0.05)
+            return [Mock(requests=[Mock(confidence=0.9)], metadata={}) for _ in batch_items]
+
+        mock_provider = Mock()
+        mock_provider.batch_parse_requests = AsyncMock(side_effect=parse)
+        processor = BatchProcessor(ai_provider=mock_provider)
+        processor._create_batches = lambda items: [items[:2], items[2:]]  # type: ignore[method-assign]
+        requests, contexts = self._requests(5)
+
+        yielded = [(start, results) async for start, results in processor.iter_batch_parse_requests(requests, contexts)]
+
+        assert [start for start, _ in yielded] == [2, 0]
+        assert [r.parse_request for r in yielded[0][1]] == requests[2:]
+        assert [r.parse_request for r in yielded[1][1]] == requests[:2]
+        assert all(r.is_valid for _, results in yielded for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_yields_failed_results(self):
+        """A failed batch yields one failed result per request in it."""
+        mock_provider = Mock()
+        mock_provider.batch_parse_requests = AsyncMock(side_effect=RuntimeError("provider down"))
+        processor = BatchProcessor(ai_provider=mock_provider)
+        requests, contexts = self._requests(3)
+
+        yielded = [(start, results) async for start, results in processor.iter_batch_parse_requests(requests, contexts)]
+
+        assert len(yielded) == 1
+        start, results = yielded[0]
+        assert start == 0
+        assert [r.parse_request for r in results] == requests
+        assert all(not r.is_valid and "provider down" in r.metadata["failure_reason"] for r in results)
+
+
 class TestBatchDisambiguate:
     """Tests for batch_disambiguate method."""
 
@@ -7,6 +7,9 @@ Tests cover:
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import Mock
 
 from bunking.sync.bunk_request_processor.data.pocketbase_wrapper import (
@@ -213,6 +216,48 @@ class TestWrappedRecordService:
         assert len(result) == 5
         assert call_count[0] == 3
 
+    def _paged_send(
+        self, total_items: int, delays: dict[int, float] | None = None
+    ) -> Callable[[str, dict[str, Any]], dict[str, Any]]:
+        """client.send stub serving rec0..rec{total_items-1} in pages"""
+
+        def mock_send(path: str, options: dict[str, Any]) -> dict[str, Any]:
+            page, per_page = options["params"]["page"], options["params"]["perPage"]
+            time.sleep((delays or {}).get(page, 0))
+            start = (page - 1) * per_page
+            return {
+                "page": page,
+                "perPage": per_page,
+                "totalItems": total_items,
+                "totalPages": -(-total_items // per_page),
+                "items": [{"id": f"rec{i}"} for i in range(start, min(start + per_page, total_items))],
+            }
+
+        return mock_send
+
+    def test_get_full_list_concurrent_pages_keep_order(self):
+        """Pages fetched in parallel should still be returned in page order"""
+        mock_service = self._create_mock_record_service()
+        # Page 2 finishes last
+        mock_service.client.send = Mock(side_effect=self._paged_send(10, delays={2: 0.05}))
+
+        wrapped = WrappedRecordService(mock_service)
+        result = wrapped.get_full_list(batch=3, concurrency=3)
+
+        assert [r["id"] for r in result] == [f"rec{i}" for i in range(10)]
+        assert mock_service.client.send.call_count == 4
+
+    def test_iter_full_list_streams_pages_as_they_arrive(self):
+        """Should yield each page's records as soon as that page completes"""
+        mock_service = self._create_mock_record_service()
+        mock_service.client.send = Mock(side_effect=self._paged_send(9, delays={2: 0.05}))
+
+        wrapped = WrappedRecordService(mock_service)
+        result = [r["id"] for r in wrapped.iter_full_list(batch=3, concurrency=2)]
+
+        # First page first, then page 3 overtakes the slow page 2
+        assert result == ["rec0", "rec1", "rec2", "rec6", "rec7", "rec8", "rec3", "rec4", "rec5"]
+
     def test_getattr_delegates_to_original_service(self):
         """Should delegate unknown attributes to original service"""
         mock_service = self._create_mock_record_service()
@@ -410,6 +410,95 @@ class TestOrchestratorMergeOnSave:
         assert orchestrator._stats.get("cross_run_merges", 0) == 1
 
 
+class TestOrchestratorConcurrentSave:
+    """Test concurrent persistence and per-record failure reporting."""
+
+    def _create_request(self, requester_cm_id: int, metadata: dict[str, Any] | None = None) -> BunkRequest:
+        return BunkRequest(
+            requester_cm_id=requester_cm_id,
+            requested_cm_id=67890,
+            request_type=RequestType.BUNK_WITH,
+            session_cm_id=1000002,
+            priority=3,
+            confidence_score=0.95,
+            source=RequestSource.FAMILY,
+            source_field="share_bunk_with",
+            csv_position=0,
+            year=2025,
+            status=RequestStatus.RESOLVED,
+            is_placeholder=False,
+            metadata=metadata or {},
+        )
+
+    def _orchestrator(self, request_repo: Mock, source_link_repo: Mock) -> Any:
+        from bunking.sync.bunk_request_processor.orchestrator.orchestrator import (
+            RequestOrchestrator,
+        )
+
+        with patch.object(RequestOrchestrator, "__init__", lambda self: None):
+            orchestrator = RequestOrchestrator()
+        orchestrator.request_repository = request_repo
+        orchestrator.source_link_repository = source_link_repo
+        orchestrator._stats = {}
+        return orchestrator
+
+    def test_failures_reported_per_record_in_order(self) -> None:
+        """Failed records are reported individually; saved ones keep input order."""
+        requests = [self._create_request(cm_id) for cm_id in range(1, 21)]
+
+        def create(req: BunkRequest) -> bool:
+            if req.requester_cm_id == 7:
+                raise RuntimeError("connection reset")
+            return req.requester_cm_id != 13
+
+        mock_request_repo = Mock()
+        mock_request_repo.create.side_effect = create
+        orchestrator = self._orchestrator(mock_request_repo, Mock())
+
+        saved = orchestrator._save_bunk_requests(requests)
+
+        assert [r.requester_cm_id for r in saved] == [i for i in range(1, 21) if i not in (7, 13)]
+        assert orchestrator._stats["save_failures"] == 2
+        assert [(f["requester_cm_id"], f["action"], f["error"]) for f in orchestrator.save_failures] == [
+            (7, "create", "connection reset"),
+            (13, "create", "write rejected"),
+        ]
+
+    def test_merges_into_same_record_applied_in_order(self) -> None:
+        """Each merge into a shared target sees the previous merge's update."""
+        stored = self._create_request(1)
+        stored.id = "existing_pb_id_123"
+        stored.source_fields = ["share_bunk_with"]
+
+        def update_for_merge(
+            record_id: str, source_fields: list[str], confidence_score: float, metadata: dict[str, Any]
+        ) -> bool:
+            stored.source_fields = source_fields
+            return True
+
+        mock_request_repo = Mock()
+        mock_request_repo.get_by_id.return_value = stored
+        mock_request_repo.update_for_merge.side_effect = update_for_merge
+        orchestrator = self._orchestrator(mock_request_repo, Mock())
+
+        merge_metadata = {
+            "database_duplicate_id": "existing_pb_id_123",
+            "database_match_action": "merge",
+            "database_match_locked": False,
+        }
+        requests = []
+        for field in ("bunking_notes", "internal_notes", "socialize_with"):
+            request = self._create_request(1, metadata=dict(merge_metadata))
+            request.source_field = field
+            requests.append(request)
+
+        saved = orchestrator._save_bunk_requests(requests)
+
+        assert len(saved) == 3
+        assert sorted(stored.source_fields) == ["bunking_notes", "internal_notes", "share_bunk_with", "socialize_with"]
+        assert orchestrator._stats["cross_run_merges"] == 3
+
+
 class TestOrchestratorSourceLinkInitialization:
     """Test that orchestrator initializes SourceLinkRepository."""
 
@@ -0,0 +1,181 @@
+"""Tests for the streaming Phase 1 → Phase 3 pipeline.
+
+Verifies that:
+1. Streaming mode produces the same resolutions, order and stats as the
+   phase-at-a-time pipeline, whatever order Phase 1 batches complete in
+2. Phase 2 and Phase 3 start before Phase 1 has finished"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from bunking.sync.bunk_request_processor.core.models import (
+    ParsedRequest,
+    ParseRequest,
+    ParseResult,
+    Person,
+    RequestSource,
+    RequestType,
+)
+from bunking.sync.bunk_request_processor.resolution.interfaces import ResolutionResult
+
+# Target names: "Res*" resolve locally, "Amb*" are ambiguous, "Twin*" expands into two entries
+TARGETS = ["Res A", "Amb B", "Res C", "Twin D", "Amb E", "Res F", "Amb G"]
+
+
+def _parse_result(requester_cm_id: int, target_name: str, is_valid: bool = True) -> ParseResult:
+    parse_request = ParseRequest(
+        request_text=f"With {target_name}",
+        field_name="share_bunk_with",
+        requester_name=f"Camper {requester_cm_id}",
+        requester_cm_id=requester_cm_id,
+        requester_grade="5",
+        session_cm_id=1000002,
+        session_name="Session 2",
+        year=2025,
+        row_data={},
+    )
+    parsed = ParsedRequest(
+        raw_text=f"With {target_name}",
+        request_type=RequestType.BUNK_WITH,
+        target_name=target_name,
+        age_preference=None,
+        source_field="share_bunk_with",
+        source=RequestSource.FAMILY,
+        confidence=0.9,
+        csv_position=0,
+        metadata={},
+    )
+    return ParseResult(parsed_requests=[parsed], is_valid=is_valid, parse_request=parse_request)
+
+
+def _inputs() -> tuple[list[ParseRequest], list[ParseResult], list[ParseResult]]:
+    """Fresh (parse requests, their AI parse results, pre-parsed results)"""
+    ai_results = [_parse_result(100 + i, name, is_valid=i != 5) for i, name in enumerate(TARGETS)]
+    parse_requests = [r.parse_request for r in ai_results if r.parse_request]
+    return parse_requests, ai_results, [_parse_result(200, "Res Z")]
+
+
+def _person(cm_id: int) -> Person:
+    return Person(cm_id=cm_id, first_name="P", last_name=str(cm_id))
+
+
+async def _resolve(parse_results: list[ParseResult]) -> list[tuple[ParseResult, list[ResolutionResult]]]:
+    results = []
+    for pr in parse_results:
+        resolutions = []
+        for req in pr.parsed_requests:
+            name = req.target_name or ""
+            if name.startswith("Amb"):
+                resolutions.append(ResolutionResult(candidates=[_person(1), _person(2)], method="fuzzy"))
+            else:
+                resolutions.append(ResolutionResult(person=_person(len(name)), confidence=0.95, method="exact"))
+        results.append((pr, resolutions))
+    return results
+
+
+async def _expand(entries: list[tuple[ParseResult, list[ResolutionResult]]]) -> list[Any]:
+    expanded = []
+    for pr, resolutions in entries:
+        expanded.append((pr, resolutions))
+        if pr.parsed_requests and (pr.parsed_requests[0].target_name or "").startswith("Twin"):
+            expanded.append((pr, [ResolutionResult(candidates=[_person(3), _person(4)], method="sibling")]))
+    return expanded
+
+
+async def _disambiguate(
+    cases: list[tuple[ParseResult, list[ResolutionResult]]], progress_callback: Callable[..., None] | None = None
+) -> list[Any]:
+    return [
+        (pr, [ResolutionResult(person=_person(9), confidence=0.9, method="ai_disambiguation") for _ in resolutions])
+        for pr, resolutions in cases
+    ]
+
+
+def _orchestrator() -> Any:
+    from bunking.sync.bunk_request_processor.orchestrator.orchestrator import RequestOrchestrator
+
+    orchestrator = RequestOrchestrator(pb=Mock(), year=2025, session_cm_ids=[])
+    orchestrator._smart_resolution_enabled = False
+    orchestrator.temporal_name_cache = Mock()
+    orchestrator.temporal_name_cache.get_stats.return_value = {"persons_loaded": 0, "unique_names": 0}
+    orchestrator.phase2_service = Mock(batch_resolve=AsyncMock(side_effect=_resolve))
+    orchestrator.placeholder_expander = Mock(expand=AsyncMock(side_effect=_expand))
+    orchestrator.historical_verification_service = Mock(verify=AsyncMock(side_effect=lambda results: results))
+    orchestrator.phase3_service = Mock(batch_disambiguate=AsyncMock(side_effect=_disambiguate))
+    return orchestrator
+
+
+def _summary(results: list[tuple[ParseResult, list[ResolutionResult]]]) -> list[Any]:
+    return [
+        (
+            pr.parse_request.requester_cm_id if pr.parse_request else None,
+            [(r.method, r.person and r.person.cm_id) for r in rl],
+        )
+        for pr, rl in results
+    ]
+
+
+class TestStreamingPipeline:
+    """Test _run_phases_streaming against _run_phases."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_order", [[0, 1, 2], [2, 0, 1], [1, 2, 0]])
+    async def test_matches_phase_at_a_time_pipeline(self, batch_order):
+        """Same resolutions, order, Phase 3 indices and stats in either mode."""
+        parse_requests, ai_results, pre_parsed = _inputs()
+        barrier = _orchestrator()
+        barrier.phase1_service = Mock(batch_parse=AsyncMock(return_value=ai_results))
+        expected = await barrier._run_phases(parse_requests, pre_parsed, None)
+
+        parse_requests, ai_results, pre_parsed = _inputs()
+        batches = [list(range(0, 3)), list(range(3, 5)), list(range(5, len(ai_results)))]
+
+        async def iter_parse(requests, progress_callback=None):
+            for b in batch_order:
+                yield batches[b], [ai_results[i] for i in batches[b]]
+
+        streaming = _orchestrator()
+        streaming.phase1_service = Mock(iter_parse=iter_parse)
+        actual = await streaming._run_phases_streaming(parse_requests, pre_parsed, None)
+
+        assert _summary(actual) == _summary(expected)
+        assert streaming._phase3_indices == barrier._phase3_indices
+        for stat in ("phase1_parsed", "phase2_resolved", "phase2_ambiguous", "phase3_disambiguated"):
+            assert streaming._stats[stat] == barrier._stats[stat], stat
+
+    @pytest.mark.asyncio
+    async def test_resolution_and_disambiguation_start_during_phase1(self):
+        """The first batch reaches Phase 2 and Phase 3 while Phase 1 is still running."""
+        parse_requests, ai_results, pre_parsed = _inputs()
+        events: list[str] = []
+
+        async def iter_parse(requests, progress_callback=None):
+            yield [0, 1], ai_results[:2]
+            for _ in range(5):
+                await asyncio.sleep(0)
+            events.append("phase1 last batch")
+            yield list(range(2, len(ai_results))), ai_results[2:]
+
+        async def resolve(parse_results):
+            events.append("phase2")
+            return await _resolve(parse_results)
+
+        async def disambiguate(cases, progress_callback=None):
+            events.append("phase3")
+            return await _disambiguate(cases)
+
+        orchestrator = _orchestrator()
+        orchestrator.phase1_service = Mock(iter_parse=iter_parse)
+        orchestrator.phase2_service.batch_resolve.side_effect = resolve
+        orchestrator.phase3_service.batch_disambiguate.side_effect = disambiguate
+
+        await orchestrator._run_phases_streaming(parse_requests, pre_parsed, None)
+
+        assert events[:3] == ["phase2", "phase3", "phase1 last batch"]
+        orchestrator.temporal_name_cache.initialize.assert_called_once()
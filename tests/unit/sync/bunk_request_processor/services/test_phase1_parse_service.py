@@ -9,6 +9,8 @@ These tests verify:
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -24,6 +26,9 @@ from bunking.sync.bunk_request_processor.services.phase1_parse_service import (
     Phase1ParseService,
 )
 
+if TYPE_CHECKING:
+    from bunking.sync.bunk_request_processor.data.cache.parse_cache import PersistentParseCache
+
 
 def _create_parse_request(
     request_text: str = "I want to bunk with Sarah Smith",
@@ -369,3 +374,115 @@ class TestPhase1ParseServiceStatistics:
 
         # Internal stats should be unchanged
         assert service.get_stats()["total_parsed"] == 0
+
+
+class TestPhase1ParseServiceParseCache:
+    """Tests for the persistent parse cache in front of the batch processor"""
+
+    @pytest.mark.asyncio
+    async def test_rerun_only_sends_changed_requests(self, tmp_path):
+        """Unchanged request text is served from the cache on the next run"""
+        from bunking.sync.bunk_request_processor.data.cache.parse_cache import PersistentParseCache
+
+        context_builder = Mock()
+        context_builder.build_parse_only_context.return_value = Mock()
+        batch_processor = Mock()
+        batch_processor.get_statistics = Mock(return_value={})
+        batch_processor.batch_parse_requests = AsyncMock(
+            return_value=[_create_parse_result(), _create_parse_result(is_valid=False, parsed_requests=[])]
+        )
+        service = Phase1ParseService(
+            ai_service=Mock(model="gpt-4.1-nano"),
+            context_builder=context_builder,
+            batch_processor=batch_processor,
+            parse_cache=PersistentParseCache(tmp_path / "parse.sqlite3"),
+        )
+        first = _create_parse_request("Sarah Smith", requester_cm_id=1)
+        failed = _create_parse_request("???", requester_cm_id=2)
+        await service.batch_parse([first, failed])
+
+        changed = _create_parse_request("Emma Jones", requester_cm_id=3)
+        batch_processor.batch_parse_requests = AsyncMock(return_value=[_create_parse_result(), _create_parse_result()])
+        results = await service.batch_parse([first, failed, changed])
+
+        # Failed parses are not cached, so only the cached success skips the AI
+        sent = batch_processor.batch_parse_requests.call_args.kwargs["requests"]
+        assert [req.requester_cm_id for req in sent] == [2, 3]
+        assert results[0].metadata["cache_hit"] is True
+        assert results[0].parsed_requests[0].target_name == "Sarah Smith"
+        parse_request = results[0].parse_request
+        assert parse_request is not None
+        assert parse_request.requester_cm_id == 1
+        assert service.get_stats()["cache_hits"] == 1
+
+
+class TestPhase1ParseServiceIterParse:
+    """Tests for the streaming iter_parse method"""
+
+    @staticmethod
+    def _service(
+        batches: Callable[[list[ParseRequest]], list[tuple[int, list[ParseResult]]]],
+        parse_cache: PersistentParseCache | None = None,
+        error: Exception | None = None,
+    ) -> Phase1ParseService:
+        """Service whose batch processor yields the given (start, results) batches"""
+
+        async def iter_batches(
+            requests: list[ParseRequest], contexts: list[Any], progress_callback: Callable[..., None] | None = None
+        ) -> AsyncIterator[tuple[int, list[ParseResult]]]:
+            for start, results in batches(requests):
+                yield start, results
+            if error:
+                raise error
+
+        context_builder = Mock()
+        context_builder.build_parse_only_context.return_value = Mock()
+        batch_processor = Mock()
+        batch_processor.iter_batch_parse_requests = iter_batches
+        return Phase1ParseService(
+            ai_service=Mock(model="gpt-4.1-nano"),
+            context_builder=context_builder,
+            batch_processor=batch_processor,
+            parse_cache=parse_cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_then_batches_with_request_indices(self, tmp_path):
+        """Cache hits come first; AI batches map back to positions in the input"""
+        from bunking.sync.bunk_request_processor.data.cache.parse_cache import PersistentParseCache
+
+        cache = PersistentParseCache(tmp_path / "parse.sqlite3")
+        requests = [_create_parse_request(f"Friend {i}", requester_cm_id=i) for i in range(4)]
+
+        def ai_batches(sent):
+            results = [ParseResult(parsed_requests=[_create_parsed_request()], parse_request=r) for r in sent]
+            # Later batch finishes first
+            return [(len(results) - 2, results[-2:]), (0, results[:-2])] if len(results) > 2 else [(0, results)]
+
+        # Warm the cache with request 1
+        service = self._service(ai_batches, cache)
+        _ = [batch async for batch in service.iter_parse(requests[1:2])]
+
+        yielded = [(indices, results) async for indices, results in service.iter_parse(requests)]
+
+        assert [indices for indices, _ in yielded] == [[1], [2, 3], [0]]
+        assert yielded[0][1][0].metadata["cache_hit"] is True
+        for indices, results in yielded:
+            assert [getattr(r.parse_request, "requester_cm_id", None) for r in results] == indices
+        assert service.get_stats()["total_parsed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_error_mid_stream_fails_remaining_requests(self):
+        """Requests not yet returned when the batch processor fails come back failed"""
+        requests = [_create_parse_request(f"Friend {i}", requester_cm_id=i) for i in range(3)]
+
+        def first_batch(sent):
+            return [(0, [ParseResult(parsed_requests=[_create_parsed_request()], parse_request=sent[0])])]
+
+        service = self._service(first_batch, error=RuntimeError("AI API Error"))
+
+        yielded = [(indices, results) async for indices, results in service.iter_parse(requests)]
+
+        assert [indices for indices, _ in yielded] == [[0], [1, 2]]
+        assert all(not r.is_valid and "AI API Error" in r.metadata["failure_reason"] for r in yielded[1][1])
+        assert service.get_stats()["failed_parses"] == 2
@@ -16,10 +16,12 @@ from __future__ import annotations
 from typing import Any
 from unittest.mock import Mock
 
+import httpx
 import networkx as nx
 import pytest
 
 from bunking.sync.bunk_request_processor.core.models import Person
+from bunking.sync.bunk_request_processor.data.async_pocketbase import AsyncPocketBase
 from bunking.sync.bunk_request_processor.social.social_graph import (
     RELATIONSHIP_WEIGHTS,
     FriendGroup,
@@ -948,6 +950,38 @@ class TestInitializeAsync:
         sg._session_repo.get_valid_bunking_session_ids.assert_called_with(2025)
         assert set(sg.session_cm_ids) == {1234, 5678}
 
+    @pytest.mark.asyncio
+    async def test_initialize_reads_through_async_client(self):
+        """Graph reads use the async client when one is given."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            items: list[dict[str, Any]] = []
+            if request.url.path == "/api/collections/attendees/records":
+                items = [
+                    {
+                        "id": f"att{cm_id}",
+                        "family_id": "fam1",
+                        "expand": {
+                            "person": {"id": f"p{cm_id}", "cm_id": cm_id},
+                            "session": {"id": "s1", "cm_id": 1234},
+                        },
+                    }
+                    for cm_id in (1, 2)
+                ]
+            return httpx.Response(
+                200, json={"page": 1, "perPage": 100, "totalItems": len(items), "totalPages": 1, "items": items}
+            )
+
+        mock_pb = Mock()
+        async_pb = AsyncPocketBase("http://pb.test", transport=httpx.MockTransport(handler))
+        sg = SocialGraph(pb=mock_pb, year=2025, session_cm_ids=[1234], async_pb=async_pb)
+
+        await sg.initialize()
+        await async_pb.aclose()
+
+        assert sg.graphs[1234].has_edge(1, 2)
+        mock_pb.collection.assert_not_called()
+
 
 class TestSocialSignalsEdgeCases:
     """Additional edge case tests for social signals."""
@@ -5,6 +5,9 @@ Test suite for the graph cache manager.
 Tests caching, invalidation, TTL, and thread safety.
 """
 
+import asyncio
+import threading
+import time
 import unittest
 from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
@@ -260,6 +263,125 @@ class TestGraphCacheManager(unittest.TestCase):
         stats = self.cache.get_stats()
         self.assertEqual(stats["cache_size"], 0)
 
+    def test_derived_values_follow_session_graph(self):
+        """Test person details and responses are cached alongside the session graph."""
+        # Nothing is stored without the graph it derives from
+        self.cache.cache_session_response(1, 2025, "force", b"{}")
+        self.assertIsNone(self.cache.get_session_response(1, 2025, "force"))
+
+        self.cache.cache_session_graph(1, 2025, self.graph1)
+        self.cache.cache_session_persons(1, 2025, {1: "Alice"})
+        self.cache.cache_session_response(1, 2025, "force", b"{}")
+
+        self.assertEqual(self.cache.get_session_persons(1, 2025), {1: "Alice"})
+        self.assertEqual(self.cache.get_session_response(1, 2025, "force"), b"{}")
+        self.assertIsNone(self.cache.get_session_response(1, 2025, "circle"))
+
+        # Invalidating the graph drops everything derived from it
+        self.cache.invalidate_for_person(2)
+        self.assertIsNone(self.cache.get_session_persons(1, 2025))
+        self.assertIsNone(self.cache.get_session_response(1, 2025, "force"))
+
+    def test_recaching_graph_drops_stale_derived_values(self):
+        """Test a rebuilt session graph does not serve responses from the old one."""
+        self.cache.cache_session_graph(1, 2025, self.graph1)
+        self.cache.cache_session_response(1, 2025, "force", b"{}")
+
+        self.cache.cache_session_graph(1, 2025, self.graph2)
+
+        self.assertIsNone(self.cache.get_session_response(1, 2025, "force"))
+
+    def test_get_or_build_shares_one_build(self):
+        """Test concurrent misses for the same graph run the builder once."""
+        calls = []
+
+        def build():
+            calls.append(threading.current_thread())
+            time.sleep(0.05)
+            return self.graph1
+
+        async def fetch_all():
+            return await asyncio.gather(*(self.cache.get_or_build_session_graph(1, 2025, build) for _ in range(5)))
+
+        graphs = asyncio.run(fetch_all())
+
+        self.assertEqual(len(calls), 1)
+        # Built off the event loop thread
+        self.assertIsNot(calls[0], threading.main_thread())
+        self.assertTrue(all(g.number_of_nodes() == 3 for g in graphs))
+        self.assertIsNotNone(self.cache.get_session_graph(1, 2025))
+
+    def test_get_or_build_serves_stale_while_rebuilding(self):
+        """Test an expired graph is returned immediately and refreshed in the background."""
+        self.cache.cache_session_graph(1, 2025, self.graph1)
+        self.cache._cache_times["session_1_2025"] -= 3  # past the 2s TTL, inside the stale window
+
+        async def fetch_then_wait():
+            graph = await self.cache.get_or_build_session_graph(1, 2025, lambda: self.graph2)
+            await asyncio.gather(*self.cache._inflight.values())
+            return graph
+
+        stale = asyncio.run(fetch_then_wait())
+
+        self.assertEqual(set(stale.nodes()), {1, 2, 3})
+        rebuilt = self.cache.get_session_graph(1, 2025)
+        self.assertIsNotNone(rebuilt)
+        assert rebuilt is not None
+        self.assertEqual(set(rebuilt.nodes()), {4, 5, 6})
+        self.assertEqual(self.cache.get_stats()["stale_served"], 1)
+
+    def test_response_derived_from_stale_graph_not_cached_on_rebuild(self):
+        """Test a response rendered from a stale graph is dropped once the rebuild has landed."""
+        self.cache.cache_session_graph(1, 2025, self.graph1)
+        self.cache._cache_times["session_1_2025"] -= 3  # past the 2s TTL, inside the stale window
+
+        async def render_while_rebuilding():
+            graph, version = await self.cache.get_or_build_versioned_session_graph(1, 2025, lambda: self.graph2)
+            # The background rebuild finishes before the slow render does
+            await asyncio.gather(*self.cache._inflight.values())
+            self.cache.cache_session_response(1, 2025, "force", b"stale", version)
+            return graph
+
+        stale = asyncio.run(render_while_rebuilding())
+
+        self.assertEqual(set(stale.nodes()), {1, 2, 3})
+        self.assertIsNone(self.cache.get_session_response(1, 2025, "force"))
+
+        graph, version = asyncio.run(self.cache.get_or_build_versioned_session_graph(1, 2025, lambda: self.graph1))
+        self.cache.cache_session_response(1, 2025, "force", b"fresh", version)
+        self.assertEqual(set(graph.nodes()), {4, 5, 6})
+        self.assertEqual(self.cache.get_session_response(1, 2025, "force"), b"fresh")
+
+    def test_get_or_build_does_not_cache_invalidated_build(self):
+        """Test a build started before an invalidation is returned but not cached."""
+
+        def build():
+            self.cache.invalidate_session(1, 2025)
+            return self.graph1
+
+        graph = asyncio.run(self.cache.get_or_build_session_graph(1, 2025, build))
+
+        self.assertEqual(graph.number_of_nodes(), 3)
+        self.assertIsNone(self.cache.get_session_graph(1, 2025))
+
+    def test_get_or_build_caches_build_when_another_session_is_invalidated(self):
+        """Test invalidating one session does not discard an in-flight build for another."""
+
+        def build():
+            self.cache.invalidate_session(2, 2025)
+            return self.graph1
+
+        asyncio.run(self.cache.get_or_build_session_graph(1, 2025, build))
+
+        self.assertIsNotNone(self.cache.get_session_graph(1, 2025))
+
+    def test_get_or_build_bunk_graph_skips_empty(self):
+        """Test empty bunk graphs are returned but not cached."""
+        graph = asyncio.run(self.cache.get_or_build_bunk_graph(10, 1, 2025, nx.DiGraph))
+
+        self.assertEqual(graph.number_of_nodes(), 0)
+        self.assertIsNone(self.cache.get_bunk_graph(10, 1, 2025))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -586,6 +586,49 @@ class TestBunkingValidator:
         assert len(adjacency_issues) == 0
 
 
+class TestIsolationRiskValidation:
+    """Tests for isolation risk detection."""
+
+    @pytest.fixture
+    def validator(self):
+        return BunkingValidator()
+
+    def _validate(self, validator, extra_requests):
+        # Ten friends chained by requests, plus one outsider, all in one bunk
+        friends = [str(10001 + i) for i in range(10)]
+        persons = [MockPerson(campminder_id=pid, name=f"Friend {pid}", grade=5) for pid in friends]
+        persons.append(MockPerson(campminder_id="19999", name="Outsider", grade=5))
+        requests = [
+            MockBunkRequest(requester_person_cm_id=a, requested_person_cm_id=b, request_type="bunk_with")
+            for a, b in zip(friends, friends[1:], strict=False)
+        ]
+        return validator.validate_bunking(
+            session=MockSession(campminder_id="1000001", name="Session 1"),
+            bunks=[MockBunk(campminder_id="20001", name="B-1")],
+            assignments=[MockBunkAssignment(person_cm_id=p.campminder_id, bunk_cm_id="20001") for p in persons],
+            persons=persons,
+            requests=requests + extra_requests,
+        )
+
+    def test_outsider_in_large_group_flagged(self, validator):
+        result = self._validate(validator, [])
+
+        risks = [i for i in result.issues if i.type == "isolation_risk"]
+        assert result.statistics.isolation_risks == 1
+        assert risks[0].affected_ids == ["19999"]
+        assert risks[0].details["group_size"] == 10
+
+    def test_incoming_request_from_group_not_isolated(self, validator):
+        incoming = MockBunkRequest(
+            requester_person_cm_id="10005", requested_person_cm_id="19999", request_type="bunk_with"
+        )
+
+        result = self._validate(validator, [incoming])
+
+        # The outsider now belongs to the group (11 in bunk), so no risk
+        assert result.statistics.isolation_risks == 0
+
+
 class TestHistoricalBunkingRecord:
     """Tests for HistoricalBunkingRecord dataclass."""
 
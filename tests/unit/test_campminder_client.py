@@ -0,0 +1,95 @@
+"""Tests for CampMinderClient concurrent fetching and rate limiting."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+from unittest.mock import patch
+
+import requests
+
+from campminder.client import CampMinderClient, CampMinderConfig, RateLimiter
+
+
+def _response(status: int, body: dict[str, Any], headers: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+def _client(limiter: RateLimiter | None = None) -> CampMinderClient:
+    client = CampMinderClient(
+        CampMinderConfig(api_key="key", subscription_key="sub", client_id=1, season_id=2025), rate_limiter=limiter
+    )
+    client.jwt_token = "token"
+    client.jwt_expiry = time.time() + 3600
+    return client
+
+
+class TestRateLimiter:
+    """Tests for the adaptive token bucket."""
+
+    def test_throttles_beyond_burst(self):
+        limiter = RateLimiter(rate=50, burst=2)
+        start = time.monotonic()
+
+        for _ in range(4):
+            limiter.acquire()
+
+        # Two tokens up front, two more at 50/s
+        assert time.monotonic() - start >= 0.03
+
+    def test_backoff_halves_rate_and_success_recovers(self):
+        limiter = RateLimiter(rate=10, burst=1, min_rate=1)
+
+        limiter.backoff()
+        assert limiter.rate == 5
+
+        for _ in range(100):
+            limiter.record_success()
+        assert limiter.rate == 10
+
+
+class TestMakeRequestRateLimit:
+    """Tests for 429 handling in _make_request."""
+
+    def test_retries_after_429_using_retry_after(self):
+        limiter = RateLimiter(rate=100, burst=5)
+        client = _client(limiter)
+        responses = [
+            _response(429, {"message": "Rate limit is exceeded."}, {"Retry-After": "0.05"}),
+            _response(200, {"Results": []}),
+        ]
+        start = time.monotonic()
+
+        with patch.object(client.session, "request", autospec=True, side_effect=responses) as mock_request:
+            assert client._make_request("GET", "persons") == {"Results": []}
+
+        assert time.monotonic() - start >= 0.05
+        assert mock_request.call_count == 2
+        # Halved by the 429, nudged back up by the success
+        assert 50 < limiter.rate < 100
+
+
+class TestIterCustomFields:
+    """Tests for concurrent custom-field fetching."""
+
+    def test_yields_every_person_including_failures(self):
+        client = _client()
+
+        def get_custom_fields(person_id: int) -> dict[str, Any]:
+            if person_id == 3:
+                raise Exception("boom")
+            time.sleep(0.01 * (5 - person_id))
+            return {"field_1": person_id}
+
+        client.get_custom_fields = get_custom_fields  # type: ignore[method-assign]
+
+        results = dict(client.iter_custom_fields([1, 2, 3, 4], max_workers=4))
+
+        assert results[1] == {"field_1": 1}
+        assert results[4] == {"field_1": 4}
+        assert isinstance(results[3], Exception)
@@ -0,0 +1,195 @@
+"""Tests for incremental validation (ValidationSession)."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from bunking.bunking_validator import BunkingValidator, HistoricalBunkingRecord
+from bunking.models import Bunk, BunkAssignment, BunkRequest, Person, Session
+from bunking.validation_session import AssignmentMove, ValidationSession
+
+
+@dataclass
+class PlanData:
+    session_cm_id: int
+    bunk_cm_id: int
+
+
+@dataclass
+class AttendeeData:
+    person_cm_id: int
+    session_cm_id: int
+
+
+def _inputs(seed: int) -> dict[str, Any]:
+    """A random two-gender session with requests, history and unassigned campers."""
+    rng = random.Random(seed)
+    session = Session(campminder_id="1000", name="Session 2", year=2025)
+    bunks = [
+        Bunk(campminder_id=str(100 + i), name=f"{gender}-{level}", gender=gender, max_size=8)
+        for i, (gender, level) in enumerate([("B", 1), ("B", 2), ("B", 3), ("G", 1), ("G", 2), ("G", 3)])
+    ]
+    # Flow checks look at M/F genders
+    for bunk in bunks:
+        bunk.gender = "M" if bunk.name.startswith("B") else "F"
+    bunks.append(Bunk(campminder_id="199", name="AG-1", max_size=6))
+
+    persons = [
+        Person(
+            campminder_id=str(i),
+            name=f"Camper {i}",
+            grade=rng.choice([4, 5, 6, 7, None]),
+            age=round(rng.uniform(9, 13), 2),
+        )
+        for i in range(1, 41)
+    ]
+    assignments = [
+        BunkAssignment(
+            person_cm_id=p.campminder_id, session_cm_id="1000", bunk_cm_id=rng.choice(bunks).campminder_id, year=2025
+        )
+        for p in persons[:36]
+    ]
+
+    requests = []
+    for p in persons:
+        for _ in range(rng.randint(0, 3)):
+            request_type = rng.choice(["bunk_with", "bunk_with", "not_bunk_with", "age_preference"])
+            requests.append(
+                BunkRequest(
+                    requester_person_cm_id=p.campminder_id,
+                    requested_person_cm_id=None
+                    if request_type == "age_preference"
+                    else rng.choice(persons).campminder_id,
+                    request_type=request_type,
+                    age_preference_target=rng.choice(["older", "younger"]),
+                    status=rng.choice(["resolved", "resolved", "pending"]),
+                    source_field=rng.choice(["Share Bunk With", "Do Not Share Bunk With", "bunking_notes", None]),
+                    session_cm_id="1000",
+                    year=2025,
+                )
+            )
+
+    historical = [
+        HistoricalBunkingRecord(
+            person_cm_id=int(p.campminder_id), bunk_name=rng.choice(bunks[:6]).name, year=2024, session_cm_id=1000
+        )
+        for p in persons[::2]
+    ]
+    return {
+        "session": session,
+        "bunks": bunks,
+        "assignments": assignments,
+        "persons": persons,
+        "requests": requests,
+        "all_sessions": [session],
+        "bunk_plans": [PlanData(1000, int(b.campminder_id)) for b in bunks],
+        "attendees": [AttendeeData(int(p.campminder_id), 1000) for p in persons],
+        "historical_bunking": historical,
+    }
+
+
+def _full_validation(inputs: dict[str, Any], assignments: list[BunkAssignment]) -> dict[str, Any]:
+    result = BunkingValidator().validate_bunking(**{**inputs, "assignments": assignments})
+    return result.model_dump(exclude={"validated_at"})
+
+
+class TestValidationSession:
+    """Tests for ValidationSession"""
+
+    def test_initial_result_matches_full_validation(self):
+        inputs = _inputs(seed=1)
+        validation = ValidationSession(**inputs)
+
+        assert validation.result().model_dump(exclude={"validated_at"}) == _full_validation(
+            inputs, inputs["assignments"]
+        )
+
+    @pytest.mark.parametrize("seed", [2, 3, 4])
+    def test_moves_match_full_revalidation(self, seed):
+        inputs = _inputs(seed)
+        validation = ValidationSession(**inputs)
+        rng = random.Random(seed)
+        bunk_ids = [b.campminder_id for b in inputs["bunks"]] + [None]
+
+        for _ in range(25):
+            moves = [
+                AssignmentMove(
+                    person_cm_id=rng.choice(inputs["persons"]).campminder_id, bunk_cm_id=rng.choice(bunk_ids)
+                )
+                for _ in range(rng.randint(1, 2))
+            ]
+            validation.apply_moves(moves)
+
+            assert validation.result().model_dump(exclude={"validated_at"}) == _full_validation(
+                inputs, validation.assignments
+            )
+
+    def test_delta_reports_only_changes(self):
+        inputs = _inputs(seed=5)
+        validation = ValidationSession(**inputs)
+        before = validation.result()
+        person = inputs["assignments"][0]
+        target = next(b for b in inputs["bunks"] if b.campminder_id != person.bunk_cm_id)
+
+        delta = validation.apply_moves(
+            [AssignmentMove(person_cm_id=person.person_cm_id, bunk_cm_id=target.campminder_id)]
+        )
+        after = validation.result()
+
+        before_keys = [i.model_dump_json() for i in before.issues]
+        after_keys = [i.model_dump_json() for i in after.issues]
+        assert all(i.model_dump_json() not in before_keys for i in delta.added_issues)
+        assert all(i.model_dump_json() not in after_keys for i in delta.removed_issues)
+        assert len(after.issues) == len(before.issues) + len(delta.added_issues) - len(delta.removed_issues)
+        assert "total_campers" not in delta.statistics
+        assert {b.bunk_cm_id for b in delta.bunks} == {person.bunk_cm_id, target.campminder_id}
+        assert delta.version == 1
+
+    def test_bunk_summary_tracks_moves(self):
+        inputs = _inputs(seed=6)
+        validation = ValidationSession(**inputs)
+        person = inputs["persons"][-1]  # unassigned
+        bunk = inputs["bunks"][0]
+        before = validation.bunk_summary(bunk.campminder_id)
+        assert before is not None
+        assigned_before = before.assigned
+
+        delta = validation.apply_moves(
+            [AssignmentMove(person_cm_id=person.campminder_id, bunk_cm_id=bunk.campminder_id)]
+        )
+
+        summary = validation.bunk_summary(bunk.campminder_id)
+        assert summary is not None
+        assert summary.assigned == assigned_before + 1
+        assert delta.statistics["assigned_campers"] == 37
+        assert validation.assignments[-1].session_cm_id == "1000"
+
+    def test_no_op_move_returns_empty_delta(self):
+        inputs = _inputs(seed=7)
+        validation = ValidationSession(**inputs)
+        assignment = inputs["assignments"][0]
+
+        delta = validation.apply_moves(
+            [AssignmentMove(person_cm_id=assignment.person_cm_id, bunk_cm_id=assignment.bunk_cm_id)]
+        )
+
+        assert not delta.added_issues and not delta.removed_issues and not delta.statistics
+
+    def test_unknown_bunk_rejected_without_changes(self):
+        inputs = _inputs(seed=8)
+        validation = ValidationSession(**inputs)
+        assignments = validation.assignments
+
+        with pytest.raises(ValueError, match="Unknown bunk"):
+            validation.apply_moves(
+                [
+                    AssignmentMove(person_cm_id=assignments[0].person_cm_id, bunk_cm_id=None),
+                    AssignmentMove(person_cm_id=assignments[1].person_cm_id, bunk_cm_id="999"),
+                ]
+            )
+
+        assert validation.assignments == assignments